@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+パズルコアのマイクロベンチマーク
+代表的な盤面（空・半分・連鎖・おじゃま多め・全特殊ぷよ）で、連鎖判定・重力・連鎖実行・
+連鎖アニメーション・ぷよペアの落下と回転を描画なしで計測し、ops/secと割り当て量をJSONで出力する
+
+使い方:
+    python benchmark_puzzle.py                                   # 計測して表示
+    python benchmark_puzzle.py --output puzzle.json              # 結果をファイルに保存
+    python benchmark_puzzle.py --baseline puzzle.json            # 保存した基準と比較（悪化時は終了コード1）
+    python benchmark_puzzle.py --compare old.json new.json       # 保存済みの2つの結果を比較するだけ
+    python benchmark_puzzle.py --quick --filter find_all_chains  # 一部のケースを短時間で
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import logging
+import argparse
+import platform
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from core.constants import PuyoType, GRID_WIDTH, GRID_HEIGHT
+from core.rng import seed_run
+from core.authentic_demo_handler import PuyoPair
+from puzzle.puyo_grid import PuyoGrid
+from core.simple_special_puyo import SimpleSpecialType
+
+# 盤面の文字表記（上の行から順に GRID_HEIGHT 行）
+PUYO_LETTERS = {
+    '.': PuyoType.EMPTY,
+    'R': PuyoType.RED,
+    'B': PuyoType.BLUE,
+    'G': PuyoType.GREEN,
+    'Y': PuyoType.YELLOW,
+    'P': PuyoType.PURPLE,
+    'X': PuyoType.GARBAGE,
+}
+
+# 16連鎖の盤面（6x12では19連鎖GTRは収まらないため、探索で見つけた最長の連鎖）
+CHAIN_BOARD = [
+    '.G..RR',
+    '.G.BYR',
+    '.Y.RGY',
+    '.RYBGY',
+    'GRBBRB',
+    'BGRGRG',
+    'YRGRBB',
+    'YYGBGY',
+    'BYRBBY',
+    'YRRYGG',
+    'YGBRYG',
+    'BBGRYB',
+]
+CHAIN_BOARD_LENGTH = 16
+
+# 計測に使う代表盤面
+BOARDS = {
+    'empty': ['......'] * GRID_HEIGHT,
+    # 下半分が2個ずつの組で埋まっている（消えるものはない）
+    'half_full': ['......'] * 6 + [
+        'GGYYRR',
+        'YYRRBB',
+        'RRBBGG',
+        'BBGGYY',
+        'GGYYRR',
+        'YYRRBB',
+    ],
+    'chain': CHAIN_BOARD,
+    # おじゃまぷよの上で1連鎖
+    'garbage_heavy': ['......'] * 3 + [
+        'BB....',
+        'RRRRBB',
+        'XXXXXX',
+        'XXPXXX',
+        'XXXXXX',
+        'XXXXPX',
+        'XPXXXX',
+        'XXXXXX',
+        'XXXPXX',
+    ],
+    'all_specials': CHAIN_BOARD,
+}
+
+# 全ての色ぷよに特殊ぷよ情報を付ける盤面
+SPECIAL_BOARDS = {'all_specials': [SimpleSpecialType.HEAL, SimpleSpecialType.BOMB]}
+
+# ケースごとに使う盤面
+CASE_BOARDS = {
+    'find_all_chains': list(BOARDS),
+    'apply_gravity': ['half_full', 'chain', 'garbage_heavy'],
+    'execute_full_chain_sequence': ['half_full', 'chain', 'garbage_heavy', 'all_specials'],
+    'animated_chain': ['chain', 'garbage_heavy', 'all_specials'],
+    'pair_fall': ['empty', 'half_full', 'chain'],
+    'pair_fast_fall': ['empty', 'half_full', 'chain'],
+    'try_rotate': ['empty', 'half_full', 'chain'],
+}
+
+# アニメーション・落下を進める1フレームの時間（60FPS）
+FRAME_DT = 1.0 / 60
+
+# 落下・アニメーションが終わらない場合の打ち切りフレーム数
+MAX_FRAMES = 10000
+
+# 比較時に無視する差（ops/secの割合）- 誤差レベルの変化を悪化として扱わない
+DEFAULT_TOLERANCE = 0.2
+
+
+_shared_grid = None
+
+
+def _grid() -> PuyoGrid:
+    """グリッドは画像読み込みを伴うため1つを使い回す"""
+    global _shared_grid
+    if _shared_grid is None:
+        _shared_grid = PuyoGrid()
+    return _shared_grid
+
+
+def load_board(grid: PuyoGrid, name: str):
+    """盤面を読み込み、連鎖・アニメーションの状態をリセット"""
+    rows = BOARDS[name]
+    for y, row in enumerate(rows):
+        for x, letter in enumerate(row):
+            grid.grid[x][y] = PUYO_LETTERS[letter]
+    grid.special_puyo_data.clear()
+    grid.disappearing_puyos.clear()
+    grid.chain_animation_active = False
+    grid.chain_queue = []
+    grid.total_chains = 0
+
+    specials = SPECIAL_BOARDS.get(name)
+    if specials:
+        index = 0
+        for x in range(GRID_WIDTH):
+            for y in range(GRID_HEIGHT):
+                if grid.grid[x][y] not in (PuyoType.EMPTY, PuyoType.GARBAGE):
+                    grid.set_special_puyo_data(x, y, specials[index % len(specials)])
+                    index += 1
+
+
+def lift_board(grid: PuyoGrid):
+    """下から3段目を空けて、その上のぷよを浮かせる（重力の計測用）"""
+    y = GRID_HEIGHT - 3
+    for x in range(GRID_WIDTH):
+        grid.grid[x][y] = PuyoType.EMPTY
+        grid.special_puyo_data.pop((x, y), None)
+
+
+def _run_animation(grid: PuyoGrid):
+    grid.start_animated_chain_sequence()
+    for _ in range(MAX_FRAMES):
+        if grid.update_chain_animation(FRAME_DT):
+            return
+
+
+def _make_pair(center_x: int = 2, fast: bool = False) -> PuyoPair:
+    # 特殊ぷよの抽選は固定シードで行い、毎回同じペアにする
+    seed_run(0)
+    pair = PuyoPair(PuyoType.RED, PuyoType.BLUE, center_x)
+    pair.fast_falling = fast
+    return pair
+
+
+def _fall_to_lock(state):
+    grid, pair = state
+    for _ in range(MAX_FRAMES):
+        if pair.update(FRAME_DT, grid):
+            return
+
+
+def _rotate_at_wall(state):
+    grid, pair = state
+    for _ in range(4):
+        pair.try_rotate(True, grid)
+
+
+def _setup(board: str, case: str):
+    """ケースの準備（計測外）を行い、計測対象に渡す状態を返す"""
+    grid = _grid()
+    load_board(grid, board)
+    if case == 'apply_gravity':
+        lift_board(grid)
+    if case in ('pair_fall', 'pair_fast_fall'):
+        return grid, _make_pair(fast=case == 'pair_fast_fall')
+    if case == 'try_rotate':
+        # 壁際・盤面の上端付近で回転（壁蹴り・床蹴りの判定を通る）
+        pair = _make_pair(center_x=0)
+        pair.center_y = 1.0
+        return grid, pair
+    return grid
+
+
+# 計測対象の処理（状態を受け取る）
+CASES = {
+    'find_all_chains': lambda grid: grid.find_all_chains(),
+    'apply_gravity': lambda grid: grid.apply_gravity(),
+    'execute_full_chain_sequence': lambda grid: grid.execute_full_chain_sequence(),
+    'animated_chain': _run_animation,
+    'pair_fall': _fall_to_lock,
+    'pair_fast_fall': _fall_to_lock,
+    'try_rotate': _rotate_at_wall,
+}
+
+def time_case(case: str, board: str, rounds: int, min_round_seconds: float) -> float:
+    """1ケースを計測し、最も速かったラウンドのops/secを返す"""
+    op = CASES[case]
+    best = 0.0
+    for _ in range(rounds):
+        elapsed = 0.0
+        ops = 0
+        while elapsed < min_round_seconds:
+            state = _setup(board, case)
+            start = time.perf_counter()
+            op(state)
+            elapsed += time.perf_counter() - start
+            ops += 1
+        best = max(best, ops / elapsed)
+    return best
+
+
+def measure_allocations(case: str, board: str, samples: int):
+    """tracemallocで1回あたりの割り当てを計測
+
+    CPythonには累積割り当て数のカウンターがないため、
+    処理中のピークメモリ（バイト）と、処理直後に残っているメモリブロック数の増分で代用する
+    （増分の大半は循環参照でGC待ちになったオブジェクト）
+
+    Returns:
+        (ピーク割り当てバイトの最大値, 残ったブロック数の平均)
+    """
+    op = CASES[case]
+    peak_bytes = 0
+    retained_blocks = 0
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            state = _setup(board, case)
+            gc.collect()
+            tracemalloc.reset_peak()
+            before_bytes = tracemalloc.get_traced_memory()[0]
+            before_blocks = sys.getallocatedblocks()
+            op(state)
+            retained_blocks += sys.getallocatedblocks() - before_blocks
+            peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1] - before_bytes)
+    finally:
+        tracemalloc.stop()
+    return peak_bytes, retained_blocks / samples
+
+
+def run_benchmark(rounds: int = 5, min_round_seconds: float = 0.2, alloc_samples: int = 5,
+                  case_filter: str = None):
+    """全ケースを計測して結果の辞書を返す（キーは "ケース/盤面"）"""
+    logging.disable(logging.CRITICAL)
+    results = {}
+    try:
+        for case, boards in CASE_BOARDS.items():
+            for board in boards:
+                key = f"{case}/{board}"
+                if case_filter and case_filter not in key:
+                    continue
+                ops_per_sec = time_case(case, board, rounds, min_round_seconds)
+                peak_bytes, retained_blocks = measure_allocations(case, board, alloc_samples)
+                results[key] = {
+                    'ops_per_sec': ops_per_sec,
+                    'mean_us': 1e6 / ops_per_sec,
+                    'alloc_peak_bytes': peak_bytes,
+                    'alloc_retained_blocks': retained_blocks,
+                }
+    finally:
+        logging.disable(logging.NOTSET)
+    return {
+        'python': platform.python_version(),
+        'rounds': rounds,
+        'min_round_seconds': min_round_seconds,
+        'results': results,
+    }
+
+
+def compare_with_baseline(result: dict, baseline: dict, tolerance: float):
+    """基準と比較し、ops/secが許容率を超えて下がったケースの一覧を返す"""
+    regressions = []
+    for key, current in result['results'].items():
+        previous = baseline.get('results', {}).get(key)
+        if previous is None:
+            continue
+        if current['ops_per_sec'] < previous['ops_per_sec'] * (1.0 - tolerance):
+            regressions.append((key, previous['ops_per_sec'], current['ops_per_sec']))
+    return regressions
+
+
+def _load(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _report_regressions(regressions) -> int:
+    for key, previous, current in regressions:
+        print(f"REGRESSION {key}: {previous:,.0f} -> {current:,.0f} ops/s ({current / previous - 1:+.0%})")
+    if regressions:
+        return 1
+    print("No regressions against baseline")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Puzzle core micro-benchmark")
+    parser.add_argument('--rounds', type=int, default=5, help="ラウンド数（最速を採用）")
+    parser.add_argument('--quick', action='store_true', help="短時間で計測（精度は下がる）")
+    parser.add_argument('--filter', help="ケース名に含まれる文字列で絞り込む（例: chain/）")
+    parser.add_argument('--output', help="結果JSONの保存先")
+    parser.add_argument('--baseline', help="比較する基準JSON")
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'), help="保存済みの結果同士を比較")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="許容する低下率（0.2 = 20%%）")
+    args = parser.parse_args()
+
+    if args.compare:
+        baseline, current = (_load(path) for path in args.compare)
+        return _report_regressions(compare_with_baseline(current, baseline, args.tolerance))
+
+    pygame.init()
+    if args.quick:
+        result = run_benchmark(rounds=2, min_round_seconds=0.02, alloc_samples=2, case_filter=args.filter)
+    else:
+        result = run_benchmark(rounds=args.rounds, case_filter=args.filter)
+
+    print("=== PUZZLE BENCHMARK ===")
+    print(f"{'case':42s} {'ops/s':>10s} {'us/op':>10s} {'peak KiB':>9s} {'blocks':>7s}")
+    for key, entry in result['results'].items():
+        print(f"{key:42s} {entry['ops_per_sec']:10,.0f} {entry['mean_us']:10.1f} "
+              f"{entry['alloc_peak_bytes'] / 1024:9.1f} {entry['alloc_retained_blocks']:7.1f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        print(f"Saved: {args.output}")
+
+    if args.baseline:
+        return _report_regressions(compare_with_baseline(result, _load(args.baseline), args.tolerance))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
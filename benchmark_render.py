@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+画面別の描画ベンチマーク
+ヘッドレスで代表的な場面（3体と戦闘中の連鎖・15階マップの中腹・品揃えのあるショップ・休憩所・
+宝箱・アイテム50個のインベントリ・勝利画面）を組み立て、それぞれをNフレーム描画して
+1フレームの描画時間（p50/p95/p99）とフレームあたりのSurface生成数を画面ごとに出力する
+
+場面は組み立てた状態のまま更新せずに描画するため、毎フレーム同じ内容になり実行間で比較できる
+
+使い方:
+    python benchmark_render.py                              # 全場面を計測して表示
+    python benchmark_render.py --frames 600 --scenes battle shop
+    python benchmark_render.py --output render.json         # 結果をファイルに保存
+    python benchmark_render.py --baseline render.json       # 保存した基準と比較（悪化時は終了コード1）
+    python benchmark_render.py --compare old.json new.json  # 保存済みの2つの結果を比較するだけ
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+import pygame
+
+from core.constants import GameState
+from core.rng import seed_run
+from core.surface_tracker import get_surface_tracker
+from battle.battle_simulator import percentile
+from benchmark_puzzle import load_board
+
+# 1フレームの時間（描画前の準備で連鎖アニメーションを進める刻み）
+FRAME_DT = 1.0 / 60
+
+# 戦闘場面で連鎖アニメーションを進めておくフレーム数（連鎖の途中で止める）
+BATTLE_CHAIN_FRAMES = 20
+
+# ダンジョンマップの階数（ゲーム本体と同じ）
+MAP_FLOORS = 15
+
+# ショップ・休憩所・宝箱を置くフロア（マップの中腹）
+MID_FLOOR = 7
+
+# インベントリ場面のアイテム数
+INVENTORY_ITEMS = 50
+
+# 報告するパーセンタイル
+PERCENTILES = (50, 95, 99)
+
+# 比較時に無視する差（ミリ秒）- 誤差レベルの変化を悪化として扱わない
+MIN_REGRESSION_MS = 0.5
+
+# 場面ごとに記録するSurface生成の多い呼び出し元の数
+TOP_SURFACE_SITES = 5
+
+
+def _build_battle(engine):
+    from battle.battle_handler import BattleHandler
+    from battle.enemy import Enemy, EnemyGroup, EnemyType
+
+    handler = BattleHandler(engine, floor_level=MID_FLOOR)
+    handler.enemy_group = EnemyGroup([Enemy(EnemyType.SLIME, MID_FLOOR), Enemy(EnemyType.GOBLIN, MID_FLOOR),
+                                      Enemy(EnemyType.ORC, MID_FLOOR)])
+    handler.countdown_active = False
+
+    grid = handler.puyo_handler.puyo_grid
+    load_board(grid, 'chain')
+    grid.start_animated_chain_sequence()
+    for _ in range(BATTLE_CHAIN_FRAMES):
+        grid.update_chain_animation(FRAME_DT)
+    return handler
+
+
+def _build_map(engine):
+    from dungeon.map_handler import DungeonMapHandler
+
+    handler = DungeonMapHandler(engine, engine.persistent_dungeon_map)
+    renderer = handler.map_renderer
+    renderer.scroll_y = renderer.max_scroll_y / 2
+    return handler
+
+
+def _mid_floor_node(engine):
+    return engine.persistent_dungeon_map.get_nodes_by_floor(MID_FLOOR)[0]
+
+
+def _build_shop(engine):
+    from shop.shop_handler import ShopHandler
+    return ShopHandler(engine, current_node=_mid_floor_node(engine))
+
+
+def _build_rest(engine):
+    from rest.rest_handler import RestHandler
+    return RestHandler(engine, current_node=_mid_floor_node(engine))
+
+
+def _build_treasure(engine):
+    from treasure.treasure_handler import TreasureHandler
+
+    handler = TreasureHandler(engine, current_node=_mid_floor_node(engine))
+    # 開封後の報酬一覧を表示している状態
+    handler.chest_opened = True
+    handler.treasure_revealed = True
+    return handler
+
+
+def _build_inventory(engine):
+    from inventory.inventory_ui import InventoryUI
+    from inventory.player_inventory import Item, ItemType, ItemRarity
+
+    inventory = engine.player.inventory
+    inventory.max_items = INVENTORY_ITEMS
+    item_types = list(ItemType)
+    rarities = list(ItemRarity)
+    index = 0
+    while len(inventory.items) < INVENTORY_ITEMS:
+        inventory.add_item(Item(f"bench_item_{index}", f"テストアイテム{index}", "ベンチマーク用のアイテム",
+                                item_types[index % len(item_types)], rarities[index % len(rarities)],
+                                quantity=1 + index % 3))
+        index += 1
+    return InventoryUI(engine)
+
+
+def _build_victory(engine):
+    from game_completion.victory_handler import VictoryHandler
+    return VictoryHandler(engine)
+
+
+# 場面名 -> (ゲーム状態, 組み立て関数)
+SCENES = {
+    'battle': (GameState.REAL_BATTLE, _build_battle),
+    'map': (GameState.DUNGEON_MAP, _build_map),
+    'shop': (GameState.SHOP, _build_shop),
+    'rest': (GameState.REST, _build_rest),
+    'treasure': (GameState.TREASURE, _build_treasure),
+    'inventory': (GameState.INVENTORY, _build_inventory),
+    'victory': (GameState.VICTORY, _build_victory),
+}
+
+
+def create_engine(seed: int = 0):
+    """ヘッドレス描画のエンジンと、場面で共有する15階のダンジョンマップを作る"""
+    from core.game_engine import GameEngine
+    from dungeon.dungeon_map import DungeonMap
+
+    engine = GameEngine(headless=True, render_headless=True, seed=seed)
+    engine.persistent_dungeon_map = DungeonMap(total_floors=MAP_FLOORS)
+    return engine
+
+
+def render_scene(engine, name: str, frames: int, seed: int = 0) -> dict:
+    """場面を組み立ててframes回描画し、フレーム時間とSurface生成数を集計"""
+    state, build = SCENES[name]
+    seed_run(seed)
+    handler = build(engine)
+    engine.register_state_handler(state, handler)
+    engine.change_state(state)
+
+    tracker = get_surface_tracker()
+    tracker.reset()
+    # 初回はフォント・キャッシュの生成を含むため別に記録
+    tracker.begin_frame()
+    start = time.perf_counter()
+    engine.render()
+    first_frame_ms = (time.perf_counter() - start) * 1000
+    first_frame_surfaces = tracker.end_frame()
+
+    times = []
+    surfaces = []
+    for _ in range(frames):
+        tracker.begin_frame()
+        start = time.perf_counter()
+        engine.render()
+        times.append((time.perf_counter() - start) * 1000)
+        surfaces.append(tracker.end_frame())
+
+    result = {
+        'frames': frames,
+        'mean_ms': sum(times) / len(times),
+        'max_ms': max(times),
+        'first_frame_ms': first_frame_ms,
+    }
+    for pct in PERCENTILES:
+        result[f'p{pct}_ms'] = percentile(times, pct)
+    if tracker.installed:
+        result['surfaces_per_frame'] = sum(surfaces) / len(surfaces)
+        result['surfaces_max'] = max(surfaces)
+        result['first_frame_surfaces'] = first_frame_surfaces
+        # 直近のフレームで生成の多い呼び出し元（新しい毎フレームの生成を見つける手がかり）
+        result['top_surface_sites'] = [
+            {'kind': entry['kind'], 'site': entry['site'], 'per_frame': entry['mean']}
+            for entry in tracker.site_stats()[:TOP_SURFACE_SITES]
+        ]
+    return result
+
+
+def run_benchmark(frames: int = 300, scenes=None, count_surfaces: bool = True, seed: int = 0) -> dict:
+    """全場面を計測して結果の辞書を返す
+
+    Args:
+        count_surfaces: Surface生成数を数えるか（数える処理のわずかなオーバーヘッドが時間に含まれる）
+    """
+    logging.disable(logging.CRITICAL)
+    tracker = get_surface_tracker()
+    if count_surfaces:
+        # install後に作られたフォントだけが数えられるため、エンジンより先にinstallする
+        tracker.install()
+    try:
+        engine = create_engine(seed)
+        results = {name: render_scene(engine, name, frames, seed) for name in (scenes or SCENES)}
+    finally:
+        tracker.uninstall()
+        tracker.reset()
+        logging.disable(logging.NOTSET)
+    return {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'frames': frames,
+        'count_surfaces': count_surfaces,
+        'scenes': results,
+    }
+
+
+def compare_with_baseline(result: dict, baseline: dict, tolerance: float):
+    """基準と比較し、p95の描画時間かフレームあたりのSurface生成数が悪化した場面の一覧を返す"""
+    regressions = []
+    for name, current in result['scenes'].items():
+        previous = baseline.get('scenes', {}).get(name)
+        if previous is None:
+            continue
+        if current['p95_ms'] - previous['p95_ms'] > max(previous['p95_ms'] * tolerance, MIN_REGRESSION_MS):
+            regressions.append((name, 'p95_ms', previous['p95_ms'], current['p95_ms']))
+        if 'surfaces_per_frame' in current and 'surfaces_per_frame' in previous:
+            before, after = previous['surfaces_per_frame'], current['surfaces_per_frame']
+            if after - before > max(before * tolerance, 1.0):
+                regressions.append((name, 'surfaces_per_frame', before, after))
+    return regressions
+
+
+def _load(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _report_regressions(regressions) -> int:
+    for name, metric, previous, current in regressions:
+        print(f"REGRESSION {name} {metric}: {previous:.2f} -> {current:.2f}")
+    if regressions:
+        return 1
+    print("No regressions against baseline")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-screen render benchmark")
+    parser.add_argument('--frames', type=int, default=300, help="場面ごとの描画フレーム数")
+    parser.add_argument('--scenes', nargs='+', choices=list(SCENES), help="計測する場面（省略時は全て）")
+    parser.add_argument('--no-surfaces', action='store_true', help="Surface生成数を数えない（時間のみ）")
+    parser.add_argument('--output', help="結果JSONの保存先")
+    parser.add_argument('--baseline', help="比較する基準JSON")
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'), help="保存済みの結果同士を比較")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="許容する悪化率（0.2 = 20%%）")
+    args = parser.parse_args()
+
+    if args.compare:
+        baseline, current = (_load(path) for path in args.compare)
+        return _report_regressions(compare_with_baseline(current, baseline, args.tolerance))
+
+    result = run_benchmark(args.frames, args.scenes, count_surfaces=not args.no_surfaces)
+
+    print("=== RENDER BENCHMARK ===")
+    print(f"{'scene':10s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'max ms':>8s} {'first ms':>9s} {'surf/frame':>10s}")
+    for name, scene in result['scenes'].items():
+        surfaces = f"{scene['surfaces_per_frame']:10.1f}" if 'surfaces_per_frame' in scene else f"{'-':>10s}"
+        print(f"{name:10s} {scene['p50_ms']:8.2f} {scene['p95_ms']:8.2f} {scene['p99_ms']:8.2f} "
+              f"{scene['max_ms']:8.2f} {scene['first_frame_ms']:9.2f} {surfaces}")
+        for site in scene.get('top_surface_sites', []):
+            print(f"{'':10s} {site['per_frame']:8.1f}  {site['kind']:18s} {site['site']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        print(f"Saved: {args.output}")
+
+    if args.baseline:
+        return _report_regressions(compare_with_baseline(result, _load(args.baseline), args.tolerance))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
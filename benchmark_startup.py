@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+起動時間ベンチマーク
+ヘッドレス（SDLダミードライバー）でエンジンを起動し、メニューの最初のフレームまでの時間を段階別に計測する
+
+使い方:
+    python benchmark_startup.py                              # 計測してJSONを表示
+    python benchmark_startup.py --output startup.json        # 結果をファイルに保存
+    python benchmark_startup.py --baseline startup.json      # 保存した基準と比較（悪化時は終了コード1）
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+# 子プロセスで計測する段階（表示順）
+PHASES = ['imports', 'pygame_init', 'display', 'fonts', 'sound', 'engine_state',
+          'handler_construction', 'first_render', 'total']
+
+# 比較時に無視する差（秒）- 誤差レベルの変化を悪化として扱わない
+MIN_REGRESSION_SECONDS = 0.005
+
+# importtimeで報告する遅いモジュール数
+SLOWEST_IMPORTS = 15
+
+
+def run_child():
+    """計測本体（-X importtime 付きの子プロセスで実行）"""
+    start = time.perf_counter()
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+    import logging
+    logging.disable(logging.CRITICAL)
+
+    timings = {}
+    phase_start = time.perf_counter()
+    import pygame
+    from core.game_engine import GameEngine
+    from core.constants import GameState
+    from core.menu_handler import MenuHandler
+    timings['imports'] = time.perf_counter() - phase_start
+
+    engine = GameEngine()
+    timings.update(engine.startup_timings)
+
+    phase_start = time.perf_counter()
+    engine.register_state_handler(GameState.MENU, MenuHandler(engine))
+    timings['handler_construction'] = time.perf_counter() - phase_start
+
+    phase_start = time.perf_counter()
+    engine.render()
+    timings['first_render'] = time.perf_counter() - phase_start
+
+    timings['total'] = time.perf_counter() - start
+    print(json.dumps(timings))
+    pygame.quit()
+
+
+def parse_importtime(stderr: str):
+    """-X importtime の出力から、累積時間の大きいモジュールを抽出
+
+    Returns:
+        (全インポートの自己時間合計（秒）, [(モジュール名, 累積時間（秒）)...])
+    """
+    total_self_us = 0
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            total_self_us += int(self_us)
+            modules.append((name.strip(), int(cumulative_us) / 1e6))
+        except ValueError:
+            continue
+    modules.sort(key=lambda item: item[1], reverse=True)
+    return total_self_us / 1e6, modules[:SLOWEST_IMPORTS]
+
+
+def run_benchmark(runs: int):
+    """子プロセスで起動をruns回計測し、段階ごとの最小値を返す"""
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy')
+    results = []
+    import_total = 0.0
+    slowest = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', os.path.abspath(__file__), '--child'],
+            capture_output=True, text=True, env=env, cwd=os.path.dirname(os.path.abspath(__file__)))
+        if completed.returncode != 0:
+            raise RuntimeError(f"Benchmark child failed:\n{completed.stderr[-2000:]}")
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+        import_total, slowest = parse_importtime(completed.stderr)
+
+    # 外れ値の影響を避けるため最小値を採用
+    phases = {phase: min(result.get(phase, 0.0) for result in results) for phase in PHASES}
+    return {
+        'runs': runs,
+        'phases': phases,
+        'import_self_total': import_total,
+        'slowest_imports': [{'module': name, 'cumulative': seconds} for name, seconds in slowest],
+    }
+
+
+def compare_with_baseline(result: dict, baseline: dict, tolerance: float):
+    """基準と比較し、悪化した段階の一覧を返す"""
+    regressions = []
+    for phase in PHASES:
+        current = result['phases'].get(phase)
+        previous = baseline.get('phases', {}).get(phase)
+        if current is None or previous is None:
+            continue
+        if current - previous > max(previous * tolerance, MIN_REGRESSION_SECONDS):
+            regressions.append((phase, previous, current))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup time benchmark")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--runs', type=int, default=3, help="計測回数（最小値を採用）")
+    parser.add_argument('--output', help="結果JSONの保存先")
+    parser.add_argument('--baseline', help="比較する基準JSON")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="許容する悪化率（0.2 = 20%%）")
+    args = parser.parse_args()
+
+    if args.child:
+        run_child()
+        return 0
+
+    result = run_benchmark(args.runs)
+
+    print("=== STARTUP BENCHMARK ===")
+    for phase in PHASES:
+        print(f"{phase:22s} {result['phases'][phase] * 1000:8.1f} ms")
+    print(f"{'import (self total)':22s} {result['import_self_total'] * 1000:8.1f} ms")
+    print("Slowest imports (cumulative):")
+    for entry in result['slowest_imports'][:5]:
+        print(f"  {entry['module']:40s} {entry['cumulative'] * 1000:8.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        print(f"Saved: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(result, baseline, args.tolerance)
+        for phase, previous, current in regressions:
+            print(f"REGRESSION {phase}: {previous * 1000:.1f} ms -> {current * 1000:.1f} ms")
+        if regressions:
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
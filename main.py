@@ -22,7 +22,7 @@ except ImportError:
 from core.game_engine import GameEngine
 from core.constants import *
 from core.menu_handler import MenuHandler
-from puzzle.puyo_grid import PuyoGrid
+from core.loading_screen import LoadingScreenHandler
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +31,8 @@ class DemoGameHandler:
     """デモ用ゲームハンドラー - 基本的なぷよぷよ動作をテスト"""
     
     def __init__(self, engine: GameEngine):
+        from puzzle.puyo_grid import PuyoGrid
+        
         self.engine = engine
         self.puyo_grid = PuyoGrid()
         self.last_drop_time = 0
@@ -219,12 +221,12 @@ def main():
         menu_handler = MenuHandler(engine)
         engine.register_state_handler(GameState.MENU, menu_handler)
         
-        # デモハンドラーも登録（後方互換性のため）
-        demo_handler = DemoGameHandler(engine)
-        engine.register_state_handler(GameState.PLAYING, demo_handler)
+        # デモハンドラーも登録（後方互換性のため、初回遷移時に生成）
+        engine.register_state_factory(GameState.PLAYING, lambda: DemoGameHandler(engine))
         
-        # ゲーム状態をメニューに設定
-        engine.change_state(GameState.MENU)
+        # 読み込み画面でアセットを先読みしてからメニューへ
+        engine.register_state_handler(GameState.LOADING, LoadingScreenHandler(engine, GameState.MENU))
+        engine.change_state(GameState.LOADING)
         
         # メインループ開始
         engine.run()
@@ -22,10 +22,13 @@ except ImportError:
 
 from src.core.game_engine import GameEngine, GameData
 from src.core.constants import *
-from src.core.puzzle_game_handler import PuzzleGameHandler
+from src.core.loading_screen import LoadingScreenHandler
 
 logger = logging.getLogger(__name__)
 
+# タイトル表示後に先行生成しておく状態（最初の遷移を待たせないため）
+PREWARM_STATES = [GameState.PLAYING]
+
 
 class MenuHandler:
     """シンプルなメニューハンドラー"""
@@ -112,6 +115,24 @@ class MenuHandler:
             surface.blit(text, text_rect)
 
 
+def register_state_handlers(engine: GameEngine):
+    """各状態のハンドラーを登録（入力リプレイでも同じ構成で使う）"""
+    # メニューハンドラーを登録
+    menu_handler = MenuHandler(engine)
+    engine.register_state_handler(GameState.MENU, menu_handler)
+    
+    # 以下のハンドラーはインポート・生成を初回遷移時まで遅らせる
+    # 完全なパズルゲームハンドラーを登録
+    engine.register_lazy_state_handler(GameState.PLAYING, 'src.core.puzzle_game_handler', 'PuzzleGameHandler')
+    
+    # 本格版デモモード（2個ペア）
+    engine.register_lazy_state_handler(GameState.BATTLE, 'src.core.authentic_demo_handler', 'AuthenticDemoHandler')
+    
+    # 戦闘システム
+    engine.register_lazy_state_handler(GameState.REAL_BATTLE, 'src.battle.battle_handler', 'BattleHandler',
+                                       floor_level=1)
+
+
 def main():
     """メイン関数"""
     # ログ設定
@@ -127,27 +148,12 @@ def main():
     try:
         # ゲームエンジン初期化
         engine = GameEngine()
+        register_state_handlers(engine)
+        engine.prewarm_state_handlers(PREWARM_STATES)
         
-        # メニューハンドラーを登録
-        menu_handler = MenuHandler(engine)
-        engine.register_state_handler(GameState.MENU, menu_handler)
-        
-        # 完全なパズルゲームハンドラーを登録
-        puzzle_handler = PuzzleGameHandler(engine)
-        engine.register_state_handler(GameState.PLAYING, puzzle_handler)
-        
-        # 本格版デモモード（2個ペア）
-        from src.core.authentic_demo_handler import AuthenticDemoHandler
-        demo_handler = AuthenticDemoHandler(engine)
-        engine.register_state_handler(GameState.BATTLE, demo_handler)
-        
-        # 戦闘システム
-        from src.battle.battle_handler import BattleHandler
-        battle_handler = BattleHandler(engine, floor_level=1)
-        engine.register_state_handler(GameState.REAL_BATTLE, battle_handler)
-        
-        # ゲーム状態をメニューに設定
-        engine.change_state(GameState.MENU)
+        # 読み込み画面でアセットを先読みしてからメニューへ
+        engine.register_state_handler(GameState.LOADING, LoadingScreenHandler(engine, GameState.MENU))
+        engine.change_state(GameState.LOADING)
         
         # メインループ開始
         engine.run()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+入力リプレイの記録・再生
+プレイヤーの入力をシード付きで記録し、ヘッドレスで高速に再生する（不具合の再現・実プレイのベンチマーク用）
+
+使い方:
+    python replay_session.py record session.rpl              # 通常どおりプレイして入力を記録
+    python replay_session.py record session.rpl --seed 42    # シードを固定して記録
+    python replay_session.py play session.rpl                # ヘッドレスで最大100倍速で再生
+    python replay_session.py play session.rpl --speed 0      # 速度制限なしで再生
+    python replay_session.py play session.rpl --render       # 描画処理も行う（ベンチマーク用）
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+# 再生速度の上限（実時間に対する倍率）
+DEFAULT_REPLAY_SPEED = 100.0
+
+# 記録された入力を使い切った後に進める時間（秒）- 最後の入力の結果まで再現するため
+REPLAY_TAIL_SECONDS = 2.0
+
+
+def run_playback(engine, speed: float = DEFAULT_REPLAY_SPEED, tail_seconds: float = REPLAY_TAIL_SECONDS):
+    """記録した入力を使い切るまでエンジンを進める
+
+    Args:
+        speed: 実時間に対する再生速度の上限（0以下なら制限なし）
+
+    Returns:
+        再生結果（tick数・所要時間・実効倍率・最終状態）
+    """
+    from core.constants import HEADLESS_FIXED_DT
+
+    player = engine.replay
+    tail_ticks = int(tail_seconds / HEADLESS_FIXED_DT)
+    start = time.perf_counter()
+    frames = 0
+    while engine.running:
+        if player.finished:
+            if tail_ticks <= 0:
+                break
+            tail_ticks -= 1
+        engine.tick(HEADLESS_FIXED_DT)
+        frames += 1
+
+        # 速度上限を超えないように待機
+        if speed > 0:
+            ahead = frames * HEADLESS_FIXED_DT / speed - (time.perf_counter() - start)
+            if ahead > 0:
+                time.sleep(ahead)
+
+    elapsed = time.perf_counter() - start
+    game_time = frames * HEADLESS_FIXED_DT
+    return {
+        'frames': frames,
+        'simulation_ticks': engine.simulation_tick,
+        'game_seconds': game_time,
+        'wall_seconds': elapsed,
+        'speedup': game_time / elapsed if elapsed > 0 else float('inf'),
+        'final_state': engine.current_state.value,
+        'run_seed': engine.run_seed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or replay input sessions")
+    parser.add_argument('mode', choices=['record', 'play'])
+    parser.add_argument('path', help="リプレイファイル")
+    parser.add_argument('--seed', type=int, help="記録時のシード（省略時はランダム）")
+    parser.add_argument('--speed', type=float, default=DEFAULT_REPLAY_SPEED, help="再生速度の上限（0 = 制限なし）")
+    parser.add_argument('--render', action='store_true', help="再生中も描画処理を行う")
+    args = parser.parse_args()
+
+    # 完全版と同じハンドラー構成・同じモジュールで動かす
+    from main_complete import register_state_handlers, GameEngine, GameState
+    from core.input_replay import InputReplay
+
+    if args.mode == 'record':
+        engine = GameEngine(seed=args.seed)
+        register_state_handlers(engine)
+        engine.start_recording(args.path)
+        engine.change_state(GameState.MENU)
+        engine.run()
+        return 0
+
+    replay = InputReplay.load(args.path)
+    engine = GameEngine(headless=True, render_headless=args.render)
+    register_state_handlers(engine)
+    engine.start_playback(replay)
+    engine.change_state(GameState.MENU)
+    result = run_playback(engine, args.speed)
+
+    print("=== REPLAY ===")
+    for key, value in result.items():
+        print(f"{key:18s} {value:.2f}" if isinstance(value, float) else f"{key:18s} {value}")
+    engine.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+戦闘バランスシミュレーター
+フロア × 敵タイプ × プレイヤービルドの戦闘を並列に大量実行し、勝率・撃破時間・被ダメージを集計する
+
+使い方:
+    python simulate_balance.py                                      # 全フロア・全敵・全ビルドを表示
+    python simulate_balance.py --floors 1-5 --battles 1000 --output balance.csv
+    python simulate_balance.py --enemies slime goblin group --builds average --output balance.json
+    python simulate_balance.py --hp-scaling 1.3 --damage-scaling 1.1    # スケーリング定数を試す
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from battle.battle_simulator import (run_sweep, write_csv, write_json, DEFAULT_BUILDS,
+                                     RANDOM_GROUP)
+from battle.enemy import EnemyType
+
+
+def parse_floors(text: str):
+    """'1-5' や '1,3,5' をフロアの一覧に変換"""
+    floors = []
+    for part in text.split(','):
+        if '-' in part:
+            first, last = part.split('-')
+            floors.extend(range(int(first), int(last) + 1))
+        else:
+            floors.append(int(part))
+    return floors
+
+
+def main():
+    enemy_names = [enemy_type.value for enemy_type in EnemyType] + [RANDOM_GROUP]
+    parser = argparse.ArgumentParser(description="Battle balance simulator")
+    parser.add_argument('--floors', default='1-15', help="フロア（例: 1-5 / 1,3,5）")
+    parser.add_argument('--enemies', nargs='+', default=enemy_names, choices=enemy_names,
+                        help=f"敵タイプ（{RANDOM_GROUP} = フロアの通常エンカウント）")
+    parser.add_argument('--builds', nargs='+', default=list(DEFAULT_BUILDS), choices=list(DEFAULT_BUILDS))
+    parser.add_argument('--battles', type=int, default=200, help="組み合わせごとの戦闘数")
+    parser.add_argument('--workers', type=int, help="プロセス数（省略時はコア数、0 = 並列化しない）")
+    parser.add_argument('--seed', type=int, default=0, help="シードの基準値")
+    parser.add_argument('--hp-scaling', type=float, help="FLOOR_SCALING_HP を上書き")
+    parser.add_argument('--damage-scaling', type=float, help="FLOOR_SCALING_DAMAGE を上書き")
+    parser.add_argument('--speed-scaling', type=float, help="FLOOR_SCALING_SPEED を上書き")
+    parser.add_argument('--output', help="結果の保存先（.csv / .json）")
+    args = parser.parse_args()
+
+    overrides = {}
+    for name, value in (('FLOOR_SCALING_HP', args.hp_scaling), ('FLOOR_SCALING_DAMAGE', args.damage_scaling),
+                        ('FLOOR_SCALING_SPEED', args.speed_scaling)):
+        if value is not None:
+            overrides[name] = value
+
+    floors = parse_floors(args.floors)
+    builds = [DEFAULT_BUILDS[name] for name in args.builds]
+    start = time.perf_counter()
+    rows = run_sweep(floors, args.enemies, builds, args.battles, workers=args.workers,
+                     base_seed=args.seed, overrides=overrides)
+    elapsed = time.perf_counter() - start
+    total = sum(row['battles'] for row in rows)
+
+    print("=== BATTLE BALANCE ===")
+    print(f"{'floor':>5} {'enemy':12} {'build':10} {'win%':>6} {'ttk p50':>8} {'hp p50':>7} {'hp p90':>7}")
+    for row in rows:
+        print(f"{row['floor']:5d} {row['enemy']:12} {row['build']:10} {row['win_rate'] * 100:6.1f} "
+              f"{row['ttk_p50']:8.1f} {row['hp_lost_p50']:7.0f} {row['hp_lost_p90']:7.0f}")
+    print(f"{total} battles in {elapsed:.1f}s ({total / elapsed:.0f} battles/s)")
+
+    if args.output:
+        if args.output.endswith('.json'):
+            settings = {'battles': args.battles, 'seed': args.seed, 'overrides': overrides}
+            write_json(rows, args.output, settings)
+        else:
+            write_csv(rows, args.output)
+        print(f"Saved: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
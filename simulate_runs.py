@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+ラン経済シミュレーター
+ダンジョン全体のランを方針ごとに並列で大量実行し、フロアごとのHP・ゴールド・装飾品数の推移を集計する
+
+使い方:
+    python simulate_runs.py                                        # 全方針を1000ランずつ
+    python simulate_runs.py --runs 5000 --policies balanced greedy --output runs.csv
+    python simulate_runs.py --gold-scale 1.2 --price-scale 0.9     # 経済パラメーターを試す
+    python simulate_runs.py --build average --output runs.json     # ボットの戦闘能力を変える
+"""
+
+import os
+import sys
+import time
+import argparse
+from dataclasses import replace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from battle.battle_simulator import DEFAULT_BUILDS
+from dungeon.run_simulator import (run_sweep, write_csv, write_json, DEFAULT_POLICIES,
+                                   EconomySettings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-run economy simulator")
+    parser.add_argument('--policies', nargs='+', default=list(DEFAULT_POLICIES), choices=list(DEFAULT_POLICIES))
+    parser.add_argument('--build', choices=list(DEFAULT_BUILDS), help="ボットの戦闘能力（省略時は方針の既定値）")
+    parser.add_argument('--runs', type=int, default=1000, help="方針ごとのラン数")
+    parser.add_argument('--workers', type=int, help="プロセス数（省略時はコア数、0 = 並列化しない）")
+    parser.add_argument('--seed', type=int, default=0, help="シードの基準値")
+    parser.add_argument('--gold-scale', type=float, default=1.0, help="戦闘報酬のゴールドの倍率")
+    parser.add_argument('--price-scale', type=float, default=1.0, help="ショップ価格の倍率")
+    parser.add_argument('--hp-scaling', type=float, help="FLOOR_SCALING_HP を上書き")
+    parser.add_argument('--damage-scaling', type=float, help="FLOOR_SCALING_DAMAGE を上書き")
+    parser.add_argument('--speed-scaling', type=float, help="FLOOR_SCALING_SPEED を上書き")
+    parser.add_argument('--output', help="結果の保存先（.csv / .json）")
+    args = parser.parse_args()
+
+    overrides = {}
+    for name, value in (('FLOOR_SCALING_HP', args.hp_scaling), ('FLOOR_SCALING_DAMAGE', args.damage_scaling),
+                        ('FLOOR_SCALING_SPEED', args.speed_scaling)):
+        if value is not None:
+            overrides[name] = value
+
+    policies = [DEFAULT_POLICIES[name] for name in args.policies]
+    if args.build:
+        policies = [replace(policy, build=DEFAULT_BUILDS[args.build]) for policy in policies]
+    economy = EconomySettings(gold_scale=args.gold_scale, price_scale=args.price_scale)
+
+    start = time.perf_counter()
+    aggregates = run_sweep(policies, args.runs, workers=args.workers, base_seed=args.seed,
+                           economy=economy, overrides=overrides)
+    elapsed = time.perf_counter() - start
+    total = sum(aggregate.runs for aggregate in aggregates.values())
+
+    print("=== RUN ECONOMY ===")
+    for name, aggregate in aggregates.items():
+        summary = aggregate.summary()
+        print(f"[{name}] win {summary['win_rate'] * 100:.1f}%  gold earned {summary['gold_earned_mean']:.0f}"
+              f"  spent {summary['gold_spent_mean']:.0f}")
+        print(f"{'floor':>5} {'reach%':>7} {'hp p50':>7} {'maxhp p50':>9} {'gold p10':>8} {'gold p50':>8} "
+              f"{'gold p90':>8} {'art p50':>7}")
+        for row in aggregate.floor_rows():
+            print(f"{row['floor']:5d} {row['reached_rate'] * 100:7.1f} {row['hp_p50']:7.0f} {row['max_hp_p50']:9.0f} "
+                  f"{row['gold_p10']:8.0f} {row['gold_p50']:8.0f} {row['gold_p90']:8.0f} {row['artifacts_p50']:7.0f}")
+    print(f"{total} runs in {elapsed:.1f}s ({total / elapsed:.0f} runs/s)")
+
+    if args.output:
+        if args.output.endswith('.json'):
+            settings = {'runs': args.runs, 'seed': args.seed, 'gold_scale': args.gold_scale,
+                        'price_scale': args.price_scale, 'overrides': overrides}
+            write_json(aggregates, args.output, settings)
+        else:
+            write_csv(aggregates, args.output)
+        print(f"Saved: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
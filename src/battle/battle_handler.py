@@ -8,13 +8,15 @@ import math
 from typing import Optional, List
 
 from core.constants import *
-from core.game_engine import GameEngine, get_appropriate_font
+from core.game_engine import GameEngine, get_appropriate_font, get_mouse_pos
 from core.authentic_demo_handler import AuthenticDemoHandler
 from core.background_renderer import BackgroundRenderer
 from core.top_ui_bar import TopUIBar
+from core.frame_profiler import get_frame_profiler
 from .enemy import Enemy, EnemyAction, EnemyGroup, create_enemy_group, ActionType
 from .enemy_renderer import EnemyRenderer
 from .enemy_intent_renderer import EnemyIntentRenderer
+from .damage_number_pool import DamageNumberPool
 from special_puyo.special_puyo import special_puyo_manager
 from rewards.reward_system import RewardGenerator, RewardSelectionHandler
 
@@ -196,6 +198,10 @@ class BattleHandler:
         self.floor_level = floor_level
         self.current_node = current_node  # マップノード情報を保持
         
+        # ボス戦はボス用BGM（MusicManagerが参照）
+        node_type = getattr(current_node, 'node_type', None)
+        self.music_track = 'boss' if node_type is not None and node_type.value == 'boss' else 'battle'
+        
         # current_nodeが設定されていることを確認
         if self.current_node:
             logger.info(f"Battle handler initialized for node: {self.current_node.node_id}")
@@ -247,7 +253,7 @@ class BattleHandler:
         self.battle_ui_y = puyo_area_bottom - 150  # より下に配置
         
         # エフェクト
-        self.damage_numbers = []  # ダメージ数値表示
+        self.damage_numbers = DamageNumberPool(self.engine.fonts['large'])  # ダメージ数値表示
         
         # 新しいビジュアルシステム
         self.background_renderer = BackgroundRenderer()
@@ -314,32 +320,37 @@ class BattleHandler:
                     pass  # NEXTキューの準備は継続
                 return
         
+        profiler = get_frame_profiler()
+        
         # プレイヤー更新（戦闘固有の機能のみ）
         self.battle_player.update(dt)
         
         # ぷよぷよシステム更新
-        self.puyo_handler.update(dt)
+        with profiler.section('puyo_handler'):
+            self.puyo_handler.update(dt)
         
         # 特殊ぷよシステム更新
-        timed_effects = special_puyo_manager.update(dt)
-        for effect in timed_effects:
-            self._apply_special_effect(effect)
+        with profiler.section('special_puyo'):
+            timed_effects = special_puyo_manager.update(dt)
+            for effect in timed_effects:
+                self._apply_special_effect(effect)
         
         # 連鎖によるダメージ処理
-        self._check_chain_damage()
+        with profiler.section('chain_damage'):
+            self._check_chain_damage()
         
         # 敵グループの更新と攻撃（カウントダウン終了後のみ）
-        enemy_actions = self.enemy_group.update(dt, self.player.hp)
-        for enemy, action in enemy_actions:
-            self._execute_enemy_action(enemy, action)
-        
-        # ダメージ数値エフェクト更新
-        self._update_damage_numbers(dt)
-        
-        # 新しいビジュアルシステム更新
-        self.background_renderer.update(dt)
-        self.top_ui_bar.update(dt)
-        self.intent_renderer.update(dt)
+        with profiler.section('enemy_group'):
+            enemy_actions = self.enemy_group.update(dt, self.player.hp)
+            for enemy, action in enemy_actions:
+                self._execute_enemy_action(enemy, action)
+        
+        # ダメージ数値・ビジュアルシステム更新
+        with profiler.section('effects'):
+            self._update_damage_numbers(dt)
+            self.background_renderer.update(dt)
+            self.top_ui_bar.update(dt)
+            self.intent_renderer.update(dt)
         
         # 戦闘結果判定
         self._check_battle_result()
@@ -644,23 +655,11 @@ class BattleHandler:
             x = self.battle_ui_x + 100
             y = self.battle_ui_y - 50
         
-        self.damage_numbers.append({
-            'damage': damage,
-            'color': color,
-            'x': x,
-            'y': y,
-            'timer': 2.0,
-            'float_speed': 30
-        })
+        self.damage_numbers.spawn(damage, color, x, y)
     
     def _update_damage_numbers(self, dt: float):
         """ダメージ数値エフェクトを更新"""
-        for number in self.damage_numbers[:]:
-            number['timer'] -= dt
-            number['y'] -= number['float_speed'] * dt
-            
-            if number['timer'] <= 0:
-                self.damage_numbers.remove(number)
+        self.damage_numbers.update(dt)
     
     def _check_battle_result(self):
         """戦闘結果をチェック"""
@@ -807,9 +806,12 @@ class BattleHandler:
     
     def render(self, surface: pygame.Surface):
         """描画処理"""
+        profiler = get_frame_profiler()
+        
         # 美しいダンジョン背景を描画
         logger.debug("Drawing background...")
-        self.background_renderer.draw_background(surface)
+        with profiler.section('background'):
+            self.background_renderer.draw_background(surface)
         
         # 上部UIバーを描画
         # プレイヤーのダメージを受けた時のフラッシュ効果
@@ -820,44 +822,47 @@ class BattleHandler:
         # 特殊ぷよの出現率データを取得
         special_puyo_rates = self.player.special_puyo_rates if hasattr(self.player, 'special_puyo_rates') else {}
         
-        self.top_ui_bar.draw_top_bar(
-            surface,
-            self.player.hp, self.player.max_hp,
-            self.player.gold,   # ゴールド
-            self.floor_level,
-            special_puyo_rates  # 特殊ぷよ出現率
-        )
+        with profiler.section('top_ui_bar'):
+            self.top_ui_bar.draw_top_bar(
+                surface,
+                self.player.hp, self.player.max_hp,
+                self.player.gold,   # ゴールド
+                self.floor_level,
+                special_puyo_rates  # 特殊ぷよ出現率
+            )
         
         # ぷよぷよフィールド描画（背景の上に）
-        self.puyo_handler.render(surface)
-        
-        # プレイヤーダメージフラッシュ
-        if self.battle_player.damage_flash_timer > 0:
-            flash_alpha = int(128 * (self.battle_player.damage_flash_timer / self.battle_player.damage_flash_duration))
-            flash_surface = pygame.Surface((GRID_WIDTH * PUYO_SIZE, GRID_HEIGHT * PUYO_SIZE))
-            flash_surface.set_alpha(flash_alpha)
-            flash_surface.fill(Colors.RED)
-            surface.blit(flash_surface, (GRID_OFFSET_X, GRID_OFFSET_Y))
+        with profiler.section('puyo_field'):
+            self.puyo_handler.render(surface)
+            
+            # プレイヤーダメージフラッシュ
+            if self.battle_player.damage_flash_timer > 0:
+                flash_alpha = int(128 * (self.battle_player.damage_flash_timer / self.battle_player.damage_flash_duration))
+                flash_surface = pygame.Surface((GRID_WIDTH * PUYO_SIZE, GRID_HEIGHT * PUYO_SIZE))
+                flash_surface.set_alpha(flash_alpha)
+                flash_surface.fill(Colors.RED)
+                surface.blit(flash_surface, (GRID_OFFSET_X, GRID_OFFSET_Y))
         
         # 敵とその行動予告を描画
-        self._render_enemies_with_intents(surface)
-        
-        # ダメージ数値描画
-        self._render_damage_numbers(surface)
-        
-        # AOE攻撃インジケーターを表示
-        self._render_aoe_indicator(surface)
-        
-        # カウントダウンオーバーレイ（最前面に描画）
-        if self.countdown_active:
-            self._render_countdown_overlay(surface)
-        
-        # 戦闘結果画面
-        if not self.battle_active:
-            self._render_battle_result(surface)
-        else:
-            # 戦闘統計を右下に表示
-            self._render_battle_stats(surface)
+        with profiler.section('enemies'):
+            self._render_enemies_with_intents(surface)
+        
+        # ダメージ数値・AOE攻撃インジケーターを表示
+        with profiler.section('effects'):
+            self._render_damage_numbers(surface)
+            self._render_aoe_indicator(surface)
+        
+        with profiler.section('overlays'):
+            # カウントダウンオーバーレイ（最前面に描画）
+            if self.countdown_active:
+                self._render_countdown_overlay(surface)
+            
+            # 戦闘結果画面
+            if not self.battle_active:
+                self._render_battle_result(surface)
+            else:
+                # 戦闘統計を右下に表示
+                self._render_battle_stats(surface)
     
     def _render_enemies_with_intents(self, surface: pygame.Surface):
         """敵とその行動予告を描画（シンプルなスライム表示）"""
@@ -954,8 +959,11 @@ class BattleHandler:
             if next_action_info:
                 intent_center_x = x + enemy_size // 2
                 intent_center_y = y - 20  # スライムの頭の上
-                self.intent_renderer.draw_intent(surface, intent_center_x, intent_center_y, 
-                                               next_action_info, self.engine.fonts)
+                intent_rect = self.intent_renderer.get_intent_rect(intent_center_x, intent_center_y)
+                intent_hovered = intent_rect.collidepoint(get_mouse_pos())
+                self.intent_renderer.draw_intent(surface, intent_center_x, intent_center_y,
+                                               next_action_info, self.engine.fonts,
+                                               hovered=intent_hovered)
     
     def _render_battle_stats(self, surface: pygame.Surface):
         """戦闘統計を右下に表示"""
@@ -1223,20 +1231,7 @@ class BattleHandler:
     
     def _render_damage_numbers(self, surface: pygame.Surface):
         """ダメージ数値を描画"""
-        font_large = self.engine.fonts['large']
-        
-        for number in self.damage_numbers:
-            alpha = int(255 * (number['timer'] / 2.0))
-            
-            # 数値テキスト
-            damage_text = font_large.render(str(number['damage']), True, number['color'])
-            
-            # 透明度適用
-            damage_surface = pygame.Surface(damage_text.get_size())
-            damage_surface.set_alpha(alpha)
-            damage_surface.blit(damage_text, (0, 0))
-            
-            surface.blit(damage_surface, (number['x'], number['y']))
+        self.damage_numbers.render(surface)
     
     def _render_aoe_indicator(self, surface: pygame.Surface):
         """AOE攻撃インジケーターを描画"""
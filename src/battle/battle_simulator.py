@@ -0,0 +1,259 @@
+"""
+戦闘シミュレーター - バランス調整用に戦闘を描画なしで大量に実行
+敵（Enemy / EnemyGroup）のタイマーと行動はゲーム本体と同じものを使い、
+プレイヤー側は設定した間隔・連鎖数で連鎖を撃つボットで置き換える
+フロア × 敵タイプ × プレイヤービルドの組み合わせを ProcessPoolExecutor で並列に実行し、
+勝率・撃破時間・被ダメージの分布をCSV / JSONに集計する
+"""
+
+import csv
+import json
+import logging
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.constants import *
+from core.rng import get_rng, seed_run
+from puzzle.puyo_grid import authentic_chain_score, authentic_chain_multiplier
+from . import enemy as enemy_module
+from .enemy import Enemy, EnemyGroup, EnemyType, ActionType, create_enemy_group
+
+logger = logging.getLogger(__name__)
+
+# シミュレーションの時間刻み（秒）- 敵の行動間隔は数秒単位なので描画フレームより粗くてよい
+BATTLE_SIM_DT = 0.05
+
+# 1戦闘の打ち切り時間（秒）- 超えたら敗北扱い
+BATTLE_TIME_LIMIT = 300.0
+
+# 敵タイプを指定しない場合（フロアの通常エンカウント）の表記
+RANDOM_GROUP = 'group'
+
+# 調整対象のスケーリング定数（battle.enemy 内で参照される名前）
+SCALING_CONSTANTS = ('FLOOR_SCALING_HP', 'FLOOR_SCALING_DAMAGE', 'FLOOR_SCALING_SPEED')
+
+# 集計するパーセンタイル
+PERCENTILES = (10, 50, 90)
+
+
+@dataclass(frozen=True)
+class PlayerBuild:
+    """ボットプレイヤーの能力"""
+    name: str
+    max_hp: int = PLAYER_MAX_HP
+    chain_interval: float = 8.0          # 連鎖を撃つ平均間隔（秒）
+    chain_level: float = 2.0             # 平均連鎖数
+    puyos_per_level: int = 4             # 1連鎖あたりの消去数
+    chain_damage_multiplier: float = 1.0
+
+
+# 代表的なビルド（初心者・標準・上級者）
+DEFAULT_BUILDS: Dict[str, PlayerBuild] = {
+    'beginner': PlayerBuild('beginner', chain_interval=10.0, chain_level=1.2),
+    'average': PlayerBuild('average', chain_interval=8.0, chain_level=2.0),
+    'expert': PlayerBuild('expert', chain_interval=6.0, chain_level=3.5, puyos_per_level=5),
+}
+
+
+@dataclass
+class BattleResult:
+    """1戦闘の結果"""
+    floor: int
+    enemy: str
+    build: str
+    won: bool
+    duration: float
+    hp_lost: int
+    chains: int
+
+
+def battle_seed(base_seed: int, floor: int, enemy: str, build: str, index: int) -> int:
+    """組み合わせと番号から戦闘ごとのシードを導出（並列実行の順序に依存しない）"""
+    digest = hashlib.sha256(f"{base_seed}:{floor}:{enemy}:{build}:{index}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+
+def apply_scaling_overrides(overrides: Optional[Dict[str, float]]):
+    """スケーリング定数を上書き（ワーカープロセスごとに適用）"""
+    for name, value in (overrides or {}).items():
+        if name not in SCALING_CONSTANTS:
+            raise ValueError(f"Unknown scaling constant: {name}")
+        setattr(enemy_module, name, value)
+
+
+def chain_damage(build: PlayerBuild, chain_level: int) -> int:
+    """連鎖数からダメージを計算（BattleHandler._check_chain_damage と同じ換算）"""
+    score = 0
+    for level in range(1, chain_level + 1):
+        score += int(authentic_chain_score(build.puyos_per_level, PuyoType.RED) *
+                     authentic_chain_multiplier(level))
+    base_damage = max(1, score // CHAIN_SCORE_BASE)
+    return max(1, int(base_damage * build.chain_damage_multiplier))
+
+
+def create_enemies(floor: int, enemy: str) -> List[Enemy]:
+    if enemy == RANDOM_GROUP:
+        return create_enemy_group(floor)
+    return [Enemy(EnemyType(enemy), floor)]
+
+
+def fight(enemies: List[Enemy], build: PlayerBuild, current_hp: Optional[int] = None,
+          dt: float = BATTLE_SIM_DT, time_limit: float = BATTLE_TIME_LIMIT) -> Tuple[bool, float, int, int]:
+    """敵グループとボットを戦わせる（乱数は現在のストリームから引く）
+
+    Args:
+        current_hp: 戦闘開始時のHP（Noneなら最大HP）- ラン途中の戦闘で使用
+
+    Returns:
+        (勝利したか, 経過時間, 失ったHP, 連鎖回数)
+    """
+    from .battle_handler import Player
+
+    rng = get_rng('puzzle')
+    group = EnemyGroup(enemies)
+    player = Player()
+    player.max_hp = build.max_hp
+    player.current_hp = start_hp = build.max_hp if current_hp is None else current_hp
+
+    elapsed = 0.0
+    chains = 0
+    next_chain = build.chain_interval * rng.uniform(0.75, 1.25)
+    while elapsed < time_limit:
+        elapsed += dt
+        player.update(dt)
+
+        # ボットの連鎖
+        next_chain -= dt
+        if next_chain <= 0:
+            level = max(1, int(round(rng.gauss(build.chain_level, 0.7))))
+            damage = int(chain_damage(build, level) * player.attack_multiplier)
+            target = group.get_selected_target()
+            if target:
+                target.take_damage(max(1, damage))
+            chains += 1
+            next_chain = build.chain_interval * rng.uniform(0.75, 1.25)
+
+        # 敵の行動（BattleHandler._execute_enemy_action と同じ扱い）
+        for attacker, action in group.update(dt, player.current_hp):
+            if action.action_type in (ActionType.ATTACK, ActionType.SPECIAL):
+                damage = action.damage
+                if "attack_buff" in attacker.buffs:
+                    damage = int(damage * (1 + attacker.buffs["attack_buff"][0] / 100))
+                _, reflected = player.take_damage(damage)
+                if reflected > 0:
+                    attacker.take_damage(reflected)
+            else:
+                attacker.execute_action(action, player)
+
+        group.alive_enemies = [e for e in group.enemies if e.is_alive]
+        if group.is_all_defeated() or not player.is_alive:
+            break
+
+    won = group.is_all_defeated() and player.is_alive
+    return won, elapsed, start_hp - player.current_hp, chains
+
+
+def simulate_battle(floor: int, enemy: str, build: PlayerBuild, seed: int,
+                    dt: float = BATTLE_SIM_DT, time_limit: float = BATTLE_TIME_LIMIT) -> BattleResult:
+    """1戦闘をシミュレート"""
+    seed_run(seed)
+    won, elapsed, hp_lost, chains = fight(create_enemies(floor, enemy), build, dt=dt, time_limit=time_limit)
+    return BattleResult(floor, enemy, build.name, won, elapsed, hp_lost, chains)
+
+
+def _run_config(task: Tuple[int, str, PlayerBuild, int, int, int]) -> List[Tuple[bool, float, int]]:
+    """ワーカーで1つの組み合わせをまとめて実行（結果は最小限のタプルで返す）"""
+    floor, enemy, build, start, count, base_seed = task
+    results = []
+    for index in range(start, start + count):
+        result = simulate_battle(floor, enemy, build, battle_seed(base_seed, floor, enemy, build.name, index))
+        results.append((result.won, result.duration, result.hp_lost))
+    return results
+
+
+def _init_worker(overrides: Optional[Dict[str, float]]):
+    # 戦闘ごとのログは大量になるため出力しない
+    logging.disable(logging.CRITICAL)
+    apply_scaling_overrides(overrides)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """最近傍順位法のパーセンタイル（値がなければ0）"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return float(ordered[index])
+
+
+def aggregate(floor: int, enemy: str, build: str, results: List[Tuple[bool, float, int]]) -> Dict[str, object]:
+    """1つの組み合わせの結果を集計"""
+    wins = [duration for won, duration, _ in results if won]
+    hp_lost = [lost for _, _, lost in results]
+    row: Dict[str, object] = {
+        'floor': floor,
+        'enemy': enemy,
+        'build': build,
+        'battles': len(results),
+        'win_rate': len(wins) / len(results) if results else 0.0,
+        'ttk_mean': sum(wins) / len(wins) if wins else 0.0,
+        'hp_lost_mean': sum(hp_lost) / len(hp_lost) if hp_lost else 0.0,
+    }
+    for pct in PERCENTILES:
+        row[f'ttk_p{pct}'] = percentile(wins, pct)
+    for pct in PERCENTILES:
+        row[f'hp_lost_p{pct}'] = percentile(hp_lost, pct)
+    return row
+
+
+def run_sweep(floors: Iterable[int], enemies: Iterable[str], builds: Iterable[PlayerBuild],
+              battles: int, workers: Optional[int] = None, base_seed: int = 0,
+              overrides: Optional[Dict[str, float]] = None, chunk_size: int = 50) -> List[Dict[str, object]]:
+    """全組み合わせを実行して集計行の一覧を返す
+
+    Args:
+        battles: 組み合わせごとの戦闘数
+        workers: プロセス数（Noneならコア数、0なら同じプロセスで実行）
+        overrides: スケーリング定数の上書き（例: {'FLOOR_SCALING_HP': 1.3}）
+        chunk_size: 1タスクにまとめる戦闘数（プロセス間通信を減らす）
+    """
+    enemies, builds = list(enemies), list(builds)
+    configs = [(floor, enemy, build) for floor in floors for enemy in enemies for build in builds]
+    tasks = []
+    for floor, enemy, build in configs:
+        for start in range(0, battles, chunk_size):
+            tasks.append((floor, enemy, build, start, min(chunk_size, battles - start), base_seed))
+
+    if workers == 0:
+        original = {name: getattr(enemy_module, name) for name in SCALING_CONSTANTS}
+        _init_worker(overrides)
+        try:
+            chunks = [_run_config(task) for task in tasks]
+        finally:
+            logging.disable(logging.NOTSET)
+            apply_scaling_overrides(original)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(overrides,)) as executor:
+            chunks = list(executor.map(_run_config, tasks))
+
+    collected: Dict[Tuple[int, str, str], List[Tuple[bool, float, int]]] = {}
+    for (floor, enemy, build, _, _, _), chunk in zip(tasks, chunks):
+        collected.setdefault((floor, enemy, build.name), []).extend(chunk)
+    return [aggregate(floor, enemy, build, results) for (floor, enemy, build), results in collected.items()]
+
+
+def write_csv(rows: List[Dict[str, object]], path: str):
+    if not rows:
+        return
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(rows: List[Dict[str, object]], path: str, settings: Optional[Dict[str, object]] = None):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'settings': settings or {}, 'results': rows}, f, indent=2, ensure_ascii=False)
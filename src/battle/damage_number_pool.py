@@ -0,0 +1,131 @@
+"""
+ダメージ数値プール - 固定容量のフローティングテキスト
+数字グリフを色ごとに事前ラスタライズし、毎フレームはグリフのblitのみで描画
+"""
+
+import pygame
+from typing import Dict, List, Tuple
+
+# プールの容量（超えた場合は最も古い数値を再利用）
+DAMAGE_NUMBER_POOL_SIZE = 32
+
+# 表示時間と上昇速度
+DAMAGE_NUMBER_DURATION = 2.0
+DAMAGE_NUMBER_FLOAT_SPEED = 30
+
+# アトラスに含める文字
+GLYPH_CHARACTERS = "0123456789-+"
+
+
+class DigitGlyphAtlas:
+    """数字グリフのアトラス（色ごとに1度だけラスタライズ）"""
+
+    def __init__(self, font: pygame.font.Font):
+        self.font = font
+        self._glyphs: Dict[Tuple[int, int, int], Dict[str, pygame.Surface]] = {}
+
+    def get_glyphs(self, color: tuple) -> Dict[str, pygame.Surface]:
+        """指定色のグリフ一式を取得"""
+        key = tuple(color[:3])
+        glyphs = self._glyphs.get(key)
+        if glyphs is None:
+            glyphs = {char: self.font.render(char, True, key) for char in GLYPH_CHARACTERS}
+            self._glyphs[key] = glyphs
+        return glyphs
+
+    def measure(self, text: str, color: tuple) -> Tuple[int, int]:
+        """テキストを並べた時のサイズを取得"""
+        glyphs = self.get_glyphs(color)
+        width = 0
+        height = 0
+        for char in text:
+            glyph = glyphs[char]
+            width += glyph.get_width()
+            height = max(height, glyph.get_height())
+        return width, height
+
+
+class FloatingNumber:
+    """プール内の1スロット"""
+
+    __slots__ = ('active', 'text', 'color', 'x', 'y', 'timer')
+
+    def __init__(self):
+        self.active = False
+        self.text = ""
+        self.color = (255, 255, 255)
+        self.x = 0.0
+        self.y = 0.0
+        self.timer = 0.0
+
+
+class DamageNumberPool:
+    """固定容量のダメージ数値プール"""
+
+    def __init__(self, font: pygame.font.Font, capacity: int = DAMAGE_NUMBER_POOL_SIZE,
+                 duration: float = DAMAGE_NUMBER_DURATION,
+                 float_speed: float = DAMAGE_NUMBER_FLOAT_SPEED):
+        self.atlas = DigitGlyphAtlas(font)
+        self.duration = duration
+        self.float_speed = float_speed
+        self.slots: List[FloatingNumber] = [FloatingNumber() for _ in range(capacity)]
+
+    @property
+    def capacity(self) -> int:
+        return len(self.slots)
+
+    @property
+    def active_count(self) -> int:
+        return sum(1 for slot in self.slots if slot.active)
+
+    def spawn(self, value: int, color: tuple, x: float, y: float) -> FloatingNumber:
+        """数値を表示（空きスロットがなければ残り時間が最も短いものを再利用）"""
+        slot = None
+        for candidate in self.slots:
+            if not candidate.active:
+                slot = candidate
+                break
+        if slot is None:
+            slot = min(self.slots, key=lambda s: s.timer)
+
+        # 色ごとのグリフを事前に用意しておく
+        self.atlas.get_glyphs(color)
+
+        slot.active = True
+        slot.text = str(value)
+        slot.color = color
+        slot.x = x
+        slot.y = y
+        slot.timer = self.duration
+        return slot
+
+    def update(self, dt: float):
+        """表示時間と位置を更新"""
+        for slot in self.slots:
+            if not slot.active:
+                continue
+            slot.timer -= dt
+            slot.y -= self.float_speed * dt
+            if slot.timer <= 0:
+                slot.active = False
+
+    def render(self, surface: pygame.Surface):
+        """キャッシュ済みグリフを並べて描画"""
+        for slot in self.slots:
+            if not slot.active:
+                continue
+
+            alpha = int(255 * max(0.0, slot.timer / self.duration))
+            glyphs = self.atlas.get_glyphs(slot.color)
+            x = int(slot.x)
+            y = int(slot.y)
+            for char in slot.text:
+                glyph = glyphs[char]
+                glyph.set_alpha(alpha)
+                surface.blit(glyph, (x, y))
+                x += glyph.get_width()
+
+    def clear(self):
+        """全ての数値を消去"""
+        for slot in self.slots:
+            slot.active = False
@@ -3,12 +3,12 @@
 """
 
 import logging
-import random
 from typing import Dict, Optional, List
 from enum import Enum
 from dataclasses import dataclass
 
 from core.constants import *
+from core.rng import get_rng
 
 logger = logging.getLogger(__name__)
 
@@ -428,7 +428,7 @@ class Enemy:
             return self._decide_action(0)  # フォールバック
         
         # 現在のパターンを取得
-        current_pattern = random.choice(self.action_patterns)
+        current_pattern = get_rng('enemy_ai').choice(self.action_patterns)
         action_name = current_pattern[self.action_pattern_index % len(current_pattern)]
         
         # パターンインデックスを進める
@@ -449,7 +449,7 @@ class Enemy:
             return
         
         # 現在のパターンから次の行動を取得
-        current_pattern = random.choice(self.action_patterns)
+        current_pattern = get_rng('enemy_ai').choice(self.action_patterns)
         next_action_name = current_pattern[self.action_pattern_index % len(current_pattern)]
         
         # 行動名から実際の行動を取得
@@ -478,7 +478,7 @@ class Enemy:
                 return max(available_actions, key=lambda a: a.damage)
             else:
                 # 通常時はランダム
-                return random.choice(available_actions)
+                return get_rng('enemy_ai').choice(available_actions)
         
         elif self.ai_type == EnemyAI.TACTICAL:
             # プレイヤーのHPに応じて戦術を変更
@@ -487,14 +487,14 @@ class Enemy:
                 return max(available_actions, key=lambda a: a.damage)
             else:
                 # 通常時はバランス良く
-                return random.choice(available_actions)
+                return get_rng('enemy_ai').choice(available_actions)
         
         else:  # DEFENSIVE
             # 基本攻撃を多用
             basic_attacks = [a for a in available_actions if "基本" in a.name]
             if basic_attacks:
-                return random.choice(basic_attacks)
-            return random.choice(available_actions)
+                return get_rng('enemy_ai').choice(basic_attacks)
+            return get_rng('enemy_ai').choice(available_actions)
     
     def take_damage(self, damage: int) -> bool:
         """ダメージを受ける"""
@@ -677,7 +677,7 @@ def create_random_enemy(floor_level: int) -> Enemy:
     else:
         enemy_types = [EnemyType.DRAGON, EnemyType.BOSS_DEMON]
     
-    enemy_type = random.choice(enemy_types)
+    enemy_type = get_rng('enemy').choice(enemy_types)
     
     # ボスフロア（5の倍数）ではボス敵を強制
     if floor_level % 5 == 0:
@@ -689,7 +689,7 @@ def create_random_enemy(floor_level: int) -> Enemy:
             enemy_type = EnemyType.BOSS_DEMON
     
     # レベルはフロアレベル±1
-    enemy_level = max(1, floor_level + random.randint(-1, 1))
+    enemy_level = max(1, floor_level + get_rng('enemy').randint(-1, 1))
     
     return Enemy(enemy_type, enemy_level)
 
@@ -698,11 +698,11 @@ def create_enemy_group(floor_level: int) -> List[Enemy]:
     """フロアレベルに応じた敵グループを生成（1〜3体）"""
     # 敵の数を決定
     if floor_level <= 2:
-        enemy_count = random.choices([1, 2], weights=[0.8, 0.2])[0]
+        enemy_count = get_rng('enemy').choices([1, 2], weights=[0.8, 0.2])[0]
     elif floor_level <= 5:
-        enemy_count = random.choices([1, 2, 3], weights=[0.5, 0.4, 0.1])[0]
+        enemy_count = get_rng('enemy').choices([1, 2, 3], weights=[0.5, 0.4, 0.1])[0]
     else:
-        enemy_count = random.choices([1, 2, 3], weights=[0.3, 0.5, 0.2])[0]
+        enemy_count = get_rng('enemy').choices([1, 2, 3], weights=[0.3, 0.5, 0.2])[0]
     
     enemies = []
     
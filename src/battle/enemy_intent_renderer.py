@@ -5,17 +5,35 @@
 
 import pygame
 import math
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from core.constants import Colors
 from .enemy import ActionType
 
+# インテントボックスの寸法（敵の頭上の描画基準点からの相対位置）
+INTENT_WIDTH = 80
+INTENT_HEIGHT = 50
+INTENT_OFFSET_Y = 60
+INTENT_ICON_SIZE = 30
+
+# 合成済みバッジキャッシュの上限（ダメージ値の変動で無制限に増えないように）
+MAX_BADGE_CACHE_SIZE = 64
+
+
 class EnemyIntentRenderer:
     """敵の行動予告の描画を担当するクラス"""
     
+    # アイコン・背景スプライトは全インスタンスで共有（サイズごとに1度だけ描画）
+    _icon_sprites: Dict[Tuple[str, int], pygame.Surface] = {}
+    _background_sprites: Dict[Tuple[int, int], pygame.Surface] = {}
+    
     def __init__(self):
         """行動予告レンダラーを初期化"""
         self.animation_time = 0
         self.pulse_intensity = 0
+        
+        # (行動, ダメージ, ホバー) ごとの合成済みバッジ
+        self._badge_cache: Dict[tuple, Tuple[pygame.Surface, Tuple[int, int]]] = {}
+        self._badge_fonts: Optional[Dict[str, pygame.font.Font]] = None
     
     def update(self, dt: float):
         """アニメーションを更新"""
@@ -23,8 +41,9 @@ class EnemyIntentRenderer:
         self.pulse_intensity = abs(math.sin(self.animation_time * 3))
     
     def draw_intent(self, surface: pygame.Surface, x: int, y: int, 
-                    action_info: Dict, fonts: Dict[str, pygame.font.Font]):
-        """敵の行動予告を敵の上に描画"""        
+                    action_info: Dict, fonts: Dict[str, pygame.font.Font],
+                    hovered: bool = False):
+        """敵の行動予告を敵の上に描画（合成済みバッジをキャッシュから1回blit）"""
         if not action_info:
             return
         
@@ -32,36 +51,122 @@ class EnemyIntentRenderer:
         damage = action_info.get('damage', 0)
         name = action_info.get('name', '不明')
         
-        # より大きなインテントボックス
-        intent_x = x - 40
-        intent_y = y - 60
-        intent_width = 80
-        intent_height = 50
-        
-        # インテントの背景（明確に見えるように）
-        pygame.draw.rect(surface, (100, 0, 0), (intent_x, intent_y, intent_width, intent_height))
-        pygame.draw.rect(surface, (255, 255, 255), (intent_x, intent_y, intent_width, intent_height), 3)
+        badge, (offset_x, offset_y) = self._get_intent_badge(action_type, damage, hovered, name, fonts)
+        surface.blit(badge, (x + offset_x, y + offset_y))
+    
+    def get_intent_rect(self, x: int, y: int) -> pygame.Rect:
+        """行動予告ボックスの矩形を取得（ホバー判定用）"""
+        return pygame.Rect(x - INTENT_WIDTH // 2, y - INTENT_OFFSET_Y, INTENT_WIDTH, INTENT_HEIGHT)
+    
+    def _get_intent_badge(self, action_type: ActionType, damage: int, hovered: bool,
+                          name: str, fonts: Dict[str, pygame.font.Font]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """(行動, ダメージ, ホバー) ごとに合成済みのバッジを取得"""
+        # フォントが差し替えられたら合成済みバッジは無効
+        if fonts is not self._badge_fonts:
+            self._badge_cache.clear()
+            self._badge_fonts = fonts
         
-        # アクションアイコン（大きく、明確に）
-        icon_x = intent_x + intent_width // 2
-        icon_y = intent_y + intent_height // 2
+        # ActionTypeは@dataclass付きでハッシュ不可のため値で識別
+        key = (action_type.value, damage, hovered, name if hovered else None)
+        badge = self._badge_cache.get(key)
+        if badge is None:
+            if len(self._badge_cache) >= MAX_BADGE_CACHE_SIZE:
+                self._badge_cache.clear()
+            badge = self._compose_intent_badge(action_type, damage, hovered, name, fonts)
+            self._badge_cache[key] = badge
+        return badge
+    
+    def _compose_intent_badge(self, action_type: ActionType, damage: int, hovered: bool,
+                              name: str, fonts: Dict[str, pygame.font.Font]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """背景・アイコン・ダメージ数値・ツールチップを1枚のサーフェスに合成
         
+        Returns:
+            (バッジサーフェス, 描画基準点からのオフセット)
+        """
+        # 描画基準点(0, 0)からの相対位置で部品を並べる
+        box_x = -INTENT_WIDTH // 2
+        box_y = -INTENT_OFFSET_Y
+        parts = [(self._get_background_sprite(INTENT_WIDTH, INTENT_HEIGHT), (box_x, box_y))]
         
-        # 直接ここでアイコンを描画
-        if action_type == ActionType.ATTACK:
-            # 剣：太い白い十字
-            pygame.draw.line(surface, (255, 255, 255), (icon_x, icon_y - 15), (icon_x, icon_y + 15), 5)
-            pygame.draw.line(surface, (255, 255, 255), (icon_x - 10, icon_y), (icon_x + 10, icon_y), 5)
-        elif action_type == ActionType.GUARD:
-            # 盾：白い円
-            pygame.draw.circle(surface, (255, 255, 255), (icon_x, icon_y), 12, 4)
-        else:
-            # デフォルト：白い四角
-            pygame.draw.rect(surface, (255, 255, 255), (icon_x - 8, icon_y - 8, 16, 16))
+        # アクションアイコン（ボックス中央）
+        icon = self._get_icon_sprite(action_type, INTENT_ICON_SIZE)
+        icon_x = box_x + INTENT_WIDTH // 2
+        icon_y = box_y + INTENT_HEIGHT // 2
+        parts.append((icon, (icon_x - icon.get_width() // 2, icon_y - icon.get_height() // 2)))
         
         # ダメージ数値（攻撃の場合）
         if action_type == ActionType.ATTACK and damage > 0:
-            self._draw_damage_number(surface, icon_x, intent_y + intent_height + 10, damage, fonts)
+            font = fonts.get('small', fonts.get('medium'))
+            damage_text = str(damage)
+            number_y = box_y + INTENT_HEIGHT + 10
+            shadow_surface = font.render(damage_text, True, (0, 0, 0))
+            text_surface = font.render(damage_text, True, (255, 255, 255))
+            parts.append((shadow_surface, (icon_x - shadow_surface.get_width() // 2 + 1, number_y + 1)))
+            parts.append((text_surface, (icon_x - text_surface.get_width() // 2, number_y)))
+        
+        # アクション名のツールチップ（ホバー時）
+        if hovered and name and name != '不明':
+            tooltip = self._render_tooltip_sprite(name, fonts)
+            parts.append((tooltip, (icon_x - tooltip.get_width() // 2, box_y - 4 - tooltip.get_height())))
+        
+        # 全部品を包む矩形にまとめる
+        bounds = pygame.Rect(parts[0][1], parts[0][0].get_size())
+        for part, pos in parts[1:]:
+            bounds.union_ip(pygame.Rect(pos, part.get_size()))
+        
+        badge = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for part, (px, py) in parts:
+            badge.blit(part, (px - bounds.x, py - bounds.y))
+        
+        return badge, (bounds.x, bounds.y)
+    
+    @classmethod
+    def _get_background_sprite(cls, width: int, height: int) -> pygame.Surface:
+        """インテント背景のスプライトをサイズごとに1度だけ生成"""
+        key = (width, height)
+        sprite = cls._background_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.rect(sprite, (100, 0, 0), (0, 0, width, height))
+            pygame.draw.rect(sprite, (255, 255, 255), (0, 0, width, height), 3)
+            cls._background_sprites[key] = sprite
+        return sprite
+    
+    @classmethod
+    def _get_icon_sprite(cls, action_type: ActionType, size: int) -> pygame.Surface:
+        """アクションアイコンのスプライトを(行動, サイズ)ごとに1度だけ生成"""
+        key = (action_type.value, size)
+        sprite = cls._icon_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size + 2, size + 2), pygame.SRCALPHA)
+            center = (size + 2) // 2
+            if action_type == ActionType.ATTACK:
+                # 剣：太い白い十字
+                pygame.draw.line(sprite, (255, 255, 255), (center, center - size // 2), (center, center + size // 2), 5)
+                pygame.draw.line(sprite, (255, 255, 255), (center - size // 3, center), (center + size // 3, center), 5)
+            elif action_type == ActionType.GUARD:
+                # 盾：白い円
+                pygame.draw.circle(sprite, (255, 255, 255), (center, center), size * 2 // 5, 4)
+            else:
+                # デフォルト：白い四角
+                half = size * 4 // 15
+                pygame.draw.rect(sprite, (255, 255, 255), (center - half, center - half, half * 2, half * 2))
+            cls._icon_sprites[key] = sprite
+        return sprite
+    
+    def _render_tooltip_sprite(self, name: str, fonts: Dict[str, pygame.font.Font]) -> pygame.Surface:
+        """アクション名のツールチップをサーフェスとして生成"""
+        font = fonts.get('small', fonts.get('medium'))
+        text_surface = font.render(name, True, Colors.WHITE)
+        text_width = text_surface.get_width()
+        text_height = text_surface.get_height()
+        
+        tooltip = pygame.Surface((text_width + 10, text_height + 10), pygame.SRCALPHA)
+        tooltip_rect = tooltip.get_rect()
+        pygame.draw.rect(tooltip, (40, 40, 40), tooltip_rect)
+        pygame.draw.rect(tooltip, (120, 120, 120), tooltip_rect, 1)
+        tooltip.blit(text_surface, (5, 5))
+        return tooltip
     
     def _draw_intent_background(self, surface: pygame.Surface, x: int, y: int, 
                                 width: int, height: int, action_type: ActionType):
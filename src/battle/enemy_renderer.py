@@ -5,9 +5,25 @@ pygame描画関数を使用して各敵タイプの見た目を作成
 
 import pygame
 import math
-from typing import Tuple
+from typing import List, Optional, Tuple
 from .enemy import EnemyType
 from core.constants import Colors
+from core import asset_cache
+
+# 敵タイプごとの画像ファイルと表示サイズ
+ENEMY_SPRITES = {
+    EnemyType.SLIME: ("slime.png", 240),
+    EnemyType.GOBLIN: ("goblin.png", 280),  # ゴブリンはさらに大きく表示
+    EnemyType.ORC: ("オーク.png", 240),
+    EnemyType.GOLEM: ("ゴーレム.png", 240),
+    EnemyType.MAGE: ("mahou.png", 240),
+    EnemyType.DRAGON: ("ドラゴン.png", 240),
+    EnemyType.BOSS_DEMON: ("boss.png", 240),
+}
+
+# HP赤み表現の段階数（HP割合をこの数に量子化して事前生成）
+HP_TINT_LEVELS = 8
+
 
 class EnemyRenderer:
     """敵の描画を担当するクラス"""
@@ -24,6 +40,12 @@ class EnemyRenderer:
         
         # 選択時のエフェクトは削除（シンプルに）
         
+        # 画像がある敵はHP段階ごとの事前生成スプライトを1回blit
+        sprite = EnemyRenderer.get_enemy_sprite(enemy_type, hp_ratio)
+        if sprite is not None:
+            surface.blit(sprite, (center_x - sprite.get_width() // 2, center_y - sprite.get_height() // 2))
+            return
+        
         # HP低下時の赤みエフェクト
         damage_alpha = int((1.0 - hp_ratio) * 100)
         
@@ -43,210 +65,164 @@ class EnemyRenderer:
         elif enemy_type == EnemyType.BOSS_DEMON:
             EnemyRenderer._draw_boss_demon(surface, center_x, center_y, hp_ratio, damage_alpha)
     
+    @staticmethod
+    def get_enemy_sprite(enemy_type: EnemyType, hp_ratio: float) -> Optional[pygame.Surface]:
+        """HP割合に対応する色付け済みスプライトを取得（画像がなければNone）"""
+        variants = EnemyRenderer._get_tint_variants(enemy_type)
+        if not variants:
+            return None
+        level = min(HP_TINT_LEVELS - 1, max(0, int(hp_ratio * HP_TINT_LEVELS)))
+        return variants[level]
+    
+    @staticmethod
+    def _get_tint_variants(enemy_type: EnemyType) -> List[pygame.Surface]:
+        """敵スプライトのHP段階別バリエーションをアセットキャッシュ経由で1度だけ生成"""
+        if enemy_type not in ENEMY_SPRITES:
+            return []
+        filename, size = ENEMY_SPRITES[enemy_type]
+        
+        def build_variants() -> List[pygame.Surface]:
+            base_image = asset_cache.load_image(filename, (size, size))
+            if base_image is None:
+                return []
+            
+            variants = []
+            for level in range(HP_TINT_LEVELS):
+                level_ratio = level / HP_TINT_LEVELS
+                # HPが低い場合は赤みがかった効果
+                if level_ratio < 0.5:
+                    tinted = base_image.copy()
+                    red_overlay = pygame.Surface((size, size))
+                    red_overlay.set_alpha(int((1.0 - level_ratio) * 100))
+                    red_overlay.fill((255, 100, 100))
+                    tinted.blit(red_overlay, (0, 0))
+                    variants.append(tinted)
+                else:
+                    variants.append(base_image)
+            return variants
+        
+        return asset_cache.get_derived(('enemy_hp_tint', filename, size), build_variants)
+    
     @staticmethod
     def _draw_slime(surface: pygame.Surface, center_x: int, center_y: int, 
                     hp_ratio: float, damage_alpha: int):
-        """スライムを描画（画像使用）"""
-        try:
-            import os
-            # slime.png画像を読み込み
-            image_path = os.path.join(os.path.dirname(__file__), '..', '..', 'slime.png')
-            slime_image = pygame.image.load(image_path)
-            # 敵のサイズに合わせてスケール（240x240）
-            slime_image = pygame.transform.scale(slime_image, (240, 240))
-            
-            # HPが低い場合は赤みがかった効果
-            if hp_ratio < 0.5:
-                # 赤いオーバーレイを作成
-                red_overlay = pygame.Surface((240, 240))
-                red_overlay.set_alpha(int((1.0 - hp_ratio) * 100))
-                red_overlay.fill((255, 100, 100))
-                slime_image.blit(red_overlay, (0, 0))
-            
-            # 中央に配置するため位置調整
-            surface.blit(slime_image, (center_x - 120, center_y - 120))
-            print(f"Slime image loaded successfully from {image_path}")
-        except Exception as e:
-            print(f"Failed to load slime image: {e}, using fallback drawing")
-            # フォールバック：従来の描画方式
-            # 本体（緑の円）
-            body_color = (50, 200, 50) if hp_ratio > 0.3 else (200, 100, 50)
-            pygame.draw.circle(surface, body_color, (center_x, center_y + 10), 35)
-            
-            # ハイライト（光沢感）
-            pygame.draw.circle(surface, (100, 255, 100), (center_x - 10, center_y), 15)
-            
-            # 目
-            pygame.draw.circle(surface, Colors.BLACK, (center_x - 12, center_y - 5), 6)
-            pygame.draw.circle(surface, Colors.BLACK, (center_x + 12, center_y - 5), 6)
-            pygame.draw.circle(surface, Colors.WHITE, (center_x - 10, center_y - 7), 3)
-            pygame.draw.circle(surface, Colors.WHITE, (center_x + 14, center_y - 7), 3)
-            
-            # 口
-            if hp_ratio > 0.5:
-                # 元気な笑顔
-                pygame.draw.arc(surface, Colors.BLACK, 
-                              pygame.Rect(center_x - 10, center_y + 5, 20, 15), 
-                              0, math.pi, 3)
-            else:
-                # ダメージ時の困った顔
-                pygame.draw.arc(surface, Colors.BLACK, 
-                              pygame.Rect(center_x - 10, center_y + 15, 20, 10), 
-                              math.pi, 2 * math.pi, 3)
+        """スライムを描画（画像がない場合のフォールバック）"""
+        # フォールバック：従来の描画方式
+        # 本体（緑の円）
+        body_color = (50, 200, 50) if hp_ratio > 0.3 else (200, 100, 50)
+        pygame.draw.circle(surface, body_color, (center_x, center_y + 10), 35)
+        
+        # ハイライト（光沢感）
+        pygame.draw.circle(surface, (100, 255, 100), (center_x - 10, center_y), 15)
+        
+        # 目
+        pygame.draw.circle(surface, Colors.BLACK, (center_x - 12, center_y - 5), 6)
+        pygame.draw.circle(surface, Colors.BLACK, (center_x + 12, center_y - 5), 6)
+        pygame.draw.circle(surface, Colors.WHITE, (center_x - 10, center_y - 7), 3)
+        pygame.draw.circle(surface, Colors.WHITE, (center_x + 14, center_y - 7), 3)
+        
+        # 口
+        if hp_ratio > 0.5:
+            # 元気な笑顔
+            pygame.draw.arc(surface, Colors.BLACK, 
+                          pygame.Rect(center_x - 10, center_y + 5, 20, 15), 
+                          0, math.pi, 3)
+        else:
+            # ダメージ時の困った顔
+            pygame.draw.arc(surface, Colors.BLACK, 
+                          pygame.Rect(center_x - 10, center_y + 15, 20, 10), 
+                          math.pi, 2 * math.pi, 3)
     
     @staticmethod
     def _draw_goblin(surface: pygame.Surface, center_x: int, center_y: int, 
                      hp_ratio: float, damage_alpha: int):
-        """ゴブリンを描画（画像使用）"""
-        try:
-            import os
-            # goblin.png画像を読み込み
-            image_path = os.path.join(os.path.dirname(__file__), '..', '..', 'goblin.png')
-            goblin_image = pygame.image.load(image_path)
-            # ゴブリンをさらに大きく表示（280x280）
-            goblin_image = pygame.transform.scale(goblin_image, (280, 280))
-            
-            # HPが低い場合は赤みがかった効果
-            if hp_ratio < 0.5:
-                # 赤いオーバーレイを作成（サイズ変更）
-                red_overlay = pygame.Surface((280, 280))
-                red_overlay.set_alpha(int((1.0 - hp_ratio) * 100))
-                red_overlay.fill((255, 100, 100))
-                goblin_image.blit(red_overlay, (0, 0))
-            
-            # 中央に配置するため位置調整（サイズ増加に合わせて）
-            surface.blit(goblin_image, (center_x - 140, center_y - 140))
-            print(f"Goblin image loaded successfully from {image_path}")
-        except Exception as e:
-            print(f"Failed to load goblin image: {e}, using fallback drawing")
-            # フォールバック：従来の描画方式
-            # 頭（緑の楕円）
-            head_color = (80, 150, 80) if hp_ratio > 0.3 else (150, 100, 80)
-            pygame.draw.ellipse(surface, head_color, 
-                              pygame.Rect(center_x - 20, center_y - 30, 40, 35))
-            
-            # 体（小さい楕円）
-            body_color = (100, 100, 60) if hp_ratio > 0.3 else (150, 100, 60)
-            pygame.draw.ellipse(surface, body_color, 
-                              pygame.Rect(center_x - 15, center_y - 5, 30, 40))
-            
-            # 耳（尖った三角）
-            ear_color = head_color
-            ear_points = [
-                (center_x - 25, center_y - 20),
-                (center_x - 35, center_y - 35),
-                (center_x - 20, center_y - 25)
-            ]
-            pygame.draw.polygon(surface, ear_color, ear_points)
-            
-            ear_points2 = [
-                (center_x + 25, center_y - 20),
-                (center_x + 35, center_y - 35),
-                (center_x + 20, center_y - 25)
-            ]
-            pygame.draw.polygon(surface, ear_color, ear_points2)
-            
-            # 目（赤い小さい円）
-            pygame.draw.circle(surface, Colors.RED, (center_x - 8, center_y - 18), 4)
-            pygame.draw.circle(surface, Colors.RED, (center_x + 8, center_y - 18), 4)
-            
-            # 武器（簡単な棒）
-            weapon_color = (139, 69, 19)  # 茶色
-            pygame.draw.line(surface, weapon_color, 
-                            (center_x + 25, center_y - 10), 
-                            (center_x + 35, center_y - 25), 4)
+        """ゴブリンを描画（画像がない場合のフォールバック）"""
+        # フォールバック：従来の描画方式
+        # 頭（緑の楕円）
+        head_color = (80, 150, 80) if hp_ratio > 0.3 else (150, 100, 80)
+        pygame.draw.ellipse(surface, head_color, 
+                          pygame.Rect(center_x - 20, center_y - 30, 40, 35))
+        
+        # 体（小さい楕円）
+        body_color = (100, 100, 60) if hp_ratio > 0.3 else (150, 100, 60)
+        pygame.draw.ellipse(surface, body_color, 
+                          pygame.Rect(center_x - 15, center_y - 5, 30, 40))
+        
+        # 耳（尖った三角）
+        ear_color = head_color
+        ear_points = [
+            (center_x - 25, center_y - 20),
+            (center_x - 35, center_y - 35),
+            (center_x - 20, center_y - 25)
+        ]
+        pygame.draw.polygon(surface, ear_color, ear_points)
+        
+        ear_points2 = [
+            (center_x + 25, center_y - 20),
+            (center_x + 35, center_y - 35),
+            (center_x + 20, center_y - 25)
+        ]
+        pygame.draw.polygon(surface, ear_color, ear_points2)
+        
+        # 目（赤い小さい円）
+        pygame.draw.circle(surface, Colors.RED, (center_x - 8, center_y - 18), 4)
+        pygame.draw.circle(surface, Colors.RED, (center_x + 8, center_y - 18), 4)
+        
+        # 武器（簡単な棒）
+        weapon_color = (139, 69, 19)  # 茶色
+        pygame.draw.line(surface, weapon_color, 
+                        (center_x + 25, center_y - 10), 
+                        (center_x + 35, center_y - 25), 4)
     
     @staticmethod
     def _draw_orc(surface: pygame.Surface, center_x: int, center_y: int, 
                   hp_ratio: float, damage_alpha: int):
-        """オークを描画（画像使用）"""
-        try:
-            import os
-            # オーク.png画像を読み込み
-            image_path = os.path.join(os.path.dirname(__file__), '..', '..', 'オーク.png')
-            orc_image = pygame.image.load(image_path)
-            # 敵のサイズに合わせてスケール（240x240）
-            orc_image = pygame.transform.scale(orc_image, (240, 240))
-            
-            # HPが低い場合は赤みがかった効果
-            if hp_ratio < 0.5:
-                # 赤いオーバーレイを作成
-                red_overlay = pygame.Surface((240, 240))
-                red_overlay.set_alpha(int((1.0 - hp_ratio) * 100))
-                red_overlay.fill((255, 100, 100))
-                orc_image.blit(red_overlay, (0, 0))
-            
-            # 中央に配置するため位置調整
-            surface.blit(orc_image, (center_x - 120, center_y - 120))
-            print(f"Orc image loaded successfully from {image_path}")
-        except Exception as e:
-            print(f"Failed to load orc image: {e}, using fallback drawing")
-            # フォールバック：従来の描画方式
-            # 頭（大きい緑の円）
-            head_color = (60, 120, 60) if hp_ratio > 0.3 else (120, 80, 60)
-            pygame.draw.circle(surface, head_color, (center_x, center_y - 15), 25)
-            
-            # 体（大きい長方形）
-            body_color = (80, 80, 40) if hp_ratio > 0.3 else (120, 80, 40)
-            pygame.draw.rect(surface, body_color, 
-                            pygame.Rect(center_x - 20, center_y + 5, 40, 50))
-            
-            # 牙
-            tusk_color = Colors.WHITE
-            pygame.draw.polygon(surface, tusk_color, [
-                (center_x - 8, center_y - 5),
-                (center_x - 12, center_y + 5),
-                (center_x - 5, center_y + 2)
-            ])
-            pygame.draw.polygon(surface, tusk_color, [
-                (center_x + 8, center_y - 5),
-                (center_x + 12, center_y + 5),
-                (center_x + 5, center_y + 2)
-            ])
-            
-            # 目（怒った赤い目）
-            pygame.draw.circle(surface, Colors.RED, (center_x - 10, center_y - 20), 5)
-            pygame.draw.circle(surface, Colors.RED, (center_x + 10, center_y - 20), 5)
-            pygame.draw.circle(surface, Colors.BLACK, (center_x - 10, center_y - 20), 3)
-            pygame.draw.circle(surface, Colors.BLACK, (center_x + 10, center_y - 20), 3)
-            
-            # 腕（筋肉質）
-            arm_color = head_color
-            pygame.draw.ellipse(surface, arm_color, 
-                              pygame.Rect(center_x - 35, center_y + 10, 15, 30))
-            pygame.draw.ellipse(surface, arm_color, 
-                              pygame.Rect(center_x + 20, center_y + 10, 15, 30))
+        """オークを描画（画像がない場合のフォールバック）"""
+        # フォールバック：従来の描画方式
+        # 頭（大きい緑の円）
+        head_color = (60, 120, 60) if hp_ratio > 0.3 else (120, 80, 60)
+        pygame.draw.circle(surface, head_color, (center_x, center_y - 15), 25)
+        
+        # 体（大きい長方形）
+        body_color = (80, 80, 40) if hp_ratio > 0.3 else (120, 80, 40)
+        pygame.draw.rect(surface, body_color, 
+                        pygame.Rect(center_x - 20, center_y + 5, 40, 50))
+        
+        # 牙
+        tusk_color = Colors.WHITE
+        pygame.draw.polygon(surface, tusk_color, [
+            (center_x - 8, center_y - 5),
+            (center_x - 12, center_y + 5),
+            (center_x - 5, center_y + 2)
+        ])
+        pygame.draw.polygon(surface, tusk_color, [
+            (center_x + 8, center_y - 5),
+            (center_x + 12, center_y + 5),
+            (center_x + 5, center_y + 2)
+        ])
+        
+        # 目（怒った赤い目）
+        pygame.draw.circle(surface, Colors.RED, (center_x - 10, center_y - 20), 5)
+        pygame.draw.circle(surface, Colors.RED, (center_x + 10, center_y - 20), 5)
+        pygame.draw.circle(surface, Colors.BLACK, (center_x - 10, center_y - 20), 3)
+        pygame.draw.circle(surface, Colors.BLACK, (center_x + 10, center_y - 20), 3)
+        
+        # 腕（筋肉質）
+        arm_color = head_color
+        pygame.draw.ellipse(surface, arm_color, 
+                          pygame.Rect(center_x - 35, center_y + 10, 15, 30))
+        pygame.draw.ellipse(surface, arm_color, 
+                          pygame.Rect(center_x + 20, center_y + 10, 15, 30))
     
     @staticmethod
     def _draw_golem(surface: pygame.Surface, center_x: int, center_y: int, 
                     hp_ratio: float, damage_alpha: int):
-        """ゴーレムを描画（画像使用）"""
-        try:
-            import os
-            # ゴーレム.png画像を読み込み
-            image_path = os.path.join(os.path.dirname(__file__), '..', '..', 'ゴーレム.png')
-            golem_image = pygame.image.load(image_path)
-            # 敵のサイズに合わせてスケール（240x240）
-            golem_image = pygame.transform.scale(golem_image, (240, 240))
-            
-            # HPが低い場合は赤みがかった効果
-            if hp_ratio < 0.5:
-                # 赤いオーバーレイを作成
-                red_overlay = pygame.Surface((240, 240))
-                red_overlay.set_alpha(int((1.0 - hp_ratio) * 100))
-                red_overlay.fill((255, 100, 100))
-                golem_image.blit(red_overlay, (0, 0))
-            
-            # 中央に配置するため位置調整
-            surface.blit(golem_image, (center_x - 120, center_y - 120))
-            print(f"Golem image loaded successfully from {image_path}")
-        except Exception as e:
-            print(f"Failed to load golem image: {e}, using fallback drawing")
-            # フォールバック：従来の描画方式
-            # 本体（石っぽい灰色の四角）
-            body_color = (120, 120, 120) if hp_ratio > 0.3 else (100, 100, 100)
-            pygame.draw.rect(surface, body_color, 
-                            pygame.Rect(center_x - 25, center_y - 20, 50, 60))
+        """ゴーレムを描画（画像がない場合のフォールバック）"""
+        # フォールバック：従来の描画方式
+        # 本体（石っぽい灰色の四角）
+        body_color = (120, 120, 120) if hp_ratio > 0.3 else (100, 100, 100)
+        pygame.draw.rect(surface, body_color, 
+                        pygame.Rect(center_x - 25, center_y - 20, 50, 60))
         
         # 石の質感（線）
         line_color = (80, 80, 80)
@@ -275,37 +251,16 @@ class EnemyRenderer:
     @staticmethod
     def _draw_mage(surface: pygame.Surface, center_x: int, center_y: int, 
                    hp_ratio: float, damage_alpha: int):
-        """魔導士を描画（画像使用）"""
-        try:
-            import os
-            # mahou.png画像を読み込み
-            image_path = os.path.join(os.path.dirname(__file__), '..', '..', 'mahou.png')
-            mage_image = pygame.image.load(image_path)
-            # 敵のサイズに合わせてスケール（240x240）
-            mage_image = pygame.transform.scale(mage_image, (240, 240))
-            
-            # HPが低い場合は赤みがかった効果
-            if hp_ratio < 0.5:
-                # 赤いオーバーレイを作成
-                red_overlay = pygame.Surface((240, 240))
-                red_overlay.set_alpha(int((1.0 - hp_ratio) * 100))
-                red_overlay.fill((255, 100, 100))
-                mage_image.blit(red_overlay, (0, 0))
-            
-            # 中央に配置するため位置調整
-            surface.blit(mage_image, (center_x - 120, center_y - 120))
-            print(f"Mage image loaded successfully from {image_path}")
-        except Exception as e:
-            print(f"Failed to load mage image: {e}, using fallback drawing")
-            # フォールバック：従来の描画方式
-            # ローブ（青い三角形）
-            robe_color = (50, 50, 200) if hp_ratio > 0.3 else (150, 50, 100)
-            robe_points = [
-                (center_x, center_y - 30),
-                (center_x - 30, center_y + 40),
-                (center_x + 30, center_y + 40)
-            ]
-            pygame.draw.polygon(surface, robe_color, robe_points)
+        """魔導士を描画（画像がない場合のフォールバック）"""
+        # フォールバック：従来の描画方式
+        # ローブ（青い三角形）
+        robe_color = (50, 50, 200) if hp_ratio > 0.3 else (150, 50, 100)
+        robe_points = [
+            (center_x, center_y - 30),
+            (center_x - 30, center_y + 40),
+            (center_x + 30, center_y + 40)
+        ]
+        pygame.draw.polygon(surface, robe_color, robe_points)
         
         # 顔（肌色の円）
         face_color = (255, 220, 177)
@@ -340,33 +295,12 @@ class EnemyRenderer:
     @staticmethod
     def _draw_dragon(surface: pygame.Surface, center_x: int, center_y: int, 
                      hp_ratio: float, damage_alpha: int):
-        """ドラゴンを描画（画像使用）"""
-        try:
-            import os
-            # ドラゴン.png画像を読み込み
-            image_path = os.path.join(os.path.dirname(__file__), '..', '..', 'ドラゴン.png')
-            dragon_image = pygame.image.load(image_path)
-            # 敵のサイズに合わせてスケール（240x240）
-            dragon_image = pygame.transform.scale(dragon_image, (240, 240))
-            
-            # HPが低い場合は赤みがかった効果
-            if hp_ratio < 0.5:
-                # 赤いオーバーレイを作成
-                red_overlay = pygame.Surface((240, 240))
-                red_overlay.set_alpha(int((1.0 - hp_ratio) * 100))
-                red_overlay.fill((255, 100, 100))
-                dragon_image.blit(red_overlay, (0, 0))
-            
-            # 中央に配置するため位置調整
-            surface.blit(dragon_image, (center_x - 120, center_y - 120))
-            print(f"Dragon image loaded successfully from {image_path}")
-        except Exception as e:
-            print(f"Failed to load dragon image: {e}, using fallback drawing")
-            # フォールバック：従来の描画方式
-            # 体（大きい赤い楕円）
-            body_color = (200, 50, 50) if hp_ratio > 0.3 else (150, 100, 100)
-            pygame.draw.ellipse(surface, body_color, 
-                              pygame.Rect(center_x - 30, center_y - 10, 60, 40))
+        """ドラゴンを描画（画像がない場合のフォールバック）"""
+        # フォールバック：従来の描画方式
+        # 体（大きい赤い楕円）
+        body_color = (200, 50, 50) if hp_ratio > 0.3 else (150, 100, 100)
+        pygame.draw.ellipse(surface, body_color, 
+                          pygame.Rect(center_x - 30, center_y - 10, 60, 40))
         
         # 頭（三角っぽい形）
         head_points = [
@@ -413,71 +347,50 @@ class EnemyRenderer:
     @staticmethod
     def _draw_boss_demon(surface: pygame.Surface, center_x: int, center_y: int, 
                          hp_ratio: float, damage_alpha: int):
-        """ボス魔王を描画（画像使用）"""
-        try:
-            import os
-            # boss.png画像を読み込み
-            image_path = os.path.join(os.path.dirname(__file__), '..', '..', 'boss.png')
-            boss_image = pygame.image.load(image_path)
-            # 敵のサイズに合わせてスケール（240x240）
-            boss_image = pygame.transform.scale(boss_image, (240, 240))
-            
-            # HPが低い場合は赤みがかった効果
-            if hp_ratio < 0.5:
-                # 赤いオーバーレイを作成
-                red_overlay = pygame.Surface((240, 240))
-                red_overlay.set_alpha(int((1.0 - hp_ratio) * 100))
-                red_overlay.fill((255, 100, 100))
-                boss_image.blit(red_overlay, (0, 0))
-            
-            # 中央に配置するため位置調整
-            surface.blit(boss_image, (center_x - 120, center_y - 120))
-            print(f"Boss image loaded successfully from {image_path}")
-        except Exception as e:
-            print(f"Failed to load boss image: {e}, using fallback drawing")
-            # フォールバック：従来の描画方式
-            # 体（大きい黒い人型）
-            body_color = (50, 0, 50) if hp_ratio > 0.3 else (100, 50, 50)
-            pygame.draw.ellipse(surface, body_color, 
-                              pygame.Rect(center_x - 25, center_y - 15, 50, 70))
-            
-            # 頭（角の生えた頭）
-            head_color = (80, 0, 80)
-            pygame.draw.circle(surface, head_color, (center_x, center_y - 20), 20)
-            
-            # 角
-            horn_color = Colors.BLACK
-            horn1_points = [
-                (center_x - 15, center_y - 30),
-                (center_x - 20, center_y - 45),
-                (center_x - 10, center_y - 35)
-            ]
-            pygame.draw.polygon(surface, horn_color, horn1_points)
-            
-            horn2_points = [
-                (center_x + 15, center_y - 30),
-                (center_x + 20, center_y - 45),
-                (center_x + 10, center_y - 35)
-            ]
-            pygame.draw.polygon(surface, horn_color, horn2_points)
-            
-            # 目（赤く光る）
-            pygame.draw.circle(surface, Colors.RED, (center_x - 8, center_y - 25), 6)
-            pygame.draw.circle(surface, Colors.RED, (center_x + 8, center_y - 25), 6)
-            pygame.draw.circle(surface, Colors.WHITE, (center_x - 8, center_y - 25), 2)
-            pygame.draw.circle(surface, Colors.WHITE, (center_x + 8, center_y - 25), 2)
-            
-            # 腕（太くて長い）
-            arm_color = body_color
-            pygame.draw.ellipse(surface, arm_color, 
-                              pygame.Rect(center_x - 45, center_y - 5, 20, 40))
-            pygame.draw.ellipse(surface, arm_color, 
-                              pygame.Rect(center_x + 25, center_y - 5, 20, 40))
-            
-            # 邪悪なオーラ（紫の輪）
-            if hp_ratio > 0.7:  # 元気なときのみ
-                aura_color = (100, 0, 100, 100)  # 半透明紫
-                pygame.draw.circle(surface, Colors.PURPLE, 
-                                 (center_x, center_y), 60, 3)
-                pygame.draw.circle(surface, Colors.PURPLE, 
-                                 (center_x, center_y), 70, 2)
\ No newline at end of file
+        """ボス魔王を描画（画像がない場合のフォールバック）"""
+        # フォールバック：従来の描画方式
+        # 体（大きい黒い人型）
+        body_color = (50, 0, 50) if hp_ratio > 0.3 else (100, 50, 50)
+        pygame.draw.ellipse(surface, body_color, 
+                          pygame.Rect(center_x - 25, center_y - 15, 50, 70))
+        
+        # 頭（角の生えた頭）
+        head_color = (80, 0, 80)
+        pygame.draw.circle(surface, head_color, (center_x, center_y - 20), 20)
+        
+        # 角
+        horn_color = Colors.BLACK
+        horn1_points = [
+            (center_x - 15, center_y - 30),
+            (center_x - 20, center_y - 45),
+            (center_x - 10, center_y - 35)
+        ]
+        pygame.draw.polygon(surface, horn_color, horn1_points)
+        
+        horn2_points = [
+            (center_x + 15, center_y - 30),
+            (center_x + 20, center_y - 45),
+            (center_x + 10, center_y - 35)
+        ]
+        pygame.draw.polygon(surface, horn_color, horn2_points)
+        
+        # 目（赤く光る）
+        pygame.draw.circle(surface, Colors.RED, (center_x - 8, center_y - 25), 6)
+        pygame.draw.circle(surface, Colors.RED, (center_x + 8, center_y - 25), 6)
+        pygame.draw.circle(surface, Colors.WHITE, (center_x - 8, center_y - 25), 2)
+        pygame.draw.circle(surface, Colors.WHITE, (center_x + 8, center_y - 25), 2)
+        
+        # 腕（太くて長い）
+        arm_color = body_color
+        pygame.draw.ellipse(surface, arm_color, 
+                          pygame.Rect(center_x - 45, center_y - 5, 20, 40))
+        pygame.draw.ellipse(surface, arm_color, 
+                          pygame.Rect(center_x + 25, center_y - 5, 20, 40))
+        
+        # 邪悪なオーラ（紫の輪）
+        if hp_ratio > 0.7:  # 元気なときのみ
+            aura_color = (100, 0, 100, 100)  # 半透明紫
+            pygame.draw.circle(surface, Colors.PURPLE, 
+                             (center_x, center_y), 60, 3)
+            pygame.draw.circle(surface, Colors.PURPLE, 
+                             (center_x, center_y), 70, 2)
\ No newline at end of file
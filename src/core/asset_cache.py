@@ -0,0 +1,181 @@
+"""
+アセットキャッシュ - 画像・音声の読み込み・スケール・派生サーフェスを1度だけ生成して共有
+先読み（asset_preloader）で読み込んだアセットもここに格納される
+"""
+
+import os
+import wave
+import hashlib
+import tempfile
+import pygame
+import logging
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# プロジェクトルート（画像ファイルの配置場所）
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# (パス, サイズ) -> 読み込み済み画像（失敗時はNone）
+_images: Dict[Tuple[str, Optional[Tuple[int, int]]], Optional[pygame.Surface]] = {}
+
+# 任意のキー -> 派生アセット（色付け済みバリエーションなど）
+_derived: Dict[Hashable, object] = {}
+
+# パス -> 読み込み済み音声（失敗時はNone）
+_sounds: Dict[str, Optional[pygame.mixer.Sound]] = {}
+
+# デコード済みPCM（WAV）のディスクキャッシュ
+SOUND_CACHE_DIR = os.path.join(PROJECT_ROOT, '.sound_cache')
+
+
+def asset_path(*parts: str) -> str:
+    """プロジェクトルートからの相対パスを絶対パスに変換"""
+    return os.path.join(PROJECT_ROOT, *parts)
+
+
+def load_image(path: str, size: Optional[Tuple[int, int]] = None) -> Optional[pygame.Surface]:
+    """画像を読み込み（サイズ指定時はスケール済み）、キャッシュから返す
+
+    Args:
+        path: 画像ファイルのパス（相対パスはプロジェクトルート基準）
+        size: スケール後のサイズ（Noneなら元サイズ）
+
+    Returns:
+        読み込んだサーフェス。読み込めない場合はNone（失敗も記録して再試行しない）
+    """
+    path = _normalize(path)
+    key = (path, tuple(size) if size else None)
+    if key in _images:
+        return _images[key]
+
+    image = None
+    try:
+        if size:
+            original = load_image(path)
+            if original is not None:
+                image = pygame.transform.scale(original, size)
+        else:
+            image = pygame.image.load(path)
+            # 表示モード設定後なら描画用のピクセル形式に変換
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+            logger.debug(f"Loaded image: {path}")
+    except Exception as e:
+        logger.warning(f"Failed to load image {path}: {e}")
+        image = None
+
+    _images[key] = image
+    return image
+
+
+def load_sound(path: str) -> Optional[pygame.mixer.Sound]:
+    """音声を読み込み（デコード済みバッファ）、キャッシュから返す
+
+    Args:
+        path: 音声ファイルのパス（相対パスはプロジェクトルート基準）
+
+    Returns:
+        読み込んだサウンド。読み込めない場合はNone
+    """
+    path = _normalize(path)
+    if path in _sounds:
+        return _sounds[path]
+
+    sound = None
+    try:
+        sound = decode_sound(path)
+        logger.debug(f"Loaded sound: {path}")
+    except Exception as e:
+        logger.warning(f"Failed to load sound {path}: {e}")
+
+    _sounds[path] = sound
+    return sound
+
+
+def decode_sound(path: str, cache_dir: str = SOUND_CACHE_DIR) -> pygame.mixer.Sound:
+    """音声をデコード（ディスク上のPCMキャッシュがあればそれを使う）
+
+    mp3などの圧縮音声は初回にミキサーの形式でデコードし、WAVとして保存する。
+    2回目以降は元ファイルより新しいWAVを読み込み、デコードを省略する。
+    WAVは一時ファイルに書いてから置き換えるため、書き込み途中のファイルを読むことはない。
+    ワーカースレッドからも呼び出せる。
+    """
+    mixer_format = pygame.mixer.get_init()
+    if not mixer_format or path.lower().endswith('.wav'):
+        return pygame.mixer.Sound(path)
+
+    frequency, size, channels = mixer_format
+    cache_path = os.path.join(cache_dir, f"{_sound_cache_key(path)}_{frequency}_{abs(size)}_{channels}.wav")
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            return pygame.mixer.Sound(cache_path)
+    except OSError:
+        pass
+
+    sound = pygame.mixer.Sound(path)
+    # WAVに書けるのは16bit符号付きPCMのみ
+    if size == -16:
+        temp_path = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=cache_dir)
+            with os.fdopen(fd, 'wb') as f, wave.open(f, 'wb') as wav:
+                wav.setnchannels(channels)
+                wav.setsampwidth(2)
+                wav.setframerate(frequency)
+                wav.writeframes(sound.get_raw())
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Failed to write sound cache {cache_path}: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+    return sound
+
+
+def _sound_cache_key(path: str) -> str:
+    """PCMキャッシュのファイル名（別フォルダの同名ファイルと衝突しないよう相対パスのハッシュを含める）"""
+    path = _normalize(path)
+    try:
+        relative = os.path.relpath(path, PROJECT_ROOT).replace(os.sep, '/')
+    except ValueError:
+        # Windowsで別ドライブの場合は絶対パスのまま
+        relative = path
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return f"{stem}_{hashlib.sha1(relative.encode('utf-8')).hexdigest()[:12]}"
+
+
+def store_image(path: str, image: Optional[pygame.Surface]):
+    """読み込み済みの元サイズ画像を登録（先読み用）"""
+    _images[(_normalize(path), None)] = image
+
+
+def store_sound(path: str, sound: Optional[pygame.mixer.Sound]):
+    """読み込み済みの音声を登録（先読み用）"""
+    _sounds[_normalize(path)] = sound
+
+
+def is_loaded(path: str) -> bool:
+    """元サイズの画像、または音声が読み込み済みか"""
+    path = _normalize(path)
+    return (path, None) in _images or path in _sounds
+
+
+def _normalize(path: str) -> str:
+    if not os.path.isabs(path):
+        path = asset_path(path)
+    return os.path.normpath(path)
+
+
+def get_derived(key: Hashable, factory: Callable[[], object]):
+    """派生アセットを取得（未生成ならfactoryで1度だけ生成）"""
+    if key not in _derived:
+        _derived[key] = factory()
+    return _derived[key]
+
+
+def clear():
+    """キャッシュを全て破棄"""
+    _images.clear()
+    _derived.clear()
+    _sounds.clear()
@@ -0,0 +1,132 @@
+"""
+アセット先読み - 画像・音声のデコードをワーカースレッドで行い、アセットキャッシュに格納
+メインスレッドは描画用ピクセル形式への変換（convert_alpha）だけを行う
+"""
+
+import os
+import glob
+import queue
+import logging
+import threading
+from typing import List, Optional, Tuple
+
+import pygame
+
+from core import asset_cache
+
+logger = logging.getLogger(__name__)
+
+# 先読みする画像（プロジェクトルート基準）
+PRELOAD_IMAGES = [
+    "背景.png",          # 戦闘背景
+    "map2.png",          # ダンジョンマップ背景
+    # マップのノードアイコン
+    "雑魚.png", "エリート.png", "宝箱.png", "ショップ.png", "ボス.png", "ランダム.png", "休憩所.png",
+    # ステータスアイコン
+    "HP.png", "gold.png",
+    # 敵画像
+    "slime.png", "goblin.png", "オーク.png", "ゴーレム.png", "mahou.png", "boss.png",
+]
+
+# 先読みする画像・音声フォルダ（パターン）
+PRELOAD_IMAGE_PATTERNS = ["Picture/*.png"]
+PRELOAD_SOUND_PATTERNS = ["SE/*.mp3"]
+
+# 1フレームで変換・登録するアセット数の上限（読み込み画面の描画を止めないため）
+PRELOAD_ITEMS_PER_PUMP = 4
+
+IMAGE = "image"
+SOUND = "sound"
+
+
+def build_preload_manifest() -> List[Tuple[str, str]]:
+    """先読み対象の (種類, 絶対パス) の一覧を作成（存在しないファイルは除外）"""
+    manifest = [(IMAGE, asset_cache.asset_path(name)) for name in PRELOAD_IMAGES]
+    for pattern in PRELOAD_IMAGE_PATTERNS:
+        manifest.extend((IMAGE, path) for path in sorted(glob.glob(asset_cache.asset_path(pattern))))
+    for pattern in PRELOAD_SOUND_PATTERNS:
+        manifest.extend((SOUND, path) for path in sorted(glob.glob(asset_cache.asset_path(pattern))))
+    return [(kind, path) for kind, path in manifest if os.path.exists(path)]
+
+
+class AssetPreloader:
+    """マニフェストのアセットをワーカースレッドで読み込み、メインスレッドでキャッシュに登録"""
+
+    def __init__(self, manifest: Optional[List[Tuple[str, str]]] = None):
+        if manifest is None:
+            manifest = build_preload_manifest()
+        # 読み込み済みのアセットは対象外
+        self.manifest = [(kind, path) for kind, path in manifest if not asset_cache.is_loaded(path)]
+        self.total = len(self.manifest)
+        self.completed = 0
+        self.current_path: Optional[str] = None
+        self._results: "queue.Queue[Tuple[str, str, object]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def progress(self) -> float:
+        """進捗（0.0-1.0）"""
+        if self.total == 0:
+            return 1.0
+        return self.completed / self.total
+
+    @property
+    def done(self) -> bool:
+        return self.completed >= self.total
+
+    @property
+    def started(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        """ワーカースレッドでデコードを開始"""
+        if self._thread is not None:
+            return
+        logger.info(f"Preloading {self.total} assets")
+        self._thread = threading.Thread(target=self._worker, name="AssetPreloader", daemon=True)
+        self._thread.start()
+
+    def _worker(self):
+        """ファイルをデコードして結果キューに送る（ワーカースレッド）"""
+        for kind, path in self.manifest:
+            data = None
+            try:
+                if kind == IMAGE:
+                    data = pygame.image.load(path)
+                elif pygame.mixer.get_init():
+                    data = asset_cache.decode_sound(path)
+            except Exception as e:
+                logger.warning(f"Failed to preload {path}: {e}")
+            self._results.put((kind, path, data))
+
+    def pump(self, max_items: int = PRELOAD_ITEMS_PER_PUMP) -> int:
+        """デコード済みのアセットを変換してキャッシュに登録（メインスレッド）
+
+        Returns:
+            今回登録したアセット数
+        """
+        count = 0
+        while count < max_items:
+            try:
+                kind, path, data = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == IMAGE:
+                if data is not None and pygame.display.get_surface() is not None:
+                    data = data.convert_alpha()
+                asset_cache.store_image(path, data)
+            elif data is not None:
+                asset_cache.store_sound(path, data)
+
+            self.current_path = path
+            self.completed += 1
+            count += 1
+        return count
+
+    def wait(self):
+        """全アセットの読み込み完了まで待つ"""
+        self.start()
+        while not self.done:
+            if not self.pump(self.total):
+                self._thread.join(0.01)
@@ -5,12 +5,13 @@ Drop Puzzle × Roguelike の完全版ぷよぷよデモ
 
 import pygame
 import logging
-import random
 import math
 from typing import List, Optional, Tuple
 
 from .constants import *
 from .game_engine import GameEngine
+from core.rng import get_rng
+from core.input_replay import get_pressed_keys
 from .sound_manager import play_se, SoundType
 from puzzle.puyo_grid import PuyoGrid
 from .simple_special_puyo import simple_special_manager, SimpleSpecialType
@@ -36,6 +37,7 @@ class PuyoPair:
         # 位置（浮動小数点で滑らかな移動）
         self.center_x = float(center_x)  # 軸ぷよのX座標
         self.center_y = -1.0             # 軸ぷよのY座標
+        self.previous_center_y = -1.0    # 前回の更新前のY座標（描画補間用）
         
         # 回転状態（0=上, 1=右, 2=下, 3=左）
         self.rotation = 0
@@ -429,6 +431,7 @@ class PuyoPair:
         
         # 落下処理（段階的移動で衝突判定を確実に行う）
         old_y = self.center_y
+        self.previous_center_y = old_y
         target_y = self.center_y + current_speed * dt
         
         # 落下処理（最適化：段階的移動で重複防止）
@@ -676,6 +679,26 @@ class PuyoPair:
             # 分離が発生中であることを示す（デバッグ用）
             logger.debug(f"Puyo separation in progress: main_fixed={self.main_fixed}, sub_fixed={self.sub_fixed}")
     
+    def _get_render_center_y(self) -> float:
+        """描画用のY座標（前回と今回の更新位置をエンジンの補間係数で補間）"""
+        engine = getattr(self.parent_handler, 'engine', None)
+        alpha = getattr(engine, 'interpolation_alpha', 1.0)
+        fall = self.center_y - self.previous_center_y
+        
+        # 補間は落下中のみ（移動・回転・蹴り上げで位置が飛んだ場合は現在位置）
+        if 0.0 < fall <= 1.0:
+            return self.previous_center_y + fall * alpha
+        return self.center_y
+    
+    def _get_render_y(self, grid: PuyoGrid) -> float:
+        """描画するY座標（行単位の実数）。補間位置が1つ下の行に進めない場合は今の行に揃える"""
+        render_y = self._get_render_center_y()
+        row = int(round(render_y + 1e-10))
+        # 衝突判定は四捨五入した行で行うため、下が埋まっていると半行分まで食い込んだ位置になりうる
+        if render_y > row and not self.can_place_at(grid, self.center_x, row + 1, self.rotation):
+            return float(row)
+        return render_y
+    
     def _determine_special_type(self) -> Optional[SimpleSpecialType]:
         """特殊ぷよタイプを決定（新しいシンプルシステム）"""
         if simple_special_manager.should_spawn_special():
@@ -696,15 +719,16 @@ class PuyoPair:
         if y < 0 or x < 0 or x >= GRID_WIDTH:
             return
         
-        # 重なり防止のため、描画位置を整数グリッドにスナップ
+        # 横方向と重なりチェックは整数の行・列、縦の描画位置は補間した実数の行で行う
         grid_x = int(round(self.center_x + 1e-10))
-        grid_y = int(round(self.center_y + 1e-10))
+        render_y = self._get_render_y(grid)
+        grid_y = int(round(render_y + 1e-10))
         
         if is_main:
-            actual_x, actual_y = grid_x, grid_y
+            offset_x, offset_y = 0, 0
         else:
             offset_x, offset_y = [0, 1, 0, -1][self.rotation], [-1, 0, 1, 0][self.rotation]
-            actual_x, actual_y = grid_x + offset_x, grid_y + offset_y
+        actual_x, actual_y = grid_x + offset_x, grid_y + offset_y
         
         # 既存のぷよとの重なりチェック（視覚的重なり防止）
         # ただし、落下中のぷよは少し上にオフセットして描画することで重なりを回避
@@ -719,7 +743,7 @@ class PuyoPair:
             pixel_y_offset = 0
         
         pixel_x = grid.offset_x + actual_x * grid.puyo_size
-        pixel_y = grid.offset_y + actual_y * grid.puyo_size + pixel_y_offset
+        pixel_y = grid.offset_y + (render_y + offset_y) * grid.puyo_size + pixel_y_offset
         
         rect = pygame.Rect(
             int(pixel_x) + 2,
@@ -869,8 +893,8 @@ class AuthenticDemoHandler:
         """初期NEXTキューを生成（2ペア分に調整）"""
         self.next_pairs_queue = []
         for i in range(2):  # 3つから2つに減らす
-            main_type = random.choice(self.puyo_types)
-            sub_type = random.choice(self.puyo_types)
+            main_type = get_rng('puzzle').choice(self.puyo_types)
+            sub_type = get_rng('puzzle').choice(self.puyo_types)
             
             # NEXTキューでも特殊ぷよ情報を生成（表示用）
             from .simple_special_puyo import simple_special_manager
@@ -897,8 +921,8 @@ class AuthenticDemoHandler:
         next_pair = self.next_pairs_queue.pop(0)
         
         # 新しいペアを末尾に追加
-        new_main = random.choice(self.puyo_types)
-        new_sub = random.choice(self.puyo_types)
+        new_main = get_rng('puzzle').choice(self.puyo_types)
+        new_sub = get_rng('puzzle').choice(self.puyo_types)
         # NEXTキューでも特殊ぷよ情報を生成（表示用）
         from .simple_special_puyo import simple_special_manager
         new_main_special = simple_special_manager.get_random_special_type() if simple_special_manager.should_spawn_special() else None
@@ -987,7 +1011,7 @@ class AuthenticDemoHandler:
         
         # チェイン安全機構：アニメーション中のタイムアウトチェック
         if self.puyo_grid.chain_animation_active:
-            current_time = pygame.time.get_ticks() / 1000.0
+            current_time = self.engine.game_clock.now()
             if self.chain_start_time == 0.0:
                 self.chain_start_time = current_time
             
@@ -1033,13 +1057,13 @@ class AuthenticDemoHandler:
             self.current_pair.post_separation_timer >= self.current_pair.post_separation_control_time):
             return
         
-        keys = pygame.key.get_pressed()
+        keys = get_pressed_keys()
         
         # 横移動の継続的な処理（移動速度制限付き）
         if not hasattr(self, 'move_timer'):
             self.move_timer = 0.0
         
-        current_time = pygame.time.get_ticks() / 1000.0
+        current_time = self.engine.game_clock.now()
         
         # A/Dキーの継続的な処理（0.12秒間隔で本家に近い移動速度）
         if keys[pygame.K_a] and (current_time - self.move_timer) > 0.12:
@@ -1080,7 +1104,7 @@ class AuthenticDemoHandler:
             logger.debug(f"PuyoPair created with special types: main_special={new_pair.main_special}, sub_special={new_pair.sub_special}")
             
             # スポーン直後にキー状態をチェック（Sキー継続対応）
-            keys = pygame.key.get_pressed()
+            keys = get_pressed_keys()
             if keys[pygame.K_s]:
                 self.current_pair.set_fast_fall(True)
                 logger.debug("Fast fall applied to new pair immediately")
@@ -1131,8 +1155,8 @@ class AuthenticDemoHandler:
         next_pair = self.next_pairs_queue.pop(0)
         
         # 新しいペアを末尾に追加
-        new_main = random.choice(self.puyo_types)
-        new_sub = random.choice(self.puyo_types)
+        new_main = get_rng('puzzle').choice(self.puyo_types)
+        new_sub = get_rng('puzzle').choice(self.puyo_types)
         # NEXTキューでは特殊ぷよ情報はNone（実際のペア生成時に決定）
         self.next_pairs_queue.append((new_main, new_sub, None, None))
         
@@ -1278,7 +1302,7 @@ class AuthenticDemoHandler:
                 grid_x, grid_y = self.puyo_grid.pixel_to_grid(mouse_x, mouse_y)
                 
                 if self.puyo_grid.can_place_puyo(grid_x, grid_y):
-                    puyo_type = random.choice(self.puyo_types)
+                    puyo_type = get_rng('puzzle').choice(self.puyo_types)
                     self.puyo_grid.set_puyo(grid_x, grid_y, puyo_type)
                     logger.info(f"Manual placement: {puyo_type.name} at ({grid_x}, {grid_y})")
                     self._execute_chain_check()
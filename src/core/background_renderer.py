@@ -8,6 +8,8 @@ import math
 import random
 from typing import List, Tuple
 from .constants import Colors, SCREEN_WIDTH, SCREEN_HEIGHT
+from core.quality_governor import get_quality_setting
+from core.asset_cache import load_image
 
 class BackgroundRenderer:
     """ダンジョン背景の描画を担当するクラス"""
@@ -21,9 +23,10 @@ class BackgroundRenderer:
             import os
             # プロジェクトルートの背景.pngを使用
             image_path = os.path.join(os.path.dirname(__file__), '..', '..', '背景.png')
-            self.background_image = pygame.image.load(image_path)
-            # 画面サイズに合わせてスケール
-            self.background_image = pygame.transform.scale(self.background_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            # 画面サイズに合わせてスケール（先読み済みならキャッシュから取得）
+            self.background_image = load_image(image_path, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            if self.background_image is None:
+                raise FileNotFoundError(image_path)
             print(f"Background image loaded successfully from {image_path}")
         except Exception as e:
             print(f"Failed to load background image: {e}")
@@ -474,7 +477,9 @@ class BackgroundRenderer:
     
     def _draw_forest_particles(self, surface: pygame.Surface):
         """森の浮遊パーティクル"""
-        for particle in self.floating_particles:
+        # 品質レベルに応じて描画するパーティクル数を絞る
+        visible_count = int(len(self.floating_particles) * get_quality_setting('background_particle_ratio'))
+        for particle in self.floating_particles[:visible_count]:
             alpha = int(particle['alpha'])
             if alpha > 0:
                 particle_color = (150, 200, 100)  # 薄緑
@@ -16,6 +16,21 @@ SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
 FPS = 60
 
+# フレーム時間に応じてエフェクト品質を自動調整するか
+ADAPTIVE_QUALITY = True
+
+# シミュレーションの固定時間刻み（秒）- 更新は常にこの刻みで行い、描画は補間する
+SIMULATION_DT = 1.0 / FPS
+
+# 1フレームで追いつく更新回数の上限（超えた分の遅れは切り捨てる）
+MAX_CATCH_UP_STEPS = 5
+
+# ヘッドレスモードで1フレームごとに進める時間（秒）
+HEADLESS_FIXED_DT = SIMULATION_DT
+
+# ラン全体の乱数シード（Noneなら起動ごとにランダム、整数なら毎回同じランを再現）
+RUN_SEED = None
+
 # 色定義 (R, G, B)
 class Colors:
     BLACK = (0, 0, 0)
@@ -203,6 +218,7 @@ class Keys:
 # ============================================================================
 
 class GameState(Enum):
+    LOADING = "loading"  # アセット読み込み画面
     MENU = "menu"
     PLAYING = "playing"
     BATTLE = "battle"
@@ -227,6 +243,8 @@ DEBUG_MODE = True
 SHOW_FPS = True
 SHOW_GRID = True
 SHOW_CHAIN_INFO = True
+TRACK_SURFACE_ALLOCATIONS = False  # Surface生成を呼び出し元ごとに数える（F1で表示・F10で保存）
+DEBUG_SURFACE_SITES = 6            # デバッグ表示に出すSurface生成の多い呼び出し元の数
 
 # ログレベル
 import logging
@@ -0,0 +1,86 @@
+"""
+描画リスト - フレーム内のblitを集めて Surface.blits でまとめて描画
+要素ごとの surface.blit 呼び出し（Pythonのオーバーヘッド）を減らす
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+# レイヤー（小さいほど先に描画）
+LAYER_EFFECT = 0   # グロウ・リングなどの下地エフェクト
+LAYER_SPRITE = 1   # ぷよ・アイコンなどの本体
+LAYER_OVERLAY = 2  # 本体の上に重ねる文字・パーティクル
+
+
+class DrawList:
+    """描画先とレイヤーごとにblitを集め、flushでまとめて描画する描画リスト"""
+
+    def __init__(self):
+        # (描画先のid, レイヤー) -> (描画先, blitエントリのリスト)
+        self._batches: Dict[Tuple[int, int], Tuple[pygame.Surface, List[tuple]]] = {}
+        self.flushed_blits = 0  # 直近のflushで描画したblit数
+
+    def add(self, target: pygame.Surface, source: pygame.Surface, dest,
+            area: Optional[pygame.Rect] = None, special_flags: int = 0, layer: int = LAYER_SPRITE):
+        """blitを予約（描画はflush時）
+
+        Args:
+            target: 描画先サーフェス
+            source: 描画するサーフェス（flushまで内容・アルファを変更しないこと）
+            dest: 描画位置（座標またはRect）
+            area: 描画元の範囲
+            special_flags: ブレンドフラグ
+            layer: 描画レイヤー（小さいほど先に描画）
+        """
+        key = (id(target), layer)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = (target, [])
+
+        if area is None and not special_flags:
+            batch[1].append((source, dest))
+        else:
+            batch[1].append((source, dest, area, special_flags))
+
+    def flush(self, target: Optional[pygame.Surface] = None) -> int:
+        """予約したblitをレイヤー順に描画
+
+        Args:
+            target: 指定した場合はその描画先の分だけ描画（Noneなら全て）
+
+        Returns:
+            描画したblit数
+        """
+        keys = [key for key, (surface, _) in self._batches.items()
+                if target is None or surface is target]
+        # sortedは安定なので、同じレイヤー内では予約順が保たれる
+        keys.sort(key=lambda key: key[1])
+
+        count = 0
+        for key in keys:
+            surface, entries = self._batches.pop(key)
+            surface.blits(entries, doreturn=False)
+            count += len(entries)
+
+        self.flushed_blits = count
+        return count
+
+    def clear(self):
+        """予約したblitを描画せずに破棄"""
+        self._batches.clear()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for _, entries in self._batches.values())
+
+
+# グローバル描画リストインスタンス
+_draw_list: Optional[DrawList] = None
+
+
+def get_draw_list() -> DrawList:
+    """描画リストのシングルトンインスタンスを取得"""
+    global _draw_list
+    if _draw_list is None:
+        _draw_list = DrawList()
+    return _draw_list
@@ -0,0 +1,201 @@
+"""
+フォントキャッシュ - 日本語フォントの探索結果を保存し、サイズ別フォントを遅延生成
+2回目以降の起動ではフォント候補の探索（読み込み・試し描画）を省略する
+"""
+
+import os
+import json
+import time
+import logging
+import platform
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, Optional
+
+import pygame
+
+from core.constants import FONT_SIZE_SMALL, FONT_SIZE_MEDIUM, FONT_SIZE_LARGE, FONT_SIZE_TITLE
+from core.asset_cache import asset_path
+
+logger = logging.getLogger(__name__)
+
+# 探索結果のキャッシュファイル
+FONT_CACHE_FILE = asset_path('.font_cache.json')
+
+# Windows環境での日本語・絵文字対応フォント（優先順）
+WINDOWS_FONT_DIR = "C:/Windows/Fonts"
+WINDOWS_FONT_PATHS = [
+    "C:/Windows/Fonts/seguiemj.ttf",  # 絵文字対応フォント（優先）
+    "C:/Windows/Fonts/NotoColorEmoji.ttf",  # Google絵文字フォント
+    "C:/Windows/Fonts/msgothic.ttc",
+    "C:/Windows/Fonts/msmincho.ttc",
+    "C:/Windows/Fonts/YuGothM.ttc",
+    "C:/Windows/Fonts/meiryo.ttc",
+]
+
+# フォントが見つからなかった場合にキャッシュの有効性判定に使うフォントフォルダ（OSごと）
+PLATFORM_FONT_DIRS = {
+    'Windows': [WINDOWS_FONT_DIR],
+    'Darwin': ['/System/Library/Fonts', '/Library/Fonts', '~/Library/Fonts'],
+    'Linux': ['/usr/share/fonts', '/usr/local/share/fonts', '~/.local/share/fonts', '~/.fonts'],
+}
+
+# 「見つからなかった」結果を使い回す期間（秒）
+# サブフォルダへのフォント追加はフォントフォルダの更新時刻に現れないため、期限で探索し直す
+NOT_FOUND_CACHE_TTL = 24 * 60 * 60
+
+# システムフォント名での候補（フォールバック）
+SYSTEM_FONT_NAMES = [
+    'Segoe UI Emoji',     # Windows絵文字フォント
+    'Noto Color Emoji',   # Google絵文字フォント
+    'MS Gothic',
+    'MS UI Gothic',
+    'Yu Gothic',
+    'Meiryo',
+    'msgothic',
+    'meiryo'
+]
+
+# 用途別のフォントサイズ
+FONT_SIZES = {
+    'small': FONT_SIZE_SMALL,
+    'medium': FONT_SIZE_MEDIUM,
+    'large': FONT_SIZE_LARGE,
+    'title': FONT_SIZE_TITLE,
+    'japanese': FONT_SIZE_MEDIUM,
+}
+
+
+def _font_can_render(font_path: str) -> bool:
+    """フォントを読み込み、日本語か絵文字を描画できるか試す"""
+    try:
+        test_font = pygame.font.Font(font_path, FONT_SIZE_MEDIUM)
+        test_japanese = test_font.render("ゴブリン", True, (255, 255, 255))
+        test_emoji = test_font.render("⚔️", True, (255, 255, 255))
+        return test_japanese.get_width() > 0 or test_emoji.get_width() > 0
+    except Exception as e:
+        logger.debug(f"Failed to load font from {font_path}: {e}")
+        return False
+
+
+def probe_font_path() -> Optional[str]:
+    """フォント候補を順に試し、使えるフォントファイルのパスを返す（見つからなければNone）"""
+    if platform.system() == "Windows":
+        for font_path in WINDOWS_FONT_PATHS:
+            if os.path.exists(font_path) and _font_can_render(font_path):
+                logger.info(f"Successfully loaded font (Japanese/Emoji) from: {font_path}")
+                return font_path
+
+    for font_name in SYSTEM_FONT_NAMES:
+        try:
+            font_path = pygame.font.match_font(font_name)
+        except Exception as e:
+            logger.debug(f"Failed to look up system font {font_name}: {e}")
+            continue
+        if font_path and _font_can_render(font_path):
+            logger.info(f"Successfully loaded system font (Japanese/Emoji): {font_name}")
+            return font_path
+
+    return None
+
+
+def _cache_stamp(font_path: Optional[str]) -> Optional[float]:
+    """キャッシュの有効性判定に使う更新時刻（フォントファイル、未発見ならこのOSのフォントフォルダの最新）"""
+    targets = [font_path] if font_path else PLATFORM_FONT_DIRS.get(platform.system(), [])
+    stamps = []
+    for target in targets:
+        try:
+            stamps.append(os.path.getmtime(os.path.expanduser(target)))
+        except OSError:
+            continue
+    return max(stamps) if stamps else None
+
+
+def _read_cache(cache_file: str) -> Optional[dict]:
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(cache_file: str, font_path: Optional[str]):
+    entry = {
+        'platform': platform.system(),
+        'path': font_path,
+        'mtime': _cache_stamp(font_path),
+        'checked_at': time.time(),
+    }
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+    except OSError as e:
+        logger.debug(f"Failed to write font cache {cache_file}: {e}")
+
+
+def discover_font_path(cache_file: str = FONT_CACHE_FILE) -> Optional[str]:
+    """日本語フォントのパスを取得（キャッシュが有効なら探索を省略）
+
+    キャッシュはフォントファイル（未発見の場合はこのOSのフォントフォルダ）の更新時刻が
+    保存時と同じ場合のみ有効とする。未発見の結果は NOT_FOUND_CACHE_TTL を過ぎたら探索し直す。
+    """
+    entry = _read_cache(cache_file)
+    if (entry and entry.get('platform') == platform.system()
+            and entry.get('mtime') == _cache_stamp(entry.get('path'))
+            and (entry.get('path') or time.time() - entry.get('checked_at', 0) < NOT_FOUND_CACHE_TTL)):
+        logger.debug(f"Using cached font path: {entry.get('path')}")
+        return entry.get('path')
+
+    font_path = probe_font_path()
+    if font_path is None:
+        logger.error("No Japanese font found! Using system default.")
+    _write_cache(cache_file, font_path)
+    return font_path
+
+
+class FontSet(MutableMapping):
+    """用途名（'small'など）でフォントを引く辞書。各サイズのフォントは初回参照時に生成"""
+
+    def __init__(self, font_path: Optional[str], sizes: Dict[str, int] = FONT_SIZES):
+        self.font_path = font_path
+        self.sizes = dict(sizes)
+        self._fonts: Dict[str, pygame.font.Font] = {}
+        self._by_size: Dict[int, pygame.font.Font] = {}
+
+    def get_size(self, size: int) -> pygame.font.Font:
+        """指定ピクセルサイズのフォントを取得（サイズごとに1度だけ生成）"""
+        font = self._by_size.get(size)
+        if font is None:
+            try:
+                font = pygame.font.Font(self.font_path, size)
+            except Exception as e:
+                logger.error(f"Font loading error: {e}. Using default font.")
+                font = pygame.font.Font(None, size)
+            self._by_size[size] = font
+        return font
+
+    def __getitem__(self, key: str) -> pygame.font.Font:
+        font = self._fonts.get(key)
+        if font is None:
+            if key not in self.sizes:
+                raise KeyError(key)
+            font = self._fonts[key] = self.get_size(self.sizes[key])
+        return font
+
+    def __setitem__(self, key: str, font: pygame.font.Font):
+        self._fonts[key] = font
+        self.sizes.setdefault(key, font.get_height())
+
+    def __delitem__(self, key: str):
+        del self.sizes[key]
+        self._fonts.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.sizes)
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+
+def load_fonts(cache_file: str = FONT_CACHE_FILE) -> FontSet:
+    """日本語フォントを探索（またはキャッシュから取得）し、遅延生成のフォント辞書を返す"""
+    return FontSet(discover_font_path(cache_file))
@@ -0,0 +1,287 @@
+"""
+フレームプロファイラー - フレーム内の処理区間ごとの時間を計測し、直近のフレームの分布を保持
+イベント処理・更新・描画と、その中の各状態・戦闘の各処理の時間を区間として記録し、
+F2のオーバーレイで積み上げグラフと重い区間の上位を表示する（スパイク時は内訳をログに出す）
+"""
+
+import time
+import logging
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import pygame
+
+from core.constants import FPS, Colors
+
+logger = logging.getLogger(__name__)
+
+# 保持するフレーム数（ローリングウィンドウ）
+PROFILE_HISTORY_FRAMES = 240
+
+# フレームの最上位の段階（積み上げグラフの要素、表示順）
+FRAME_PHASES = ('events', 'update', 'render')
+
+# 段階ごとのグラフの色（段階に含まれない時間は 'other'）
+PHASE_COLORS = {
+    'events': (255, 200, 80),
+    'update': (100, 200, 255),
+    'render': (120, 230, 120),
+    'other': (160, 160, 160),
+}
+
+# ヒストグラムの区切り（ミリ秒、最後の区間は上限なし）
+HISTOGRAM_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 33.0, 66.0)
+
+# フレーム予算の何倍を超えたらスパイクとして内訳を記録するか
+SPIKE_FACTOR = 2.0
+
+# オーバーレイの設定
+OVERLAY_TOP_SECTIONS = 8        # 表示する重い区間の数
+OVERLAY_GRAPH_FRAMES = 120      # グラフに表示するフレーム数
+OVERLAY_GRAPH_HEIGHT = 80       # グラフの高さ（ピクセル）
+OVERLAY_GRAPH_SCALE_MS = 33.0   # グラフ上端に対応する時間
+OVERLAY_TEXT_REFRESH = 15       # 文字の更新間隔（フレーム）- 毎フレームの文字描画を避ける
+
+
+class _Section:
+    """計測区間（with文で使う、区間名ごとに1つを使い回す）"""
+
+    __slots__ = ('profiler', 'name')
+
+    def __init__(self, profiler: 'FrameProfiler', name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._push(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.profiler._pop()
+        return False
+
+
+class _NullSection:
+    """計測無効時の何もしない区間"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    """区間ごとのフレーム時間を集計するプロファイラー
+
+    区間は入れ子にでき、親区間の名前と '/' でつないだパス（例: 'update/real_battle/enemy_group'）で記録する。
+    同じフレームで同じ区間が複数回実行された場合（固定刻みの複数回更新など）は合計する。
+    """
+
+    def __init__(self, enabled: bool = True, history: int = PROFILE_HISTORY_FRAMES,
+                 target_fps: int = FPS, clock: Callable[[], float] = time.perf_counter):
+        self.enabled = enabled
+        self.history = history
+        self.frame_budget = 1.0 / target_fps
+        self.clock = clock
+
+        self.frame_times: Deque[float] = deque(maxlen=history)
+        self.samples: Dict[str, Deque[float]] = {}
+        self.frames = 0
+        self.last_spike: Optional[Tuple[float, List[Tuple[str, float]]]] = None
+
+        self._current: Dict[str, float] = {}
+        self._stack: List[Tuple[str, float]] = []
+        self._sections: Dict[str, _Section] = {}
+        self._paths: Dict[Tuple[str, str], str] = {}
+        self._frame_start: Optional[float] = None
+
+    def section(self, name: str):
+        """計測区間を取得（with profiler.section('name'): ...）"""
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def _push(self, name: str):
+        parent = self._stack[-1][0] if self._stack else ''
+        path = self._paths.get((parent, name))
+        if path is None:
+            path = self._paths[(parent, name)] = f"{parent}/{name}" if parent else name
+        self._stack.append((path, self.clock()))
+
+    def _pop(self):
+        path, start = self._stack.pop()
+        self._current[path] = self._current.get(path, 0.0) + (self.clock() - start)
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame_start = self.clock()
+
+    def end_frame(self):
+        """フレームを締めて、区間ごとの時間をローリングウィンドウに追加"""
+        if not self.enabled or self._frame_start is None:
+            self._current.clear()
+            return
+        total = self.clock() - self._frame_start
+        self._frame_start = None
+        self.frame_times.append(total)
+        self.frames += 1
+
+        # このフレームで実行されなかった区間も0として記録（ウィンドウの長さを揃える）
+        for path in self._current:
+            if path not in self.samples:
+                self.samples[path] = deque(maxlen=self.history)
+        for path, samples in self.samples.items():
+            samples.append(self._current.get(path, 0.0))
+
+        if total > self.frame_budget * SPIKE_FACTOR:
+            # 内訳は最も内側の区間（子区間を持たない区間）で示す
+            parents = {path.rsplit('/', 1)[0] for path in self._current if '/' in path}
+            breakdown = sorted(((path, seconds) for path, seconds in self._current.items()
+                                if path not in parents), key=lambda item: item[1], reverse=True)
+            self.last_spike = (total, breakdown[:OVERLAY_TOP_SECTIONS])
+            details = ', '.join(f"{path} {seconds * 1000:.1f}ms" for path, seconds in breakdown[:3])
+            logger.warning(f"Frame spike {total * 1000:.1f}ms: {details}")
+        self._current.clear()
+
+    def reset(self):
+        self.frame_times.clear()
+        self.samples.clear()
+        self.frames = 0
+        self.last_spike = None
+        self._current.clear()
+        self._stack.clear()
+        self._frame_start = None
+
+    def stats(self, path: str) -> Dict[str, float]:
+        """区間のウィンドウ内の統計（ミリ秒）"""
+        samples = self.samples.get(path)
+        if not samples:
+            return {'mean_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+        return {
+            'mean_ms': sum(ordered) / len(ordered) * 1000,
+            'p95_ms': ordered[index] * 1000,
+            'max_ms': ordered[-1] * 1000,
+        }
+
+    def histogram(self, path: str) -> List[int]:
+        """区間のウィンドウ内の時間分布（HISTOGRAM_BUCKETS_MS の区間ごとのフレーム数、最後は上限なし）"""
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for seconds in self.samples.get(path, ()):
+            milliseconds = seconds * 1000
+            bucket = 0
+            while bucket < len(HISTOGRAM_BUCKETS_MS) and milliseconds > HISTOGRAM_BUCKETS_MS[bucket]:
+                bucket += 1
+            counts[bucket] += 1
+        return counts
+
+    def top_sections(self, count: int = OVERLAY_TOP_SECTIONS) -> List[Tuple[str, Dict[str, float]]]:
+        """平均時間の大きい区間の上位（最上位の段階はグラフで表示するため除く）"""
+        entries = [(path, self.stats(path)) for path in self.samples if path not in FRAME_PHASES]
+        entries.sort(key=lambda item: item[1]['mean_ms'], reverse=True)
+        return entries[:count]
+
+    def phase_history(self, frames: int = OVERLAY_GRAPH_FRAMES) -> List[Dict[str, float]]:
+        """直近のフレームの段階別時間（秒）。段階に含まれない時間は 'other'"""
+        totals = list(self.frame_times)[-frames:]
+        if not totals:
+            return []
+        # 区間のウィンドウは末尾がフレーム時間と揃っている（途中から現れた区間は短い）
+        columns = {}
+        for phase in FRAME_PHASES:
+            samples = list(self.samples.get(phase, ()))[-len(totals):]
+            columns[phase] = [0.0] * (len(totals) - len(samples)) + samples
+        history = []
+        for index, total in enumerate(totals):
+            entry = {phase: columns[phase][index] for phase in FRAME_PHASES}
+            entry['other'] = max(0.0, total - sum(entry.values()))
+            history.append(entry)
+        return history
+
+    def summary(self) -> Dict[str, object]:
+        """全区間の統計とヒストグラム（ログ・保存用）"""
+        return {
+            'frames': len(self.frame_times),
+            'frame_mean_ms': sum(self.frame_times) / len(self.frame_times) * 1000 if self.frame_times else 0.0,
+            'histogram_buckets_ms': list(HISTOGRAM_BUCKETS_MS),
+            'sections': {path: dict(self.stats(path), histogram=self.histogram(path))
+                         for path in sorted(self.samples)},
+        }
+
+
+class FrameProfilerOverlay:
+    """プロファイラーの内容を描画するオーバーレイ（積み上げグラフ＋重い区間の上位）"""
+
+    def __init__(self, profiler: FrameProfiler):
+        self.profiler = profiler
+        self._text_surfaces: List[pygame.Surface] = []
+        self._text_frame = -OVERLAY_TEXT_REFRESH
+
+    def draw(self, surface: pygame.Surface, font: pygame.font.Font, topright: Tuple[int, int]):
+        width = OVERLAY_GRAPH_FRAMES * 2
+        left, top = topright[0] - width, topright[1]
+
+        if self.profiler.frames - self._text_frame >= OVERLAY_TEXT_REFRESH:
+            self._text_surfaces = [font.render(line, True, Colors.WHITE) for line in self._text_lines()]
+            self._text_frame = self.profiler.frames
+        line_height = font.get_linesize()
+        height = OVERLAY_GRAPH_HEIGHT + 8 + line_height * len(self._text_surfaces)
+
+        panel = pygame.Rect(left - 6, top - 4, width + 12, height + 8)
+        surface.fill((20, 20, 30), panel)
+        pygame.draw.rect(surface, Colors.UI_BORDER, panel, 1)
+
+        # 段階別の積み上げグラフ（1フレーム = 幅2ピクセル）
+        bottom = top + OVERLAY_GRAPH_HEIGHT
+        pixels_per_second = OVERLAY_GRAPH_HEIGHT / (OVERLAY_GRAPH_SCALE_MS / 1000)
+        history = self.profiler.phase_history(OVERLAY_GRAPH_FRAMES)
+        x = left + width - len(history) * 2
+        for entry in history:
+            y = bottom
+            for phase in FRAME_PHASES + ('other',):
+                bar = min(int(entry[phase] * pixels_per_second), y - top)
+                if bar > 0:
+                    surface.fill(PHASE_COLORS[phase], (x, y - bar, 2, bar))
+                    y -= bar
+            x += 2
+
+        # フレーム予算の線
+        budget_y = bottom - int(self.profiler.frame_budget * pixels_per_second)
+        pygame.draw.line(surface, Colors.RED, (left, budget_y), (left + width, budget_y))
+
+        y = bottom + 8
+        for text_surface in self._text_surfaces:
+            surface.blit(text_surface, (left, y))
+            y += line_height
+
+    def _text_lines(self) -> List[str]:
+        lines = ['  '.join(f"{phase} {self.profiler.stats(phase)['mean_ms']:.1f}" for phase in FRAME_PHASES)]
+        for path, stats in self.profiler.top_sections():
+            lines.append(f"{stats['mean_ms']:5.2f} / {stats['max_ms']:5.1f}ms  {path}")
+        if self.profiler.last_spike:
+            total, breakdown = self.profiler.last_spike
+            culprit = f" {breakdown[0][0]} {breakdown[0][1] * 1000:.1f}ms" if breakdown else ""
+            lines.append(f"last spike {total * 1000:.1f}ms:{culprit}")
+        return lines
+
+
+# グローバルプロファイラーインスタンス
+_frame_profiler: Optional[FrameProfiler] = None
+
+
+def get_frame_profiler() -> FrameProfiler:
+    """フレームプロファイラーのシングルトンインスタンスを取得"""
+    global _frame_profiler
+    if _frame_profiler is None:
+        _frame_profiler = FrameProfiler()
+    return _frame_profiler
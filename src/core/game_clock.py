@@ -0,0 +1,92 @@
+"""
+ゲームクロック - シミュレーション時間の一元管理
+アニメーション・タイマーは壁時計（time.time / get_ticks）ではなくこの時間を参照する
+ポーズ・スロー・早送り・リプレイの高速再生でも同じ結果になる
+"""
+
+import logging
+from typing import Dict, Optional
+
+from core.constants import GameState
+
+logger = logging.getLogger(__name__)
+
+# タイムスケールの範囲（早送りの上限は1フレームの追いつき更新回数で頭打ちになる）
+MIN_TIME_SCALE = 0.1
+MAX_TIME_SCALE = 4.0
+
+# デバッグキー（F5/F6）で切り替えるタイムスケールの段階
+TIME_SCALE_STEPS = (0.25, 0.5, 1.0, 2.0, 4.0)
+
+
+class GameClock:
+    """単調増加するシミュレーション時間と状態ごとのサブクロック"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """時間・ポーズ・タイムスケールを初期状態に戻す"""
+        self.time = 0.0                 # シミュレーション時間（秒）
+        self.real_time = 0.0            # 経過した実時間（秒、ポーズ中も進む）
+        self.time_scale = 1.0
+        self.paused = False
+        self.current_state: Optional[str] = None
+        self.state_times: Dict[str, float] = {}
+
+    def now(self) -> float:
+        """現在のシミュレーション時間（秒）"""
+        return self.time
+
+    def scale_frame_time(self, frame_time: float) -> float:
+        """実時間の経過をシミュレーション時間に換算（ポーズ中は0）"""
+        self.real_time += frame_time
+        if self.paused:
+            return 0.0
+        return frame_time * self.time_scale
+
+    def advance(self, dt: float):
+        """シミュレーション時間を進める（固定刻みの更新ごとに呼ばれる）"""
+        self.time += dt
+        if self.current_state is not None:
+            self.state_times[self.current_state] = self.state_times.get(self.current_state, 0.0) + dt
+
+    def set_time_scale(self, scale: float):
+        """タイムスケールを設定（1.0 = 等速、0.5 = スロー、2.0 = 早送り）"""
+        self.time_scale = max(MIN_TIME_SCALE, min(MAX_TIME_SCALE, scale))
+        logger.info(f"Time scale: {self.time_scale}")
+
+    def step_time_scale(self, direction: int) -> float:
+        """タイムスケールを1段階遅く（-1）または速く（+1）し、新しい値を返す"""
+        if direction > 0:
+            faster = [step for step in TIME_SCALE_STEPS if step > self.time_scale]
+            self.set_time_scale(faster[0] if faster else TIME_SCALE_STEPS[-1])
+        else:
+            slower = [step for step in TIME_SCALE_STEPS if step < self.time_scale]
+            self.set_time_scale(slower[-1] if slower else TIME_SCALE_STEPS[0])
+        return self.time_scale
+
+    def set_paused(self, paused: bool):
+        self.paused = paused
+
+    def enter_state(self, state: GameState):
+        """状態のサブクロックを0から開始"""
+        self.current_state = state.value
+        self.state_times[state.value] = 0.0
+
+    def state_time(self, state: Optional[GameState] = None) -> float:
+        """状態に入ってからのシミュレーション時間（省略時は現在の状態）"""
+        key = state.value if state is not None else self.current_state
+        return self.state_times.get(key, 0.0)
+
+
+# グローバルゲームクロックインスタンス
+_game_clock: Optional[GameClock] = None
+
+
+def get_game_clock() -> GameClock:
+    """ゲームクロックのシングルトンインスタンスを取得"""
+    global _game_clock
+    if _game_clock is None:
+        _game_clock = GameClock()
+    return _game_clock
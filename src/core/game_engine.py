@@ -3,15 +3,28 @@
 Drop Puzzle × Roguelike のコアシステム
 """
 
+import os
 import pygame
 import sys
+import time
 import logging
-from typing import Dict, Optional
+import importlib
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 from core.constants import *
 from core.sound_manager import get_sound_manager
+from core.music_manager import get_music_manager
+from core.game_clock import get_game_clock
+from core.rng import seed_run
+from core.input_replay import InputRecorder, InputReplay, ReplayPlayer, get_input_state
+from core.quality_governor import get_quality_governor
+from core.frame_profiler import get_frame_profiler, FrameProfilerOverlay
+from core.sampling_profiler import SamplingProfiler, default_profile_path, profile_settings_from_env
+from core.surface_tracker import get_surface_tracker, tracking_requested, default_dump_path
+from core.draw_list import get_draw_list
+from core.font_cache import load_fonts
 from core.player_data import PlayerData
 
 # ログ設定
@@ -60,29 +73,81 @@ class GameData:
 class GameEngine:
     """メインゲームエンジン - 状態管理とメインループを担当"""
     
-    def __init__(self):
-        """ゲームエンジン初期化"""
+    def __init__(self, headless: bool = False, render_headless: bool = False,
+                 seed: Optional[int] = None):
+        """ゲームエンジン初期化
+        
+        Args:
+            headless: ウィンドウ・音声なしで、固定dtのまま待機せずに進めるモード
+            render_headless: ヘッドレスでも描画処理を行うか（画面更新はしない）
+            seed: ラン全体の乱数シード（省略時は RUN_SEED、それもNoneならランダム）
+        """
         logger.info("Initializing Game Engine...")
         
+        # ヘッドレスモード（スクリプトからの通しプレイ・負荷試験用）
+        self.headless = headless
+        self.render_enabled = not headless or render_headless
+        self.fixed_dt = SIMULATION_DT
+        
+        # 固定時間刻みシミュレーション（未消化の時間と描画補間係数）
+        self.accumulator = 0.0
+        self.interpolation_alpha = 1.0
+        self.dropped_time = 0.0
+        self.simulation_tick = 0  # 実行した固定刻み更新の回数（入力リプレイの時刻）
+        
+        # 入力の記録・再生
+        self.recorder: Optional[InputRecorder] = None
+        self.record_path: Optional[str] = None
+        self.replay: Optional[ReplayPlayer] = None
+        get_input_state().reset()
+        if headless:
+            # pygame初期化前にSDLのダミードライバーを指定
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        
+        # 起動処理の段階ごとの所要時間（秒、起動ベンチマーク用）
+        self.startup_timings: Dict[str, float] = {}
+        phase_start = time.perf_counter()
+        
         # Pygame初期化
         pygame.init()
         pygame.mixer.init()
+        phase_start = self._record_startup_phase('pygame_init', phase_start)
+        
+        # Surface生成の呼び出し元ごとの集計（フォント生成より前に差し替える）
+        # トラッカーはプロセス共通のため、以前の利用者の集計を消してから数える
+        self.surface_tracker = get_surface_tracker()
+        if tracking_requested(TRACK_SURFACE_ALLOCATIONS):
+            self.surface_tracker.reset()
+            self.surface_tracker.install()
         
         # 画面設定
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Drop Puzzle × Roguelike")
         self.clock = pygame.time.Clock()
+        phase_start = self._record_startup_phase('display', phase_start)
         
         # フォント設定
         self.fonts = self._load_fonts()
+        phase_start = self._record_startup_phase('fonts', phase_start)
         
         # サウンドシステム初期化
         self.sound_manager = get_sound_manager()
+        self.music_manager = get_music_manager()
+        
+        # シミュレーション時間（アニメーション・タイマーはこれを参照する）
+        self.game_clock = get_game_clock()
+        self.game_clock.reset()
+        
+        # ラン全体の乱数シード（シードと入力ログでランを再現できる）
+        self.run_seed = seed_run(seed if seed is not None else RUN_SEED)
+        phase_start = self._record_startup_phase('sound', phase_start)
         
         # ゲーム状態
         self.current_state = GameState.MENU
         self.running = True
         self.paused = False
+        self.game_clock.enter_state(self.current_state)
         
         # ゲームデータ
         self.game_data = GameData()
@@ -98,6 +163,10 @@ class GameEngine:
         self.state_handlers = {}
         self.state_systems = {}
         
+        # 遅延生成するハンドラーのファクトリ（初めてその状態に遷移した時に生成）
+        self.state_factories: Dict[GameState, Callable[[], object]] = {}
+        self.prewarm_queue: List[GameState] = []  # 最初の描画後に1フレーム1つずつ生成
+        
         # 永続データ
         self.persistent_dungeon_map = None  # ダンジョンマップの状態を保持
         
@@ -109,130 +178,145 @@ class GameEngine:
         self.frame_count = 0
         self.fps_counter = 0
         
+        # フレーム時間に応じたエフェクト品質の自動調整
+        self.quality_governor = get_quality_governor()
+        
+        # 区間ごとのフレーム時間（F2で積み上げグラフと重い区間を表示）
+        self.frame_profiler = get_frame_profiler()
+        self.profiler_overlay = FrameProfilerOverlay(self.frame_profiler)
+        self.show_profiler = False
+        
+        # サンプリングプロファイラー（F9で開始・停止、環境変数 PUYO_PROFILE で起動時から記録）
+        profile_path, profile_rate = profile_settings_from_env()
+        self.sampling_profiler = SamplingProfiler(profile_rate, state_provider=lambda: self.current_state.value)
+        self.sampling_profile_path: Optional[str] = None
+        if profile_path:
+            self.start_sampling_profile(profile_path)
+        
+        self._record_startup_phase('engine_state', phase_start)
         logger.info("Game Engine initialized successfully")
     
+    def _record_startup_phase(self, name: str, phase_start: float) -> float:
+        """起動処理の1段階の所要時間を記録し、次の段階の開始時刻を返す"""
+        now = time.perf_counter()
+        self.startup_timings[name] = now - phase_start
+        return now
+    
     def _load_fonts(self) -> Dict[str, pygame.font.Font]:
-        """フォントを読み込み"""
-        fonts = {}
+        """フォントを読み込み（探索結果はキャッシュし、各サイズは初回使用時に生成）"""
+        return load_fonts()
+    
+    def start_new_run(self, seed: Optional[int] = None) -> int:
+        """新しいランの乱数シードを設定（省略時は新しいシードを生成）"""
+        if seed is None and self.replay is not None:
+            # 再生中は記録時と同じシードを使う
+            seed = self.replay.next_seed()
+        self.run_seed = seed_run(seed)
+        if self.recorder is not None:
+            self.recorder.record_seed(self.simulation_tick, self.run_seed)
+        return self.run_seed
+    
+    def start_recording(self, path: Optional[str] = None) -> InputRecorder:
+        """入力の記録を開始（pathを指定すると終了時に保存）"""
+        self.recorder = InputRecorder(self.run_seed, self.simulation_tick)
+        self.record_path = path
+        logger.info(f"Recording input (seed {self.run_seed})")
+        return self.recorder
+    
+    def stop_recording(self) -> Optional[InputRecorder]:
+        """入力の記録を終了（開始時にpathを指定していれば保存）"""
+        recorder, self.recorder = self.recorder, None
+        if recorder is not None and self.record_path:
+            recorder.save(self.record_path)
+        return recorder
+    
+    def start_sampling_profile(self, path: Optional[str] = None):
+        """サンプリングプロファイラーを開始（停止時にpathへ保存、省略時は日時付きのファイル名）"""
+        self.sampling_profile_path = path or default_profile_path()
+        self.sampling_profiler.clear()
+        self.sampling_profiler.start()
+    
+    def stop_sampling_profile(self) -> Optional[str]:
+        """サンプリングプロファイラーを停止して折りたたみスタックを保存し、保存先を返す"""
+        if not self.sampling_profiler.running:
+            return None
+        self.sampling_profiler.stop()
+        path, self.sampling_profile_path = self.sampling_profile_path, None
         try:
-            # Windows用日本語フォント直接読み込み
-            import os
-            import platform
-            
-            japanese_font = None
-            
-            # Windows環境での日本語・絵文字対応フォント読み込み
-            if platform.system() == "Windows":
-                windows_font_paths = [
-                    "C:/Windows/Fonts/seguiemj.ttf",  # 絵文字対応フォント（優先）
-                    "C:/Windows/Fonts/NotoColorEmoji.ttf",  # Google絵文字フォント
-                    "C:/Windows/Fonts/msgothic.ttc",
-                    "C:/Windows/Fonts/msmincho.ttc", 
-                    "C:/Windows/Fonts/YuGothM.ttc",
-                    "C:/Windows/Fonts/meiryo.ttc",
-                ]
-                
-                for font_path in windows_font_paths:
-                    if os.path.exists(font_path):
-                        try:
-                            test_font = pygame.font.Font(font_path, FONT_SIZE_MEDIUM)
-                            # 日本語と絵文字テスト
-                            test_japanese = test_font.render("ゴブリン", True, (255, 255, 255))
-                            test_emoji = test_font.render("A", True, (255, 255, 255))
-                            if ((test_japanese and test_japanese.get_width() > 0) or 
-                                (test_emoji and test_emoji.get_width() > 0)):
-                                japanese_font = test_font
-                                logger.info(f"Successfully loaded font (Japanese/Emoji) from: {font_path}")
-                                break
-                        except Exception as e:
-                            logger.debug(f"Failed to load font from {font_path}: {e}")
-                            continue
-            
-            # システムフォントでの試行（フォールバック）
-            if not japanese_font:
-                japanese_font_names = [
-                    'Segoe UI Emoji',     # Windows絵文字フォント
-                    'Noto Color Emoji',   # Google絵文字フォント
-                    'MS Gothic',
-                    'MS UI Gothic', 
-                    'Yu Gothic',
-                    'Meiryo',
-                    'msgothic',
-                    'meiryo'
-                ]
-                
-                for font_name in japanese_font_names:
-                    try:
-                        test_font = pygame.font.SysFont(font_name, FONT_SIZE_MEDIUM)
-                        # 日本語と絵文字テスト
-                        test_japanese = test_font.render("ゴブリン", True, (255, 255, 255))
-                        test_emoji = test_font.render("⚔️", True, (255, 255, 255))
-                        if ((test_japanese and test_japanese.get_width() > 0) or 
-                            (test_emoji and test_emoji.get_width() > 0)):
-                            japanese_font = test_font
-                            logger.info(f"Successfully loaded system font (Japanese/Emoji): {font_name}")
-                            break
-                    except Exception as e:
-                        logger.debug(f"Failed to load system font {font_name}: {e}")
-                        continue
-            
-            if japanese_font:
-                # 日本語フォントで全サイズ作成
-                try:
-                    # TTCフォントの場合、直接パスから作成
-                    if hasattr(japanese_font, '_pygame_font_path'):
-                        font_path = japanese_font._pygame_font_path
-                        fonts['small'] = pygame.font.Font(font_path, FONT_SIZE_SMALL)
-                        fonts['medium'] = pygame.font.Font(font_path, FONT_SIZE_MEDIUM) 
-                        fonts['large'] = pygame.font.Font(font_path, FONT_SIZE_LARGE)
-                        fonts['title'] = pygame.font.Font(font_path, FONT_SIZE_TITLE)
-                        fonts['japanese'] = japanese_font
-                    else:
-                        # システムフォントの場合
-                        font_family = japanese_font.get_family()[0] if japanese_font.get_family() else 'MS Gothic'
-                        fonts['small'] = pygame.font.SysFont(font_family, FONT_SIZE_SMALL)
-                        fonts['medium'] = pygame.font.SysFont(font_family, FONT_SIZE_MEDIUM)
-                        fonts['large'] = pygame.font.SysFont(font_family, FONT_SIZE_LARGE)
-                        fonts['title'] = pygame.font.SysFont(font_family, FONT_SIZE_TITLE)
-                        fonts['japanese'] = japanese_font
-                except:
-                    # システムフォント方式にフォールバック
-                    fonts['small'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_SMALL)
-                    fonts['medium'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_MEDIUM)
-                    fonts['large'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_LARGE)
-                    fonts['title'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_TITLE)
-                    fonts['japanese'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_MEDIUM)
-            else:
-                # 最終フォールバック
-                logger.error("No Japanese font found! Using system default.")
-                fonts['small'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_SMALL)
-                fonts['medium'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_MEDIUM)
-                fonts['large'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_LARGE)
-                fonts['title'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_TITLE)
-                fonts['japanese'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_MEDIUM)
-                
-        except Exception as e:
-            logger.error(f"Font loading error: {e}. Using emergency fallback.")
-            # 緊急フォールバック - MS Gothicを強制使用
-            try:
-                fonts['small'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_SMALL)
-                fonts['medium'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_MEDIUM)
-                fonts['large'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_LARGE)
-                fonts['title'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_TITLE)
-                fonts['japanese'] = pygame.font.SysFont('MS Gothic', FONT_SIZE_MEDIUM)
-            except:
-                # 最終手段
-                default_font = pygame.font.Font(None, 24)
-                for key in ['small', 'medium', 'large', 'title', 'japanese']:
-                    fonts[key] = default_font
-        
-        return fonts
+            self.sampling_profiler.write_collapsed(path)
+        except OSError as e:
+            logger.error(f"Failed to write sampling profile to {path}: {e}")
+            return None
+        return path
+    
+    def dump_surface_allocations(self, path: Optional[str] = None) -> Optional[str]:
+        """呼び出し元ごとのSurface生成数を保存し、保存先を返す（集計していなければNone）"""
+        if not self.surface_tracker.installed:
+            logger.warning("Surface tracking is off (set TRACK_SURFACE_ALLOCATIONS or PUYO_TRACK_SURFACES=1)")
+            return None
+        path = path or default_dump_path()
+        try:
+            self.surface_tracker.dump(path)
+        except OSError as e:
+            logger.error(f"Failed to write surface allocations to {path}: {e}")
+            return None
+        return path
+    
+    def start_playback(self, replay: InputReplay) -> ReplayPlayer:
+        """記録した入力の再生を開始（記録時のシードでランを開始し直す）"""
+        self.start_new_run(replay.seed)
+        self.replay = ReplayPlayer(replay, self.simulation_tick)
+        get_input_state().reset()
+        logger.info(f"Replaying {len(replay.records)} inputs (seed {replay.seed})")
+        return self.replay
     
     def register_state_handler(self, state: GameState, handler):
         """状態ハンドラーを登録"""
         self.state_handlers[state] = handler
+        self.state_factories.pop(state, None)
         logger.info(f"Registered handler for state: {state}")
     
+    def register_state_factory(self, state: GameState, factory: Callable[[], object]):
+        """状態ハンドラーのファクトリを登録（初めてその状態に遷移した時に生成）"""
+        self.state_factories[state] = factory
+        logger.info(f"Registered lazy handler for state: {state}")
+    
+    def register_lazy_state_handler(self, state: GameState, module_name: str, class_name: str,
+                                    *args, **kwargs):
+        """モジュールのインポートとハンドラーの生成を初回遷移時まで遅らせて登録
+        
+        Args:
+            state: 対象の状態
+            module_name: ハンドラーのモジュール名（例: 'battle.battle_handler'）
+            class_name: ハンドラーのクラス名
+            *args, **kwargs: エンジンの後に渡すコンストラクタ引数
+        """
+        def factory():
+            module = importlib.import_module(module_name)
+            return getattr(module, class_name)(self, *args, **kwargs)
+        
+        self.register_state_factory(state, factory)
+    
+    def prewarm_state_handlers(self, states: List[GameState]):
+        """指定した状態のハンドラーを最初の描画後に先行生成する"""
+        self.prewarm_queue.extend(state for state in states if state not in self.prewarm_queue)
+    
+    def get_state_handler(self, state: GameState):
+        """状態ハンドラーを取得（ファクトリのみ登録されていればここで生成）"""
+        if state not in self.state_handlers and state in self.state_factories:
+            logger.info(f"Creating handler for state: {state}")
+            self.state_handlers[state] = self.state_factories[state]()
+            del self.state_factories[state]
+        return self.state_handlers.get(state)
+    
+    def _prewarm_next_state_handler(self):
+        """先行生成待ちのハンドラーを1つ生成"""
+        while self.prewarm_queue:
+            state = self.prewarm_queue.pop(0)
+            if state in self.state_factories:
+                self.get_state_handler(state)
+                return
+    
     def register_state_system(self, state: GameState, system):
         """状態システムを登録"""
         self.state_systems[state] = system
@@ -240,6 +324,9 @@ class GameEngine:
     
     def change_state(self, new_state: GameState):
         """ゲーム状態を変更"""
+        # 遅延登録されたハンドラーはここで初めて生成
+        self.get_state_handler(new_state)
+        
         if self.current_state != new_state:
             logger.info(f"State change: {self.current_state} -> {new_state}")
             
@@ -253,10 +340,15 @@ class GameEngine:
             old_state = self.current_state
             self.current_state = new_state
             
-            if new_state in self.state_handlers:
-                handler = self.state_handlers[new_state]
-                if hasattr(handler, 'on_enter'):
-                    handler.on_enter(old_state)
+            handler = self.state_handlers.get(new_state)
+            if handler is not None and hasattr(handler, 'on_enter'):
+                handler.on_enter(old_state)
+            
+            # 状態のサブクロックを開始
+            self.game_clock.enter_state(new_state)
+            
+            # BGMを切り替え（フェードは tick で進める）
+            self.music_manager.on_state_change(new_state, handler)
     
     def handle_global_events(self, event: pygame.event.Event) -> bool:
         """グローバルイベント処理（全状態で共通）"""
@@ -271,9 +363,36 @@ class GameEngine:
                 logger.info(f"Debug mode: {self.debug_mode}")
                 return True
             
-            # FPS表示切り替え
+            # FPS表示切り替え（FPS → FPS＋フレームプロファイラー → 非表示）
             elif event.key == pygame.K_F2:
-                self.show_fps = not self.show_fps
+                if self.show_fps and not self.show_profiler:
+                    self.show_profiler = True
+                elif self.show_fps:
+                    self.show_fps = self.show_profiler = False
+                else:
+                    self.show_fps = True
+                return True
+            
+            # サンプリングプロファイラーの開始・停止（停止時に保存、デバッグモード時のみ）
+            elif event.key == pygame.K_F9 and self.debug_mode:
+                if self.sampling_profiler.running:
+                    self.stop_sampling_profile()
+                else:
+                    self.start_sampling_profile()
+                return True
+            
+            # タイムスケール（スロー・早送り）の切り替え（デバッグモード時のみ）
+            elif event.key == pygame.K_F5 and self.debug_mode:
+                self.game_clock.step_time_scale(-1)
+                return True
+            
+            elif event.key == pygame.K_F6 and self.debug_mode:
+                self.game_clock.step_time_scale(1)
+                return True
+            
+            # 呼び出し元ごとのSurface生成数を保存（デバッグモード時のみ）
+            elif event.key == pygame.K_F10 and self.debug_mode:
+                self.dump_surface_allocations()
                 return True
             
             # ポーズ切り替え
@@ -292,6 +411,7 @@ class GameEngine:
         """ポーズ状態を切り替え"""
         if self.current_state != GameState.MENU:
             self.paused = not self.paused
+            self.game_clock.set_paused(self.paused)
             logger.info(f"Game paused: {self.paused}")
     
     def update(self, dt: float):
@@ -299,27 +419,38 @@ class GameEngine:
         if self.paused:
             return
         
+        self.game_clock.advance(dt)
+        
         # ゲーム終了条件チェック（ゲーム中のみ）
         if self.current_state in [GameState.DUNGEON_MAP, GameState.BATTLE, GameState.REAL_BATTLE]:
-            self.condition_manager.check_game_conditions()
-        
-        # 現在の状態のシステムを更新
-        if self.current_state in self.state_systems:
-            system = self.state_systems[self.current_state]
-            if hasattr(system, 'update'):
-                system.update(dt)
-        
-        # 現在の状態のハンドラーを更新
-        if self.current_state in self.state_handlers:
-            handler = self.state_handlers[self.current_state]
-            if hasattr(handler, 'update'):
-                handler.update(dt)
+            with self.frame_profiler.section('conditions'):
+                self.condition_manager.check_game_conditions()
+        
+        with self.frame_profiler.section(self.current_state.value):
+            # 現在の状態のシステムを更新
+            if self.current_state in self.state_systems:
+                system = self.state_systems[self.current_state]
+                if hasattr(system, 'update'):
+                    system.update(dt)
+            
+            # 現在の状態のハンドラーを更新
+            if self.current_state in self.state_handlers:
+                handler = self.state_handlers[self.current_state]
+                if hasattr(handler, 'update'):
+                    handler.update(dt)
         
         # フレームカウント更新
         self.frame_count += 1
     
-    def render(self):
-        """画面描画"""
+    def render(self, alpha: float = 1.0):
+        """画面描画
+        
+        Args:
+            alpha: 前回の更新から次の更新までの補間係数（0.0〜1.0）
+                   落下中のぷよなどは engine.interpolation_alpha を参照して位置を補間する
+        """
+        self.interpolation_alpha = alpha
+        
         # 背景クリア
         self.screen.fill(Colors.UI_BACKGROUND)
         
@@ -327,7 +458,12 @@ class GameEngine:
         if self.current_state in self.state_handlers:
             handler = self.state_handlers[self.current_state]
             if hasattr(handler, 'render'):
-                handler.render(self.screen)
+                with self.frame_profiler.section(self.current_state.value):
+                    handler.render(self.screen)
+        
+        # 描画リストに残ったblitを描画（各描画処理でflushし忘れた分）
+        with self.frame_profiler.section('draw_list'):
+            get_draw_list().flush()
         
         # デバッグ情報描画
         if self.debug_mode:
@@ -335,14 +471,16 @@ class GameEngine:
         
         # FPS表示
         if self.show_fps:
-            self._render_fps()
+            with self.frame_profiler.section('fps_overlay'):
+                self._render_fps()
         
         # ポーズ画面
         if self.paused:
             self._render_pause_overlay()
         
-        # 画面更新
-        pygame.display.flip()
+        # 画面更新（ヘッドレスでは表示しない）
+        if not self.headless:
+            pygame.display.flip()
     
     def _render_debug_info(self):
         """デバッグ情報を描画"""
@@ -351,14 +489,28 @@ class GameEngine:
             f"Frame: {self.frame_count}",
             f"Player HP: {self.game_data.player_hp}/{self.game_data.player_max_hp}",
             f"Floor: {self.game_data.floor}",
+            f"Seed: {self.run_seed}",
             f"Gold: {self.game_data.gold}",
+            f"Time scale: x{self.game_clock.time_scale:g} (F5/F6)",
+            f"Quality: {self.quality_governor.level.name} "
+            f"({self.quality_governor.average_frame_time * 1000:.1f}ms)",
         ]
         
+        # Surface生成の多い呼び出し元（直近のフレームの平均）
+        tracker = self.surface_tracker
+        if tracker.installed:
+            debug_info.append(f"Surfaces: {tracker.frame_mean():.1f}/frame")
+            for entry in tracker.site_stats()[:DEBUG_SURFACE_SITES]:
+                debug_info.append(f"  {entry['mean']:5.1f} {entry['kind']} {entry['site']}")
+        
+        # デバッグ表示自体の文字描画は数えない
+        tracker.suspended = True
         y_offset = 10
         for info in debug_info:
             text_surface = self.fonts['small'].render(info, True, Colors.WHITE)
             self.screen.blit(text_surface, (10, y_offset))
             y_offset += 20
+        tracker.suspended = False
     
     def _render_fps(self):
         """FPS表示"""
@@ -368,6 +520,10 @@ class GameEngine:
         text_rect = text_surface.get_rect()
         text_rect.topright = (SCREEN_WIDTH - 10, 10)
         self.screen.blit(text_surface, text_rect)
+        
+        # フレームプロファイラー（段階別の積み上げグラフと重い区間）
+        if self.show_profiler:
+            self.profiler_overlay.draw(self.screen, self.fonts['small'], (SCREEN_WIDTH - 16, text_rect.bottom + 10))
     
     def _render_pause_overlay(self):
         """ポーズ画面オーバーレイ"""
@@ -388,8 +544,20 @@ class GameEngine:
         self.screen.blit(instruction, instruction_rect)
     
     def handle_events(self):
-        """イベント処理"""
-        for event in pygame.event.get():
+        """イベント処理（記録中は入力を記録し、再生中は記録した入力を流し込む）"""
+        input_state = get_input_state()
+        if self.replay is not None:
+            # 再生中は実際の入力のうちウィンドウを閉じる操作だけを受け付ける
+            events = [event for event in pygame.event.get() if event.type == pygame.QUIT]
+            events.extend(self.replay.pop_events(self.simulation_tick))
+        else:
+            events = pygame.event.get()
+        
+        for event in events:
+            input_state.update(event, replaying=self.replay is not None)
+            if self.recorder is not None:
+                self.recorder.record(self.simulation_tick, event)
+            
             # グローバルイベント処理
             if self.handle_global_events(event):
                 continue
@@ -411,26 +579,102 @@ class GameEngine:
         last_time = pygame.time.get_ticks()
         
         while self.running:
-            # 時間計算
-            current_time = pygame.time.get_ticks()
-            dt = (current_time - last_time) / 1000.0  # 秒単位
-            last_time = current_time
-            
-            # イベント処理
-            self.handle_events()
-            
-            # 更新
-            self.update(dt)
-            
-            # 描画
-            self.render()
+            # 経過時間計算（ヘッドレスは固定dt）
+            if self.headless:
+                frame_time = HEADLESS_FIXED_DT
+            else:
+                current_time = pygame.time.get_ticks()
+                frame_time = (current_time - last_time) / 1000.0  # 秒単位
+                last_time = current_time
             
-            # FPS制限
-            self.clock.tick(FPS)
+            self.tick(frame_time)
         
         logger.info("Game loop ended")
         self.cleanup()
     
+    def tick(self, frame_time: float):
+        """1フレーム分の処理（イベント・固定刻みの更新・補間描画・FPS制限）
+        
+        Args:
+            frame_time: 前フレームからの経過時間（秒）
+        """
+        profiler = self.frame_profiler
+        profiler.begin_frame()
+        if self.surface_tracker.installed:
+            self.surface_tracker.begin_frame()
+        
+        # イベント処理
+        with profiler.section('events'):
+            self.handle_events()
+        
+        # BGMのフェードは実時間で進める（ポーズ・スロー・早送りの影響を受けない）
+        self.music_manager.update(frame_time)
+        
+        # 更新（経過時間をタイムスケールで換算し、固定刻みで消化する）
+        with profiler.section('update'):
+            self.update_fixed_steps(self.game_clock.scale_frame_time(frame_time))
+        
+        # 描画（次の更新までの割合で補間）
+        if self.render_enabled:
+            with profiler.section('render'):
+                self.render(self.interpolation_alpha)
+        
+        # 先行生成を指定されたハンドラーを描画後に1つずつ生成
+        if self.prewarm_queue:
+            self._prewarm_next_state_handler()
+        
+        # FPS制限の待機はフレームの処理時間に含めない
+        profiler.end_frame()
+        if self.surface_tracker.installed:
+            self.surface_tracker.end_frame()
+        
+        # ヘッドレスは待機せずCPUの許す限り進める
+        if self.headless:
+            return
+        
+        # FPS制限
+        self.clock.tick(FPS)
+        
+        # 待機時間を除いた処理時間で品質を調整
+        self.quality_governor.record_frame(self.clock.get_rawtime() / 1000.0)
+    
+    def update_fixed_steps(self, frame_time: float) -> int:
+        """経過時間を固定刻み（fixed_dt）の更新に分けて実行
+        
+        Returns:
+            実行した更新回数
+        """
+        self.accumulator += max(0.0, frame_time)
+        
+        steps = 0
+        while self.accumulator >= self.fixed_dt and steps < MAX_CATCH_UP_STEPS:
+            self.update(self.fixed_dt)
+            self.accumulator -= self.fixed_dt
+            self.simulation_tick += 1
+            steps += 1
+        
+        # 上限を超えた遅れは切り捨てる（長いフレームの後に更新が連鎖して重くならないように）
+        if self.accumulator >= self.fixed_dt:
+            dropped = self.accumulator - self.accumulator % self.fixed_dt
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+            logger.debug(f"Dropped {dropped * 1000:.1f}ms of simulation time")
+        
+        self.interpolation_alpha = self.accumulator / self.fixed_dt
+        return steps
+    
+    def advance(self, frames: int) -> int:
+        """固定dtで指定フレーム数だけ進める（スクリプトからの駆動用）
+        
+        Returns:
+            実際に進めたフレーム数（途中で終了した場合は少なくなる）
+        """
+        for frame in range(frames):
+            if not self.running:
+                return frame
+            self.tick(HEADLESS_FIXED_DT)
+        return frames
+    
     def quit_game(self):
         """ゲーム終了"""
         logger.info("Quitting game...")
@@ -440,6 +684,11 @@ class GameEngine:
         """リソース解放"""
         logger.info("Cleaning up resources...")
         
+        # 記録中の入力・プロファイルを保存
+        self.stop_recording()
+        self.stop_sampling_profile()
+        self.surface_tracker.uninstall()
+        
         # Pygame終了
         pygame.mixer.quit()
         pygame.quit()
@@ -457,6 +706,14 @@ def create_text_surface(font: pygame.font.Font, text: str, color: tuple,
         return font.render(text, True, color)
 
 
+def get_mouse_pos() -> Tuple[int, int]:
+    """現在のマウス位置を取得（入力リプレイ中は記録されたマウス位置）"""
+    virtual_pos = get_input_state().virtual_mouse_pos
+    if virtual_pos is not None:
+        return virtual_pos
+    return pygame.mouse.get_pos()
+
+
 def has_japanese_characters(text: str) -> bool:
     """テキストに日本語文字が含まれているかチェック"""
     for char in text:
@@ -5,11 +5,11 @@ Drop Puzzle × Roguelike のビジュアル改善版デモ
 
 import pygame
 import logging
-import random
 from typing import List, Optional
 
 from .constants import *
 from .game_engine import GameEngine
+from core.rng import get_rng
 from puzzle.puyo_grid import PuyoGrid
 
 logger = logging.getLogger(__name__)
@@ -218,8 +218,8 @@ class ImprovedDemoHandler:
             logger.warning("No available columns for spawning")
             return
         
-        column = random.choice(available_columns)
-        puyo_type = random.choice(self.puyo_types)
+        column = get_rng('puzzle').choice(available_columns)
+        puyo_type = get_rng('puzzle').choice(self.puyo_types)
         
         # 落下ぷよ作成
         falling_puyo = FallingDemoPuyo(puyo_type, column)
@@ -298,7 +298,7 @@ class ImprovedDemoHandler:
                     grid_x, grid_y = self.puyo_grid.pixel_to_grid(mouse_x, mouse_y)
                     
                     if self.puyo_grid.can_place_puyo(grid_x, grid_y):
-                        puyo_type = random.choice(self.puyo_types)
+                        puyo_type = get_rng('puzzle').choice(self.puyo_types)
                         self.puyo_grid.set_puyo(grid_x, grid_y, puyo_type)
                         logger.info(f"Manual placement: {puyo_type.name} at ({grid_x}, {grid_y})")
                         
@@ -0,0 +1,261 @@
+"""
+入力リプレイ - ゲーム入力をシミュレーションtick付きで記録・再生
+記録はvarintの可変長バイナリで、ラン開始シードと一緒に保存する
+再生時はヘッドレスで GameEngine.handle_events にそのまま流し込み、プレイヤー報告の再現や実プレイのベンチマークに使う
+"""
+
+import logging
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+REPLAY_MAGIC = b'PRPL'
+REPLAY_VERSION = 1
+
+# 記録する入力の種類
+KIND_KEYDOWN = 1
+KIND_KEYUP = 2
+KIND_MOUSEDOWN = 3
+KIND_MOUSEUP = 4
+KIND_MOUSEMOTION = 5
+KIND_MOUSEWHEEL = 6
+KIND_SEED = 7       # ラン途中の再シード（リトライ・新しいゲーム）
+
+RECORDED_EVENT_KINDS: Dict[int, int] = {
+    pygame.KEYDOWN: KIND_KEYDOWN,
+    pygame.KEYUP: KIND_KEYUP,
+    pygame.MOUSEBUTTONDOWN: KIND_MOUSEDOWN,
+    pygame.MOUSEBUTTONUP: KIND_MOUSEUP,
+    pygame.MOUSEMOTION: KIND_MOUSEMOTION,
+    pygame.MOUSEWHEEL: KIND_MOUSEWHEEL,
+}
+
+
+def write_varint(buffer: bytearray, value: int):
+    """非負整数をvarint（7bitずつ、上位bitが継続フラグ）で書き込み"""
+    if value < 0:
+        raise ValueError(f"varint must be non-negative: {value}")
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """varintを読み込み、(値, 次の位置) を返す"""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def zigzag(value: int) -> int:
+    """符号付き整数を非負整数に変換（小さな負数も短く書けるように）"""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value: int) -> int:
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+
+class InputState:
+    """イベントから求めた入力状態（記録時と再生時で同じ結果になるようにする）"""
+
+    def __init__(self):
+        self.held_keys: Set[int] = set()
+        self.virtual_mouse_pos: Optional[Tuple[int, int]] = None  # 再生中のみ設定
+
+    def reset(self):
+        self.held_keys.clear()
+        self.virtual_mouse_pos = None
+
+    def update(self, event: pygame.event.Event, replaying: bool = False):
+        if event.type == pygame.KEYDOWN:
+            self.held_keys.add(event.key)
+        elif event.type == pygame.KEYUP:
+            self.held_keys.discard(event.key)
+        elif replaying and event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            self.virtual_mouse_pos = event.pos
+
+
+class PressedKeys:
+    """pygame.key.get_pressed() と同じ添字アクセスができる押下中キー一覧"""
+
+    def __init__(self, held_keys: Set[int]):
+        self._held_keys = held_keys
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._held_keys
+
+
+class InputRecorder:
+    """入力をシミュレーションtick付きで記録するクラス"""
+
+    def __init__(self, seed: int, start_tick: int = 0):
+        self.seed = seed
+        self.start_tick = start_tick
+        self.last_tick = 0
+        self.event_count = 0
+        self.buffer = bytearray(REPLAY_MAGIC)
+        self.buffer.append(REPLAY_VERSION)
+        write_varint(self.buffer, seed)
+
+    def _begin_record(self, tick: int, kind: int):
+        tick -= self.start_tick
+        write_varint(self.buffer, tick - self.last_tick)
+        self.buffer.append(kind)
+        self.last_tick = tick
+        self.event_count += 1
+
+    def record(self, tick: int, event: pygame.event.Event) -> bool:
+        """イベントを記録（ゲーム入力以外は無視してFalseを返す）"""
+        kind = RECORDED_EVENT_KINDS.get(event.type)
+        if kind is None:
+            return False
+
+        self._begin_record(tick, kind)
+        if kind in (KIND_KEYDOWN, KIND_KEYUP):
+            write_varint(self.buffer, event.key)
+            write_varint(self.buffer, event.mod)
+            text = getattr(event, 'unicode', '').encode('utf-8') if kind == KIND_KEYDOWN else b''
+            write_varint(self.buffer, len(text))
+            self.buffer.extend(text)
+        elif kind == KIND_MOUSEWHEEL:
+            write_varint(self.buffer, zigzag(event.x))
+            write_varint(self.buffer, zigzag(event.y))
+        else:
+            x, y = event.pos
+            write_varint(self.buffer, max(0, x))
+            write_varint(self.buffer, max(0, y))
+            if kind != KIND_MOUSEMOTION:
+                write_varint(self.buffer, event.button)
+        return True
+
+    def record_seed(self, tick: int, seed: int):
+        """ラン途中の再シードを記録"""
+        self._begin_record(tick, KIND_SEED)
+        write_varint(self.buffer, seed)
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.buffer)
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            f.write(self.buffer)
+        logger.info(f"Saved input replay: {path} ({self.event_count} inputs, {len(self.buffer)} bytes)")
+
+
+class InputReplay:
+    """記録した入力を読み込み、tickごとにpygameイベントとして取り出すクラス"""
+
+    def __init__(self, seed: int, records: List[Tuple[int, int, object]]):
+        self.seed = seed
+        self.records = records      # (tick, kind, pygameイベント or シード)
+        self.duration_ticks = records[-1][0] if records else 0
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'InputReplay':
+        if data[:len(REPLAY_MAGIC)] != REPLAY_MAGIC:
+            raise ValueError("Not an input replay file")
+        offset = len(REPLAY_MAGIC)
+        version = data[offset]
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {version}")
+        seed, offset = read_varint(data, offset + 1)
+
+        records = []
+        tick = 0
+        while offset < len(data):
+            delta, offset = read_varint(data, offset)
+            tick += delta
+            kind = data[offset]
+            offset += 1
+            if kind in (KIND_KEYDOWN, KIND_KEYUP):
+                key, offset = read_varint(data, offset)
+                mod, offset = read_varint(data, offset)
+                length, offset = read_varint(data, offset)
+                text = data[offset:offset + length].decode('utf-8')
+                offset += length
+                event_type = pygame.KEYDOWN if kind == KIND_KEYDOWN else pygame.KEYUP
+                payload = pygame.event.Event(event_type, key=key, mod=mod, unicode=text, scancode=0)
+            elif kind == KIND_MOUSEWHEEL:
+                x, offset = read_varint(data, offset)
+                y, offset = read_varint(data, offset)
+                payload = pygame.event.Event(pygame.MOUSEWHEEL, x=unzigzag(x), y=unzigzag(y), flipped=False)
+            elif kind == KIND_SEED:
+                payload, offset = read_varint(data, offset)
+            elif kind in (KIND_MOUSEDOWN, KIND_MOUSEUP, KIND_MOUSEMOTION):
+                x, offset = read_varint(data, offset)
+                y, offset = read_varint(data, offset)
+                if kind == KIND_MOUSEMOTION:
+                    payload = pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0))
+                else:
+                    button, offset = read_varint(data, offset)
+                    event_type = pygame.MOUSEBUTTONDOWN if kind == KIND_MOUSEDOWN else pygame.MOUSEBUTTONUP
+                    payload = pygame.event.Event(event_type, pos=(x, y), button=button)
+            else:
+                raise ValueError(f"Unknown replay record kind: {kind}")
+            records.append((tick, kind, payload))
+        return cls(seed, records)
+
+    @classmethod
+    def load(cls, path: str) -> 'InputReplay':
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayPlayer:
+    """再生位置を管理し、現在のtickまでの入力を順に返すクラス"""
+
+    def __init__(self, replay: InputReplay, start_tick: int = 0):
+        self.replay = replay
+        self.start_tick = start_tick
+        self.pending: Deque[Tuple[int, int, object]] = deque(replay.records)
+        self.seeds: Deque[int] = deque()
+
+    @property
+    def finished(self) -> bool:
+        return not self.pending
+
+    def pop_events(self, tick: int) -> List[pygame.event.Event]:
+        """指定tickまでに記録された入力を取り出す（再シードは next_seed 用に保持）"""
+        tick -= self.start_tick
+        events = []
+        while self.pending and self.pending[0][0] <= tick:
+            _, kind, payload = self.pending.popleft()
+            if kind == KIND_SEED:
+                self.seeds.append(payload)
+            else:
+                events.append(payload)
+        return events
+
+    def next_seed(self) -> Optional[int]:
+        """記録時にラン途中で設定されたシード（なければNone）"""
+        if not self.seeds and self.pending and self.pending[0][1] == KIND_SEED:
+            self.seeds.append(self.pending.popleft()[2])
+        return self.seeds.popleft() if self.seeds else None
+
+
+# グローバル入力状態インスタンス
+_input_state: Optional[InputState] = None
+
+
+def get_input_state() -> InputState:
+    """入力状態のシングルトンインスタンスを取得"""
+    global _input_state
+    if _input_state is None:
+        _input_state = InputState()
+    return _input_state
+
+
+def get_pressed_keys() -> PressedKeys:
+    """押下中のキー（pygame.key.get_pressed() の代わりに使い、記録・再生で同じ結果にする）"""
+    return PressedKeys(get_input_state().held_keys)
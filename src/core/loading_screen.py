@@ -0,0 +1,79 @@
+"""
+読み込み画面ハンドラー - アセットの先読み中に進捗を表示
+読み込みが終わると指定した状態に遷移する
+"""
+
+import os
+import pygame
+import logging
+from typing import Optional
+
+from .constants import *
+from .game_engine import GameEngine
+from .asset_preloader import AssetPreloader
+
+logger = logging.getLogger(__name__)
+
+# 進捗バーのサイズ
+LOADING_BAR_WIDTH = 600
+LOADING_BAR_HEIGHT = 24
+
+
+class LoadingScreenHandler:
+    """アセット先読みの進捗を表示する読み込み画面"""
+
+    def __init__(self, engine: GameEngine, next_state: GameState = GameState.MENU,
+                 preloader: Optional[AssetPreloader] = None):
+        self.engine = engine
+        self.next_state = next_state
+        self.preloader = preloader or AssetPreloader()
+
+        logger.info("Loading screen handler initialized")
+
+    def on_enter(self, previous_state):
+        """状態開始時の処理（先読み開始）"""
+        self.preloader.start()
+
+    def on_exit(self):
+        """状態終了時の処理"""
+        logger.info(f"Preloaded {self.preloader.completed}/{self.preloader.total} assets")
+
+    def handle_event(self, event: pygame.event.Event):
+        """イベント処理（読み込み中は操作なし）"""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.engine.quit_game()
+
+    def update(self, dt: float):
+        """読み込み済みアセットを登録し、完了したら次の状態へ"""
+        self.preloader.start()
+        self.preloader.pump()
+        if self.preloader.done:
+            # 先読みしたバッファからSEと連鎖音を用意
+            self.engine.sound_manager.load_sounds()
+            self.engine.change_state(self.next_state)
+
+    def render(self, surface: pygame.Surface):
+        """進捗バーを描画"""
+        center_x = SCREEN_WIDTH // 2
+        center_y = SCREEN_HEIGHT // 2
+
+        # タイトル
+        title_text = self.engine.fonts['large'].render("Now Loading...", True, Colors.WHITE)
+        surface.blit(title_text, title_text.get_rect(center=(center_x, center_y - 50)))
+
+        # 進捗バー
+        bar_rect = pygame.Rect(0, 0, LOADING_BAR_WIDTH, LOADING_BAR_HEIGHT)
+        bar_rect.center = (center_x, center_y)
+        pygame.draw.rect(surface, Colors.DARK_GRAY, bar_rect)
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(LOADING_BAR_WIDTH * self.preloader.progress)
+        if fill_rect.width > 0:
+            pygame.draw.rect(surface, Colors.CYAN, fill_rect)
+        pygame.draw.rect(surface, Colors.WHITE, bar_rect, 2)
+
+        # 件数と読み込み中のファイル
+        status = f"{self.preloader.completed} / {self.preloader.total}"
+        if self.preloader.current_path:
+            status += f"  {os.path.basename(self.preloader.current_path)}"
+        status_text = self.engine.fonts['small'].render(status, True, Colors.LIGHT_GRAY)
+        surface.blit(status_text, status_text.get_rect(center=(center_x, center_y + 40)))
@@ -9,7 +9,7 @@ import math
 from typing import List, Optional
 
 from .constants import *
-from .game_engine import GameEngine
+from .game_engine import GameEngine, get_mouse_pos
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +75,7 @@ class MenuHandler:
         self.title_pulse += dt * 2.0
         
         # マウス位置でホバー状態を更新
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = get_mouse_pos()
         self._update_hover_state(mouse_pos)
     
     def handle_event(self, event: pygame.event.Event):
@@ -0,0 +1,160 @@
+"""
+ミュージックマネージャー - 状態ごとのBGMをディスクからストリーミング再生
+曲の切り替えはフレームごとの更新でフェードアウト→フェードインし、フレームを止めない
+"""
+
+import os
+import logging
+from typing import Dict, Optional
+
+import pygame
+
+from core.constants import GameState
+from core.asset_cache import asset_path
+
+logger = logging.getLogger(__name__)
+
+# BGMフォルダ（プロジェクトルート基準）
+BGM_FOLDER = "BGM"
+
+# 曲名 -> ファイル名（拡張子なし、MUSIC_EXTENSIONSの順に探す）
+MUSIC_TRACKS: Dict[str, str] = {
+    'menu': "menu",
+    'map': "map",
+    'battle': "battle",
+    'boss': "boss",
+    'shop': "shop",
+    'rest': "rest",
+}
+MUSIC_EXTENSIONS = (".ogg", ".mp3", ".wav")
+
+# 状態ごとの曲（ここにない状態では現在の曲を流し続ける）
+# core.constants と src.core.constants の両方から GameState が読み込まれることがあるため、値の文字列で引く
+STATE_MUSIC: Dict[str, str] = {
+    GameState.MENU.value: 'menu',
+    GameState.DUNGEON_MAP.value: 'map',
+    GameState.REAL_BATTLE.value: 'battle',
+    GameState.SHOP.value: 'shop',
+    GameState.REST.value: 'rest',
+}
+
+MUSIC_VOLUME = 0.5
+MUSIC_FADE_OUT_TIME = 0.6   # 秒（フレーム更新で音量を下げる）
+MUSIC_FADE_IN_MS = 800      # ミリ秒（ミキサー側でフェードイン）
+
+
+class MusicManager:
+    """pygame.mixer.music で状態ごとのBGMをクロスフェード再生するクラス"""
+
+    def __init__(self, volume: float = MUSIC_VOLUME):
+        self.volume = volume
+        self.enabled = pygame.mixer.get_init() is not None
+        self.current_track: Optional[str] = None
+        self.next_track: Optional[str] = None
+        self.fading_out = False
+        self.fade_elapsed = 0.0
+
+        # 次の曲のファイルを切り替え前に開いておく（切り替え時にパス解決・オープンをしない）
+        self._next_handle = None
+        self._current_handle = None
+
+    def find_track_path(self, track: str) -> Optional[str]:
+        """曲名に対応するファイルのパスを取得（なければNone）"""
+        name = MUSIC_TRACKS.get(track)
+        if not name:
+            return None
+        for extension in MUSIC_EXTENSIONS:
+            path = asset_path(BGM_FOLDER, name + extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def on_state_change(self, state: GameState, handler=None):
+        """状態変更時の曲切り替え（ハンドラーの music_track があればそちらを優先）"""
+        track = getattr(handler, 'music_track', None) or STATE_MUSIC.get(state.value)
+        if track:
+            self.play(track)
+
+    def play(self, track: str):
+        """曲を切り替える（再生中の曲はフェードアウトしてから次の曲へ）"""
+        if not self.enabled:
+            return
+        if track == (self.next_track if self.fading_out else self.current_track):
+            return
+
+        self._close_next_handle()
+        path = self.find_track_path(track)
+        if path:
+            try:
+                self._next_handle = open(path, 'rb')
+            except OSError as e:
+                logger.warning(f"Failed to open music {path}: {e}")
+        else:
+            logger.debug(f"Music track not found: {track}")
+        self.next_track = track
+
+        if self.current_track is None or not pygame.mixer.music.get_busy():
+            self._start_next()
+        elif not self.fading_out:
+            self.fading_out = True
+            self.fade_elapsed = 0.0
+
+    def update(self, dt: float):
+        """フェードアウトを進め、終わったら次の曲を開始"""
+        if not self.fading_out:
+            return
+        self.fade_elapsed += dt
+        remaining = max(0.0, 1.0 - self.fade_elapsed / MUSIC_FADE_OUT_TIME)
+        pygame.mixer.music.set_volume(self.volume * remaining)
+        if remaining <= 0.0:
+            self.fading_out = False
+            self._start_next()
+
+    def stop(self):
+        """BGMを停止"""
+        if not self.enabled:
+            return
+        pygame.mixer.music.stop()
+        self.fading_out = False
+        self.current_track = None
+        self._close_next_handle()
+
+    def _start_next(self):
+        """開いておいた次の曲をストリーミング再生（全体をメモリに展開しない）"""
+        pygame.mixer.music.stop()
+        handle, self._next_handle = self._next_handle, None
+        self.current_track = self.next_track
+        if handle is None:
+            return
+
+        try:
+            pygame.mixer.music.load(handle, os.path.splitext(handle.name)[1][1:])
+            pygame.mixer.music.set_volume(self.volume)
+            pygame.mixer.music.play(loops=-1, fade_ms=MUSIC_FADE_IN_MS)
+            logger.info(f"Playing music: {self.current_track}")
+        except pygame.error as e:
+            logger.warning(f"Failed to play music {handle.name}: {e}")
+            handle.close()
+            return
+
+        # 前の曲のファイルは読み込み終了後に閉じる
+        if self._current_handle is not None:
+            self._current_handle.close()
+        self._current_handle = handle
+
+    def _close_next_handle(self):
+        if self._next_handle is not None:
+            self._next_handle.close()
+            self._next_handle = None
+
+
+# グローバルミュージックマネージャーインスタンス
+_music_manager: Optional[MusicManager] = None
+
+
+def get_music_manager() -> MusicManager:
+    """ミュージックマネージャーのシングルトンインスタンスを取得"""
+    global _music_manager
+    if _music_manager is None:
+        _music_manager = MusicManager()
+    return _music_manager
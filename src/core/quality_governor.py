@@ -0,0 +1,137 @@
+"""
+品質ガバナー - 実測フレーム時間に応じてエフェクト品質を自動調整
+フレームが遅れたら品質を下げ、余裕があれば品質を戻す
+"""
+
+import logging
+from collections import deque
+from enum import Enum
+from typing import Dict, Optional
+
+from core.constants import FPS, ADAPTIVE_QUALITY
+
+logger = logging.getLogger(__name__)
+
+
+class QualityLevel(Enum):
+    """エフェクト品質レベル"""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+
+
+# 品質レベルごとのエフェクト設定
+QUALITY_SETTINGS: Dict[QualityLevel, Dict[str, float]] = {
+    QualityLevel.HIGH: {
+        'elimination_particles': 8,      # ぷよ1個あたりの弾けるパーティクル数
+        'connection_glow_layers': 3,     # 連結ハイライトのグロウ層数
+        'map_hover_glow_layers': 6,      # マップのホバーグロウ層数
+        'map_pulse': True,               # 選択可能ノードのパルス
+        'background_particle_ratio': 1.0,  # 背景パーティクルの描画割合
+    },
+    QualityLevel.MEDIUM: {
+        'elimination_particles': 4,
+        'connection_glow_layers': 1,
+        'map_hover_glow_layers': 2,
+        'map_pulse': True,
+        'background_particle_ratio': 0.5,
+    },
+    QualityLevel.LOW: {
+        'elimination_particles': 0,
+        'connection_glow_layers': 0,
+        'map_hover_glow_layers': 0,
+        'map_pulse': False,
+        'background_particle_ratio': 0.0,
+    },
+}
+
+# 計測ウィンドウ（フレーム数）
+QUALITY_SAMPLE_WINDOW = 60
+
+# フレーム予算に対する閾値（平均処理時間の割合）
+QUALITY_DOWNGRADE_THRESHOLD = 0.9   # 予算の90%を超えたら品質を下げる
+QUALITY_UPGRADE_THRESHOLD = 0.5     # 予算の50%未満なら品質を戻す
+
+# 品質を上げる前に必要な連続した余裕ウィンドウ数（行き来を防ぐ）
+QUALITY_UPGRADE_WINDOWS = 3
+
+
+class QualityGovernor:
+    """ローリング平均のフレーム時間からエフェクト品質を決めるガバナー"""
+
+    def __init__(self, target_fps: int = 60, level: QualityLevel = QualityLevel.HIGH,
+                 enabled: bool = True):
+        self.frame_budget = 1.0 / target_fps
+        self.level = level
+        self.enabled = enabled
+        self.samples = deque(maxlen=QUALITY_SAMPLE_WINDOW)
+        self.headroom_windows = 0
+
+    @property
+    def settings(self) -> Dict[str, float]:
+        """現在の品質レベルのエフェクト設定"""
+        return QUALITY_SETTINGS[self.level]
+
+    def get(self, name: str):
+        """現在の品質レベルでの設定値を取得"""
+        return QUALITY_SETTINGS[self.level][name]
+
+    @property
+    def average_frame_time(self) -> float:
+        """計測ウィンドウ内の平均フレーム処理時間（秒）"""
+        if not self.samples:
+            return 0.0
+        return sum(self.samples) / len(self.samples)
+
+    def record_frame(self, frame_time: float):
+        """1フレームの処理時間（秒、待機時間を除く）を記録し、必要なら品質を変更"""
+        if not self.enabled:
+            return
+
+        self.samples.append(frame_time)
+        if len(self.samples) < self.samples.maxlen:
+            return
+
+        load = self.average_frame_time / self.frame_budget
+        if load > QUALITY_DOWNGRADE_THRESHOLD:
+            self.headroom_windows = 0
+            if self.level != QualityLevel.LOW:
+                self._set_level(QualityLevel(self.level.value - 1), load)
+        elif load < QUALITY_UPGRADE_THRESHOLD:
+            self.headroom_windows += 1
+            if self.headroom_windows >= QUALITY_UPGRADE_WINDOWS and self.level != QualityLevel.HIGH:
+                self.headroom_windows = 0
+                self._set_level(QualityLevel(self.level.value + 1), load)
+        else:
+            self.headroom_windows = 0
+
+        # 次のウィンドウは新しい品質で計測し直す
+        self.samples.clear()
+
+    def set_level(self, level: QualityLevel):
+        """品質レベルを直接設定"""
+        self._set_level(level, self.average_frame_time / self.frame_budget)
+        self.samples.clear()
+        self.headroom_windows = 0
+
+    def _set_level(self, level: QualityLevel, load: float):
+        if level != self.level:
+            logger.info(f"Quality {self.level.name} -> {level.name} (frame load {load:.0%})")
+            self.level = level
+
+
+# グローバル品質ガバナーインスタンス
+_quality_governor: Optional[QualityGovernor] = None
+
+
+def get_quality_governor() -> QualityGovernor:
+    """品質ガバナーのシングルトンインスタンスを取得"""
+    global _quality_governor
+    if _quality_governor is None:
+        _quality_governor = QualityGovernor(FPS, enabled=ADAPTIVE_QUALITY)
+    return _quality_governor
+
+
+def get_quality_setting(name: str):
+    """現在の品質レベルでのエフェクト設定値を取得するショートカット関数"""
+    return get_quality_governor().get(name)
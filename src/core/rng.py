@@ -0,0 +1,93 @@
+"""
+乱数ストリーム - ラン単位のシードからサブシステムごとに独立した乱数を生成
+シードと入力ログがあればランを完全に再現できる（リプレイ検証・一括シミュレーション・不具合再現用）
+"""
+
+import hashlib
+import logging
+import random
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# サブシステムごとのストリーム名
+# ストリームが独立しているため、あるサブシステムで乱数を引く回数が変わっても他には影響しない
+RNG_STREAMS = (
+    'puzzle',     # ぷよの色・ネクスト
+    'special',    # 特殊ぷよの出現・種類
+    'map',        # ダンジョンマップ生成
+    'enemy',      # 敵グループ・敵レベル
+    'enemy_ai',   # 敵の行動選択
+    'reward',     # 戦闘報酬・アイテム生成
+    'treasure',   # 宝箱
+    'shop',       # ショップの品揃え・価格
+    'event',      # イベント
+    'effects',    # 見た目だけのエフェクト（ゲーム進行に影響しない）
+)
+
+
+def derive_seed(run_seed: int, name: str) -> int:
+    """ラン全体のシードとストリーム名から、ストリームのシードを導出"""
+    digest = hashlib.sha256(f"{run_seed}:{name}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+
+class RandomStreams:
+    """ラン単位のシードと名前付き乱数ストリームを管理するクラス"""
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = 0
+        self._streams: Dict[str, random.Random] = {}
+        self.set_seed(seed)
+
+    def set_seed(self, seed: Optional[int] = None) -> int:
+        """シードを設定し、全ストリームを作り直す（Noneなら新しいシードを生成）"""
+        if seed is None:
+            seed = random.SystemRandom().randrange(1 << 32)
+        self.seed = int(seed)
+        self._streams.clear()
+        logger.info(f"Run seed: {self.seed}")
+        return self.seed
+
+    def stream(self, name: str) -> random.Random:
+        """名前付きストリームを取得（初回使用時に生成）"""
+        rng = self._streams.get(name)
+        if rng is None:
+            if name not in RNG_STREAMS:
+                logger.warning(f"Unknown RNG stream: {name}")
+            rng = random.Random(derive_seed(self.seed, name))
+            self._streams[name] = rng
+        return rng
+
+    def get_state(self) -> Dict[str, object]:
+        """全ストリームの状態を取得（途中から再現する場合に使用）"""
+        return {'seed': self.seed,
+                'streams': {name: rng.getstate() for name, rng in self._streams.items()}}
+
+    def set_state(self, state: Dict[str, object]):
+        """get_state で保存した状態を復元"""
+        self.set_seed(state['seed'])
+        for name, rng_state in state['streams'].items():
+            self.stream(name).setstate(rng_state)
+
+
+# グローバル乱数ストリームインスタンス
+_random_streams: Optional[RandomStreams] = None
+
+
+def get_random_streams() -> RandomStreams:
+    """乱数ストリームのシングルトンインスタンスを取得"""
+    global _random_streams
+    if _random_streams is None:
+        _random_streams = RandomStreams()
+    return _random_streams
+
+
+def get_rng(name: str) -> random.Random:
+    """名前付き乱数ストリームを取得（便利関数）"""
+    return get_random_streams().stream(name)
+
+
+def seed_run(seed: Optional[int] = None) -> int:
+    """新しいランのシードを設定（便利関数）"""
+    return get_random_streams().set_seed(seed)
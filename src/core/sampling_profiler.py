@@ -0,0 +1,164 @@
+"""
+サンプリングプロファイラー - 別スレッドから一定間隔でメインスレッドのスタックを記録
+sys._current_frames() でスタックを覗くだけなので、cProfileのように60FPSのループを歪めない
+サンプルは現在のゲーム状態でタグ付けし、flamegraph.pl / speedscope などで読める
+折りたたみスタック形式（"状態;関数;関数 回数"）で保存する
+
+F9で開始・停止（停止時に保存）、または環境変数 PUYO_PROFILE=保存先 で起動時から記録する
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+from collections import Counter
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 起動時から記録する場合の保存先を指定する環境変数
+PROFILE_ENV = 'PUYO_PROFILE'
+
+# サンプリング頻度（Hz）を指定する環境変数
+PROFILE_RATE_ENV = 'PUYO_PROFILE_HZ'
+
+# 既定のサンプリング頻度（Hz）- 1フレーム（16.7ms）に1〜2回
+DEFAULT_SAMPLE_RATE = 100
+
+# 記録するスタックの深さの上限（深い再帰で1サンプルが重くならないように）
+MAX_STACK_DEPTH = 128
+
+# 状態が取得できない場合のタグ
+UNKNOWN_STATE = 'unknown'
+
+
+def _frame_label(code) -> str:
+    """折りたたみスタックの1要素（関数名 (ファイル名:行)）- ';' は区切り文字なので含めない"""
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(';', ':')
+
+
+class SamplingProfiler:
+    """メインスレッドのスタックを別スレッドから定期的に記録するプロファイラー
+
+    サンプルはコードオブジェクトのタプルのまま数え、文字列への変換は保存時にまとめて行う。
+    """
+
+    def __init__(self, rate_hz: float = DEFAULT_SAMPLE_RATE,
+                 state_provider: Optional[Callable[[], str]] = None,
+                 thread_id: Optional[int] = None):
+        self.rate_hz = rate_hz
+        self.state_provider = state_provider
+        self.thread_id = thread_id if thread_id is not None else threading.main_thread().ident
+        self.counts: Counter = Counter()
+        self.samples = 0
+        self.started_at: Optional[float] = None
+        self.elapsed = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        """サンプリングを開始（記録済みのサンプルは保持したまま追加する）"""
+        if self.running:
+            return
+        self._stop.clear()
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='SamplingProfiler', daemon=True)
+        self._thread.start()
+        logger.info(f"Sampling profiler started ({self.rate_hz:g} Hz)")
+
+    def stop(self):
+        """サンプリングを停止"""
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.elapsed += time.perf_counter() - self.started_at
+        logger.info(f"Sampling profiler stopped ({self.samples} samples)")
+
+    def clear(self):
+        self.counts.clear()
+        self.samples = 0
+        self.elapsed = 0.0
+
+    def _run(self):
+        interval = 1.0 / self.rate_hz
+        next_time = time.perf_counter()
+        while True:
+            # 処理時間の分だけ待ち時間を減らし、頻度を一定に保つ
+            next_time += interval
+            if self._stop.wait(max(0.0, next_time - time.perf_counter())):
+                return
+            self.sample()
+
+    def sample(self):
+        """対象スレッドのスタックを1回記録"""
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        codes = []
+        while frame is not None and len(codes) < MAX_STACK_DEPTH:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        del frame
+        codes.reverse()
+
+        state = UNKNOWN_STATE
+        if self.state_provider is not None:
+            try:
+                state = self.state_provider()
+            except Exception:
+                pass
+        self.counts[(state, tuple(codes))] += 1
+        self.samples += 1
+
+    def collapsed_stacks(self) -> Dict[str, int]:
+        """折りたたみスタック（"状態;外側の関数;…;内側の関数" -> サンプル数）"""
+        labels: Dict[object, str] = {}
+        stacks: Counter = Counter()
+        for (state, codes), count in self.counts.items():
+            names = []
+            for code in codes:
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = _frame_label(code)
+                names.append(label)
+            stacks[';'.join([state] + names)] += count
+        return dict(stacks)
+
+    def state_totals(self) -> Dict[str, int]:
+        """状態ごとのサンプル数"""
+        totals: Counter = Counter()
+        for (state, _), count in self.counts.items():
+            totals[state] += count
+        return dict(totals)
+
+    def write_collapsed(self, path: str) -> int:
+        """折りたたみスタック形式で保存し、書いた行数を返す"""
+        stacks = self.collapsed_stacks()
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(stacks.items()):
+                f.write(f"{stack} {count}\n")
+        logger.info(f"Saved {self.samples} samples ({len(stacks)} stacks) to {path}")
+        return len(stacks)
+
+
+def default_profile_path() -> str:
+    """保存先の既定値（カレントディレクトリに日時付きで保存）"""
+    return time.strftime('profile-%Y%m%d-%H%M%S.collapsed')
+
+
+def profile_settings_from_env() -> Tuple[Optional[str], float]:
+    """環境変数から（起動時から記録する場合の保存先, サンプリング頻度）を取得"""
+    path = os.environ.get(PROFILE_ENV) or None
+    try:
+        rate = float(os.environ.get(PROFILE_RATE_ENV, DEFAULT_SAMPLE_RATE))
+    except ValueError:
+        logger.warning(f"Invalid {PROFILE_RATE_ENV}, using {DEFAULT_SAMPLE_RATE} Hz")
+        rate = DEFAULT_SAMPLE_RATE
+    return path, rate if rate > 0 else DEFAULT_SAMPLE_RATE
@@ -3,12 +3,12 @@
 """
 
 import pygame
-import random
 import logging
 from typing import Dict, Optional, Tuple
 from enum import Enum
 
 from .constants import *
+from core.rng import get_rng
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +90,7 @@ class SimpleSpecialManager:
     
     def should_spawn_special(self) -> bool:
         """特殊ぷよを生成するかどうか判定"""
-        return random.random() < self.base_spawn_rate
+        return get_rng('special').random() < self.base_spawn_rate
     
     def get_random_special_type(self) -> Optional[SimpleSpecialType]:
         """確率に基づいてランダムな特殊ぷよタイプを取得"""
@@ -102,7 +102,7 @@ class SimpleSpecialManager:
         if sum(weights) == 0:
             return None
         
-        return random.choices(types, weights=weights)[0]
+        return get_rng('special').choices(types, weights=weights)[0]
     
     def increase_type_rate(self, special_type: SimpleSpecialType, increase_amount: float = 0.05):
         """特定タイプの出現率を上昇（デフォルト5%）"""
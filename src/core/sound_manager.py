@@ -6,9 +6,17 @@ Drop Puzzle × Roguelike のサウンドシステム
 import pygame
 import logging
 import os
-from typing import Dict, Optional
+import time
+from typing import Dict, List, Optional
 from enum import Enum
 
+from core.asset_cache import load_sound
+
+try:
+    import numpy as np
+except ImportError:  # 連鎖音のバリエーション生成にのみ使用
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,14 +29,51 @@ class SoundType(Enum):
     DROP = "drop"          # ぷよが着地
 
 
+# 連鎖音のバリエーション数（1〜19連鎖、それ以上は19連鎖の音を使う）
+CHAIN_SOUND_LEVELS = 19
+
+# 連鎖1段ごとのピッチ上昇（半音）
+CHAIN_PITCH_SEMITONES = 1.0
+
+# 重ねる音（開始連鎖数, ピッチ倍率, 音量）- 連鎖が進むほど厚みを増す
+CHAIN_SOUND_LAYERS = [
+    (7, 2.0, 0.35),    # 1オクターブ上
+    (13, 1.5, 0.3),    # 完全5度上
+]
+
+# SEの種類ごとに予約するチャンネル数（同時発音数の上限）
+SOUND_VOICES: Dict[SoundType, int] = {
+    SoundType.MOVE: 1,
+    SoundType.ROTATE: 1,
+    SoundType.ELIMINATE: 3,
+    SoundType.CHAIN: 3,
+    SoundType.DROP: 2,
+}
+
+# 同じ種類のSEを再び鳴らすまでの最短間隔（秒）
+SOUND_MIN_INTERVAL: Dict[SoundType, float] = {
+    SoundType.MOVE: 0.04,
+    SoundType.ROTATE: 0.04,
+    SoundType.ELIMINATE: 0.05,
+    SoundType.CHAIN: 0.05,
+    SoundType.DROP: 0.03,
+}
+
+
 class SoundManager:
     """サウンド管理クラス"""
     
     def __init__(self):
         """サウンドマネージャー初期化"""
         self.sounds: Dict[SoundType, pygame.mixer.Sound] = {}
+        self.chain_sounds: List[pygame.mixer.Sound] = []  # 連鎖数ごとの消去音
         self.enabled = True
         self.volume = 0.7
+        self.loaded = False  # SEの読み込みは先読み完了後（load_sounds）まで遅らせる
+        
+        # 種類ごとの予約チャンネルと最終再生時刻
+        self.channels: Dict[SoundType, List[pygame.mixer.Channel]] = {}
+        self.last_played: Dict[SoundType, float] = {}
         
         # pygameのミキサー初期化
         try:
@@ -39,8 +84,40 @@ class SoundManager:
             self.enabled = False
             return
         
+        # 種類ごとにチャンネルを予約
+        self._reserve_channels()
+    
+    def load_sounds(self):
+        """SEの読み込みと連鎖音の生成（2回目以降は何もしない）
+        
+        読み込み画面の先読み完了後に呼ぶと、ワーカースレッドでデコード済みのバッファを使う。
+        呼ばれないまま再生された場合は初回再生時に読み込む。
+        """
+        if self.loaded or not self.enabled:
+            return
+        self.loaded = True
+        
         # SEファイルを読み込み
         self._load_sounds()
+        
+        # 連鎖数ごとの消去音を事前生成
+        self._build_chain_sounds()
+    
+    def _reserve_channels(self):
+        """SEの種類ごとに専用チャンネルを割り当てる
+        
+        予約したチャンネルは Sound.play() の空きチャンネル探索に使われないため、
+        連打や大連鎖でミキサー全体が埋まることがない。
+        """
+        total = sum(SOUND_VOICES.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+        
+        index = 0
+        for sound_type, voices in SOUND_VOICES.items():
+            self.channels[sound_type] = [pygame.mixer.Channel(index + i) for i in range(voices)]
+            index += voices
     
     def _load_sounds(self):
         """SE音源を読み込み"""
@@ -61,7 +138,10 @@ class SoundManager:
             file_path = os.path.join(se_folder, filename)
             try:
                 if os.path.exists(file_path):
-                    sound = pygame.mixer.Sound(file_path)
+                    # 先読み済みならデコード済みのバッファを共有
+                    sound = load_sound(file_path)
+                    if sound is None:
+                        continue
                     sound.set_volume(self.volume)
                     self.sounds[sound_type] = sound
                     logger.info(f"Loaded sound: {filename}")
@@ -70,23 +150,107 @@ class SoundManager:
             except Exception as e:
                 logger.error(f"Failed to load sound {filename}: {e}")
     
+    def _build_chain_sounds(self):
+        """消去音からピッチを上げ・音を重ねた連鎖数ごとのバリエーションを生成
+        
+        再生時に音声処理をしないよう、起動時に全連鎖数分をまとめて作る。
+        NumPyがない場合は通常の消去音をそのまま使う。
+        """
+        base = self.sounds.get(SoundType.ELIMINATE)
+        if base is None or np is None:
+            return
+        
+        try:
+            samples = pygame.sndarray.array(base).astype(np.float32)
+            mono = samples.ndim == 1
+            if mono:
+                samples = samples[:, np.newaxis]
+            
+            for level in range(1, CHAIN_SOUND_LEVELS + 1):
+                ratio = 2.0 ** ((level - 1) * CHAIN_PITCH_SEMITONES / 12.0)
+                mixed = self._resample(samples, ratio)
+                for start_level, layer_ratio, layer_volume in CHAIN_SOUND_LAYERS:
+                    if level >= start_level:
+                        layer = self._resample(samples, ratio * layer_ratio)
+                        mixed[:len(layer)] += layer * layer_volume
+                
+                # 重ねた分だけ音が割れないよう正規化
+                peak = np.abs(mixed).max()
+                if peak > 32767:
+                    mixed *= 32767 / peak
+                pcm = mixed.astype(np.int16)
+                sound = pygame.sndarray.make_sound(pcm[:, 0].copy() if mono else pcm)
+                sound.set_volume(self.volume)
+                self.chain_sounds.append(sound)
+            logger.info(f"Built {len(self.chain_sounds)} chain sound variants")
+        except Exception as e:
+            logger.error(f"Failed to build chain sounds: {e}")
+            self.chain_sounds = []
+    
+    @staticmethod
+    def _resample(samples, ratio: float):
+        """線形補間で再生速度（ピッチ）を変える"""
+        length = len(samples)
+        positions = np.arange(0, length - 1, ratio, dtype=np.float32)
+        source = np.arange(length, dtype=np.float32)
+        return np.stack([np.interp(positions, source, samples[:, ch]) for ch in range(samples.shape[1])],
+                        axis=1).astype(np.float32)
+    
+    def play_chain_sound(self, chain_level: int):
+        """連鎖数に応じた消去音を再生（バリエーションがなければ通常の消去音）"""
+        self.load_sounds()
+        if not self.chain_sounds:
+            self.play_sound(SoundType.ELIMINATE)
+            return
+        if not self.enabled:
+            return
+        
+        now = time.perf_counter()
+        if now - self.last_played.get(SoundType.CHAIN, float('-inf')) < SOUND_MIN_INTERVAL[SoundType.CHAIN]:
+            return
+        
+        level = max(1, min(chain_level, CHAIN_SOUND_LEVELS))
+        channel = self._find_channel(SoundType.CHAIN)
+        if channel is None:
+            return
+        channel.play(self.chain_sounds[level - 1])
+        self.last_played[SoundType.CHAIN] = now
+        logger.debug(f"Played chain sound: level {level}")
+    
     def play_sound(self, sound_type: SoundType):
         """指定したSEを再生"""
+        self.load_sounds()
         if not self.enabled or sound_type not in self.sounds:
             return
         
+        # 最短間隔以内の再生は間引く
+        now = time.perf_counter()
+        if now - self.last_played.get(sound_type, float('-inf')) < SOUND_MIN_INTERVAL.get(sound_type, 0.0):
+            return
+        
         try:
-            self.sounds[sound_type].play()
+            channel = self._find_channel(sound_type)
+            if channel is None:
+                return
+            channel.play(self.sounds[sound_type])
+            self.last_played[sound_type] = now
             logger.debug(f"Played sound: {sound_type.value}")
         except Exception as e:
             logger.error(f"Failed to play sound {sound_type.value}: {e}")
     
+    def _find_channel(self, sound_type: SoundType) -> Optional[pygame.mixer.Channel]:
+        """その種類の予約チャンネルから空きを探す（全て使用中ならNone＝発音数上限）"""
+        for channel in self.channels.get(sound_type, []):
+            if not channel.get_busy():
+                return channel
+        return None
+    
     def set_volume(self, volume: float):
         """音量設定（0.0-1.0）"""
         self.volume = max(0.0, min(1.0, volume))
         
         if self.enabled:
-            for sound in self.sounds.values():
+            for sound in list(self.sounds.values()) + self.chain_sounds:
                 sound.set_volume(self.volume)
             logger.info(f"Volume set to {self.volume}")
     
@@ -116,4 +280,9 @@ def get_sound_manager() -> SoundManager:
 
 def play_se(sound_type: SoundType):
     """SE再生のショートカット関数"""
-    get_sound_manager().play_sound(sound_type)
\ No newline at end of file
+    get_sound_manager().play_sound(sound_type)
+
+
+def play_chain_se(chain_level: int):
+    """連鎖数に応じた消去音を再生するショートカット関数"""
+    get_sound_manager().play_chain_sound(chain_level)
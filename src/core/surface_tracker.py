@@ -0,0 +1,201 @@
+"""
+Surface生成トラッカー - フレームごとに新しく作られたSurfaceの数を呼び出し元ごとに数える
+pygame.Surface の生成・pygame.transform の変形・pygame.image.load・Font.render を差し替えて数える
+（描画ベンチマーク・デバッグ用。install中は呼び出しごとに少しオーバーヘッドがある）
+
+ゲーム中は TRACK_SURFACE_ALLOCATIONS または環境変数 PUYO_TRACK_SURFACES=1 で起動時に有効になり、
+F1のデバッグ表示に呼び出し元の上位を表示、F10で集計をファイルに保存する
+"""
+
+import os
+import sys
+import time
+import logging
+from collections import Counter, deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+# 新しいSurfaceを返しうる pygame.transform の関数
+TRANSFORM_FUNCTIONS = ('scale', 'smoothscale', 'scale_by', 'smoothscale_by', 'rotate', 'rotozoom',
+                       'flip', 'scale2x', 'chop', 'laplacian', 'grayscale')
+
+# 起動時から数える場合の環境変数
+TRACK_SURFACES_ENV = 'PUYO_TRACK_SURFACES'
+
+# 呼び出し元ごとの平均を出すフレーム数（ローリングウィンドウ）
+SURFACE_HISTORY_FRAMES = 60
+
+# 記録関数から見た呼び出し元のフレームの深さ（record <- 差し替えた関数 <- 呼び出し元）
+_CALLER_DEPTH = 2
+
+
+class SurfaceTracker:
+    """Surfaceの生成数を呼び出し元ごとに数えるトラッカー
+
+    Font.render はinstall後に生成したフォントのみ数える（install前のフォントは差し替えられない）。
+    Surface.copy / convert / subsurface はC実装のメソッドで差し替えられないため数えない。
+    """
+
+    def __init__(self, history: int = SURFACE_HISTORY_FRAMES):
+        self.installed = False
+        self.suspended = False      # Trueの間は数えない（デバッグ表示自体の描画など）
+        self.frame_allocations = 0  # 現在のフレームで生成した数
+        self.total_allocations = 0
+        self.frames: Deque[Counter] = deque(maxlen=history)
+        self._frame_sites: Counter = Counter()
+        self._originals: Dict[str, object] = {}
+
+    def record(self, kind: str):
+        """Surfaceの生成を1件記録（差し替えた関数から呼ぶ）"""
+        if self.suspended:
+            return
+        self.frame_allocations += 1
+        self.total_allocations += 1
+        caller = sys._getframe(_CALLER_DEPTH)
+        self._frame_sites[(kind, caller.f_code, caller.f_lineno)] += 1
+
+    def begin_frame(self):
+        self.frame_allocations = 0
+        self._frame_sites = Counter()
+
+    def end_frame(self) -> int:
+        """フレームを締め、そのフレームで生成した数を返す"""
+        count = self.frame_allocations
+        self.frames.append(self._frame_sites)
+        self.begin_frame()
+        return count
+
+    def reset(self):
+        """集計をすべて消去（差し替えはそのまま）"""
+        self.frames.clear()
+        self.total_allocations = 0
+        self.begin_frame()
+
+    def site_stats(self) -> List[Dict[str, object]]:
+        """ウィンドウ内の呼び出し元ごとのフレームあたり生成数（平均の大きい順）
+
+        Returns:
+            [{'kind': 種類, 'site': 'ファイル:行 関数', 'mean': 平均, 'max': 最大, 'last': 直近のフレーム}]
+        """
+        if not self.frames:
+            return []
+        totals: Counter = Counter()
+        peaks: Dict[Tuple, int] = {}
+        for sites in self.frames:
+            for key, count in sites.items():
+                totals[key] += count
+                peaks[key] = max(peaks.get(key, 0), count)
+        last = self.frames[-1]
+        stats = []
+        for key, total in totals.items():
+            kind, code, line = key
+            stats.append({
+                'kind': kind,
+                'site': f"{os.path.basename(code.co_filename)}:{line} {code.co_name}",
+                'mean': total / len(self.frames),
+                'max': peaks[key],
+                'last': last.get(key, 0),
+            })
+        stats.sort(key=lambda entry: (-entry['mean'], entry['site']))
+        return stats
+
+    def frame_mean(self) -> float:
+        """ウィンドウ内のフレームあたり生成数の平均"""
+        if not self.frames:
+            return 0.0
+        return sum(sum(sites.values()) for sites in self.frames) / len(self.frames)
+
+    def dump(self, path: str) -> int:
+        """呼び出し元ごとの集計をテキストで保存し、行数を返す"""
+        stats = self.site_stats()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"# {len(self.frames)} frames, {self.frame_mean():.1f} surfaces/frame\n")
+            f.write(f"{'mean':>8} {'max':>5} {'last':>5}  {'kind':18} site\n")
+            for entry in stats:
+                f.write(f"{entry['mean']:8.2f} {entry['max']:5d} {entry['last']:5d}  {entry['kind']:18} {entry['site']}\n")
+        logger.info(f"Saved surface allocations ({len(stats)} call sites) to {path}")
+        return len(stats)
+
+    def install(self):
+        """pygameの生成関数を計測用に差し替え"""
+        if self.installed:
+            return
+        tracker = self
+        original_surface = pygame.Surface
+        original_font = pygame.font.Font
+
+        class TrackedSurface(original_surface):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                tracker.record('Surface')
+
+        class TrackedFont(original_font):
+            def render(self, *args, **kwargs):
+                tracker.record('font.render')
+                return super().render(*args, **kwargs)
+
+        self._originals = {'Surface': original_surface, 'Font': original_font,
+                           'image.load': pygame.image.load}
+        pygame.Surface = TrackedSurface
+        pygame.font.Font = TrackedFont
+        pygame.image.load = self._wrap(pygame.image.load, 'image.load')
+        for name in TRANSFORM_FUNCTIONS:
+            function = getattr(pygame.transform, name, None)
+            if function is not None:
+                self._originals[f'transform.{name}'] = function
+                setattr(pygame.transform, name, self._wrap(function, f'transform.{name}'))
+        self.installed = True
+
+    def uninstall(self):
+        """差し替えを元に戻す"""
+        if not self.installed:
+            return
+        pygame.Surface = self._originals.pop('Surface')
+        pygame.font.Font = self._originals.pop('Font')
+        pygame.image.load = self._originals.pop('image.load')
+        for key, function in self._originals.items():
+            setattr(pygame.transform, key.split('.', 1)[1], function)
+        self._originals = {}
+        self.installed = False
+
+    def _wrap(self, function: Callable, kind: str) -> Callable:
+        """戻り値が引数で渡した描画先でなければ新規生成として数える"""
+        tracker = self
+
+        def tracked(*args, **kwargs):
+            result = function(*args, **kwargs)
+            if not any(result is arg for arg in args[1:]) and result is not kwargs.get('dest_surface'):
+                tracker.record(kind)
+            return result
+
+        tracked.__name__ = function.__name__
+        tracked.__doc__ = function.__doc__
+        return tracked
+
+
+def default_dump_path() -> str:
+    """保存先の既定値（カレントディレクトリに日時付きで保存）"""
+    return time.strftime('surfaces-%Y%m%d-%H%M%S.txt')
+
+
+def tracking_requested(default: bool = False) -> bool:
+    """起動時から数えるか（環境変数 PUYO_TRACK_SURFACES が指定されていればそちらを優先）"""
+    value = os.environ.get(TRACK_SURFACES_ENV)
+    if value is None:
+        return default
+    return value.strip().lower() not in ('', '0', 'false', 'no', 'off')
+
+
+# グローバルトラッカーインスタンス
+_surface_tracker: Optional[SurfaceTracker] = None
+
+
+def get_surface_tracker() -> SurfaceTracker:
+    """Surface生成トラッカーのシングルトンインスタンスを取得"""
+    global _surface_tracker
+    if _surface_tracker is None:
+        _surface_tracker = SurfaceTracker()
+    return _surface_tracker
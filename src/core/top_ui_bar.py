@@ -8,7 +8,8 @@ import math
 import os
 from typing import Dict, Optional
 from .constants import Colors, SCREEN_WIDTH, FONT_SIZE_SMALL, FONT_SIZE_MEDIUM
-from .game_engine import get_appropriate_font
+from .game_engine import get_appropriate_font, get_mouse_pos
+from core.asset_cache import load_image
 
 class TopUIBar:
     """上部UIバーの描画と管理を担当するクラス"""
@@ -57,16 +58,14 @@ class TopUIBar:
             # HP.pngを読み込み
             hp_path = os.path.join(base_path, "HP.png")
             if os.path.exists(hp_path):
-                self.hp_icon = pygame.image.load(hp_path).convert_alpha()
                 # サイズを調整（24x24ピクセル）
-                self.hp_icon = pygame.transform.scale(self.hp_icon, (24, 24))
+                self.hp_icon = load_image(hp_path, (24, 24))
             
             # gold.pngを読み込み
             gold_path = os.path.join(base_path, "gold.png")
             if os.path.exists(gold_path):
-                self.gold_icon = pygame.image.load(gold_path).convert_alpha()
                 # サイズを調整（24x24ピクセル）
-                self.gold_icon = pygame.transform.scale(self.gold_icon, (24, 24))
+                self.gold_icon = load_image(gold_path, (24, 24))
             
             # 特殊ぷよアイコンを読み込み
             picture_path = os.path.join(base_path, "Picture")
@@ -82,9 +81,10 @@ class TopUIBar:
             for puyo_type, filename in special_puyo_files.items():
                 icon_path = os.path.join(picture_path, filename)
                 if os.path.exists(icon_path):
-                    icon = pygame.image.load(icon_path).convert_alpha()
                     # UIバー用に小さくリサイズ（20x20ピクセル）
-                    self.special_puyo_icons[puyo_type] = pygame.transform.scale(icon, (20, 20))
+                    icon = load_image(icon_path, (20, 20))
+                    if icon is not None:
+                        self.special_puyo_icons[puyo_type] = icon
                 
         except Exception as e:
             print(f"Warning: Could not load UI icons: {e}")
@@ -351,7 +351,7 @@ class TopUIBar:
                 
                 # マウスオーバー検出領域を記録
                 hover_rect = pygame.Rect(current_x - 5, y + 10, 30, 30)
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = get_mouse_pos()
                 if hover_rect.collidepoint(mouse_pos):
                     self.hover_info = {
                         'type': puyo_type,
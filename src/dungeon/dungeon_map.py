@@ -3,12 +3,13 @@
 Drop Puzzle × Roguelike のダンジョンマップ構造と進行管理
 """
 
-import random
 import logging
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
+from core.rng import get_rng
+
 logger = logging.getLogger(__name__)
 
 
@@ -128,7 +129,7 @@ class DungeonMap:
             node_types = [NodeType.BOSS]
         else:
             # 通常フロア：新しいルールでノード生成（エリート戦を含む）
-            node_count = random.randint(3, 6)
+            node_count = get_rng('map').randint(3, 6)
             node_types = self._generate_floor_nodes(floor, node_count)
         
         # ノードを配置
@@ -149,7 +150,7 @@ class DungeonMap:
                 node.enemy_type = self._assign_enemy_type(node_type, floor)
             
             # 報酬シードを設定
-            node.reward_seed = random.randint(1000, 99999)
+            node.reward_seed = get_rng('map').randint(1000, 99999)
             
             self.nodes[node.node_id] = node
             nodes_this_floor.append(node)
@@ -213,7 +214,7 @@ class DungeonMap:
             
             # 重み付き選択（フロア情報を渡す）
             weights = self._get_node_weights(available_types, floor)
-            chosen_type = random.choices(available_types, weights=weights)[0]
+            chosen_type = get_rng('map').choices(available_types, weights=weights)[0]
             types.append(chosen_type)
             
             # ショップ・休憩所が選ばれた場合、記録
@@ -419,7 +420,7 @@ class DungeonMap:
         
         # 宝箱の品質向上
         for node in route_path:
-            if node.node_type == NodeType.TREASURE and random.random() < 0.3:
+            if node.node_type == NodeType.TREASURE and get_rng('map').random() < 0.3:
                 logger.debug(f"Hard route: enhanced treasure at {node.node_id}")
     
     def _find_reachable_elites_from_node(self, start_node: DungeonNode) -> List[DungeonNode]:
@@ -574,7 +575,7 @@ class DungeonMap:
         else:
             # 7個以上の場合は重複を許可
             positions = list(range(7))
-            random.shuffle(positions)
+            get_rng('map').shuffle(positions)
             return positions[:count]
     
     def _assign_enemy_type(self, node_type: NodeType, floor: int) -> str:
@@ -586,7 +587,7 @@ class DungeonMap:
         else:
             # 通常戦闘
             enemy_pool = ["goblin", "orc", "skeleton", "slime", "spider"]
-            return random.choice(enemy_pool)
+            return get_rng('map').choice(enemy_pool)
     
     def _generate_connections(self):
         """Slay the Spire風の接続を生成：すべてのノードが到達可能"""
@@ -617,7 +618,6 @@ class DungeonMap:
                               next_floor_nodes: List[DungeonNode],
                               reduce_branch_chance: bool = False) -> List[DungeonNode]:
         """Slay the Spire風の接続を生成：基本は真っ直ぐ、たまに分岐"""
-        import random
         
         valid_connections = []
         current_x = current_node.x
@@ -643,9 +643,9 @@ class DungeonMap:
         
         # 分岐の確率的追加（連続分岐を制限）
         branch_chance = 0.15 if reduce_branch_chance else 0.3
-        if secondary_targets and random.random() < branch_chance:
+        if secondary_targets and get_rng('map').random() < branch_chance:
             # 分岐は最大1つまで
-            branch_target = random.choice(secondary_targets)
+            branch_target = get_rng('map').choice(secondary_targets)
             valid_connections.append(branch_target)
             logger.debug(f"Node {current_node.node_id} has branch to: {branch_target.node_id}")
         
@@ -684,8 +684,7 @@ class DungeonMap:
                         current_node.connections.append(target.node_id)
                 else:
                     # 斜めの場合は1つだけ選択
-                    import random
-                    chosen = random.choice(best_targets)
+                    chosen = get_rng('map').choice(best_targets)
                     current_node.connections.append(chosen.node_id)
     
     def _fix_isolated_nodes(self, current_floor_nodes, next_floor_nodes):
@@ -708,7 +707,6 @@ class DungeonMap:
     
     def _add_strategic_branches(self, current_floor_nodes, next_floor_nodes):
         """戦略的な分岐を適度に追加"""
-        import random
         
         for current_node in current_floor_nodes:
             # 既に複数の接続がある場合はスキップ
@@ -716,7 +714,7 @@ class DungeonMap:
                 continue
             
             # 20%の確率で分岐を追加
-            if random.random() < 0.2:
+            if get_rng('map').random() < 0.2:
                 # 隣接するノードで、まだ接続していないものを探す
                 for next_node in next_floor_nodes:
                     if (next_node.node_id not in current_node.connections and
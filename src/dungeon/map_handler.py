@@ -5,11 +5,11 @@ Drop Puzzle × Roguelike のダンジョンマップ操作とゲーム状態遷
 
 import pygame
 import logging
-import random
 from typing import Optional
 
 from core.constants import *
 from core.game_engine import GameEngine
+from core.rng import get_rng
 from .dungeon_map import DungeonMap, DungeonNode, NodeType
 from .map_renderer import MapRenderer
 
@@ -308,11 +308,11 @@ class DungeonMapHandler:
     def _simulate_treasure(self, node: DungeonNode):
         """宝箱シミュレーション（フォールバック）"""
         # 簡易報酬獲得（新しいプレイヤーデータシステム使用）
-        bonus_gold = random.randint(50, 100)
+        bonus_gold = get_rng('treasure').randint(50, 100)
         self.engine.player.gain_gold(bonus_gold)
         
         # HP強化と回復
-        hp_bonus = random.randint(10, 20)
+        hp_bonus = get_rng('treasure').randint(10, 20)
         self.engine.player.level_up_skill("max_hp", hp_bonus)
         self.engine.player.heal(hp_bonus)
         
@@ -361,7 +361,7 @@ class DungeonMapHandler:
             ("謎の祝福", 0, 5, "謎の力により体力が向上した！")
         ]
         
-        event_name, gold_change, hp_change, message = random.choice(events)
+        event_name, gold_change, hp_change, message = get_rng('event').choice(events)
         
         # プレイヤーに効果を適用
         if gold_change != 0:
@@ -494,7 +494,7 @@ class DungeonMapHandler:
         # 簡易ゴールド獲得
         if not hasattr(self.engine.game_data, 'gold'):
             self.engine.game_data.gold = 0
-        bonus_gold = random.randint(20, 50)
+        bonus_gold = get_rng('shop').randint(20, 50)
         self.engine.game_data.gold += bonus_gold
         logger.info(f"Shop simulation: gained {bonus_gold} gold")
     
@@ -10,6 +10,11 @@ import os
 from typing import Dict, List, Optional, Tuple
 
 from core.constants import *
+from core.game_engine import get_mouse_pos
+from core.quality_governor import get_quality_setting
+from core.asset_cache import load_image
+from core.game_clock import get_game_clock
+from core.draw_list import get_draw_list, LAYER_EFFECT, LAYER_SPRITE, LAYER_OVERLAY
 from .dungeon_map import DungeonMap, DungeonNode, NodeType
 
 logger = logging.getLogger(__name__)
@@ -29,6 +34,8 @@ class MapRenderer:
         
         # 画像ファイルのロード
         self.node_images = self._load_node_images()
+        self._node_icon_variants: Dict[Tuple[NodeType, str], pygame.Surface] = {}
+        self._label_cache: Dict[Tuple[str, Tuple[int, int, int], int], pygame.Surface] = {}
         self.background_image = self._load_background_image()
         
         # ステータスアイコンを初期化
@@ -117,12 +124,13 @@ class MapRenderer:
             try:
                 image_path = os.path.join(project_root, filename)
                 if os.path.exists(image_path):
-                    original_image = pygame.image.load(image_path)
                     # ノードサイズに合わせてスケール（通常ノードは96x96、大きいノードは128x128）
                     if node_type in [NodeType.BOSS, NodeType.ELITE]:
-                        scaled_image = pygame.transform.scale(original_image, (128, 128))
+                        scaled_image = load_image(image_path, (128, 128))
                     else:
-                        scaled_image = pygame.transform.scale(original_image, (96, 96))
+                        scaled_image = load_image(image_path, (96, 96))
+                    if scaled_image is None:
+                        raise pygame.error(f"Cannot load {image_path}")
                     images[node_type] = scaled_image
                     logger.info(f"Loaded image for {node_type.value}: {filename}")
                 else:
@@ -153,17 +161,15 @@ class MapRenderer:
             # HP.pngを読み込み
             hp_path = os.path.join(base_path, "HP.png")
             if os.path.exists(hp_path):
-                self.hp_icon = pygame.image.load(hp_path).convert_alpha()
                 # サイズを調整（30x30ピクセル）
-                self.hp_icon = pygame.transform.scale(self.hp_icon, (30, 30))
+                self.hp_icon = load_image(hp_path, (30, 30))
                 logger.info("Loaded HP icon for map status")
             
             # gold.pngを読み込み
             gold_path = os.path.join(base_path, "gold.png")
             if os.path.exists(gold_path):
-                self.gold_icon = pygame.image.load(gold_path).convert_alpha()
                 # サイズを調整（30x30ピクセル）
-                self.gold_icon = pygame.transform.scale(self.gold_icon, (30, 30))
+                self.gold_icon = load_image(gold_path, (30, 30))
                 logger.info("Loaded Gold icon for map status")
                 
         except Exception as e:
@@ -185,9 +191,8 @@ class MapRenderer:
                 try:
                     image_path = os.path.join(base_path, "Picture", filename)
                     if os.path.exists(image_path):
-                        image = pygame.image.load(image_path).convert_alpha()
                         # ヘッダー用に小さくスケール（25x25ピクセル）
-                        self.special_puyo_images[puyo_type] = pygame.transform.scale(image, (25, 25))
+                        self.special_puyo_images[puyo_type] = load_image(image_path, (25, 25))
                         logger.debug(f"Loaded special puyo image for map header: {filename}")
                     else:
                         logger.warning(f"Special puyo image not found: {image_path}")
@@ -205,9 +210,8 @@ class MapRenderer:
             image_path = os.path.join(project_root, "map2.png")
             
             if os.path.exists(image_path):
-                background_image = pygame.image.load(image_path)
                 # 画面サイズに合わせてスケール
-                scaled_background = pygame.transform.scale(background_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
+                scaled_background = load_image(image_path, (SCREEN_WIDTH, SCREEN_HEIGHT))
                 logger.info(f"Loaded background image: map2.png")
                 return scaled_background
             else:
@@ -378,22 +382,27 @@ class MapRenderer:
     def _render_nodes(self, surface: pygame.Surface, fonts: Dict[str, pygame.font.Font]):
         """ノードを描画"""
         font_small = fonts.get('small', pygame.font.Font(None, 16))
+        draw_list = get_draw_list()
         
         # フロア順に描画（手前から奥へ）
+        # エフェクト・アイコン・文字はレイヤーごとにまとめて描画する
         for floor in range(self.dungeon_map.total_floors):
             nodes = self.dungeon_map.get_nodes_by_floor(floor)
             
             for node in nodes:
                 self._render_single_node(surface, font_small, node)
+        
+        draw_list.flush(surface)
     
     def _render_single_node(self, surface: pygame.Surface, font: pygame.font.Font, node: DungeonNode):
-        """単一ノードをアイコン画像で描画"""
+        """単一ノードをアイコン画像で描画（描画リストに追加）"""
         pos = self._get_node_position(node)
+        draw_list = get_draw_list()
         
         # ホバー効果 - グロウ
         if self.hovered_node == node:
-            # アウターグロウ（アイコンの周りに光る効果）
-            for i in range(6):
+            # アウターグロウ（アイコンの周りに光る効果、層数は品質レベル依存）
+            for i in range(get_quality_setting('map_hover_glow_layers')):
                 glow_radius = 70 + i * 8
                 glow_alpha = 50 - i * 8
                 if glow_alpha > 0:
@@ -403,8 +412,8 @@ class MapRenderer:
                     glow_surface.set_colorkey((0, 0, 0))
                     pygame.draw.circle(glow_surface, (255, 255, 100), 
                                      (glow_radius, glow_radius), glow_radius - 8)
-                    surface.blit(glow_surface, 
-                               (pos[0] - glow_radius, pos[1] - glow_radius))
+                    draw_list.add(surface, glow_surface,
+                                  (pos[0] - glow_radius, pos[1] - glow_radius), layer=LAYER_EFFECT)
         
         # 選択効果 - 輝くリング
         if self.selected_node == node:
@@ -418,12 +427,12 @@ class MapRenderer:
                     ring_surface.set_colorkey((0, 0, 0))
                     pygame.draw.circle(ring_surface, (255, 255, 0), 
                                      (ring_radius, ring_radius), ring_radius, 4)
-                    surface.blit(ring_surface, 
-                               (pos[0] - ring_radius, pos[1] - ring_radius))
+                    draw_list.add(surface, ring_surface,
+                                  (pos[0] - ring_radius, pos[1] - ring_radius), layer=LAYER_EFFECT)
         
         # 選択可能ノードのパルス効果
-        if node.available and not node.visited:
-            pulse = abs(math.sin(pygame.time.get_ticks() * 0.003)) * 0.4 + 0.6
+        if node.available and not node.visited and get_quality_setting('map_pulse'):
+            pulse = abs(math.sin(get_game_clock().now() * 3.0)) * 0.4 + 0.6
             pulse_radius = int(80 * pulse)
             pulse_alpha = int(60 * (1 - pulse))
             if pulse_alpha > 0:
@@ -433,8 +442,8 @@ class MapRenderer:
                 pulse_surface.set_colorkey((0, 0, 0))
                 pygame.draw.circle(pulse_surface, (255, 255, 255), 
                                  (pulse_radius, pulse_radius), pulse_radius, 3)
-                surface.blit(pulse_surface, 
-                           (pos[0] - pulse_radius, pos[1] - pulse_radius))
+                draw_list.add(surface, pulse_surface,
+                              (pos[0] - pulse_radius, pos[1] - pulse_radius), layer=LAYER_EFFECT)
         
         # アイコン画像を描画
         self._render_node_icon(surface, font, node, pos)
@@ -442,62 +451,68 @@ class MapRenderer:
     
     def _render_node_icon(self, surface: pygame.Surface, font: pygame.font.Font, 
                          node: DungeonNode, pos: Tuple[int, int]):
-        """ノードタイプに応じた画像アイコンを描画"""
+        """ノードタイプに応じた画像アイコンを描画（描画リストに追加）"""
+        draw_list = get_draw_list()
+        
+        # ノードの状態に応じた文字色
+        if node.visited:
+            text_color = (160, 160, 160)
+        elif node.available:
+            text_color = (255, 255, 255)
+        else:
+            text_color = (100, 100, 100)
+        
         # 画像が利用可能な場合は画像を使用
         if node.node_type in self.node_images:
-            image = self.node_images[node.node_type]
-            
-            # 選択可能なノードは1.3倍に拡大して目立たせる
+            # 選択可能なノードは1.3倍に拡大、訪問済みは暗く、選択不可は薄く
             if node.available and not node.visited:
-                # 1.3倍に拡大
-                enlarged_size = (int(image.get_width() * 1.3), int(image.get_height() * 1.3))
-                enlarged_image = pygame.transform.scale(image, enlarged_size)
-                image_rect = enlarged_image.get_rect(center=pos)
-                surface.blit(enlarged_image, image_rect)
+                variant = 'available'
             elif node.visited:
-                # 訪問済みは暗くする
-                darkened_image = image.copy()
-                darkened_image.set_alpha(128)
-                image_rect = darkened_image.get_rect(center=pos)
-                surface.blit(darkened_image, image_rect)
+                variant = 'visited'
             else:
-                # 選択不可はグレースケール
-                grayscale_image = image.copy()
-                # シンプルなグレースケール変換
-                grayscale_image.set_alpha(80)
-                image_rect = grayscale_image.get_rect(center=pos)
-                surface.blit(grayscale_image, image_rect)
+                variant = 'locked'
+            image = self._get_node_icon_variant(node.node_type, variant)
+            draw_list.add(surface, image, image.get_rect(center=pos))
                 
             # ボスノードには追加でテキスト表示
             if node.node_type == NodeType.BOSS:
-                small_font = pygame.font.Font(None, 24)
-                if node.visited:
-                    text_color = (160, 160, 160)
-                elif node.available:
-                    text_color = (255, 255, 255)
-                else:
-                    text_color = (100, 100, 100)
-                boss_text = small_font.render("BOSS", True, text_color)
+                boss_text = self._get_label("BOSS", text_color, 24)
                 # 選択可能なボスノードは少し下にずらす（拡大されるため）
                 y_offset = 85 if (node.available and not node.visited) else 75
                 text_rect = boss_text.get_rect(center=(pos[0], pos[1] + y_offset))
-                surface.blit(boss_text, text_rect)
+                draw_list.add(surface, boss_text, text_rect, layer=LAYER_OVERLAY)
         else:
             # フォールバック：テキストアイコンを使用
             icon = self.node_icons.get(node.node_type, "?")
-            
-            # アイコンの色を決定
-            if node.visited:
-                text_color = (160, 160, 160)
-            elif node.available:
-                text_color = (255, 255, 255)
-            else:
-                text_color = (100, 100, 100)
-            
-            medium_font = pygame.font.Font(None, 64)
-            icon_text = medium_font.render(icon, True, text_color)
+            icon_text = self._get_label(icon, text_color, 64)
             text_rect = icon_text.get_rect(center=pos)
-            surface.blit(icon_text, text_rect)
+            draw_list.add(surface, icon_text, text_rect, layer=LAYER_SPRITE)
+    
+    def _get_node_icon_variant(self, node_type: NodeType, variant: str) -> pygame.Surface:
+        """状態別のノードアイコンを取得（種類・状態ごとに1度だけ生成）"""
+        key = (node_type, variant)
+        image = self._node_icon_variants.get(key)
+        if image is None:
+            base = self.node_images[node_type]
+            if variant == 'available':
+                # 1.3倍に拡大
+                enlarged_size = (int(base.get_width() * 1.3), int(base.get_height() * 1.3))
+                image = pygame.transform.scale(base, enlarged_size)
+            else:
+                # 訪問済みは暗く、選択不可はさらに薄くする
+                image = base.copy()
+                image.set_alpha(128 if variant == 'visited' else 80)
+            self._node_icon_variants[key] = image
+        return image
+    
+    def _get_label(self, text: str, color: Tuple[int, int, int], size: int) -> pygame.Surface:
+        """ノード用のラベル文字を取得（文字・色・サイズごとに1度だけ描画）"""
+        key = (text, color, size)
+        label = self._label_cache.get(key)
+        if label is None:
+            label = pygame.font.Font(None, size).render(text, True, color)
+            self._label_cache[key] = label
+        return label
     
     def _render_ui(self, surface: pygame.Surface, fonts: Dict[str, pygame.font.Font]):
         """UI要素を描画"""
@@ -564,7 +579,7 @@ class MapRenderer:
         tooltip_height = len(lines) * 20 + 10
         
         # マウス位置を取得してツールチップ位置を決定
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = get_mouse_pos()
         tooltip_x = mouse_x + 15
         tooltip_y = mouse_y - tooltip_height // 2
         
@@ -0,0 +1,470 @@
+"""
+ランシミュレーター - 経済バランス調整用にラン全体を描画なしで大量に実行
+DungeonMap の生成・ルート選択から、戦闘（battle_simulator のボット）、戦闘報酬、
+ショップ・休憩所・宝箱・イベントまでをゲーム本体のハンドラーの処理でそのまま解決し、
+フロアごとのHP・ゴールド・装飾品数の推移を集計する
+集計はヒストグラムで持ち、ワーカーから届いた部分集計を順次マージするためシード数が増えてもメモリは一定
+"""
+
+import os
+import csv
+import json
+import logging
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+from core.rng import derive_seed, seed_run
+from core.player_data import PlayerData
+from battle.battle_simulator import (PlayerBuild, DEFAULT_BUILDS, SCALING_CONSTANTS, fight,
+                                     apply_scaling_overrides)
+from battle import enemy as enemy_module
+from battle.enemy import create_enemy_group
+from rewards.reward_system import RewardType, Reward, reward_generator
+from .dungeon_map import DungeonMap, DungeonNode, NodeType
+
+logger = logging.getLogger(__name__)
+
+# ラン中の戦闘の時間刻み（秒）- 1ランで十数回戦うため単体の戦闘シミュレーションより粗くする
+RUN_BATTLE_DT = 0.2
+
+# ダンジョンの階数（DungeonMap の既定値）
+RUN_TOTAL_FLOORS = 15
+
+# 集計するパーセンタイル
+PERCENTILES = (10, 50, 90)
+
+# フロアごとに記録する値
+FLOOR_METRICS = ('hp', 'max_hp', 'gold', 'artifacts')
+
+# ルート選択の優先度（高いほど選ばれやすい）
+ROUTE_PREFERENCES: Dict[str, Dict[NodeType, int]] = {
+    'safe': {NodeType.TREASURE: 3, NodeType.REST: 3, NodeType.SHOP: 2, NodeType.EVENT: 1,
+             NodeType.BATTLE: 1, NodeType.ELITE: -2, NodeType.BOSS: 0},
+    'balanced': {NodeType.TREASURE: 3, NodeType.SHOP: 2, NodeType.EVENT: 2, NodeType.REST: 1,
+                 NodeType.BATTLE: 1, NodeType.ELITE: 0, NodeType.BOSS: 0},
+    'greedy': {NodeType.ELITE: 3, NodeType.TREASURE: 3, NodeType.SHOP: 2, NodeType.EVENT: 2,
+               NodeType.BATTLE: 1, NodeType.REST: 0, NodeType.BOSS: 0},
+}
+
+# HPが減っているときに休憩所へ加算する優先度
+LOW_HP_REST_BONUS = 3
+
+
+@dataclass(frozen=True)
+class RunPolicy:
+    """ボットの方針（ルート・報酬・ショップ・休憩所・イベントの選び方）"""
+    name: str
+    build: PlayerBuild = DEFAULT_BUILDS['expert']   # 'average' だと戦闘モデル上ほとんどが序盤で倒れる
+    route: str = 'balanced'                  # ROUTE_PREFERENCES のキー、または 'random'
+    reward_priority: Tuple[str, ...] = ('artifact', 'chain_upgrade', 'hp_upgrade', 'gold',
+                                        'special_puyo', 'potion')
+    shop_priority: Tuple[str, ...] = ('heal', 'artifact', 'special_puyo', 'potion')
+    heal_threshold: float = 0.6              # HP割合がこれ未満なら回復を優先
+    gold_reserve: int = 0                    # ショップで残しておくゴールド
+    event_choice: Optional[int] = None       # イベントの選択肢（Noneならランダム）
+
+
+# 代表的な方針
+DEFAULT_POLICIES: Dict[str, RunPolicy] = {
+    'cautious': RunPolicy('cautious', route='safe', heal_threshold=0.75,
+                          reward_priority=('hp_upgrade', 'gold', 'artifact', 'chain_upgrade',
+                                           'potion', 'special_puyo')),
+    'balanced': RunPolicy('balanced'),
+    'greedy': RunPolicy('greedy', route='greedy', heal_threshold=0.4,
+                        reward_priority=('gold', 'artifact', 'chain_upgrade', 'hp_upgrade',
+                                         'special_puyo', 'potion')),
+    'random': RunPolicy('random', route='random'),
+}
+
+
+@dataclass(frozen=True)
+class EconomySettings:
+    """経済パラメーターの倍率（ゲーム本体を書き換えずに試すため）"""
+    gold_scale: float = 1.0      # 戦闘報酬のゴールド
+    price_scale: float = 1.0     # ショップの価格
+
+
+class SimulatedEngine:
+    """ハンドラーが参照するエンジンの属性だけを持つ代用品"""
+
+    def __init__(self, player: PlayerData, dungeon_map: DungeonMap):
+        self.player = player
+        self.persistent_dungeon_map = dungeon_map
+        self.fonts: Dict[str, pygame.font.Font] = {}
+
+
+@dataclass
+class RunTrace:
+    """1ランの結果"""
+    seed: int
+    policy: str
+    won: bool = False
+    death_floor: Optional[int] = None
+    floors: List[Tuple[int, int, int, int]] = field(default_factory=list)  # フロアごとの FLOOR_METRICS
+    gold_earned: int = 0
+    gold_spent: int = 0
+    node_counts: Counter = field(default_factory=Counter)
+
+
+def choose_node(available: List[DungeonNode], player: PlayerData, policy: RunPolicy,
+                decide: random.Random) -> DungeonNode:
+    """方針に従って次のノードを選ぶ"""
+    if policy.route == 'random':
+        return decide.choice(available)
+
+    preferences = ROUTE_PREFERENCES[policy.route]
+    low_hp = player.hp < player.max_hp * policy.heal_threshold
+
+    def score(node: DungeonNode) -> Tuple[int, float]:
+        value = preferences.get(node.node_type, 0)
+        if low_hp and node.node_type == NodeType.REST:
+            value += LOW_HP_REST_BONUS
+        return value, decide.random()
+
+    return max(available, key=score)
+
+
+def apply_battle_reward(player: PlayerData, reward: Reward, economy: EconomySettings):
+    """選んだ戦闘報酬を適用（RewardSelectionHandler._apply_selected_reward と同じ効果）
+
+    ゲーム本体の呼び出し先のうち PlayerData に無いもの（add_gold など）は、
+    宝箱で同じ報酬を得たときの処理に合わせて直接適用する
+    """
+    if reward.reward_type == RewardType.GOLD:
+        player.gain_gold(int(reward.value * economy.gold_scale))
+    elif reward.reward_type == RewardType.HP_UPGRADE:
+        player.max_hp += reward.value
+        player.hp += reward.value
+    elif reward.reward_type == RewardType.CHAIN_UPGRADE:
+        player.chain_damage_multiplier += 0.1
+    # ポーション・装飾品・特殊ぷよは戦闘モデルに効果がないため数だけ数える
+
+
+def choose_reward(rewards: List[Reward], policy: RunPolicy) -> Reward:
+    for reward_type in policy.reward_priority:
+        for reward in rewards:
+            if reward.reward_type.value == reward_type:
+                return reward
+    return rewards[0]
+
+
+class RunSimulator:
+    """1ラン分の進行を管理するクラス"""
+
+    def __init__(self, seed: int, policy: RunPolicy, economy: EconomySettings = EconomySettings(),
+                 battle_dt: float = RUN_BATTLE_DT, total_floors: int = RUN_TOTAL_FLOORS):
+        self.policy = policy
+        self.economy = economy
+        self.battle_dt = battle_dt
+        self.trace = RunTrace(seed, policy.name)
+
+        seed_run(seed)
+        self.decide = random.Random(derive_seed(seed, 'policy'))  # ボットの判断用（ゲームの乱数とは別）
+        self.dungeon_map = DungeonMap(total_floors)
+        self.player = PlayerData()
+        self.engine = SimulatedEngine(self.player, self.dungeon_map)
+        self.artifacts = 0
+
+    def run(self) -> RunTrace:
+        """ボス撃破か死亡までランを進める"""
+        trace = self.trace
+        while not self.dungeon_map.is_completed():
+            available = self.dungeon_map.get_available_nodes()
+            if not available:
+                break
+            node = choose_node(available, self.player, self.policy, self.decide)
+            gold_before = self.player.gold
+            trace.node_counts[node.node_type.value] += 1
+
+            survived = self._resolve(node)
+            if survived:
+                self.dungeon_map.select_node(node.node_id)
+
+            gold_delta = self.player.gold - gold_before
+            if gold_delta > 0:
+                trace.gold_earned += gold_delta
+            else:
+                trace.gold_spent -= gold_delta
+            trace.floors.append((self.player.hp, self.player.max_hp, self.player.gold, self.artifacts))
+
+            if not survived:
+                trace.death_floor = node.floor + 1
+                return trace
+
+        trace.won = self.dungeon_map.is_completed()
+        return trace
+
+    def _resolve(self, node: DungeonNode) -> bool:
+        """ノードを解決（死亡したらFalse）"""
+        if node.node_type in (NodeType.BATTLE, NodeType.ELITE, NodeType.BOSS):
+            return self._battle(node)
+        if node.node_type == NodeType.TREASURE:
+            self._treasure(node)
+        elif node.node_type == NodeType.SHOP:
+            self._shop(node)
+        elif node.node_type == NodeType.REST:
+            self._rest(node)
+        elif node.node_type == NodeType.EVENT:
+            self._event(node)
+        return self.player.hp > 0
+
+    def _battle(self, node: DungeonNode) -> bool:
+        """戦闘（マップから BattleHandler を作るときと同じく floor + 1 の敵グループ）"""
+        enemies = create_enemy_group(node.floor + 1)
+        # BattleHandler._generate_victory_rewards と同じ判定
+        is_boss = len(enemies) == 1 and enemies[0].max_hp > 50
+        enemy_type = enemies[0].enemy_type.value
+
+        build = replace(self.policy.build, max_hp=self.player.max_hp,
+                        chain_damage_multiplier=self.policy.build.chain_damage_multiplier *
+                        self.player.chain_damage_multiplier)
+        won, _, hp_lost, _ = fight(enemies, build, self.player.hp, dt=self.battle_dt)
+        self.player.hp = max(0, self.player.hp - hp_lost)
+        if not won:
+            # 時間切れも敗北扱い
+            self.player.hp = 0
+            return False
+
+        rewards = reward_generator.generate_battle_rewards(node.floor + 1, enemy_type, is_boss)
+        reward = choose_reward(rewards, self.policy)
+        apply_battle_reward(self.player, reward, self.economy)
+        if reward.reward_type == RewardType.ARTIFACT:
+            self.artifacts += 1
+        return True
+
+    def _treasure(self, node: DungeonNode):
+        from treasure.treasure_handler import TreasureHandler
+
+        handler = TreasureHandler(self.engine, current_node=node)
+        self.player.visit_room("treasure")
+        for reward in handler.treasure_rewards:
+            handler._apply_reward(reward)
+            if reward.reward_type == RewardType.ARTIFACT:
+                self.artifacts += 1
+
+    def _shop(self, node: DungeonNode):
+        from shop.shop_handler import ShopHandler
+
+        handler = ShopHandler(self.engine, current_node=node)
+        for category in self.policy.shop_priority:
+            for index, shop_item in enumerate(handler.shop_items):
+                if shop_item.sold or not self._wants(category, shop_item):
+                    continue
+                shop_item.price = int(shop_item.price * self.economy.price_scale)
+                if self.player.gold - shop_item.price < self.policy.gold_reserve:
+                    continue
+                if shop_item.item_type == 'special_puyo':
+                    # 出現率の変更はプロセス全体に残るため、購入と所持だけ反映
+                    self.player.spend_gold(shop_item.price)
+                    self.player.add_special_puyo(shop_item.item['puyo_type'])
+                    shop_item.sold = True
+                else:
+                    handler.player_gold = self.player.gold
+                    handler.selected_index = index
+                    handler._attempt_purchase()
+                if shop_item.sold and shop_item.item_type == 'artifact':
+                    self.artifacts += 1
+
+    def _wants(self, category: str, shop_item) -> bool:
+        """ショップの商品が方針のカテゴリーに当てはまるか"""
+        from items.potions import PotionType
+
+        if category == 'heal':
+            return (shop_item.item_type == 'potion' and
+                    shop_item.item.potion_type == PotionType.HEALTH and
+                    self.player.hp < self.player.max_hp * self.policy.heal_threshold)
+        if category == 'potion':
+            return shop_item.item_type == 'potion' and shop_item.item.potion_type != PotionType.HEALTH
+        return shop_item.item_type == category
+
+    def _rest(self, node: DungeonNode):
+        from rest.rest_handler import RestHandler, RestAction
+
+        handler = RestHandler(self.engine, current_node=node)
+        self.player.visit_room("rest")
+        actions = {action['type']: action for action in handler.available_actions}
+        if RestAction.HEAL in actions and self.player.hp < self.player.max_hp * self.policy.heal_threshold:
+            handler._execute_heal(actions[RestAction.HEAL])
+        else:
+            handler._execute_upgrade(actions[RestAction.UPGRADE])
+
+    def _event(self, node: DungeonNode):
+        from event.event_handler import EventHandler
+
+        handler = EventHandler(self.engine, current_node=node)
+        self.player.visit_room("event")
+        choices = handler.current_event.choices
+        if self.policy.event_choice is None:
+            choice = self.decide.choice(choices)
+        else:
+            choice = choices[min(self.policy.event_choice, len(choices) - 1)]
+        choice.effect()
+
+
+def simulate_run(seed: int, policy: RunPolicy, economy: EconomySettings = EconomySettings(),
+                 battle_dt: float = RUN_BATTLE_DT) -> RunTrace:
+    """1ランをシミュレート"""
+    return RunSimulator(seed, policy, economy, battle_dt).run()
+
+
+def histogram_percentile(histogram: Counter, pct: float) -> float:
+    """ヒストグラムから最近傍順位法のパーセンタイルを求める（値がなければ0）"""
+    total = sum(histogram.values())
+    if total == 0:
+        return 0.0
+    rank = min(total - 1, max(0, int(round(pct / 100 * (total - 1)))))
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if seen > rank:
+            return float(value)
+    return 0.0
+
+
+class RunAggregate:
+    """ランの結果をヒストグラムに集計するクラス（部分集計どうしをマージできる）"""
+
+    def __init__(self, total_floors: int = RUN_TOTAL_FLOORS):
+        self.total_floors = total_floors
+        self.runs = 0
+        self.wins = 0
+        self.gold_earned = 0
+        self.gold_spent = 0
+        self.death_floors: Counter = Counter()
+        self.node_counts: Counter = Counter()
+        self.floor_histograms: Dict[str, List[Counter]] = {
+            metric: [Counter() for _ in range(total_floors)] for metric in FLOOR_METRICS
+        }
+
+    def add(self, trace: RunTrace):
+        self.runs += 1
+        self.wins += trace.won
+        self.gold_earned += trace.gold_earned
+        self.gold_spent += trace.gold_spent
+        self.node_counts.update(trace.node_counts)
+        if trace.death_floor is not None:
+            self.death_floors[trace.death_floor] += 1
+        for floor, values in enumerate(trace.floors[:self.total_floors]):
+            for metric, value in zip(FLOOR_METRICS, values):
+                self.floor_histograms[metric][floor][value] += 1
+
+    def merge(self, other: 'RunAggregate'):
+        self.runs += other.runs
+        self.wins += other.wins
+        self.gold_earned += other.gold_earned
+        self.gold_spent += other.gold_spent
+        self.death_floors.update(other.death_floors)
+        self.node_counts.update(other.node_counts)
+        for metric in FLOOR_METRICS:
+            for mine, theirs in zip(self.floor_histograms[metric], other.floor_histograms[metric]):
+                mine.update(theirs)
+
+    def floor_rows(self) -> List[Dict[str, object]]:
+        """フロアごとの推移（到達率と各値のパーセンタイル）"""
+        rows = []
+        for floor in range(self.total_floors):
+            reached = sum(self.floor_histograms['hp'][floor].values())
+            row: Dict[str, object] = {
+                'floor': floor + 1,
+                'reached_rate': reached / self.runs if self.runs else 0.0,
+            }
+            for metric in FLOOR_METRICS:
+                for pct in PERCENTILES:
+                    row[f'{metric}_p{pct}'] = histogram_percentile(self.floor_histograms[metric][floor], pct)
+            rows.append(row)
+        return rows
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            'runs': self.runs,
+            'win_rate': self.wins / self.runs if self.runs else 0.0,
+            'gold_earned_mean': self.gold_earned / self.runs if self.runs else 0.0,
+            'gold_spent_mean': self.gold_spent / self.runs if self.runs else 0.0,
+            'death_floors': dict(sorted(self.death_floors.items())),
+            'node_counts': dict(self.node_counts.most_common()),
+        }
+
+
+def _run_chunk(task: Tuple[RunPolicy, int, int, int, EconomySettings]) -> RunAggregate:
+    """ワーカーでシードの範囲をまとめて実行し、部分集計だけを返す"""
+    policy, start, count, base_seed, economy = task
+    aggregate = RunAggregate()
+    for index in range(start, start + count):
+        aggregate.add(simulate_run(derive_seed(base_seed, f"{policy.name}:{index}"), policy, economy))
+    return aggregate
+
+
+def _init_worker(overrides: Optional[Dict[str, float]]):
+    # ランごとのログは大量になるため出力しない
+    logging.disable(logging.CRITICAL)
+    pygame.font.init()  # EventHandler が既定フォントを作るため
+    apply_scaling_overrides(overrides)
+
+
+def run_sweep(policies: Iterable[RunPolicy], runs: int, workers: Optional[int] = None, base_seed: int = 0,
+              economy: EconomySettings = EconomySettings(), overrides: Optional[Dict[str, float]] = None,
+              chunk_size: int = 25) -> Dict[str, RunAggregate]:
+    """方針ごとに runs 回のランを実行して集計する
+
+    Args:
+        workers: プロセス数（Noneならコア数、0なら同じプロセスで実行）
+        overrides: 敵のスケーリング定数の上書き（battle_simulator と同じ）
+        chunk_size: 1タスクにまとめるラン数
+
+    Returns:
+        方針名 → 集計
+    """
+    policies = list(policies)
+    aggregates = {policy.name: RunAggregate() for policy in policies}
+    tasks = ((policy, start, min(chunk_size, runs - start), base_seed, economy)
+             for policy in policies for start in range(0, runs, chunk_size))
+
+    if workers == 0:
+        original = {name: getattr(enemy_module, name) for name in SCALING_CONSTANTS}
+        _init_worker(overrides)
+        try:
+            for task in tasks:
+                aggregates[task[0].name].merge(_run_chunk(task))
+        finally:
+            logging.disable(logging.NOTSET)
+            apply_scaling_overrides(original)
+        return aggregates
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(overrides,)) as executor:
+        # 投入するタスクを一定数に抑え、終わったものから集計に取り込む
+        max_pending = workers * 2
+        pending = {}
+        for task in tasks:
+            pending[executor.submit(_run_chunk, task)] = task[0].name
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    aggregates[pending.pop(future)].merge(future.result())
+        for future in list(pending):
+            aggregates[pending.pop(future)].merge(future.result())
+    return aggregates
+
+
+def write_csv(aggregates: Dict[str, RunAggregate], path: str):
+    """方針 × フロアの推移をCSVに保存"""
+    rows = [{'policy': name, **row} for name, aggregate in aggregates.items() for row in aggregate.floor_rows()]
+    if not rows:
+        return
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(aggregates: Dict[str, RunAggregate], path: str, settings: Optional[Dict[str, object]] = None):
+    results = {name: {'summary': aggregate.summary(), 'floors': aggregate.floor_rows()}
+               for name, aggregate in aggregates.items()}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'settings': settings or {}, 'results': results}, f, indent=2, ensure_ascii=False)
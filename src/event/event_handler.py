@@ -1,10 +1,10 @@
 import pygame
-import random
 import logging
 from typing import List, Dict, Callable, Optional
 from core.state_handler import StateHandler
 from core.constants import GameState, Colors
-from core.game_engine import GameEngine
+from core.game_engine import GameEngine, get_mouse_pos
+from core.rng import get_rng
 from dungeon.dungeon_map import NodeType, DungeonNode
 
 logger = logging.getLogger(__name__)
@@ -55,15 +55,15 @@ class EventHandler(StateHandler):
             self._create_golden_idol_event()
         ]
         
-        self.current_event = random.choice(events)
+        self.current_event = get_rng('event').choice(events)
     
     def _create_mysterious_shrine_event(self) -> RandomEvent:
         """謎の祠イベント"""
         def pray_effect():
             # ランダムに HP回復 or スキル強化 or 呪い
-            roll = random.randint(1, 3)
+            roll = get_rng('event').randint(1, 3)
             if roll == 1:
-                heal_amount = random.randint(15, 25)
+                heal_amount = get_rng('event').randint(15, 25)
                 old_hp = self.engine.player.hp
                 self.engine.player.hp = min(self.engine.player.max_hp, self.engine.player.hp + heal_amount)
                 actual_heal = self.engine.player.hp - old_hp
@@ -76,7 +76,7 @@ class EventHandler(StateHandler):
                 self.engine.player.chain_damage_bonus += 10
                 self._show_result("祠の加護を受けた！最大HP+5、連鎖ダメージ+10%")
             else:
-                curse_damage = random.randint(8, 12)
+                curse_damage = get_rng('event').randint(8, 12)
                 self.engine.player.hp = max(1, self.engine.player.hp - curse_damage)
                 self._show_result(f"祠の呪いを受けた... {curse_damage}ダメージ")
         
@@ -86,8 +86,8 @@ class EventHandler(StateHandler):
         
         def steal_effect():
             # 確実にダメージを受けるが、ゴールドを得る
-            damage = random.randint(5, 10)
-            gold = random.randint(80, 120)
+            damage = get_rng('event').randint(5, 10)
+            gold = get_rng('event').randint(80, 120)
             self.engine.player.hp = max(1, self.engine.player.hp - damage)
             self.engine.player.gold += gold
             self._show_result(f"祠の宝を盗んだ！{gold}ゴールドを得たが {damage}ダメージを受けた")
@@ -127,12 +127,12 @@ class EventHandler(StateHandler):
         
         def rob_effect():
             # 強盗を試みる：成功すればアイテム、失敗すればダメージ
-            if random.random() < 0.4:  # 40%成功率
-                gold = random.randint(60, 100)
+            if get_rng('event').random() < 0.4:  # 40%成功率
+                gold = get_rng('event').randint(60, 100)
                 self.engine.player.gold += gold
                 self._show_result(f"強盗成功！{gold}ゴールドを奪った！")
             else:
-                damage = random.randint(12, 18)
+                damage = get_rng('event').randint(12, 18)
                 self.engine.player.hp = max(1, self.engine.player.hp - damage)
                 self._show_result(f"強盗失敗！商人に反撃され {damage}ダメージ")
         
@@ -150,14 +150,14 @@ class EventHandler(StateHandler):
         """呪いの泉イベント"""
         def drink_effect():
             # 50%で大回復、50%で毒
-            if random.random() < 0.5:
-                heal_amount = random.randint(25, 40)
+            if get_rng('event').random() < 0.5:
+                heal_amount = get_rng('event').randint(25, 40)
                 old_hp = self.engine.player.hp
                 self.engine.player.hp = min(self.engine.player.max_hp, self.engine.player.hp + heal_amount)
                 actual_heal = self.engine.player.hp - old_hp
                 self._show_result(f"清浄な水だった！{actual_heal}HP回復")
             else:
-                damage = random.randint(15, 20)
+                damage = get_rng('event').randint(15, 20)
                 self.engine.player.hp = max(1, self.engine.player.hp - damage)
                 self._show_result(f"呪われた水だった... {damage}ダメージ")
         
@@ -201,7 +201,7 @@ class EventHandler(StateHandler):
         
         def rest_effect():
             # 読書で休憩
-            heal_amount = random.randint(12, 18)
+            heal_amount = get_rng('event').randint(12, 18)
             old_hp = self.engine.player.hp
             self.engine.player.hp = min(self.engine.player.max_hp, self.engine.player.hp + heal_amount)
             actual_heal = self.engine.player.hp - old_hp
@@ -209,8 +209,8 @@ class EventHandler(StateHandler):
         
         def search_effect():
             # 宝探し
-            if random.random() < 0.7:  # 70%成功
-                gold = random.randint(50, 80)
+            if get_rng('event').random() < 0.7:  # 70%成功
+                gold = get_rng('event').randint(50, 80)
                 self.engine.player.gold += gold
                 self._show_result(f"隠された宝を発見！{gold}ゴールド獲得")
             else:
@@ -232,8 +232,8 @@ class EventHandler(StateHandler):
         """黄金の偶像イベント"""
         def take_effect():
             # 呪いと引き換えに大金
-            gold = random.randint(120, 180)
-            curse_damage = random.randint(10, 15)
+            gold = get_rng('event').randint(120, 180)
+            curse_damage = get_rng('event').randint(10, 15)
             self.engine.player.gold += gold
             self.engine.player.hp = max(1, self.engine.player.hp - curse_damage)
             self.engine.player.max_hp = max(10, self.engine.player.max_hp - 3)  # 永続的な呪い（最低10HPは残す）
@@ -328,7 +328,7 @@ class EventHandler(StateHandler):
     def handle_event(self, event: pygame.event.Event) -> bool:
         if event.type == pygame.MOUSEMOTION:
             self.hovered_choice = -1
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = get_mouse_pos()
             for i, rect in enumerate(self.choice_rects):
                 if rect.collidepoint(mouse_pos):
                     self.hovered_choice = i
@@ -341,7 +341,7 @@ class EventHandler(StateHandler):
                     self._return_to_map()
                     return True
                 
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = get_mouse_pos()
                 for i, rect in enumerate(self.choice_rects):
                     if rect.collidepoint(mouse_pos):
                         # 選択肢の効果を実行
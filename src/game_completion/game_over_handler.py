@@ -7,7 +7,7 @@ import pygame
 from typing import Dict
 from core.state_handler import StateHandler
 from core.constants import GameState, Colors
-from core.game_engine import GameEngine
+from core.game_engine import GameEngine, get_mouse_pos
 
 class GameOverHandler(StateHandler):
     def __init__(self, engine: GameEngine, death_cause: str = "戦闘で力尽きた"):
@@ -60,7 +60,7 @@ class GameOverHandler(StateHandler):
     def handle_event(self, event: pygame.event.Event) -> bool:
         if event.type == pygame.MOUSEMOTION:
             self.hovered_button = None
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = get_mouse_pos()
             for button_name, rect in self.button_rects.items():
                 if rect.collidepoint(mouse_pos):
                     self.hovered_button = button_name
@@ -68,7 +68,7 @@ class GameOverHandler(StateHandler):
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = get_mouse_pos()
                 for button_name, rect in self.button_rects.items():
                     if rect.collidepoint(mouse_pos):
                         self._handle_button_click(button_name)
@@ -112,6 +112,9 @@ class GameOverHandler(StateHandler):
         # ダンジョンマップをリセット
         self.engine.persistent_dungeon_map = None
         
+        # 新しいランのシードを設定
+        self.engine.start_new_run()
+        
         # ダンジョンマップ画面に遷移
         self.engine.change_state(GameState.DUNGEON_MAP)
     
@@ -128,6 +131,9 @@ class GameOverHandler(StateHandler):
         # ダンジョンマップをリセット
         self.engine.persistent_dungeon_map = None
         
+        # 新しいランのシードを設定
+        self.engine.start_new_run()
+        
         # メニューに遷移
         self.engine.change_state(GameState.MENU)
     
@@ -3,6 +3,7 @@ from typing import List, Optional
 from core.state_handler import StateHandler
 from core.constants import GameState, Colors
 from core.game_engine import GameEngine
+from core.draw_list import get_draw_list
 from .player_inventory import PlayerInventory, Item, ItemType, ItemRarity
 
 class InventoryUI(StateHandler):
@@ -217,6 +218,9 @@ class InventoryUI(StateHandler):
         end_index = min(start_index + visible_items, len(items))
         self.max_scroll = max(0, (len(items) - visible_items) * item_height)
         
+        # 文字は行の枠を描いた後でまとめて描画
+        draw_list = get_draw_list()
+        
         for i in range(start_index, end_index):
             item = items[i]
             y_pos = list_start_y + (i - start_index) * item_height - (self.scroll_offset % item_height)
@@ -238,15 +242,17 @@ class InventoryUI(StateHandler):
             
             # アイテム名
             name_text = self.font_medium.render(item.get_display_name(), True, Colors.WHITE)
-            screen.blit(name_text, (item_rect.x + 55, item_rect.y + 5))
+            draw_list.add(screen, name_text, (item_rect.x + 55, item_rect.y + 5))
             
             # アイテム説明
             desc_text = self.font_small.render(item.description, True, Colors.LIGHT_GRAY)
-            screen.blit(desc_text, (item_rect.x + 55, item_rect.y + 30))
+            draw_list.add(screen, desc_text, (item_rect.x + 55, item_rect.y + 30))
             
             # 価値
             value_text = self.font_small.render(f"{item.get_value()}G", True, Colors.GOLD)
-            screen.blit(value_text, (item_rect.right - 100, item_rect.y + 20))
+            draw_list.add(screen, value_text, (item_rect.right - 100, item_rect.y + 20))
+        
+        draw_list.flush(screen)
     
     def _render_item_details(self, screen: pygame.Surface, item: Item):
         """アイテム詳細表示"""
@@ -3,12 +3,12 @@
 """
 
 import logging
-import random
 from typing import Dict, List, Optional, Set
 from enum import Enum
 from dataclasses import dataclass
 
 from core.constants import *
+from core.rng import get_rng
 
 logger = logging.getLogger(__name__)
 
@@ -483,10 +483,10 @@ def create_random_artifact(floor_level: int = 1) -> Artifact:
     # レアリティ選択
     rarities = list(rarity_weights.keys())
     weights = list(rarity_weights.values())
-    selected_rarity = random.choices(rarities, weights=weights)[0]
+    selected_rarity = get_rng('reward').choices(rarities, weights=weights)[0]
     
     # 装飾品タイプ選択
-    artifact_type = random.choice(list(ArtifactType))
+    artifact_type = get_rng('reward').choice(list(ArtifactType))
     
     return Artifact(artifact_type, selected_rarity)
 
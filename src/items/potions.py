@@ -3,12 +3,12 @@
 """
 
 import logging
-import random
 from typing import Dict, List, Optional, Callable, Any
 from enum import Enum
 from dataclasses import dataclass
 
 from core.constants import *
+from core.rng import get_rng
 
 logger = logging.getLogger(__name__)
 
@@ -324,10 +324,10 @@ def create_random_potion(floor_level: int = 1) -> Potion:
     # レアリティ選択
     rarities = list(rarity_weights.keys())
     weights = list(rarity_weights.values())
-    selected_rarity = random.choices(rarities, weights=weights)[0]
+    selected_rarity = get_rng('reward').choices(rarities, weights=weights)[0]
     
     # ポーションタイプ選択
-    potion_type = random.choice(list(PotionType))
+    potion_type = get_rng('reward').choice(list(PotionType))
     
     return Potion(potion_type, selected_rarity)
 
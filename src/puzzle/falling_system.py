@@ -8,9 +8,9 @@ import logging
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
-import random
 
 from core.constants import *
+from core.rng import get_rng
 from .puyo_grid import PuyoGrid, PuyoPosition
 
 logger = logging.getLogger(__name__)
@@ -129,7 +129,7 @@ class FallingSystem:
         colors = [PuyoType.RED, PuyoType.BLUE, PuyoType.GREEN, 
                  PuyoType.YELLOW, PuyoType.PURPLE]
         bag = colors * 2  # 各色2個
-        random.shuffle(bag)
+        get_rng('puzzle').shuffle(bag)
         return bag
     
     def _get_next_puyo_type(self) -> PuyoType:
@@ -6,14 +6,17 @@ Drop Puzzle × Roguelike のぷよぷよゲーム部分の核となるグリッ
 import pygame
 import logging
 import math
-import time
-import random
 from typing import List, Optional, Set, Tuple, Dict
 from dataclasses import dataclass
 from copy import deepcopy
 
 from core.constants import *
-from core.sound_manager import play_se, SoundType
+from core.sound_manager import play_se, play_chain_se, SoundType
+from core.quality_governor import get_quality_setting
+from core.asset_cache import get_derived, load_image
+from core.draw_list import get_draw_list, LAYER_OVERLAY
+from core.game_clock import get_game_clock
+from core.rng import get_rng
 from special_puyo.special_puyo import special_puyo_manager
 
 logger = logging.getLogger(__name__)
@@ -45,6 +48,49 @@ class PuyoPosition:
         return neighbors
 
 
+def authentic_chain_score(puyo_count: int, puyo_type: PuyoType) -> int:
+    """本家風連鎖スコア計算"""
+    # 本家ぷよぷよのスコア計算式
+    # 基本点 = 消去数 × 10
+    base_points = puyo_count * 10
+    
+    # 連結数ボーナス（4個=1.0, 5個=1.2, 6個=1.4...）
+    connection_bonus = 1.0 + (puyo_count - 4) * 0.2
+    
+    # 色ボーナス（一部の色に特別ボーナス）
+    color_bonus = 1.0
+    if puyo_type in [PuyoType.PURPLE, PuyoType.ORANGE]:
+        color_bonus = 1.1
+    
+    final_score = int(base_points * connection_bonus * color_bonus)
+    return max(final_score, 40)  # 最低40点保証
+
+
+def authentic_chain_multiplier(chain_level: int) -> float:
+    """本家風連鎖ボーナス倍率計算"""
+    # 本家ぷよぷよの連鎖ボーナステーブル
+    multipliers = {
+        1: 1.0,    # 1連鎖
+        2: 1.8,    # 2連鎖
+        3: 2.9,    # 3連鎖
+        4: 4.6,    # 4連鎖
+        5: 7.7,    # 5連鎖
+        6: 12.0,   # 6連鎖
+        7: 16.0,   # 7連鎖
+        8: 20.0,   # 8連鎖
+        9: 24.0,   # 9連鎖
+        10: 28.0,  # 10連鎖
+    }
+    
+    if chain_level in multipliers:
+        return multipliers[chain_level]
+    elif chain_level > 10:
+        # 10連鎖以上は線形増加
+        return 28.0 + (chain_level - 10) * 4.0
+    else:
+        return 1.0
+
+
 @dataclass
 class ChainResult:
     """連鎖結果情報"""
@@ -294,20 +340,7 @@ class PuyoGrid:
     
     def _calculate_authentic_chain_score(self, puyo_count: int, puyo_type: PuyoType) -> int:
         """本家風連鎖スコア計算"""
-        # 本家ぷよぷよのスコア計算式
-        # 基本点 = 消去数 × 10
-        base_points = puyo_count * 10
-        
-        # 連結数ボーナス（4個=1.0, 5個=1.2, 6個=1.4...）
-        connection_bonus = 1.0 + (puyo_count - 4) * 0.2
-        
-        # 色ボーナス（一部の色に特別ボーナス）
-        color_bonus = 1.0
-        if puyo_type in [PuyoType.PURPLE, PuyoType.ORANGE]:
-            color_bonus = 1.1
-        
-        final_score = int(base_points * connection_bonus * color_bonus)
-        return max(final_score, 40)  # 最低40点保証
+        return authentic_chain_score(puyo_count, puyo_type)
     
     def _record_chain_positions(self, positions: Set[PuyoPosition]):
         """連鎖で消去される位置を記録（内部用）"""
@@ -331,7 +364,10 @@ class PuyoGrid:
     def eliminate_puyos(self, positions: Set[PuyoPosition]) -> int:
         """指定位置のぷよを消去（フェードアウトアニメーション付き）"""
         eliminated_count = 0
-        current_time = time.time()
+        current_time = get_game_clock().now()
+        
+        # 品質レベルに応じたパーティクル数
+        particle_count = get_quality_setting('elimination_particles')
         
         for pos in positions:
             puyo_type = self.get_puyo(pos.x, pos.y)
@@ -343,18 +379,18 @@ class PuyoGrid:
                 center_x = self.offset_x + pos.x * self.puyo_size + self.puyo_size // 2
                 center_y = self.offset_y + pos.y * self.puyo_size + self.puyo_size // 2
                 
-                # 8方向にパーティクルを飛ばす
-                for i in range(8):
-                    angle = (i / 8.0) * 2 * math.pi
-                    speed = random.uniform(50, 100)  # ピクセル/秒
+                # 放射状にパーティクルを飛ばす（最高品質で8方向）
+                for i in range(particle_count):
+                    angle = (i / particle_count) * 2 * math.pi
+                    speed = get_rng('effects').uniform(50, 100)  # ピクセル/秒
                     particles.append({
                         'x': float(center_x),
                         'y': float(center_y),
                         'vx': math.cos(angle) * speed,
                         'vy': math.sin(angle) * speed,
-                        'life': random.uniform(0.3, 0.5),  # 寿命
-                        'max_life': random.uniform(0.3, 0.5),
-                        'size': random.uniform(3, 8)
+                        'life': get_rng('effects').uniform(0.3, 0.5),  # 寿命
+                        'max_life': get_rng('effects').uniform(0.3, 0.5),
+                        'size': get_rng('effects').uniform(3, 8)
                     })
                 
                 # アニメーション用データを設定（高速化）
@@ -373,16 +409,19 @@ class PuyoGrid:
                 self.remove_special_puyo_data(pos.x, pos.y)
                 eliminated_count += 1
         
-        # 消去SEを再生（1個以上消去された場合）
+        # 消去SEを再生（1個以上消去された場合、連鎖中は連鎖数に応じた音）
         if eliminated_count > 0:
-            play_se(SoundType.ELIMINATE)
+            if self.chain_animation_active and self.animated_chain_level > 0:
+                play_chain_se(self.animated_chain_level)
+            else:
+                play_se(SoundType.ELIMINATE)
         
         logger.info(f"Eliminated {eliminated_count} puyos with fade animation")
         return eliminated_count
     
     def update_animations(self, dt: float):
         """アニメーション更新（弾けるエフェクト・連鎖アニメーション込み）"""
-        current_time = time.time()
+        current_time = get_game_clock().now()
         
         # フェードアウトアニメーション更新
         to_remove = []
@@ -622,27 +661,7 @@ class PuyoGrid:
     
     def _calculate_authentic_chain_multiplier(self, chain_level: int) -> float:
         """本家風連鎖ボーナス倍率計算"""
-        # 本家ぷよぷよの連鎖ボーナステーブル
-        multipliers = {
-            1: 1.0,    # 1連鎖
-            2: 1.8,    # 2連鎖
-            3: 2.9,    # 3連鎖
-            4: 4.6,    # 4連鎖
-            5: 7.7,    # 5連鎖
-            6: 12.0,   # 6連鎖
-            7: 16.0,   # 7連鎖
-            8: 20.0,   # 8連鎖
-            9: 24.0,   # 9連鎖
-            10: 28.0,  # 10連鎖
-        }
-        
-        if chain_level in multipliers:
-            return multipliers[chain_level]
-        elif chain_level > 10:
-            # 10連鎖以上は線形増加
-            return 28.0 + (chain_level - 10) * 4.0
-        else:
-            return 1.0
+        return authentic_chain_multiplier(chain_level)
     
     def _calculate_chain_level_score(self, chains: List, chain_level: int) -> int:
         """特定の連鎖レベルでのスコアを計算"""
@@ -778,6 +797,7 @@ class PuyoGrid:
             from core.simple_special_puyo import SimpleSpecialType
             from special_puyo.special_puyo import SpecialPuyoType
             
+            draw_list = get_draw_list()
             for (x, y), special_type in self.special_puyo_data.items():
                 if not special_type:
                     continue
@@ -808,13 +828,20 @@ class PuyoGrid:
                 icon_x = puyo_x + icon_offset
                 icon_y = puyo_y + icon_offset
                 
-                # アイコンを描画
-                scaled_icon = pygame.transform.scale(icon_image, (icon_size, icon_size))
-                surface.blit(scaled_icon, (icon_x, icon_y))
+                # スケール済みアイコンを描画リストに追加
+                scaled_icon = self._get_scaled_special_icon(old_type, icon_image, icon_size)
+                draw_list.add(surface, scaled_icon, (icon_x, icon_y))
+            
+            draw_list.flush(surface)
                 
         except ImportError:
             pass  # モジュールが利用できない場合は無視
     
+    def _get_scaled_special_icon(self, special_type, icon_image: pygame.Surface, icon_size: int) -> pygame.Surface:
+        """特殊ぷよアイコンのスケール済みサーフェスを取得（サイズごとに1度だけ生成）"""
+        return get_derived(('special_icon', special_type, icon_size),
+                           lambda: pygame.transform.scale(icon_image, (icon_size, icon_size)))
+    
     def _render_grid_background(self, surface: pygame.Surface):
         """グリッド背景を描画（透過）"""
         # 背景は描画しない（透過）
@@ -822,15 +849,21 @@ class PuyoGrid:
     
     def _render_puyos(self, surface: pygame.Surface):
         """ぷよを描画（アニメーション込み）"""
-        # 通常のぷよを描画
+        draw_list = get_draw_list()
+        
+        # 通常のぷよを描画（キャッシュ済みスプライトをまとめて描画）
+        sprite_offset = 2
         for x in range(self.width):
+            column = self.grid[x]
             for y in range(self.height):
-                puyo_type = self.get_puyo(x, y)
+                puyo_type = column[y]
                 
                 if puyo_type == PuyoType.EMPTY:
                     continue
                 
-                self._draw_puyo_at(surface, x, y, puyo_type, 255, 1.0)
+                draw_list.add(surface, self._get_puyo_sprite(puyo_type),
+                              (self.offset_x + x * self.puyo_size + sprite_offset,
+                               self.offset_y + y * self.puyo_size + sprite_offset))
                 
                 # 特殊ぷよのアイコンを表示（古いシステム無効化）
                 # self._draw_special_puyo_icon(surface, x, y)
@@ -840,6 +873,29 @@ class PuyoGrid:
             self._draw_puyo_at(surface, x, y, data['type'], data['alpha'], data['scale'])
             # パーティクルエフェクトを描画
             self._draw_particles(surface, data['particles'], data['type'])
+        
+        draw_list.flush(surface)
+    
+    def _get_puyo_sprite(self, puyo_type: PuyoType) -> pygame.Surface:
+        """通常表示のぷよスプライトを取得（色・サイズごとに1度だけ生成）"""
+        return get_derived(('puyo_sprite', puyo_type, self.puyo_size),
+                           lambda: self._create_puyo_sprite(puyo_type))
+    
+    def _create_puyo_sprite(self, puyo_type: PuyoType) -> pygame.Surface:
+        """通常表示のぷよスプライトを生成"""
+        diameter = self.puyo_size - 4
+        radius = diameter // 2
+        center = (radius, radius)
+        
+        sprite = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, PUYO_COLORS[puyo_type], center, radius)
+        pygame.draw.circle(sprite, Colors.WHITE, center, radius, 2)
+        
+        # ハイライト効果
+        highlight_radius = radius // 3
+        highlight_center = (center[0] - radius//3, center[1] - radius//3)
+        pygame.draw.circle(sprite, Colors.WHITE, highlight_center, highlight_radius)
+        return sprite
     
     def _draw_puyo_at(self, surface: pygame.Surface, x: int, y: int, puyo_type: PuyoType, alpha: int, scale: float = 1.0):
         """指定位置にぷよを描画（アルファ・スケール対応）"""
@@ -877,8 +933,8 @@ class PuyoGrid:
                 if highlight_radius > 0:
                     pygame.draw.circle(puyo_surface, Colors.WHITE, highlight_center, highlight_radius)
             
-            # 描画
-            surface.blit(puyo_surface, (center[0] - surface_size//2, center[1] - surface_size//2))
+            # 描画（描画リストに追加）
+            get_draw_list().add(surface, puyo_surface, (center[0] - surface_size//2, center[1] - surface_size//2))
         else:
             # 通常描画
             pygame.draw.circle(surface, color, center, radius)
@@ -892,6 +948,7 @@ class PuyoGrid:
     def _draw_particles(self, surface: pygame.Surface, particles: List[dict], puyo_type: PuyoType):
         """パーティクルエフェクトを描画"""
         color = PUYO_COLORS[puyo_type]
+        draw_list = get_draw_list()
         
         for particle in particles:
             if particle['life'] > 0:
@@ -910,15 +967,14 @@ class PuyoGrid:
                     # 小さな円として描画
                     pygame.draw.circle(particle_surface, color, (size, size), size)
                     
-                    # 描画
-                    surface.blit(particle_surface, (int(particle['x'] - size), int(particle['y'] - size)))
+                    # 描画（ぷよより手前のレイヤーに追加）
+                    draw_list.add(surface, particle_surface, (int(particle['x'] - size), int(particle['y'] - size)),
+                                  layer=LAYER_OVERLAY)
     
     def _render_connection_effects(self, surface: pygame.Surface):
         """連結ぷよのエフェクトを描画"""
-        import time
-        
         # アニメーション用の時間取得
-        current_time = time.time()
+        current_time = get_game_clock().now()
         pulse_intensity = (math.sin(current_time * 8) + 1) / 2  # 0-1の間で振動
         
         # 効率化のため、処理済みの位置を記録
@@ -951,6 +1007,9 @@ class PuyoGrid:
         """連結ハイライトエフェクトを描画"""
         base_color = PUYO_COLORS[puyo_type]
         
+        # 品質レベルに応じたグロウ層数（最大3層）
+        glow_layers = get_quality_setting('connection_glow_layers')
+        
         for pos in connected_positions:
             x, y = pos.x, pos.y
             
@@ -965,7 +1024,7 @@ class PuyoGrid:
             bright_color = tuple(min(255, int(c * 1.5)) for c in base_color)
             
             # 外側のグロウエフェクト
-            for i in range(3):
+            for i in range(glow_layers):
                 glow_radius = effect_radius + i * 2
                 alpha = int(80 * pulse_intensity * (3 - i) / 3)
                 
@@ -1093,10 +1152,12 @@ class PuyoGrid:
         for puyo_type, filename in image_mapping.items():
             try:
                 image_path = f"Picture/{filename}"
-                image = pygame.image.load(image_path)
                 # ぷよサイズに合わせてスケール（少し小さめにして、ぷよの上に重ねる）
                 scaled_size = int(self.puyo_size * 0.7)
-                images[puyo_type] = pygame.transform.scale(image, (scaled_size, scaled_size))
+                image = load_image(image_path, (scaled_size, scaled_size))
+                if image is None:
+                    raise pygame.error(f"Cannot load {image_path}")
+                images[puyo_type] = image
                 logger.debug(f"Loaded special puyo image: {filename}")
             except pygame.error as e:
                 logger.warning(f"Failed to load special puyo image {filename}: {e}")
@@ -4,11 +4,11 @@ Slay the Spire風の報酬選択画面
 """
 
 import pygame
-import random
 from typing import List, Optional
 from core.state_handler import StateHandler
 from core.constants import GameState, Colors
-from core.game_engine import GameEngine
+from core.game_engine import GameEngine, get_mouse_pos
+from core.rng import get_rng
 from inventory.player_inventory import create_item, ItemRarity
 from .reward_system import Reward, RewardType
 
@@ -74,7 +74,7 @@ class BattleRewardHandler(StateHandler):
         floor_bonus = self.floor * 2
         
         # ランダム要素
-        variation = random.randint(-5, 5)
+        variation = get_rng('reward').randint(-5, 5)
         
         return max(10, base + floor_bonus + variation)
     
@@ -100,7 +100,7 @@ class BattleRewardHandler(StateHandler):
         
         # 重み付きランダム選択
         total_weight = sum(weight for _, weight in reward_types)
-        roll = random.randint(1, total_weight)
+        roll = get_rng('reward').randint(1, total_weight)
         
         cumulative = 0
         for reward_type, weight in reward_types:
@@ -137,7 +137,7 @@ class BattleRewardHandler(StateHandler):
         if self.floor >= 5 or self.enemy_type in ["elite", "boss"]:
             potions.append(("health_potion_large", "大きな体力ポーション", ItemRarity.RARE))
         
-        potion_id, name, rarity = random.choice(potions)
+        potion_id, name, rarity = get_rng('reward').choice(potions)
         
         return Reward(
             reward_type=RewardType.POTION,
@@ -163,7 +163,7 @@ class BattleRewardHandler(StateHandler):
                 ("golden_scarab", "黄金のスカラベ", ItemRarity.EPIC)
             ])
         
-        artifact_id, name, rarity = random.choice(artifacts)
+        artifact_id, name, rarity = get_rng('reward').choice(artifacts)
         
         return Reward(
             reward_type=RewardType.ARTIFACT,
@@ -175,9 +175,9 @@ class BattleRewardHandler(StateHandler):
     
     def _create_hp_upgrade_reward(self) -> Reward:
         """HP強化報酬を作成"""
-        hp_gain = random.randint(8, 15)
+        hp_gain = get_rng('reward').randint(8, 15)
         if self.enemy_type in ["elite", "boss"]:
-            hp_gain = random.randint(12, 20)
+            hp_gain = get_rng('reward').randint(12, 20)
         
         return Reward(
             reward_type=RewardType.HP_UPGRADE,
@@ -199,9 +199,9 @@ class BattleRewardHandler(StateHandler):
     
     def _create_chain_upgrade_reward(self) -> Reward:
         """連鎖強化報酬を作成"""
-        chain_bonus = random.randint(10, 20)
+        chain_bonus = get_rng('reward').randint(10, 20)
         if self.enemy_type in ["elite", "boss"]:
-            chain_bonus = random.randint(15, 25)
+            chain_bonus = get_rng('reward').randint(15, 25)
         
         return Reward(
             reward_type=RewardType.CHAIN_UPGRADE,
@@ -214,7 +214,7 @@ class BattleRewardHandler(StateHandler):
     def handle_event(self, event: pygame.event.Event) -> bool:
         if event.type == pygame.MOUSEMOTION:
             self.hovered_reward = -1
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = get_mouse_pos()
             for i, rect in enumerate(self.reward_rects):
                 if rect.collidepoint(mouse_pos):
                     self.hovered_reward = i
@@ -222,7 +222,7 @@ class BattleRewardHandler(StateHandler):
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = get_mouse_pos()
                 for i, rect in enumerate(self.reward_rects):
                     if rect.collidepoint(mouse_pos) and not self.selected_rewards[i]:
                         self._select_reward(i)
@@ -3,13 +3,13 @@
 """
 
 import logging
-import random
 import pygame
 from typing import Dict, List, Optional, Union
 from enum import Enum
 from dataclasses import dataclass
 
 from core.constants import *
+from core.rng import get_rng
 from inventory.player_inventory import create_item, ItemRarity
 import pygame.font
 
@@ -139,7 +139,7 @@ class RewardGenerator:
             if other_types:  # 他のタイプがある場合のみ
                 reward_types = [t[0] for t in other_types]
                 weights = [t[1] for t in other_types]
-                selected_type = random.choices(reward_types, weights=weights)[0]
+                selected_type = get_rng('reward').choices(reward_types, weights=weights)[0]
                 
                 reward = self._generate_specific_reward(selected_type, floor_level)
                 if reward:
@@ -156,7 +156,7 @@ class RewardGenerator:
             base_gold *= 2
         
         # ±20%のランダム要素
-        variation = random.uniform(0.8, 1.2)
+        variation = get_rng('reward').uniform(0.8, 1.2)
         return int(base_gold * variation)
     
     def _generate_specific_reward(self, reward_type: RewardType, floor_level: int) -> Optional[Reward]:
@@ -165,7 +165,7 @@ class RewardGenerator:
         if reward_type == RewardType.POTION:
             # ポーション報酬の簡易実装
             potions = ["health_potion_small", "health_potion_medium", "energy_potion"]
-            potion_id = random.choice(potions)
+            potion_id = get_rng('reward').choice(potions)
             
             names = {
                 "health_potion_small": "小さな体力ポーション",
@@ -184,7 +184,7 @@ class RewardGenerator:
         elif reward_type == RewardType.ARTIFACT:
             # アーティファクト報酬の簡易実装
             artifacts = ["lucky_coin", "vitality_amulet", "power_ring", "merchants_badge"]
-            artifact_id = random.choice(artifacts)
+            artifact_id = get_rng('reward').choice(artifacts)
             
             names = {
                 "lucky_coin": "幸運のコイン",
@@ -202,7 +202,7 @@ class RewardGenerator:
             )
         
         elif reward_type == RewardType.HP_UPGRADE:
-            hp_amount = random.randint(8, 15) + floor_level
+            hp_amount = get_rng('reward').randint(8, 15) + floor_level
             return Reward(
                 reward_type=RewardType.HP_UPGRADE,
                 value=hp_amount,
@@ -212,7 +212,7 @@ class RewardGenerator:
             )
         
         elif reward_type == RewardType.CHAIN_UPGRADE:
-            chain_bonus = random.randint(10, 20)
+            chain_bonus = get_rng('reward').randint(10, 20)
             return Reward(
                 reward_type=RewardType.CHAIN_UPGRADE,
                 value=chain_bonus,
@@ -229,7 +229,7 @@ class RewardGenerator:
             # ランダムな特殊ぷよタイプを選択（新しいSimpleSpecialTypeシステム）
             from core.simple_special_puyo import SimpleSpecialType
             available_types = list(SimpleSpecialType)
-            selected_type = random.choice(available_types)
+            selected_type = get_rng('reward').choice(available_types)
             
             # 各タイプの日本語名とアイコン
             type_info = {
@@ -5,11 +5,11 @@ Drop Puzzle × Roguelike のショップ画面管理
 
 import pygame
 import logging
-import random
 from typing import Dict, List, Optional, Union
 
 from core.constants import *
 from core.game_engine import GameEngine
+from core.rng import get_rng
 from items.potions import Potion, create_random_potion, PotionType
 from items.artifacts import Artifact, create_random_artifact
 from special_puyo.special_puyo import SpecialPuyoType, special_puyo_manager
@@ -28,12 +28,18 @@ class ShopItem:
         self.item_type = self._determine_item_type()
     
     def get_name(self) -> str:
+        if isinstance(self.item, dict):
+            return self.item['name']
         return self.item.name
     
     def get_description(self) -> str:
+        if isinstance(self.item, dict):
+            return self.item['description']
         return self.item.description
     
     def get_color(self) -> tuple:
+        if isinstance(self.item, dict):
+            return self.item.get('color', Colors.WHITE)
         if hasattr(self.item, 'color'):
             return self.item.color
         return RARITY_COLORS.get(self.item.rarity, Colors.WHITE)
@@ -99,14 +105,14 @@ class ShopHandler:
             floor_level = self.current_node.floor + 1
         
         # ポーション 2-3個（安価なアイテム）
-        potion_count = random.randint(2, 3)
+        potion_count = get_rng('shop').randint(2, 3)
         for i in range(potion_count):
             potion = create_random_potion(floor_level)
             price = self._calculate_potion_price(potion)
             items.append(ShopItem(potion, price, len(items)))
         
         # 特殊ぷよ 1-2個（中価格のアイテム）
-        special_puyo_count = random.randint(1, 2)
+        special_puyo_count = get_rng('shop').randint(1, 2)
         for i in range(special_puyo_count):
             special_puyo_item = self._create_special_puyo_item(floor_level)
             price = self._calculate_special_puyo_price(special_puyo_item)
@@ -135,7 +141,7 @@ class ShopHandler:
         base_price = base_prices.get(potion.rarity, 15)
         
         # ±20%のランダム要素
-        variation = random.uniform(0.8, 1.2)
+        variation = get_rng('shop').uniform(0.8, 1.2)
         return int(base_price * variation)
     
     def _calculate_artifact_price(self, artifact: Artifact) -> int:
@@ -150,7 +156,7 @@ class ShopHandler:
         base_price = base_prices.get(artifact.rarity, 45)
         
         # ±15%のランダム要素
-        variation = random.uniform(0.85, 1.15)
+        variation = get_rng('shop').uniform(0.85, 1.15)
         return int(base_price * variation)
     
     def _create_special_puyo_item(self, floor_level: int) -> dict:
@@ -166,7 +172,7 @@ class ShopHandler:
             # 中盤：より強力な特殊ぷよ
             available_types = [
                 SpecialPuyoType.MULTIPLIER, SpecialPuyoType.FREEZE,
-                SpecialPuyoType.POISON, SpecialPuyoType.WILD
+                SpecialPuyoType.POISON, SpecialPuyoType.CHAIN_EXTEND
             ]
         else:
             # 後半：最強の特殊ぷよ
@@ -175,7 +181,7 @@ class ShopHandler:
                 SpecialPuyoType.BUFF, SpecialPuyoType.REFLECT
             ]
         
-        selected_type = random.choice(available_types)
+        selected_type = get_rng('shop').choice(available_types)
         
         # レアリティを決定
         rarity_weights = {
@@ -187,7 +193,7 @@ class ShopHandler:
         
         rarities = list(rarity_weights.keys())
         weights = list(rarity_weights.values())
-        rarity = random.choices(rarities, weights=weights)[0]
+        rarity = get_rng('shop').choices(rarities, weights=weights)[0]
         
         # アイコンを取得
         icons = {
@@ -199,7 +205,7 @@ class ShopHandler:
             SpecialPuyoType.HEAL: "💚",
             SpecialPuyoType.SHIELD: "🛡️",
             SpecialPuyoType.POISON: "☠️",
-            SpecialPuyoType.WILD: "❓",
+            SpecialPuyoType.CHAIN_EXTEND: "➕",
             SpecialPuyoType.CHAIN_STARTER: "🔗",
             SpecialPuyoType.BUFF: "💪",
             SpecialPuyoType.REFLECT: "🪞"
@@ -215,7 +221,7 @@ class ShopHandler:
             SpecialPuyoType.HEAL: "Restores 15 HP",
             SpecialPuyoType.SHIELD: "50% damage reduction",
             SpecialPuyoType.POISON: "Poison enemy over time",
-            SpecialPuyoType.WILD: "Adapts to adjacent colors",
+            SpecialPuyoType.CHAIN_EXTEND: "Extends chain count by 1",
             SpecialPuyoType.CHAIN_STARTER: "Guarantees chain start",
             SpecialPuyoType.BUFF: "30% attack boost",
             SpecialPuyoType.REFLECT: "Reflects damage back"
@@ -244,7 +250,7 @@ class ShopHandler:
         base_price = base_prices.get(rarity, 18)
         
         # ±15%のランダム要素
-        variation = random.uniform(0.85, 1.15)
+        variation = get_rng('shop').uniform(0.85, 1.15)
         return int(base_price * variation)
     
     def _create_heal_potion(self) -> Potion:
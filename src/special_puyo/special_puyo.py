@@ -3,13 +3,13 @@
 """
 
 import logging
-import random
 import math
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
 from core.constants import *
+from core.rng import get_rng
 
 logger = logging.getLogger(__name__)
 
@@ -335,7 +335,7 @@ class SpecialPuyoManager:
     
     def should_spawn_special_puyo(self) -> bool:
         """特殊ぷよを生成するかどうか判定"""
-        return random.random() < self.spawn_chance
+        return get_rng('special').random() < self.spawn_chance
     
     def get_random_special_type(self, player=None) -> SpecialPuyoType:
         """ランダムな特殊ぷよタイプを取得（プレイヤーが所持しているもののみ）"""
@@ -344,12 +344,12 @@ class SpecialPuyoManager:
             owned_types = list(player.owned_special_puyos)
             owned_weights = [self.rarity_weights.get(puyo_type, 0.1) for puyo_type in owned_types]
             if sum(owned_weights) > 0:
-                return random.choices(owned_types, weights=owned_weights)[0]
+                return get_rng('special').choices(owned_types, weights=owned_weights)[0]
         
         # フォールバック：従来通りの選択
         types = list(self.rarity_weights.keys())
         weights = list(self.rarity_weights.values())
-        return random.choices(types, weights=weights)[0]
+        return get_rng('special').choices(types, weights=weights)[0]
     
     def add_special_puyo(self, x: int, y: int, special_type: Optional[SpecialPuyoType] = None, player=None):
         """特殊ぷよを追加"""
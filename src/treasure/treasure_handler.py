@@ -5,11 +5,11 @@ Drop Puzzle × Roguelike の宝箱画面管理
 
 import pygame
 import logging
-import random
 from typing import Dict, List, Optional, Union
 
 from core.constants import *
 from core.game_engine import GameEngine
+from core.rng import get_rng
 from items.potions import Potion, create_random_potion
 from items.artifacts import Artifact, create_random_artifact
 from rewards.reward_system import RewardGenerator, RewardType, Reward
@@ -54,7 +54,7 @@ class TreasureHandler:
         reward_generator = RewardGenerator()
         
         # 必ずゴールドを多めに獲得
-        gold_amount = random.randint(40, 80) + floor_level * 10
+        gold_amount = get_rng('treasure').randint(40, 80) + floor_level * 10
         rewards.append(Reward(
             reward_type=RewardType.GOLD,
             value=gold_amount,
@@ -64,7 +64,7 @@ class TreasureHandler:
         ))
         
         # 高確率で装飾品またはレアポーション
-        treasure_type = random.choices(
+        treasure_type = get_rng('treasure').choices(
             [RewardType.ARTIFACT, RewardType.POTION, RewardType.HP_UPGRADE],
             weights=[50, 30, 20]
         )[0]
@@ -91,7 +91,7 @@ class TreasureHandler:
             ))
         else:
             # 大きなHP増加
-            hp_amount = random.randint(15, 25) + floor_level * 2
+            hp_amount = get_rng('treasure').randint(15, 25) + floor_level * 2
             rewards.append(Reward(
                 reward_type=RewardType.HP_UPGRADE,
                 value=hp_amount,
@@ -112,7 +112,7 @@ class TreasureHandler:
             Rarity.LEGENDARY: 10
         }
         
-        chosen_rarity = random.choices(
+        chosen_rarity = get_rng('treasure').choices(
             list(rarity_weights.keys()),
             weights=list(rarity_weights.values())
         )[0]
@@ -149,7 +149,7 @@ class TreasureHandler:
             }
         ]
         
-        artifact_data = random.choice(treasure_artifacts)
+        artifact_data = get_rng('treasure').choice(treasure_artifacts)
         
         # 簡易的なArtifactオブジェクトを作成
         class SimpleArtifact:
@@ -176,7 +176,7 @@ class TreasureHandler:
             Rarity.LEGENDARY: 5
         }
         
-        chosen_rarity = random.choices(
+        chosen_rarity = get_rng('treasure').choices(
             list(rarity_weights.keys()),
             weights=list(rarity_weights.values())
         )[0]
@@ -213,7 +213,7 @@ class TreasureHandler:
             }
         ]
         
-        potion_data = random.choice(treasure_potions)
+        potion_data = get_rng('treasure').choice(treasure_potions)
         
         # 簡易的なPotionオブジェクトを作成
         class SimplePotion:
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+アセット先読み（ワーカースレッドでのデコード）と読み込み画面のテスト
+"""
+
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core import asset_cache
+from core.asset_preloader import AssetPreloader, build_preload_manifest, IMAGE, SOUND
+from core.game_engine import GameEngine
+from core.constants import GameState
+from core.loading_screen import LoadingScreenHandler
+from core.sound_manager import SoundManager, SoundType
+
+print('=== ASSET PRELOADER TEST ===')
+
+
+def test_manifest_lists_existing_assets():
+    manifest = build_preload_manifest()
+    paths = [os.path.basename(path) for _, path in manifest]
+    print(f'Manifest: {len(manifest)} assets')
+    assert '背景.png' in paths
+    assert 'HEAL.png' in paths
+    assert all(os.path.exists(path) for _, path in manifest)
+    assert any(kind == SOUND for kind, _ in manifest)
+
+
+def test_preloaded_images_served_from_cache():
+    """先読みした画像は load_image で再読み込みせずに返される"""
+    asset_cache.clear()
+    manifest = [(IMAGE, asset_cache.asset_path('HP.png')), (IMAGE, asset_cache.asset_path('gold.png'))]
+    preloader = AssetPreloader(manifest)
+    assert preloader.progress == 0.0
+    preloader.wait()
+    assert preloader.done and preloader.progress == 1.0
+
+    image = asset_cache.load_image('HP.png')
+    assert image is not None
+    assert asset_cache.load_image(asset_cache.asset_path('HP.png')) is image
+
+    # 読み込み済みのアセットは次の先読みから除外
+    assert AssetPreloader(manifest).total == 0
+
+
+def test_loading_screen_switches_state_when_done():
+    engine = GameEngine()
+    asset_cache.clear()
+    preloader = AssetPreloader([(IMAGE, asset_cache.asset_path('gold.png'))])
+    engine.register_state_handler(GameState.LOADING, LoadingScreenHandler(engine, GameState.DUNGEON_MAP, preloader))
+    engine.change_state(GameState.LOADING)
+
+    for _ in range(200):
+        engine.update(1 / 60)
+        engine.render()
+        if engine.current_state != GameState.LOADING:
+            break
+        preloader._thread.join(0.01)
+    assert engine.current_state == GameState.DUNGEON_MAP
+    assert asset_cache.is_loaded('gold.png')
+
+
+def test_sounds_decoded_by_worker_after_engine_init():
+    """エンジン初期化ではSEをデコードせず、先読みのワーカースレッドがデコードする"""
+    asset_cache.clear()
+    engine = GameEngine(headless=True)
+    if not pygame.mixer.get_init():
+        print('Mixer unavailable, skipped')
+        return
+    sounds = [(kind, path) for kind, path in build_preload_manifest() if kind == SOUND]
+    preloader = AssetPreloader(sounds)
+    assert preloader.total == len(sounds) > 0
+
+    decoded_on = []
+    decode_sound = asset_cache.decode_sound
+
+    def recording_decode(path, *args):
+        decoded_on.append(threading.current_thread().name)
+        return decode_sound(path, *args)
+
+    asset_cache.decode_sound = recording_decode
+    try:
+        engine.register_state_handler(GameState.LOADING,
+                                      LoadingScreenHandler(engine, GameState.DUNGEON_MAP, preloader))
+        engine.change_state(GameState.LOADING)
+        for _ in range(200):
+            engine.update(1 / 60)
+            if engine.current_state != GameState.LOADING:
+                break
+            preloader._thread.join(0.01)
+    finally:
+        asset_cache.decode_sound = decode_sound
+
+    print(f'Decoded on: {decoded_on}')
+    assert engine.current_state == GameState.DUNGEON_MAP
+    assert decoded_on == ['AssetPreloader'] * len(sounds)
+    assert all(asset_cache.is_loaded(path) for _, path in sounds)
+    assert engine.sound_manager.loaded
+
+    # SoundManager は先読み済みのバッファをそのまま使う
+    manager = SoundManager()
+    manager.load_sounds()
+    eliminate = asset_cache.asset_path('SE', '消え.mp3')
+    assert manager.sounds[SoundType.ELIMINATE] is asset_cache.load_sound(eliminate)
+
+
+if __name__ == "__main__":
+    test_manifest_lists_existing_assets()
+    test_preloaded_images_served_from_cache()
+    test_loading_screen_switches_state_when_done()
+    test_sounds_decoded_by_worker_after_engine_init()
+    print('=== TEST COMPLETE ===')
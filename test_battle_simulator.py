@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+戦闘シミュレーター（ボット対敵・プロセス並列・集計出力）のテスト
+"""
+
+import sys
+import os
+import csv
+import json
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.constants import CHAIN_SCORE_BASE
+from battle import enemy as enemy_module
+from battle.battle_simulator import (simulate_battle, run_sweep, chain_damage, write_csv, write_json,
+                                     PlayerBuild, DEFAULT_BUILDS, RANDOM_GROUP)
+
+print('=== BATTLE SIMULATOR TEST ===')
+
+
+def test_chain_damage_matches_battle_conversion():
+    """1連鎖4個消し = スコア40 → CHAIN_SCORE_BASEで割ったダメージ"""
+    build = PlayerBuild('test')
+    assert chain_damage(build, 1) == 40 // CHAIN_SCORE_BASE
+    assert chain_damage(build, 3) > chain_damage(build, 2) > chain_damage(build, 1)
+
+
+def test_battle_is_deterministic_per_seed():
+    build = DEFAULT_BUILDS['average']
+    first = simulate_battle(3, RANDOM_GROUP, build, seed=11)
+    second = simulate_battle(3, RANDOM_GROUP, build, seed=11)
+    assert first == second
+    assert first.duration > 0 and first.chains > 0
+
+
+def test_stronger_build_wins_more():
+    rows = run_sweep([3], ['goblin'], [DEFAULT_BUILDS['beginner'], DEFAULT_BUILDS['expert']],
+                     battles=40, workers=0)
+    by_build = {row['build']: row for row in rows}
+    print({name: row['win_rate'] for name, row in by_build.items()})
+    assert by_build['expert']['win_rate'] >= by_build['beginner']['win_rate']
+    assert by_build['expert']['hp_lost_p50'] <= by_build['beginner']['hp_lost_p50']
+
+
+def test_process_pool_matches_inline_run():
+    """並列実行でも同じシードから同じ集計になる"""
+    builds = [DEFAULT_BUILDS['average']]
+    inline = run_sweep([1, 2], ['slime', RANDOM_GROUP], builds, battles=30, workers=0, chunk_size=7)
+    pooled = run_sweep([1, 2], ['slime', RANDOM_GROUP], builds, battles=30, workers=2, chunk_size=7)
+    assert inline == pooled
+    assert len(inline) == 4 and all(row['battles'] == 30 for row in inline)
+
+
+def test_scaling_overrides_are_applied_and_restored():
+    original = enemy_module.FLOOR_SCALING_HP
+    builds = [DEFAULT_BUILDS['average']]
+    normal = run_sweep([8], ['orc'], builds, battles=20, workers=0)[0]
+    harder = run_sweep([8], ['orc'], builds, battles=20, workers=0,
+                       overrides={'FLOOR_SCALING_HP': 1.6})[0]
+    assert enemy_module.FLOOR_SCALING_HP == original
+    assert harder['win_rate'] <= normal['win_rate']
+    assert harder['hp_lost_mean'] >= normal['hp_lost_mean']
+
+
+def test_outputs():
+    rows = run_sweep([1], ['slime'], [DEFAULT_BUILDS['average']], battles=5, workers=0)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'balance.csv')
+        json_path = os.path.join(tmp, 'balance.json')
+        write_csv(rows, csv_path)
+        write_json(rows, json_path, {'battles': 5})
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            assert list(csv.DictReader(f))[0]['enemy'] == 'slime'
+        with open(json_path, encoding='utf-8') as f:
+            assert json.load(f)['results'][0]['battles'] == 5
+
+
+if __name__ == "__main__":
+    test_chain_damage_matches_battle_conversion()
+    test_battle_is_deterministic_per_seed()
+    test_stronger_build_wins_more()
+    test_process_pool_matches_inline_run()
+    test_scaling_overrides_are_applied_and_restored()
+    test_outputs()
+    print('=== TEST COMPLETE ===')
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+連鎖数ごとの消去音バリエーション（事前生成）のテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.sound_manager import SoundManager, SoundType, CHAIN_SOUND_LEVELS
+
+print('=== CHAIN SOUND TEST ===')
+
+
+def test_variants_built_for_every_level():
+    """1〜19連鎖の音が生成され、連鎖が進むほど高く（短く）なる"""
+    manager = SoundManager()
+    manager.load_sounds()
+    if not manager.enabled or SoundType.ELIMINATE not in manager.sounds:
+        print('Mixer unavailable, skipped')
+        return
+    assert len(manager.chain_sounds) == CHAIN_SOUND_LEVELS
+
+    lengths = [sound.get_length() for sound in manager.chain_sounds]
+    print(f'Lengths: {lengths[0]:.2f}s -> {lengths[-1]:.2f}s')
+    assert lengths[0] > lengths[-1]
+    assert all(a >= b for a, b in zip(lengths, lengths[1:]))
+
+
+def test_play_clamps_chain_level():
+    """範囲外の連鎖数でも再生できる"""
+    manager = SoundManager()
+    manager.load_sounds()
+    if not manager.enabled or not manager.chain_sounds:
+        print('Mixer unavailable, skipped')
+        return
+    for level in (0, 1, CHAIN_SOUND_LEVELS, 99):
+        manager.last_played.clear()
+        for channel in manager.channels[SoundType.CHAIN]:
+            channel.stop()
+        manager.play_chain_sound(level)
+        assert SoundType.CHAIN in manager.last_played
+
+
+if __name__ == "__main__":
+    test_variants_built_for_every_level()
+    test_play_clamps_chain_level()
+    print('=== TEST COMPLETE ===')
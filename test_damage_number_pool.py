@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+ダメージ数値プールのテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from battle.damage_number_pool import DamageNumberPool
+
+print('=== DAMAGE NUMBER POOL TEST ===')
+
+font = pygame.font.Font(None, 32)
+
+
+def test_pool_capacity_is_fixed():
+    """容量を超えても古い数値を再利用してスロット数は変わらない"""
+    pool = DamageNumberPool(font, capacity=4)
+    for i in range(10):
+        pool.spawn(i * 10, (255, 255, 100), 100, 100)
+        pool.update(0.01)
+
+    print(f'Active: {pool.active_count}/{pool.capacity}')
+    assert pool.capacity == 4
+    assert pool.active_count == 4
+    texts = sorted(slot.text for slot in pool.slots)
+    assert texts == ['60', '70', '80', '90']
+
+
+def test_glyphs_rasterized_once_per_color():
+    """同じ色の数値はグリフアトラスを共有する"""
+    pool = DamageNumberPool(font)
+    pool.spawn(12, (255, 0, 0), 0, 0)
+    glyphs = pool.atlas.get_glyphs((255, 0, 0))
+    pool.spawn(345, (255, 0, 0), 0, 0)
+    assert pool.atlas.get_glyphs((255, 0, 0)) is glyphs
+    assert len(pool.atlas._glyphs) == 1
+
+
+def test_numbers_expire_and_render():
+    """時間経過で消え、描画は表示中の数値のみ"""
+    pool = DamageNumberPool(font, duration=1.0)
+    pool.spawn(-7, (255, 180, 100), 10, 50)
+    surface = pygame.Surface((200, 200))
+    pool.render(surface)
+
+    pool.update(0.5)
+    assert pool.active_count == 1
+    assert pool.slots[0].y < 50
+
+    pool.update(0.6)
+    assert pool.active_count == 0
+
+
+if __name__ == "__main__":
+    test_pool_capacity_is_fixed()
+    test_glyphs_rasterized_once_per_color()
+    test_numbers_expire_and_render()
+    print('=== TEST COMPLETE ===')
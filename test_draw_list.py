@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+描画リスト（Surface.blitsによるまとめ描画）のテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.draw_list import DrawList, LAYER_EFFECT, LAYER_SPRITE, LAYER_OVERLAY
+from core.constants import PuyoType, Colors
+from puzzle.puyo_grid import PuyoGrid
+
+print('=== DRAW LIST TEST ===')
+
+
+def make_sprite(color, size=4):
+    sprite = pygame.Surface((size, size))
+    sprite.fill(color)
+    return sprite
+
+
+def test_flush_orders_layers():
+    """レイヤー順に描画し、同じレイヤー内は予約順を保つ"""
+    target = pygame.Surface((10, 10))
+    draw_list = DrawList()
+    draw_list.add(target, make_sprite((255, 0, 0)), (0, 0), layer=LAYER_OVERLAY)
+    draw_list.add(target, make_sprite((0, 255, 0)), (0, 0), layer=LAYER_EFFECT)
+    draw_list.add(target, make_sprite((0, 0, 255)), (4, 4))
+    draw_list.add(target, make_sprite((255, 255, 0)), (4, 4), layer=LAYER_SPRITE)
+    assert len(draw_list) == 4
+    # flushまでは描画されない
+    assert target.get_at((0, 0))[:3] == (0, 0, 0)
+
+    assert draw_list.flush() == 4
+    assert len(draw_list) == 0
+    assert target.get_at((0, 0))[:3] == (255, 0, 0)
+    assert target.get_at((5, 5))[:3] == (255, 255, 0)
+
+
+def test_flush_single_target():
+    """描画先を指定したflushは他の描画先の予約を残す"""
+    first = pygame.Surface((4, 4))
+    second = pygame.Surface((4, 4))
+    draw_list = DrawList()
+    draw_list.add(first, make_sprite(Colors.WHITE), (0, 0))
+    draw_list.add(second, make_sprite(Colors.WHITE), (0, 0), area=pygame.Rect(0, 0, 2, 2))
+
+    assert draw_list.flush(first) == 1
+    assert len(draw_list) == 1
+    assert second.get_at((0, 0))[:3] == (0, 0, 0)
+    draw_list.flush(second)
+    assert second.get_at((1, 1))[:3] == Colors.WHITE
+    assert second.get_at((3, 3))[:3] == (0, 0, 0)
+
+
+def test_puyo_sprites_match_direct_drawing():
+    """キャッシュ済みスプライトのまとめ描画が直接描画と同じ見た目になる"""
+    grid = PuyoGrid()
+    grid.set_puyo(0, 11, PuyoType.RED)
+    grid.set_puyo(1, 11, PuyoType.BLUE)
+
+    batched = pygame.Surface((800, 1000))
+    grid._render_puyos(batched)
+
+    direct = pygame.Surface((800, 1000))
+    grid._draw_puyo_at(direct, 0, 11, PuyoType.RED, 255, 1.0)
+    grid._draw_puyo_at(direct, 1, 11, PuyoType.BLUE, 255, 1.0)
+
+    size = grid.puyo_size
+    for x in range(grid.offset_x, grid.offset_x + size * 2):
+        for y in range(grid.offset_y + size * 11, grid.offset_y + size * 12):
+            assert batched.get_at((x, y)) == direct.get_at((x, y)), (x, y)
+    print(f'Puyo sprite {size - 4}px matches direct drawing')
+
+
+if __name__ == "__main__":
+    test_flush_orders_layers()
+    test_flush_single_target()
+    test_puyo_sprites_match_direct_drawing()
+    print('=== TEST COMPLETE ===')
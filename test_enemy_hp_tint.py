@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+敵スプライトのHP段階別色付けキャッシュのテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from battle.enemy import EnemyType
+from battle.enemy_renderer import EnemyRenderer, HP_TINT_LEVELS
+
+print('=== ENEMY HP TINT TEST ===')
+
+
+def test_tint_variants_generated_once():
+    """バリエーションは1度だけ生成され、同じ段階なら同じサーフェスを返す"""
+    variants = EnemyRenderer._get_tint_variants(EnemyType.SLIME)
+    print(f'Slime variants: {len(variants)}')
+    assert len(variants) == HP_TINT_LEVELS
+    assert EnemyRenderer._get_tint_variants(EnemyType.SLIME) is variants
+
+    assert EnemyRenderer.get_enemy_sprite(EnemyType.SLIME, 0.05) is variants[0]
+    assert EnemyRenderer.get_enemy_sprite(EnemyType.SLIME, 0.1) is variants[0]
+    assert EnemyRenderer.get_enemy_sprite(EnemyType.SLIME, 1.0) is variants[-1]
+
+
+def test_healthy_levels_share_base_image():
+    """HP半分以上は赤みなしの元画像を共有する"""
+    variants = EnemyRenderer._get_tint_variants(EnemyType.GOBLIN)
+    healthy = variants[HP_TINT_LEVELS // 2:]
+    assert all(v is healthy[0] for v in healthy)
+    assert variants[0] is not healthy[0]
+    assert variants[0].get_size() == (280, 280)
+
+
+def test_draw_enemy_without_image_uses_fallback():
+    """画像がない敵も描画できる"""
+    surface = pygame.Surface((400, 400))
+    for enemy_type in EnemyType:
+        EnemyRenderer.draw_enemy(surface, enemy_type, 80, 80, 240, 240, 0.2)
+
+
+if __name__ == "__main__":
+    test_tint_variants_generated_once()
+    test_healthy_levels_share_base_image()
+    test_draw_enemy_without_image_uses_fallback()
+    print('=== TEST COMPLETE ===')
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+固定時間刻みシミュレーション（アキュムレーター・追いつき上限・描画補間）のテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.game_engine import GameEngine
+from core.constants import GameState, SIMULATION_DT, MAX_CATCH_UP_STEPS, PuyoType
+from core.authentic_demo_handler import AuthenticDemoHandler, PuyoPair
+
+print('=== FIXED TIMESTEP TEST ===')
+
+
+class RecordingHandler:
+    """受け取ったdtを記録するハンドラー"""
+
+    def __init__(self):
+        self.dts = []
+        self.alphas = []
+
+    def update(self, dt):
+        self.dts.append(dt)
+
+
+def create_engine():
+    engine = GameEngine(headless=True)
+    handler = RecordingHandler()
+    engine.register_state_handler(GameState.MENU, handler)
+    engine.change_state(GameState.MENU)
+    return engine, handler
+
+
+def test_updates_use_fixed_dt():
+    """フレーム時間が揺れても更新は常に固定刻み"""
+    engine, handler = create_engine()
+    for frame_time in (0.010, 0.025, 0.017, 0.0, 0.033):
+        engine.update_fixed_steps(frame_time)
+    assert handler.dts
+    assert all(dt == SIMULATION_DT for dt in handler.dts)
+    consumed = len(handler.dts) * SIMULATION_DT
+    assert abs(consumed + engine.accumulator - 0.085) < 1e-9
+    assert 0.0 <= engine.interpolation_alpha < 1.0
+
+
+def test_long_frame_is_capped():
+    """長いフレーム（読み込み・GC停止）の後でも更新回数は上限まで"""
+    engine, handler = create_engine()
+    steps = engine.update_fixed_steps(2.0)
+    assert steps == MAX_CATCH_UP_STEPS
+    assert len(handler.dts) == MAX_CATCH_UP_STEPS
+    assert engine.accumulator < SIMULATION_DT
+    assert engine.dropped_time > 1.0
+
+
+def test_headless_runs_one_step_per_frame():
+    engine, handler = create_engine()
+    engine.advance(10)
+    assert len(handler.dts) == 10
+    assert engine.interpolation_alpha == 0.0
+
+
+def test_falling_pair_is_interpolated():
+    """落下中のぷよは補間係数に応じて前回と今回の位置の間に描画される"""
+    engine = GameEngine(headless=True)
+    handler = AuthenticDemoHandler(engine)
+    pair = PuyoPair(PuyoType.RED, PuyoType.BLUE, 2, parent_handler=handler)
+    pair.previous_center_y = 3.0
+    pair.center_y = 3.8
+
+    engine.interpolation_alpha = 0.0
+    assert pair._get_render_center_y() == 3.0
+    engine.interpolation_alpha = 0.5
+    assert abs(pair._get_render_center_y() - 3.4) < 1e-9
+
+    # 蹴り上げなどで位置が飛んだ場合は補間しない
+    pair.center_y = 2.0
+    assert pair._get_render_center_y() == 2.0
+
+
+def test_falling_pair_is_drawn_at_fractional_y():
+    """描画は補間した実数のY座標で行い、下が埋まっている場合だけ行に揃える"""
+    engine = GameEngine(headless=True)
+    handler = AuthenticDemoHandler(engine)
+    grid = handler.puyo_grid
+    pair = PuyoPair(PuyoType.RED, PuyoType.BLUE, 2, parent_handler=handler)
+    pair.previous_center_y = 3.0
+    pair.center_y = 3.8
+    engine.interpolation_alpha = 0.5
+
+    centers = []
+    original_circle = pygame.draw.circle
+    pygame.draw.circle = lambda surface, color, center, *args: centers.append(center)
+    try:
+        pair._render_puyo_at(pygame.Surface((1, 1)), grid, (2, 3), PuyoType.RED, True)
+    finally:
+        pygame.draw.circle = original_circle
+    expected_top = int(grid.offset_y + 3.4 * grid.puyo_size) + 2
+    assert centers[0][1] == expected_top + (grid.puyo_size - 4) // 2
+
+    # 1つ下の行が埋まっていれば食い込まないように整数の行に描く
+    grid.set_puyo(2, 4, PuyoType.GREEN)
+    assert pair._get_render_y(grid) == 3.0
+
+
+if __name__ == "__main__":
+    test_updates_use_fixed_dt()
+    test_long_frame_is_capped()
+    test_headless_runs_one_step_per_frame()
+    test_falling_pair_is_interpolated()
+    test_falling_pair_is_drawn_at_fractional_y()
+    print('=== TEST COMPLETE ===')
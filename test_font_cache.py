@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+フォント探索キャッシュと遅延フォント生成のテスト
+"""
+
+import sys
+import os
+import json
+import platform
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core import font_cache
+from core.font_cache import FontSet, discover_font_path
+from core.constants import FONT_SIZE_SMALL, FONT_SIZE_MEDIUM
+
+print('=== FONT CACHE TEST ===')
+
+
+def count_probes(cache_file, calls):
+    """discover_font_path をcalls回呼び、実際に探索した回数を返す"""
+    original = font_cache.probe_font_path
+    probes = []
+
+    def probe():
+        probes.append(1)
+        return original()
+
+    font_cache.probe_font_path = probe
+    try:
+        results = [discover_font_path(cache_file) for _ in range(calls)]
+    finally:
+        font_cache.probe_font_path = original
+    assert all(result == results[0] for result in results)
+    return len(probes)
+
+
+def test_second_launch_skips_probing():
+    """2回目以降はキャッシュから取得し、探索しない"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, 'font_cache.json')
+        assert count_probes(cache_file, 3) == 1
+        assert os.path.exists(cache_file)
+
+
+def test_stale_cache_probes_again():
+    """更新時刻が変わったキャッシュは無効"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, 'font_cache.json')
+        discover_font_path(cache_file)
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        entry['mtime'] = -1.0
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        assert count_probes(cache_file, 2) == 1
+
+
+def test_not_found_cache_follows_font_dirs_and_expires():
+    """未発見のキャッシュはこのOSのフォントフォルダの更新か期限切れで無効"""
+    original_probe = font_cache.probe_font_path
+    original_dirs = font_cache.PLATFORM_FONT_DIRS
+    probes = []
+
+    def probe():
+        probes.append(1)
+        return None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        font_dir = os.path.join(tmp, 'fonts')
+        os.mkdir(font_dir)
+        cache_file = os.path.join(tmp, 'font_cache.json')
+        font_cache.probe_font_path = probe
+        font_cache.PLATFORM_FONT_DIRS = {platform.system(): [font_dir]}
+        try:
+            assert discover_font_path(cache_file) is None
+            assert discover_font_path(cache_file) is None
+            assert len(probes) == 1
+
+            # フォントの追加でフォルダの更新時刻が変わる
+            stamp = os.path.getmtime(font_dir) + 10
+            os.utime(font_dir, (stamp, stamp))
+            discover_font_path(cache_file)
+            assert len(probes) == 2
+
+            # 期限切れ
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            entry['checked_at'] -= font_cache.NOT_FOUND_CACHE_TTL + 1
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            discover_font_path(cache_file)
+            assert len(probes) == 3
+        finally:
+            font_cache.probe_font_path = original_probe
+            font_cache.PLATFORM_FONT_DIRS = original_dirs
+
+
+def test_fonts_created_lazily():
+    """各サイズのフォントは初回参照時に1度だけ生成"""
+    fonts = FontSet(None)
+    assert set(fonts) == {'small', 'medium', 'large', 'title', 'japanese'}
+    assert fonts._by_size == {}
+
+    medium = fonts['medium']
+    assert fonts['japanese'] is medium
+    assert fonts.get('missing') is None
+    assert fonts.get('small').get_height() >= FONT_SIZE_SMALL // 2
+    print(f'Created sizes: {sorted(fonts._by_size)}')
+    assert sorted(fonts._by_size) == [FONT_SIZE_SMALL, FONT_SIZE_MEDIUM]
+
+
+if __name__ == "__main__":
+    test_second_launch_skips_probing()
+    test_stale_cache_probes_again()
+    test_not_found_cache_follows_font_dirs_and_expires()
+    test_fonts_created_lazily()
+    print('=== TEST COMPLETE ===')
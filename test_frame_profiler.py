@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+フレームプロファイラー（区間計測・ローリングヒストグラム・スパイク記録・F2オーバーレイ）のテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.constants import GameState, SCREEN_WIDTH, SCREEN_HEIGHT
+from core.frame_profiler import FrameProfiler, FrameProfilerOverlay, HISTOGRAM_BUCKETS_MS
+
+print('=== FRAME PROFILER TEST ===')
+
+
+class FakeClock:
+    """テスト用の手動で進める時計"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _frame(profiler, clock, sections):
+    """sections: [(区間名のリスト（入れ子）, 秒)] の順に時間を進めて1フレームを記録"""
+    profiler.begin_frame()
+    for names, seconds in sections:
+        opened = [profiler.section(name) for name in names]
+        for section in opened:
+            section.__enter__()
+        clock.now += seconds
+        for section in reversed(opened):
+            section.__exit__(None, None, None)
+    profiler.end_frame()
+
+
+def test_nested_sections_are_accumulated_per_frame():
+    clock = FakeClock()
+    profiler = FrameProfiler(clock=clock)
+    _frame(profiler, clock, [(['update', 'real_battle', 'puyo_handler'], 0.002),
+                             (['update', 'real_battle', 'puyo_handler'], 0.003),
+                             (['render'], 0.004)])
+    assert abs(profiler.samples['update/real_battle/puyo_handler'][-1] - 0.005) < 1e-12
+    assert abs(profiler.samples['update'][-1] - 0.005) < 1e-12
+    assert abs(profiler.frame_times[-1] - 0.009) < 1e-12
+
+    # 実行されなかったフレームは0として記録される
+    _frame(profiler, clock, [(['render'], 0.001)])
+    assert profiler.samples['update/real_battle/puyo_handler'][-1] == 0.0
+    assert len(profiler.samples['update']) == len(profiler.frame_times) == 2
+
+
+def test_rolling_window_and_histogram():
+    clock = FakeClock()
+    profiler = FrameProfiler(history=10, clock=clock)
+    for index in range(25):
+        _frame(profiler, clock, [(['render'], 0.001 * (index % 5 + 1))])
+    histogram = profiler.histogram('render')
+    assert len(histogram) == len(HISTOGRAM_BUCKETS_MS) + 1
+    assert sum(histogram) == 10 == len(profiler.frame_times)
+    stats = profiler.stats('render')
+    assert abs(stats['max_ms'] - 5.0) < 1e-9 and abs(stats['mean_ms'] - 3.0) < 1e-9
+
+
+def test_top_sections_and_phase_history():
+    clock = FakeClock()
+    profiler = FrameProfiler(clock=clock)
+    for _ in range(5):
+        _frame(profiler, clock, [(['events'], 0.001), (['update', 'map'], 0.002),
+                                 (['render', 'map'], 0.006), ([], 0.001)])
+    top = profiler.top_sections(2)
+    assert [path for path, _ in top] == ['render/map', 'update/map']
+    entry = profiler.phase_history()[-1]
+    assert abs(entry['render'] - 0.006) < 1e-12
+    assert abs(entry['other'] - 0.001) < 1e-9
+
+
+def test_spike_records_culprit():
+    clock = FakeClock()
+    profiler = FrameProfiler(clock=clock)
+    _frame(profiler, clock, [(['update', 'real_battle', 'enemy_group'], 0.001),
+                             (['render', 'real_battle', 'enemies'], 0.050)])
+    total, breakdown = profiler.last_spike
+    assert abs(total - 0.051) < 1e-9
+    assert breakdown[0][0] == 'render/real_battle/enemies'
+    assert 'render/real_battle' not in dict(breakdown)
+
+
+def test_engine_records_battle_sections():
+    from core.game_engine import GameEngine
+    from battle.battle_handler import BattleHandler
+    engine = GameEngine(headless=True, render_headless=True, seed=1)
+    engine.frame_profiler.reset()
+    battle = BattleHandler(engine)
+    battle.countdown_active = False
+    engine.register_state_handler(GameState.REAL_BATTLE, battle)
+    engine.change_state(GameState.REAL_BATTLE)
+    engine.advance(30)
+    samples = engine.frame_profiler.samples
+    for path in ('events', 'update', 'render', 'update/real_battle/puyo_handler',
+                 'update/real_battle/chain_damage', 'update/real_battle/enemy_group',
+                 'render/real_battle/background', 'render/real_battle/puyo_field', 'render/real_battle/enemies'):
+        assert path in samples, path
+    print(f"Top sections: {[path for path, _ in engine.frame_profiler.top_sections(3)]}")
+    summary = engine.frame_profiler.summary()
+    assert summary['frames'] == 30
+
+
+def test_f2_cycles_overlay_and_draws():
+    from core.game_engine import GameEngine
+    engine = GameEngine(headless=True, render_headless=True, seed=1)
+    engine.show_fps, engine.show_profiler = True, False
+    modes = []
+    for _ in range(3):
+        engine.handle_global_events(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F2))
+        modes.append((engine.show_fps, engine.show_profiler))
+    assert modes == [(True, True), (False, False), (True, False)]
+
+    engine.show_profiler = True
+    engine.advance(5)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    FrameProfilerOverlay(engine.frame_profiler).draw(surface, engine.fonts['small'], (SCREEN_WIDTH - 16, 40))
+
+
+if __name__ == "__main__":
+    test_nested_sections_are_accumulated_per_frame()
+    test_rolling_window_and_histogram()
+    test_top_sections_and_phase_history()
+    test_spike_records_culprit()
+    test_engine_records_battle_sections()
+    test_f2_cycles_overlay_and_draws()
+    print('=== TEST COMPLETE ===')
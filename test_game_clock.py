@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+ゲームクロック（ポーズ・タイムスケール・状態ごとのサブクロック）のテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.game_engine import GameEngine
+from core.game_clock import GameClock, MAX_TIME_SCALE, TIME_SCALE_STEPS
+from core.constants import GameState, PuyoType, SIMULATION_DT
+from puzzle.puyo_grid import PuyoGrid, PuyoPosition
+
+print('=== GAME CLOCK TEST ===')
+
+
+class IdleHandler:
+    def update(self, dt):
+        pass
+
+
+def create_engine():
+    engine = GameEngine(headless=True)
+    engine.register_state_handler(GameState.DUNGEON_MAP, IdleHandler())
+    engine.change_state(GameState.DUNGEON_MAP)
+    return engine
+
+
+def test_clock_follows_simulation_steps():
+    engine = create_engine()
+    engine.advance(60)
+    assert abs(engine.game_clock.now() - 60 * SIMULATION_DT) < 1e-9
+    assert abs(engine.game_clock.state_time() - 60 * SIMULATION_DT) < 1e-9
+
+
+def test_pause_stops_clock():
+    engine = create_engine()
+    engine.advance(10)
+    before = engine.game_clock.now()
+    engine.toggle_pause()
+    engine.advance(30)
+    assert engine.game_clock.now() == before
+    engine.toggle_pause()
+    engine.advance(1)
+    assert engine.game_clock.now() > before
+
+
+def test_time_scale_changes_steps_per_frame():
+    """早送りでは1フレームに複数回、スローでは数フレームに1回更新される"""
+    engine = create_engine()
+    engine.game_clock.set_time_scale(2.0)
+    engine.advance(30)
+    assert abs(engine.game_clock.now() - 60 * SIMULATION_DT) < 1e-9
+
+    engine.game_clock.set_time_scale(0.5)
+    before = engine.game_clock.now()
+    engine.advance(30)
+    assert abs(engine.game_clock.now() - before - 15 * SIMULATION_DT) < 1e-9
+
+    engine.game_clock.set_time_scale(100.0)
+    assert engine.game_clock.time_scale == MAX_TIME_SCALE
+
+
+def test_debug_keys_step_time_scale():
+    """F5/F6でエンジンのタイムスケールを段階的に切り替え、更新回数に反映される"""
+    engine = create_engine()
+
+    def press(key):
+        return engine.handle_global_events(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    # F5/F6はデバッグモードのときだけ効く
+    engine.debug_mode = False
+    assert not press(pygame.K_F5)
+    assert not press(pygame.K_F6)
+    assert engine.game_clock.time_scale == 1.0
+    engine.debug_mode = True
+
+    press(pygame.K_F5)
+    assert engine.game_clock.time_scale == 0.5
+    before = engine.game_clock.now()
+    engine.advance(30)
+    assert abs(engine.game_clock.now() - before - 15 * SIMULATION_DT) < 1e-9
+
+    for _ in range(len(TIME_SCALE_STEPS) + 1):
+        press(pygame.K_F6)
+    assert engine.game_clock.time_scale == TIME_SCALE_STEPS[-1] == MAX_TIME_SCALE
+    for _ in range(len(TIME_SCALE_STEPS) + 1):
+        press(pygame.K_F5)
+    assert engine.game_clock.time_scale == TIME_SCALE_STEPS[0]
+    press(pygame.K_F6)
+    press(pygame.K_F6)
+    assert engine.game_clock.time_scale == 1.0
+
+
+def test_state_sub_clocks():
+    clock = GameClock()
+    clock.enter_state(GameState.DUNGEON_MAP)
+    clock.advance(1.0)
+    clock.enter_state(GameState.REAL_BATTLE)
+    clock.advance(0.5)
+    assert clock.state_time(GameState.DUNGEON_MAP) == 1.0
+    assert clock.state_time() == 0.5
+    assert clock.now() == 1.5
+
+
+def test_elimination_animation_uses_game_clock():
+    """消去アニメーションは壁時計ではなくゲーム時間で進む"""
+    engine = create_engine()
+    grid = PuyoGrid(engine)
+    grid.set_puyo(0, 11, PuyoType.RED)
+    grid.eliminate_puyos({PuyoPosition(0, 11)})
+    assert grid.disappearing_puyos
+
+    # ゲーム時間が進まなければアニメーションは終わらない
+    grid.update_animations(0.0)
+    assert grid.disappearing_puyos
+    engine.game_clock.advance(5.0)
+    grid.update_animations(SIMULATION_DT)
+    assert not grid.disappearing_puyos
+
+
+if __name__ == "__main__":
+    test_clock_follows_simulation_steps()
+    test_pause_stops_clock()
+    test_time_scale_changes_steps_per_frame()
+    test_debug_keys_step_time_scale()
+    test_state_sub_clocks()
+    test_elimination_animation_uses_game_clock()
+    print('=== TEST COMPLETE ===')
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+ヘッドレスモード（ダミードライバー・固定dt・待機なし）のテスト
+メニュー → マップ → 戦闘 を数秒で通しで進める
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+
+from core.game_engine import GameEngine
+from core.constants import GameState, FPS
+from core.menu_handler import MenuHandler
+from dungeon.map_handler import DungeonMapHandler
+from battle.battle_handler import BattleHandler
+
+print('=== HEADLESS ENGINE TEST ===')
+
+
+def test_full_run_without_rendering():
+    """描画なしで メニュー → マップ → 戦闘 を実時間より速く進める"""
+    engine = GameEngine(headless=True)
+    assert engine.headless and not engine.render_enabled
+
+    start = time.perf_counter()
+    engine.register_state_handler(GameState.MENU, MenuHandler(engine))
+    engine.change_state(GameState.MENU)
+    assert engine.advance(30) == 30
+
+    engine.register_state_handler(GameState.DUNGEON_MAP, DungeonMapHandler(engine))
+    engine.change_state(GameState.DUNGEON_MAP)
+    engine.advance(30)
+
+    battle = BattleHandler(engine)
+    engine.register_state_handler(GameState.REAL_BATTLE, battle)
+    engine.change_state(GameState.REAL_BATTLE)
+    frames = engine.advance(FPS * 10)
+    elapsed = time.perf_counter() - start
+
+    print(f'{frames} battle frames (10s game time) in {elapsed:.2f}s')
+    assert frames == FPS * 10
+    assert elapsed < 10.0
+
+
+def test_headless_render_skips_flip():
+    """描画を有効にしてもヘッドレスでは画面更新しない"""
+    engine = GameEngine(headless=True, render_headless=True)
+    assert engine.render_enabled
+    engine.register_state_handler(GameState.MENU, MenuHandler(engine))
+
+    flips = []
+    original_flip = pygame.display.flip
+    pygame.display.flip = lambda: flips.append(1)
+    try:
+        engine.advance(5)
+    finally:
+        pygame.display.flip = original_flip
+    assert flips == []
+    assert engine.frame_count == 5
+
+
+def test_advance_stops_when_quit():
+    engine = GameEngine(headless=True)
+    engine.quit_game()
+    assert engine.advance(10) == 0
+
+
+if __name__ == "__main__":
+    test_full_run_without_rendering()
+    test_headless_render_skips_flip()
+    test_advance_stops_when_quit()
+    print('=== TEST COMPLETE ===')
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+入力リプレイ（varint記録・シード付き・ヘッドレス再生）のテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.game_engine import GameEngine
+from core.constants import GameState
+from core.authentic_demo_handler import AuthenticDemoHandler
+from core.input_replay import (InputRecorder, InputReplay, write_varint, read_varint,
+                               get_pressed_keys)
+from replay_session import run_playback
+
+print('=== INPUT REPLAY TEST ===')
+
+# 記録時のフレーム時間（実プレイのような揺らぎ）
+FRAME_TIMES = [0.010, 0.025, 0.017, 0.016, 0.033, 0.012]
+
+# (フレーム番号, イベント)
+SCRIPTED_INPUTS = [
+    (20, pygame.event.Event(pygame.KEYDOWN, key=pygame.K_d, mod=0, unicode='d')),
+    (45, pygame.event.Event(pygame.KEYUP, key=pygame.K_d, mod=0)),
+    (60, pygame.event.Event(pygame.KEYDOWN, key=pygame.K_j, mod=0, unicode='j')),
+    (61, pygame.event.Event(pygame.KEYUP, key=pygame.K_j, mod=0)),
+    (90, pygame.event.Event(pygame.KEYDOWN, key=pygame.K_s, mod=0, unicode='s')),
+    (150, pygame.event.Event(pygame.KEYUP, key=pygame.K_s, mod=0)),
+    (200, pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode='a')),
+    (230, pygame.event.Event(pygame.KEYUP, key=pygame.K_a, mod=0)),
+    (240, pygame.event.Event(pygame.MOUSEMOTION, pos=(300, 200), rel=(0, 0), buttons=(0, 0, 0))),
+]
+
+
+def snapshot(handler):
+    grid = tuple(tuple(puyo.value for puyo in column) for column in handler.puyo_grid.grid)
+    pair = handler.current_pair
+    pair_state = (pair.center_x, round(pair.center_y, 6), pair.rotation) if pair else None
+    return grid, pair_state, handler.puyo_grid.total_chains
+
+
+def test_varint_roundtrip():
+    buffer = bytearray()
+    values = [0, 1, 127, 128, 300, 2 ** 32 + 5]
+    for value in values:
+        write_varint(buffer, value)
+    assert len(buffer) < len(values) * 4
+    offset = 0
+    for value in values:
+        decoded, offset = read_varint(bytes(buffer), offset)
+        assert decoded == value
+
+
+def test_recording_roundtrip():
+    recorder = InputRecorder(seed=1234)
+    recorder.record(3, pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=1, unicode='a'))
+    recorder.record(3, pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(640, 480), button=1))
+    recorder.record(10, pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-2))
+    recorder.record(11, pygame.event.Event(pygame.ACTIVEEVENT, gain=1, state=1))  # 記録しない
+    recorder.record_seed(12, 999)
+
+    data = recorder.to_bytes()
+    print(f'{recorder.event_count} records in {len(data)} bytes')
+    assert len(data) < 40
+
+    replay = InputReplay.from_bytes(data)
+    assert replay.seed == 1234
+    assert [(tick, kind) for tick, kind, _ in replay.records] == [(3, 1), (3, 3), (10, 6), (12, 7)]
+    assert replay.records[0][2].unicode == 'a'
+    assert replay.records[1][2].pos == (640, 480)
+    assert replay.records[2][2].y == -2
+    assert replay.records[3][2] == 999
+
+
+def record_session():
+    engine = GameEngine(headless=True, seed=4321)
+    recorder = engine.start_recording()
+    handler = AuthenticDemoHandler(engine)
+    engine.register_state_handler(GameState.BATTLE, handler)
+    engine.change_state(GameState.BATTLE)
+
+    inputs = dict(SCRIPTED_INPUTS)
+    for frame in range(400):
+        if frame in inputs:
+            pygame.event.post(inputs[frame])
+        engine.tick(FRAME_TIMES[frame % len(FRAME_TIMES)])
+    engine.stop_recording()
+    return recorder.to_bytes(), engine.simulation_tick, snapshot(handler)
+
+
+def test_playback_reproduces_session():
+    """揺らぎのあるフレーム時間で記録した入力を、ヘッドレス固定dtで再生して同じ結果になる"""
+    pygame.event.clear()
+    data, ticks, expected = record_session()
+    assert not get_pressed_keys()[pygame.K_s]
+
+    engine = GameEngine(headless=True)
+    engine.start_playback(InputReplay.from_bytes(data))
+    handler = AuthenticDemoHandler(engine)
+    engine.register_state_handler(GameState.BATTLE, handler)
+    engine.change_state(GameState.BATTLE)
+    while engine.simulation_tick < ticks:
+        engine.tick(engine.fixed_dt)
+
+    assert engine.replay.finished
+    assert snapshot(handler) == expected
+
+
+def test_run_playback_is_fast():
+    pygame.event.clear()
+    data, _, _ = record_session()
+    engine = GameEngine(headless=True)
+    engine.start_playback(InputReplay.from_bytes(data))
+    handler = AuthenticDemoHandler(engine)
+    engine.register_state_handler(GameState.BATTLE, handler)
+    engine.change_state(GameState.BATTLE)
+
+    result = run_playback(engine, speed=0, tail_seconds=0.5)
+    print(f"Replayed {result['game_seconds']:.1f}s in {result['wall_seconds']:.2f}s "
+          f"({result['speedup']:.0f}x)")
+    assert engine.replay.finished
+    assert result['simulation_ticks'] >= engine.replay.replay.duration_ticks
+    assert result['speedup'] > 5
+
+
+if __name__ == "__main__":
+    test_varint_roundtrip()
+    test_recording_roundtrip()
+    test_playback_reproduces_session()
+    test_run_playback_is_fast()
+    print('=== TEST COMPLETE ===')
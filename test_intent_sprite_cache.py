@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+敵の行動予告スプライトキャッシュのテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from battle.enemy import ActionType
+from battle.enemy_intent_renderer import EnemyIntentRenderer
+
+print('=== INTENT SPRITE CACHE TEST ===')
+
+fonts = {'small': pygame.font.Font(None, 16), 'medium': pygame.font.Font(None, 24)}
+
+
+def test_icon_sprites_shared():
+    """アイコン・背景スプライトはインスタンス間で共有される"""
+    first = EnemyIntentRenderer()
+    second = EnemyIntentRenderer()
+
+    for action_type in ActionType:
+        icon_a = first._get_icon_sprite(action_type, 30)
+        icon_b = second._get_icon_sprite(action_type, 30)
+        print(f'{action_type.name}: icon {icon_a.get_size()}')
+        assert icon_a is icon_b
+
+    assert first._get_background_sprite(80, 50) is second._get_background_sprite(80, 50)
+
+
+def test_badge_cached_per_key():
+    """同じ(行動, ダメージ, ホバー)なら合成済みバッジを再利用する"""
+    renderer = EnemyIntentRenderer()
+    surface = pygame.Surface((400, 300))
+    info = {'type': ActionType.ATTACK, 'damage': 12, 'name': '体当たり'}
+
+    renderer.draw_intent(surface, 200, 150, info, fonts)
+    badge = renderer._badge_cache[(ActionType.ATTACK.value, 12, False, None)]
+    renderer.draw_intent(surface, 100, 150, info, fonts)
+    assert renderer._badge_cache[(ActionType.ATTACK.value, 12, False, None)] is badge
+
+    # ホバー時はツールチップ込みの別バッジ
+    renderer.draw_intent(surface, 200, 150, info, fonts, hovered=True)
+    hovered_badge, _ = renderer._badge_cache[(ActionType.ATTACK.value, 12, True, '体当たり')]
+    assert hovered_badge.get_height() > badge[0].get_height()
+    print(f'Badge cache entries: {len(renderer._badge_cache)}')
+
+
+def test_badge_draws_box():
+    """バッジがインテントボックスの位置に描画される"""
+    renderer = EnemyIntentRenderer()
+    surface = pygame.Surface((400, 300))
+    renderer.draw_intent(surface, 200, 150, {'type': ActionType.GUARD, 'name': '防御'}, fonts)
+
+    rect = renderer.get_intent_rect(200, 150)
+    assert surface.get_at((rect.x + 10, rect.y + 10))[:3] == (100, 0, 0)
+    assert surface.get_at((rect.x, rect.y))[:3] == (255, 255, 255)
+
+
+if __name__ == "__main__":
+    test_icon_sprites_shared()
+    test_badge_cached_per_key()
+    test_badge_draws_box()
+    print('=== TEST COMPLETE ===')
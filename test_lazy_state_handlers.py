@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+状態ハンドラーの遅延登録（初回遷移時の生成・先行生成）のテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.game_engine import GameEngine
+from core.constants import GameState
+
+print('=== LAZY STATE HANDLER TEST ===')
+
+
+class RecordingHandler:
+    def __init__(self, created):
+        created.append(self)
+        self.entered_from = None
+
+    def on_enter(self, previous_state):
+        self.entered_from = previous_state
+
+
+def test_handler_created_on_first_change_state():
+    """ハンドラーは初めてその状態に遷移した時に1度だけ生成される"""
+    engine = GameEngine()
+    created = []
+    engine.register_state_factory(GameState.SHOP, lambda: RecordingHandler(created))
+    assert created == []
+    assert GameState.SHOP not in engine.state_handlers
+
+    engine.change_state(GameState.SHOP)
+    assert len(created) == 1
+    assert engine.state_handlers[GameState.SHOP] is created[0]
+    assert created[0].entered_from == GameState.MENU
+
+    engine.change_state(GameState.MENU)
+    engine.change_state(GameState.SHOP)
+    assert len(created) == 1
+
+
+def test_explicit_handler_replaces_factory():
+    engine = GameEngine()
+    created = []
+    engine.register_state_factory(GameState.TREASURE, lambda: RecordingHandler(created))
+    handler = RecordingHandler([])
+    engine.register_state_handler(GameState.TREASURE, handler)
+    engine.change_state(GameState.TREASURE)
+    assert created == []
+    assert engine.state_handlers[GameState.TREASURE] is handler
+
+
+def test_prewarm_builds_one_handler_per_frame():
+    """先行生成は1フレームに1つずつ行う"""
+    engine = GameEngine()
+    created = []
+    engine.register_state_factory(GameState.SHOP, lambda: RecordingHandler(created))
+    engine.register_state_factory(GameState.EVENT, lambda: RecordingHandler(created))
+    engine.prewarm_state_handlers([GameState.SHOP, GameState.EVENT, GameState.SHOP])
+    assert created == []
+
+    engine._prewarm_next_state_handler()
+    assert GameState.SHOP in engine.state_handlers and len(created) == 1
+    engine._prewarm_next_state_handler()
+    assert GameState.EVENT in engine.state_handlers and len(created) == 2
+    assert engine.prewarm_queue == []
+
+
+def test_lazy_module_import():
+    """モジュール名とクラス名での登録は初回遷移時にインポートして生成"""
+    engine = GameEngine()
+    engine.register_lazy_state_handler(GameState.INVENTORY, 'inventory.inventory_ui', 'InventoryUI')
+    assert GameState.INVENTORY not in engine.state_handlers
+
+    handler = engine.get_state_handler(GameState.INVENTORY)
+    print(f'Created: {type(handler).__name__}')
+    assert type(handler).__name__ == 'InventoryUI'
+    assert handler.engine is engine
+
+
+if __name__ == "__main__":
+    test_handler_created_on_first_change_state()
+    test_explicit_handler_replaces_factory()
+    test_prewarm_builds_one_handler_per_frame()
+    test_lazy_module_import()
+    print('=== TEST COMPLETE ===')
@@ -6,9 +6,9 @@ import sys
 import os
 
 # パス設定
-sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.dungeon.dungeon_map import DungeonMap, NodeType
+from dungeon.dungeon_map import DungeonMap, NodeType
 
 def test_map_generation_rules():
     """マップ生成ルールの詳細テスト"""
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+BGMのストリーミング再生と状態ごとのクロスフェードのテスト
+"""
+
+import sys
+import os
+import wave
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core import music_manager
+from core.music_manager import MusicManager, MUSIC_FADE_OUT_TIME
+from core.constants import GameState
+
+print('=== MUSIC MANAGER TEST ===')
+
+
+def write_track(folder, name, seconds=2.0):
+    with wave.open(os.path.join(folder, name + '.wav'), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(22050)
+        wav.writeframes(b'\x00\x10' * int(22050 * seconds))
+
+
+def test_crossfade_between_states():
+    """状態変更でフェードアウトし、完了後に次の曲へ切り替わる"""
+    if not pygame.mixer.get_init():
+        print('Mixer unavailable, skipped')
+        return
+    original_folder = music_manager.BGM_FOLDER
+    with tempfile.TemporaryDirectory() as tmp:
+        write_track(tmp, 'map')
+        write_track(tmp, 'battle')
+        music_manager.BGM_FOLDER = tmp
+        try:
+            manager = MusicManager()
+            manager.on_state_change(GameState.DUNGEON_MAP)
+            assert manager.current_track == 'map'
+            assert not manager.fading_out
+
+            # 戦闘へ：すぐには切り替えず、次の曲のファイルを開いておく
+            manager.on_state_change(GameState.REAL_BATTLE)
+            assert manager.fading_out
+            assert manager.current_track == 'map'
+            assert manager._next_handle is not None
+
+            manager.update(MUSIC_FADE_OUT_TIME / 2)
+            assert manager.current_track == 'map'
+            manager.update(MUSIC_FADE_OUT_TIME)
+            assert manager.current_track == 'battle'
+            assert not manager.fading_out
+
+            # 曲の指定がない状態では流し続ける
+            manager.on_state_change(GameState.INVENTORY)
+            assert manager.current_track == 'battle' and not manager.fading_out
+            manager.stop()
+        finally:
+            music_manager.BGM_FOLDER = original_folder
+
+
+def test_handler_track_overrides_state():
+    """ハンドラーの music_track（ボス戦など）が状態の曲より優先される"""
+    class BossHandler:
+        music_track = 'boss'
+
+    manager = MusicManager()
+    manager.on_state_change(GameState.REAL_BATTLE, BossHandler())
+    if manager.enabled:
+        assert manager.current_track == 'boss'
+
+
+def test_state_from_other_module_copy():
+    """src.core.constants 側の GameState でも状態の曲が選ばれる"""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from src.core.constants import GameState as OtherGameState
+    assert OtherGameState is not GameState
+
+    manager = MusicManager()
+    played = []
+    manager.play = played.append
+    manager.on_state_change(OtherGameState.SHOP)
+    assert played == ['shop']
+
+
+if __name__ == "__main__":
+    test_crossfade_between_states()
+    test_handler_track_overrides_state()
+    test_state_from_other_module_copy()
+    print('=== TEST COMPLETE ===')
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+パズルコアのマイクロベンチマーク（代表盤面・計測結果・基準比較）のテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.constants import PuyoType, GRID_WIDTH, GRID_HEIGHT
+from puzzle.puyo_grid import PuyoGrid
+from benchmark_puzzle import (BOARDS, CASES, CASE_BOARDS, CHAIN_BOARD_LENGTH, load_board, run_benchmark,
+                              compare_with_baseline)
+
+print('=== PUZZLE BENCHMARK TEST ===')
+
+
+def test_boards_fit_grid():
+    for name, rows in BOARDS.items():
+        assert len(rows) == GRID_HEIGHT, name
+        assert all(len(row) == GRID_WIDTH for row in rows), name
+
+
+def test_chain_board_chains():
+    grid = PuyoGrid()
+    load_board(grid, 'chain')
+    grid.execute_full_chain_sequence()
+    print(f'Chain board: {grid.total_chains} chains')
+    assert grid.total_chains == CHAIN_BOARD_LENGTH
+
+
+def test_half_full_board_has_no_chain():
+    grid = PuyoGrid()
+    load_board(grid, 'half_full')
+    assert grid.find_all_chains() == []
+
+
+def test_all_specials_board_marks_colored_puyos():
+    grid = PuyoGrid()
+    load_board(grid, 'all_specials')
+    colored = sum(1 for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT)
+                  if grid.grid[x][y] not in (PuyoType.EMPTY, PuyoType.GARBAGE))
+    assert len(grid.special_puyo_data) == colored > 0
+    load_board(grid, 'chain')
+    assert not grid.special_puyo_data
+
+
+def test_quick_run_reports_every_case():
+    result = run_benchmark(rounds=1, min_round_seconds=0.001, alloc_samples=1)
+    expected = {f"{case}/{board}" for case, boards in CASE_BOARDS.items() for board in boards}
+    assert set(result['results']) == expected
+    assert set(CASES) == set(CASE_BOARDS)
+    for entry in result['results'].values():
+        assert entry['ops_per_sec'] > 0
+        assert entry['alloc_peak_bytes'] >= 0
+
+
+def test_compare_with_baseline():
+    baseline = {'results': {'a/empty': {'ops_per_sec': 1000.0}, 'b/chain': {'ops_per_sec': 1000.0}}}
+    result = {'results': {'a/empty': {'ops_per_sec': 850.0}, 'b/chain': {'ops_per_sec': 700.0},
+                          'c/new': {'ops_per_sec': 1.0}}}
+    regressions = compare_with_baseline(result, baseline, tolerance=0.2)
+    assert regressions == [('b/chain', 1000.0, 700.0)]
+
+
+if __name__ == "__main__":
+    test_boards_fit_grid()
+    test_chain_board_chains()
+    test_half_full_board_has_no_chain()
+    test_all_specials_board_marks_colored_puyos()
+    test_quick_run_reports_every_case()
+    test_compare_with_baseline()
+    print('=== TEST COMPLETE ===')
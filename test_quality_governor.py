@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+品質ガバナーのテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.quality_governor import (QualityGovernor, QualityLevel, QUALITY_SAMPLE_WINDOW,
+                                   QUALITY_UPGRADE_WINDOWS, get_quality_governor)
+from puzzle.puyo_grid import PuyoGrid, PuyoPosition
+from core.constants import PuyoType
+
+print('=== QUALITY GOVERNOR TEST ===')
+
+
+def feed(governor, frame_time, windows=1):
+    for _ in range(QUALITY_SAMPLE_WINDOW * windows):
+        governor.record_frame(frame_time)
+
+
+def test_steps_down_when_frames_late():
+    """予算超過が続くと1段ずつ品質を下げる"""
+    governor = QualityGovernor(60)
+    feed(governor, 1 / 40)
+    assert governor.level == QualityLevel.MEDIUM
+    feed(governor, 1 / 40)
+    assert governor.level == QualityLevel.LOW
+    feed(governor, 1 / 40)
+    assert governor.level == QualityLevel.LOW
+
+
+def test_steps_up_with_headroom():
+    """余裕が連続した場合のみ品質を戻す"""
+    governor = QualityGovernor(60, level=QualityLevel.LOW)
+    feed(governor, 0.002, QUALITY_UPGRADE_WINDOWS - 1)
+    assert governor.level == QualityLevel.LOW
+    feed(governor, 0.002)
+    assert governor.level == QualityLevel.MEDIUM
+
+    # 中間の負荷では変化しない
+    feed(governor, 0.7 / 60, QUALITY_UPGRADE_WINDOWS * 2)
+    assert governor.level == QualityLevel.MEDIUM
+
+
+def test_disabled_governor_keeps_level():
+    governor = QualityGovernor(60, enabled=False)
+    feed(governor, 1.0)
+    assert governor.level == QualityLevel.HIGH
+
+
+def test_particle_count_follows_quality():
+    """消去パーティクル数が品質レベルに従う"""
+    governor = get_quality_governor()
+    original = governor.level
+    try:
+        grid = PuyoGrid()
+        for level, expected in [(QualityLevel.HIGH, 8), (QualityLevel.LOW, 0)]:
+            governor.set_level(level)
+            grid.set_puyo(0, 11, PuyoType.RED)
+            grid.eliminate_puyos({PuyoPosition(0, 11)})
+            print(f'{level.name}: {len(grid.disappearing_puyos[(0, 11)]["particles"])} particles')
+            assert len(grid.disappearing_puyos[(0, 11)]['particles']) == expected
+    finally:
+        governor.set_level(original)
+
+
+if __name__ == "__main__":
+    test_steps_down_when_frames_late()
+    test_steps_up_with_headroom()
+    test_disabled_governor_keeps_level()
+    test_particle_count_follows_quality()
+    print('=== TEST COMPLETE ===')
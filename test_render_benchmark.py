@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+画面別の描画ベンチマーク（Surface生成トラッカー・代表場面・基準比較）のテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.surface_tracker import SurfaceTracker, get_surface_tracker
+from shop.shop_handler import ShopItem
+from benchmark_render import run_benchmark, compare_with_baseline, SCENES, INVENTORY_ITEMS
+
+print('=== RENDER BENCHMARK TEST ===')
+
+
+def test_surface_tracker_counts_allocations():
+    original_surface = pygame.Surface
+    original_scale = pygame.transform.scale
+    tracker = SurfaceTracker()
+    tracker.install()
+    try:
+        font = pygame.font.Font(None, 20)
+        tracker.begin_frame()
+        surface = pygame.Surface((10, 10))
+        scaled = pygame.transform.scale(surface, (20, 20))
+        pygame.transform.scale(surface, (20, 20), scaled)  # 描画先を渡した場合は生成しない
+        font.render("abc", True, (255, 255, 255))
+        assert tracker.end_frame() == 3
+        assert tracker.frame_allocations == 0 and tracker.total_allocations == 3
+    finally:
+        tracker.uninstall()
+    assert pygame.Surface is original_surface
+    assert pygame.transform.scale is original_scale
+
+
+def test_shop_item_accepts_special_puyo_dict():
+    item = ShopItem({'type': 'special_puyo', 'name': 'Bomb Puyo', 'description': 'Boom',
+                     'color': (1, 2, 3), 'icon': 'B'}, 20, 0)
+    assert item.get_name() == 'Bomb Puyo'
+    assert item.get_description() == 'Boom'
+    assert item.get_color() == (1, 2, 3)
+
+
+def test_every_scene_renders():
+    result = run_benchmark(frames=3)
+    assert set(result['scenes']) == set(SCENES)
+    for name, scene in result['scenes'].items():
+        print(f"{name}: p50 {scene['p50_ms']:.2f} ms, {scene['surfaces_per_frame']:.0f} surfaces/frame")
+        assert scene['frames'] == 3
+        assert scene['p50_ms'] <= scene['p95_ms'] <= scene['p99_ms'] <= scene['max_ms']
+        assert scene['surfaces_per_frame'] >= 0
+    assert pygame.Surface.__name__ == 'Surface' and pygame.Surface.__module__ == 'pygame.surface'
+    # 終了後は共有トラッカーに集計を残さない
+    tracker = get_surface_tracker()
+    assert not tracker.frames and tracker.total_allocations == 0
+
+
+def test_inventory_scene_has_fifty_items():
+    from benchmark_render import create_engine, _build_inventory
+    engine = create_engine()
+    _build_inventory(engine)
+    assert len(engine.player.inventory.items) == INVENTORY_ITEMS
+
+
+def test_compare_with_baseline():
+    baseline = {'scenes': {'shop': {'p95_ms': 10.0, 'surfaces_per_frame': 20.0},
+                           'map': {'p95_ms': 10.0, 'surfaces_per_frame': 20.0},
+                           'rest': {'p95_ms': 1.0, 'surfaces_per_frame': 2.0}}}
+    result = {'scenes': {'shop': {'p95_ms': 13.0, 'surfaces_per_frame': 20.0},
+                         'map': {'p95_ms': 10.5, 'surfaces_per_frame': 30.0},
+                         'rest': {'p95_ms': 1.4, 'surfaces_per_frame': 2.5}}}
+    regressions = compare_with_baseline(result, baseline, tolerance=0.2)
+    assert regressions == [('shop', 'p95_ms', 10.0, 13.0), ('map', 'surfaces_per_frame', 20.0, 30.0)]
+
+
+if __name__ == "__main__":
+    test_surface_tracker_counts_allocations()
+    test_shop_item_accepts_special_puyo_dict()
+    test_every_scene_renders()
+    test_inventory_scene_has_fifty_items()
+    test_compare_with_baseline()
+    print('=== TEST COMPLETE ===')
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+ランシミュレーター（ルート選択・戦闘・報酬・ショップ・休憩所・イベント・ストリーミング集計）のテスト
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.rng import seed_run
+from core.player_data import PlayerData
+from battle.battle_simulator import percentile
+from dungeon.dungeon_map import DungeonMap
+from dungeon.run_simulator import (simulate_run, run_sweep, RunAggregate, SimulatedEngine, EconomySettings,
+                                   DEFAULT_POLICIES, RUN_TOTAL_FLOORS, histogram_percentile, write_csv,
+                                   write_json)
+from shop.shop_handler import ShopHandler
+
+print('=== RUN SIMULATOR TEST ===')
+
+
+def test_run_is_deterministic_per_seed():
+    policy = DEFAULT_POLICIES['balanced']
+    first = simulate_run(7, policy)
+    second = simulate_run(7, policy)
+    assert first == second
+    assert first.floors and sum(first.node_counts.values()) == len(first.floors)
+
+
+def test_trace_is_consistent():
+    for seed in range(10):
+        trace = simulate_run(seed, DEFAULT_POLICIES['random'])
+        assert trace.won or trace.death_floor == len(trace.floors)
+        for hp, max_hp, gold, artifacts in trace.floors:
+            assert 0 <= hp <= max_hp and gold >= 0 and artifacts >= 0
+        assert trace.floors[-1][2] == 50 + trace.gold_earned - trace.gold_spent
+
+
+def test_shop_stock_for_every_floor():
+    """ショップの品揃えが全フロア帯で生成できる"""
+    seed_run(3)
+    dungeon_map = DungeonMap()
+    engine = SimulatedEngine(PlayerData(), dungeon_map)
+    for floor in (1, 5, 10):
+        node = dungeon_map.get_nodes_by_floor(floor)[0]
+        shop = ShopHandler(engine, current_node=node)
+        assert len(shop.shop_items) >= 5
+        assert all(item.price > 0 for item in shop.shop_items)
+
+
+def test_histogram_percentile_matches_sorted_percentile():
+    rng = random.Random(1)
+    values = [rng.randint(0, 200) for _ in range(501)]
+    aggregate = RunAggregate()
+    histogram = aggregate.floor_histograms['hp'][0]
+    histogram.update(values)
+    for pct in (0, 10, 50, 90, 100):
+        assert histogram_percentile(histogram, pct) == percentile(values, pct)
+
+
+def test_streaming_merge_matches_single_aggregate():
+    policy = DEFAULT_POLICIES['greedy']
+    traces = [simulate_run(seed, policy) for seed in range(12)]
+    whole = RunAggregate()
+    for trace in traces:
+        whole.add(trace)
+    merged = RunAggregate()
+    for start in range(0, 12, 5):
+        part = RunAggregate()
+        for trace in traces[start:start + 5]:
+            part.add(trace)
+        merged.merge(part)
+    assert merged.summary() == whole.summary()
+    assert merged.floor_rows() == whole.floor_rows()
+    assert len(whole.floor_rows()) == RUN_TOTAL_FLOORS
+
+
+def test_process_pool_matches_inline_run():
+    policies = [DEFAULT_POLICIES['balanced'], DEFAULT_POLICIES['cautious']]
+    inline = run_sweep(policies, runs=20, workers=0, chunk_size=6)
+    pooled = run_sweep(policies, runs=20, workers=2, chunk_size=6)
+    for name in inline:
+        assert inline[name].runs == 20
+        assert inline[name].summary() == pooled[name].summary()
+        assert inline[name].floor_rows() == pooled[name].floor_rows()
+
+
+def test_economy_settings_change_gold():
+    policy = DEFAULT_POLICIES['greedy']
+    normal = run_sweep([policy], runs=30, workers=0)['greedy'].summary()
+    rich = run_sweep([policy], runs=30, workers=0, economy=EconomySettings(gold_scale=2.0))['greedy'].summary()
+    print(f"gold earned: {normal['gold_earned_mean']:.0f} -> {rich['gold_earned_mean']:.0f}")
+    assert rich['gold_earned_mean'] > normal['gold_earned_mean']
+
+
+def test_outputs():
+    aggregates = run_sweep([DEFAULT_POLICIES['balanced']], runs=5, workers=0)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'runs.csv')
+        json_path = os.path.join(tmp, 'runs.json')
+        write_csv(aggregates, csv_path)
+        write_json(aggregates, json_path, {'runs': 5})
+        with open(csv_path, encoding='utf-8') as f:
+            assert len(f.read().splitlines()) == RUN_TOTAL_FLOORS + 1
+        with open(json_path, encoding='utf-8') as f:
+            assert json.load(f)['results']['balanced']['summary']['runs'] == 5
+
+
+if __name__ == "__main__":
+    test_run_is_deterministic_per_seed()
+    test_trace_is_consistent()
+    test_shop_stock_for_every_floor()
+    test_histogram_percentile_matches_sorted_percentile()
+    test_streaming_merge_matches_single_aggregate()
+    test_process_pool_matches_inline_run()
+    test_economy_settings_change_gold()
+    test_outputs()
+    print('=== TEST COMPLETE ===')
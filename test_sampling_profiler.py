@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+サンプリングプロファイラー（スタック採取・状態タグ・折りたたみスタック出力・F9/環境変数での起動）のテスト
+"""
+
+import sys
+import os
+import time
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.constants import GameState
+from core.sampling_profiler import SamplingProfiler, PROFILE_ENV, PROFILE_RATE_ENV, profile_settings_from_env
+
+print('=== SAMPLING PROFILER TEST ===')
+
+
+def _read_collapsed(path):
+    stacks = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            stack, count = line.rstrip('\n').rsplit(' ', 1)
+            stacks[stack] = int(count)
+    return stacks
+
+
+def _busy_loop(seconds):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(100))
+    return total
+
+
+def test_sample_records_current_stack_with_state():
+    profiler = SamplingProfiler(state_provider=lambda: 'menu')
+    profiler.sample()
+    stacks = profiler.collapsed_stacks()
+    assert profiler.samples == 1 and len(stacks) == 1
+    stack = next(iter(stacks))
+    frames = stack.split(';')
+    assert frames[0] == 'menu'
+    assert frames[-1].startswith('sample (sampling_profiler.py:')
+    assert any(frame.startswith('test_sample_records_current_stack_with_state') for frame in frames)
+
+
+def test_background_thread_samples_main_thread():
+    profiler = SamplingProfiler(rate_hz=500, state_provider=lambda: 'real_battle')
+    profiler.start()
+    _busy_loop(0.3)
+    profiler.stop()
+    assert not profiler.running
+    print(f"{profiler.samples} samples in {profiler.elapsed:.2f}s")
+    assert profiler.samples > 10
+    busy = sum(count for stack, count in profiler.collapsed_stacks().items() if '_busy_loop' in stack)
+    assert busy >= profiler.samples * 0.8
+    assert profiler.state_totals() == {'real_battle': profiler.samples}
+
+
+def test_write_collapsed_format():
+    profiler = SamplingProfiler(state_provider=lambda: 'shop')
+    for _ in range(3):
+        profiler.sample()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'out.collapsed')
+        profiler.write_collapsed(path)
+        stacks = _read_collapsed(path)
+    assert sum(stacks.values()) == 3
+    assert all(stack.startswith('shop;') for stack in stacks)
+
+
+def test_env_settings():
+    os.environ[PROFILE_ENV] = 'session.collapsed'
+    os.environ[PROFILE_RATE_ENV] = '250'
+    try:
+        assert profile_settings_from_env() == ('session.collapsed', 250.0)
+        os.environ[PROFILE_RATE_ENV] = 'fast'
+        assert profile_settings_from_env()[1] == 100
+    finally:
+        del os.environ[PROFILE_ENV]
+        del os.environ[PROFILE_RATE_ENV]
+    assert profile_settings_from_env()[0] is None
+
+
+def test_engine_f9_profiles_by_state():
+    from core.game_engine import GameEngine
+    from battle.battle_handler import BattleHandler
+    engine = GameEngine(headless=True, render_headless=True, seed=2)
+    battle = BattleHandler(engine)
+    battle.countdown_active = False
+    engine.register_state_handler(GameState.REAL_BATTLE, battle)
+    engine.change_state(GameState.REAL_BATTLE)
+    engine.sampling_profiler.rate_hz = 500
+
+    # F9はデバッグモードのときだけ効く
+    engine.debug_mode = False
+    assert not engine.handle_global_events(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F9))
+    assert not engine.sampling_profiler.running
+    engine.debug_mode = True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'battle.collapsed')
+        engine.start_sampling_profile(path)
+        assert engine.sampling_profiler.running
+        engine.advance(120)
+        engine.handle_global_events(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F9))
+        assert not engine.sampling_profiler.running
+        stacks = _read_collapsed(path)
+    assert engine.sampling_profiler.state_totals().get('real_battle', 0) > 0
+    assert any('tick (game_engine.py' in stack for stack in stacks)
+    assert engine.stop_sampling_profile() is None
+
+
+def test_engine_unwritable_profile_path_is_logged():
+    from core.game_engine import GameEngine
+    engine = GameEngine(headless=True, render_headless=True, seed=2)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine.start_sampling_profile(os.path.join(tmp, 'missing', 'run.collapsed'))
+        engine.advance(5)
+        # 保存に失敗してもイベント処理や終了処理を止めない
+        assert engine.stop_sampling_profile() is None
+    assert not engine.sampling_profiler.running
+
+
+if __name__ == "__main__":
+    test_sample_records_current_stack_with_state()
+    test_background_thread_samples_main_thread()
+    test_write_collapsed_format()
+    test_env_settings()
+    test_engine_f9_profiles_by_state()
+    test_engine_unwritable_profile_path_is_logged()
+    print('=== TEST COMPLETE ===')
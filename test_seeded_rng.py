@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+ラン単位のシードとサブシステムごとの乱数ストリームのテスト
+同じシードなら同じマップ・敵・報酬・ぷよ列になることを確認
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.rng import RandomStreams, get_rng, seed_run, get_random_streams
+from core.game_engine import GameEngine
+from core.authentic_demo_handler import AuthenticDemoHandler
+from dungeon.dungeon_map import DungeonMap
+from battle.enemy import create_enemy_group
+from rewards.reward_system import RewardGenerator
+
+print('=== SEEDED RNG TEST ===')
+
+
+def snapshot_run():
+    """シード設定直後から生成される内容をまとめて取得"""
+    dungeon = DungeonMap(total_floors=5)
+    layout = sorted((node.node_id, node.node_type.value, tuple(node.connections))
+                    for node in dungeon.nodes.values())
+    enemies = [(enemy.enemy_type.value, enemy.level) for enemy in create_enemy_group(3)]
+    rewards = [(reward.reward_type.value, reward.value)
+               for reward in RewardGenerator().generate_battle_rewards(3)]
+    return layout, enemies, rewards
+
+
+def test_same_seed_reproduces_run():
+    seed_run(12345)
+    first = snapshot_run()
+    seed_run(12345)
+    second = snapshot_run()
+    assert first == second
+
+    seed_run(54321)
+    assert snapshot_run() != first
+
+
+def test_streams_are_independent():
+    """あるサブシステムで乱数を多く引いても他のストリームは変わらない"""
+    seed_run(7)
+    expected = [get_rng('map').random() for _ in range(5)]
+
+    seed_run(7)
+    for _ in range(100):
+        get_rng('effects').random()
+        get_rng('enemy_ai').random()
+    assert [get_rng('map').random() for _ in range(5)] == expected
+
+
+def test_state_roundtrip():
+    streams = RandomStreams(99)
+    streams.stream('puzzle').random()
+    state = streams.get_state()
+    expected = streams.stream('puzzle').random()
+    streams.set_state(state)
+    assert streams.stream('puzzle').random() == expected
+
+
+def test_engine_seed_reproduces_pair_sequence():
+    def pair_sequence(seed):
+        engine = GameEngine(headless=True, seed=seed)
+        handler = AuthenticDemoHandler(engine)
+        return [handler._get_next_pair_colors() for _ in range(20)]
+
+    assert pair_sequence(2024) == pair_sequence(2024)
+    engine = GameEngine(headless=True, seed=2024)
+    assert engine.run_seed == 2024 == get_random_streams().seed
+    assert engine.start_new_run() == get_random_streams().seed
+
+
+if __name__ == "__main__":
+    test_same_seed_reproduces_run()
+    test_streams_are_independent()
+    test_state_roundtrip()
+    test_engine_seed_reproduces_pair_sequence()
+    print('=== TEST COMPLETE ===')
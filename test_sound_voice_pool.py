@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+SEのチャンネルプール（種類別の予約・間引き）とPCMディスクキャッシュのテスト
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.sound_manager import SoundManager, SoundType, SOUND_VOICES, SOUND_MIN_INTERVAL
+from core.asset_cache import decode_sound, asset_path
+
+print('=== SOUND VOICE POOL TEST ===')
+
+
+def test_channels_reserved_per_type():
+    """種類ごとに重複しないチャンネルが予約される"""
+    manager = SoundManager()
+    if not manager.enabled:
+        print('Mixer unavailable, skipped')
+        return
+    channels = [channel for pool in manager.channels.values() for channel in pool]
+    assert len(manager.channels[SoundType.ELIMINATE]) == SOUND_VOICES[SoundType.ELIMINATE]
+    assert len(channels) == sum(SOUND_VOICES.values())
+    assert pygame.mixer.get_num_channels() >= len(channels)
+
+
+def test_rapid_repeats_are_throttled():
+    """最短間隔以内の連続再生は間引かれる"""
+    manager = SoundManager()
+    manager.load_sounds()
+    if not manager.enabled or SoundType.MOVE not in manager.sounds:
+        print('Mixer unavailable, skipped')
+        return
+    manager.play_sound(SoundType.MOVE)
+    first = manager.last_played[SoundType.MOVE]
+    manager.play_sound(SoundType.MOVE)
+    assert manager.last_played[SoundType.MOVE] == first
+
+    # 間隔が空けば再び鳴らせる
+    manager.last_played[SoundType.MOVE] = first - SOUND_MIN_INTERVAL[SoundType.MOVE] - 0.01
+    manager.channels[SoundType.MOVE][0].stop()
+    manager.play_sound(SoundType.MOVE)
+    assert manager.last_played[SoundType.MOVE] > first
+
+
+def test_pcm_cache_written_once():
+    """圧縮音声は1度だけデコードしてWAVで保存し、以降はWAVを読む"""
+    if not pygame.mixer.get_init():
+        print('Mixer unavailable, skipped')
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        source = asset_path('SE', '移動.mp3')
+        first = decode_sound(source, tmp)
+        cached = os.listdir(tmp)
+        print(f'Cached: {cached}')
+        assert len(cached) == 1 and cached[0].endswith('.wav')
+
+        second = decode_sound(source, tmp)
+        assert second.get_raw() == first.get_raw()
+
+
+def test_pcm_cache_keyed_by_path():
+    """別フォルダの同名ファイルは別のWAVに保存し、一時ファイルを残さない"""
+    if not pygame.mixer.get_init():
+        print('Mixer unavailable, skipped')
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, 'cache')
+        for folder in ('a', 'b'):
+            os.mkdir(os.path.join(tmp, folder))
+            source = os.path.join(tmp, folder, '移動.mp3')
+            shutil.copy(asset_path('SE', '移動.mp3'), source)
+            decode_sound(source, cache_dir)
+        cached = sorted(os.listdir(cache_dir))
+        print(f'Cached: {cached}')
+        assert len(cached) == 2 and all(name.endswith('.wav') for name in cached)
+
+
+if __name__ == "__main__":
+    test_channels_reserved_per_type()
+    test_rapid_repeats_are_throttled()
+    test_pcm_cache_written_once()
+    test_pcm_cache_keyed_by_path()
+    print('=== TEST COMPLETE ===')
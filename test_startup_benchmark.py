@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+起動時間ベンチマーク（段階別計測・importtime解析・基準比較）のテスト
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from benchmark_startup import parse_importtime, compare_with_baseline, PHASES
+from core.game_engine import GameEngine
+
+print('=== STARTUP BENCHMARK TEST ===')
+
+
+def test_engine_records_startup_phases():
+    engine = GameEngine()
+    print(f'Startup phases: {engine.startup_timings}')
+    for phase in ('pygame_init', 'display', 'fonts', 'sound', 'engine_state'):
+        assert phase in PHASES
+        assert engine.startup_timings[phase] >= 0.0
+
+
+def test_parse_importtime():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 |   zipimport",
+        "import time:      2000 |       5000 | pygame",
+        "some other warning",
+        "import time:       300 |        300 | core.constants",
+    ])
+    total, slowest = parse_importtime(stderr)
+    assert abs(total - 0.0024) < 1e-9
+    assert slowest[0] == ('pygame', 0.005)
+    assert len(slowest) == 3
+
+
+def test_compare_flags_only_real_regressions():
+    baseline = {'phases': {'fonts': 0.100, 'sound': 0.001, 'first_render': 0.020}}
+    result = {'phases': {'fonts': 0.150, 'sound': 0.003, 'first_render': 0.021}}
+    regressions = compare_with_baseline(result, baseline, 0.2)
+    # soundは比率では悪化だが誤差レベルなので無視
+    assert [phase for phase, _, _ in regressions] == ['fonts']
+
+
+if __name__ == "__main__":
+    test_engine_records_startup_phases()
+    test_parse_importtime()
+    test_compare_flags_only_real_regressions()
+    print('=== TEST COMPLETE ===')
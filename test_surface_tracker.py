@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Surface生成トラッカー（呼び出し元ごとの集計・デバッグ表示・F10での保存）のテスト
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pygame
+pygame.init()
+
+from core.constants import GameState
+from core.surface_tracker import SurfaceTracker, TRACK_SURFACES_ENV, tracking_requested, get_surface_tracker
+
+print('=== SURFACE TRACKER TEST ===')
+
+
+def _allocate_sprites(count):
+    sprites = []
+    for _ in range(count):
+        sprites.append(pygame.Surface((4, 4)))
+    return sprites
+
+
+def _scale_sprite(surface):
+    return pygame.transform.scale(surface, (8, 8))
+
+
+def test_counts_are_attributed_to_call_sites():
+    tracker = SurfaceTracker(history=4)
+    tracker.install()
+    try:
+        font = pygame.font.Font(None, 20)
+        for frame in range(4):
+            tracker.begin_frame()
+            sprites = _allocate_sprites(3 if frame % 2 == 0 else 1)
+            _scale_sprite(sprites[0])
+            font.render("x", True, (255, 255, 255))
+            tracker.end_frame()
+    finally:
+        tracker.uninstall()
+
+    stats = {(entry['kind'], entry['site'].rsplit(' ', 1)[1]): entry for entry in tracker.site_stats()}
+    sprites = stats[('Surface', '_allocate_sprites')]
+    assert sprites['mean'] == 2.0 and sprites['max'] == 3 and sprites['last'] == 1
+    assert sprites['site'].startswith('test_surface_tracker.py:')
+    assert stats[('transform.scale', '_scale_sprite')]['mean'] == 1.0
+    assert stats[('font.render', 'test_counts_are_attributed_to_call_sites')]['mean'] == 1.0
+    assert tracker.site_stats()[0]['kind'] == 'Surface'
+    assert tracker.frame_mean() == 4.0
+
+
+def test_suspended_and_reset():
+    tracker = SurfaceTracker()
+    tracker.install()
+    try:
+        tracker.begin_frame()
+        tracker.suspended = True
+        pygame.Surface((2, 2))
+        tracker.suspended = False
+        pygame.Surface((2, 2))
+        assert tracker.end_frame() == 1
+    finally:
+        tracker.uninstall()
+    tracker.reset()
+    assert tracker.site_stats() == [] and tracker.total_allocations == 0
+
+
+def test_dump_writes_table():
+    tracker = SurfaceTracker()
+    tracker.install()
+    try:
+        tracker.begin_frame()
+        _allocate_sprites(2)
+        tracker.end_frame()
+    finally:
+        tracker.uninstall()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'surfaces.txt')
+        assert tracker.dump(path) == 1
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    assert lines[0] == '# 1 frames, 2.0 surfaces/frame'
+    assert 'Surface' in lines[2] and 'test_surface_tracker.py' in lines[2]
+
+
+def test_env_enables_tracking():
+    os.environ[TRACK_SURFACES_ENV] = '1'
+    try:
+        assert tracking_requested()
+        os.environ[TRACK_SURFACES_ENV] = '0'
+        assert not tracking_requested(True)
+    finally:
+        del os.environ[TRACK_SURFACES_ENV]
+    assert tracking_requested(True) and not tracking_requested()
+
+
+def test_engine_tracks_battle_frames_and_dumps():
+    from core.game_engine import GameEngine
+    from battle.battle_handler import BattleHandler
+    # 以前の利用者の集計が残っていてもエンジンの集計には含めない
+    stale = get_surface_tracker()
+    stale.total_allocations = 7
+    stale.end_frame()
+    os.environ[TRACK_SURFACES_ENV] = '1'
+    try:
+        engine = GameEngine(headless=True, render_headless=True, seed=3)
+    finally:
+        del os.environ[TRACK_SURFACES_ENV]
+    tracker = engine.surface_tracker
+    try:
+        assert tracker.installed and tracker is stale
+        battle = BattleHandler(engine)
+        battle.countdown_active = False
+        engine.register_state_handler(GameState.REAL_BATTLE, battle)
+        engine.change_state(GameState.REAL_BATTLE)
+        engine.debug_mode = True
+        engine.advance(30)
+        stats = tracker.site_stats()
+        assert len(tracker.frames) == 30 and stats
+        # デバッグ表示自体の文字描画は数えない
+        assert not any('_render_debug_info' in entry['site'] for entry in stats)
+        print(f"{tracker.frame_mean():.1f} surfaces/frame, top: {stats[0]['kind']} {stats[0]['site']}")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = engine.dump_surface_allocations(os.path.join(tmp, 'battle.txt'))
+            assert os.path.getsize(path) > 0
+            # 書き込めない場所でもフレーム処理を止めない
+            assert engine.dump_surface_allocations(os.path.join(tmp, 'missing', 'battle.txt')) is None
+    finally:
+        tracker.uninstall()
+        tracker.reset()
+    assert engine.dump_surface_allocations() is None
+    engine.handle_global_events(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F10))
+    # F10はデバッグモードのときだけ効く
+    engine.debug_mode = False
+    assert not engine.handle_global_events(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F10))
+
+
+if __name__ == "__main__":
+    test_counts_are_attributed_to_call_sites()
+    test_suspended_and_reset()
+    test_dump_writes_table()
+    test_env_enables_tracking()
+    test_engine_tracks_battle_frames_and_dumps()
+    print('=== TEST COMPLETE ===')